@@ -0,0 +1,38 @@
+import anyio
+import pydantic
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.engine import resolve_inputs
+from prefect.utilities.collections import visit_collection
+
+
+class Model(pydantic.BaseModel):
+    x: int
+    y: str
+
+
+PAYLOADS = {
+    "flat_list": lambda: list(range(100_000)),
+    "flat_dict": lambda: {str(i): i for i in range(100_000)},
+    "list_of_dicts": lambda: [{"x": i, "y": str(i)} for i in range(20_000)],
+    "list_of_models": lambda: [Model(x=i, y=str(i)) for i in range(10_000)],
+    "nested": lambda: {"a": [[list(range(100)) for _ in range(100)]] * 10},
+}
+
+
+def identity(expr):
+    return expr
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("return_data", [False, True])
+def bench_visit_collection(benchmark: BenchmarkFixture, payload: str, return_data):
+    expr = PAYLOADS[payload]()
+    benchmark(visit_collection, expr, visit_fn=identity, return_data=return_data)
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+def bench_resolve_inputs(benchmark: BenchmarkFixture, payload: str):
+    parameters = {"x": PAYLOADS[payload](), "y": 1}
+    benchmark(anyio.run, resolve_inputs, parameters)
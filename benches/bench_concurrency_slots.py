@@ -0,0 +1,51 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server.orchestration.concurrency_slots import ConcurrencySlotManager
+
+
+async def contend_for_slots(manager: ConcurrencySlotManager, num_runs: int):
+    """
+    Run `num_runs` tasks that each acquire a slot, yield to the event loop, and release
+    the slot, returning the order slots were granted in.
+    """
+    granted = []
+
+    async def run(i):
+        holder = uuid4()
+        await manager.acquire(["bench"], holder)
+        granted.append(i)
+        await asyncio.sleep(0)
+        manager.release(["bench"], holder)
+
+    runs = []
+    for i in range(num_runs):
+        runs.append(asyncio.ensure_future(run(i)))
+        # Let each run queue before the next one starts
+        await asyncio.sleep(0)
+
+    await asyncio.gather(*runs)
+    return granted
+
+
+@pytest.mark.parametrize("limit", [1, 10])
+@pytest.mark.parametrize("num_runs", [100, 1000])
+def bench_concurrency_slot_contention(
+    benchmark: BenchmarkFixture, limit: int, num_runs: int
+):
+    def contend():
+        manager = ConcurrencySlotManager()
+        manager.track_limit("bench", limit)
+        return asyncio.run(contend_for_slots(manager, num_runs))
+
+    granted = benchmark(contend)
+
+    # Fairness is measured as the largest distance between the order a run started
+    # waiting in and the order its slot was granted in
+    benchmark.extra_info["max_displacement"] = max(
+        abs(position - i) for position, i in enumerate(granted)
+    )
+    assert sorted(granted) == list(range(num_runs))
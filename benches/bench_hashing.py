@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.utilities.hashing import hash_objects, hash_structure
+
+
+def bytes_backed_array():
+    # digests of arrays backed by `bytes` are memoized after the first round
+    return np.frombuffer(np.random.default_rng(0).bytes(80_000_000), dtype=np.float64)
+
+
+PAYLOADS = {
+    "array": lambda: np.random.default_rng(0).random((1_000, 10_000)),
+    "bytes_backed_array": bytes_backed_array,
+    "strided_array": lambda: np.random.default_rng(0).random((1_000, 20_000))[:, ::2],
+    "bytes": lambda: np.random.default_rng(0).bytes(80_000_000),
+    "dict": lambda: {str(i): [i, float(i), str(i)] for i in range(100_000)},
+}
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("hasher", [hash_objects, hash_structure])
+def bench_hash_task_inputs(benchmark: BenchmarkFixture, hasher, payload: str):
+    arguments = {"x": PAYLOADS[payload](), "y": 1}
+    benchmark(hasher, "task-key", arguments)
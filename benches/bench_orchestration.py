@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server import models, schemas
+from prefect.server.database.dependencies import provide_database_interface
+from prefect.server.orchestration.core_policy import CoreTaskPolicy
+from prefect.server.orchestration.profiling import get_orchestration_profiler
+from prefect.settings import PREFECT_API_DATABASE_CONNECTION_URL, temporary_settings
+
+
+@pytest.fixture
+def event_loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def database(tmp_path, event_loop):
+    with temporary_settings(
+        {
+            PREFECT_API_DATABASE_CONNECTION_URL: (
+                f"sqlite+aiosqlite:///{tmp_path / 'orchestration.db'}"
+            )
+        }
+    ):
+        db = provide_database_interface()
+        event_loop.run_until_complete(db.create_db())
+        yield db
+
+
+async def orchestrate_task_runs(db, flow_run_id, num_task_runs: int):
+    """
+    Create `num_task_runs` task runs and orchestrate each through the states of a
+    successful run, one transition per transaction as the API would.
+    """
+    for i in range(num_task_runs):
+        async with db.session_context(begin_transaction=True) as session:
+            task_run = await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run_id, task_key="bench", dynamic_key=str(i)
+                ),
+            )
+
+        for state in (
+            schemas.states.Pending(),
+            schemas.states.Running(),
+            schemas.states.Completed(),
+        ):
+            async with db.session_context(begin_transaction=True) as session:
+                await models.task_runs.set_task_run_state(
+                    session=session,
+                    task_run_id=task_run.id,
+                    state=state,
+                    task_policy=CoreTaskPolicy,
+                )
+
+
+@pytest.mark.parametrize("num_task_runs", [50])
+def bench_task_run_state_transitions(
+    benchmark: BenchmarkFixture, database, event_loop, num_task_runs: int
+):
+    async def create_flow_run():
+        async with database.session_context(begin_transaction=True) as session:
+            flow = await models.flows.create_flow(
+                session=session, flow=schemas.core.Flow(name="bench")
+            )
+            return await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id, state=schemas.states.Running()
+                ),
+            )
+
+    flow_run = event_loop.run_until_complete(create_flow_run())
+    get_orchestration_profiler().reset()
+
+    benchmark.pedantic(
+        event_loop.run_until_complete,
+        setup=lambda: (
+            (orchestrate_task_runs(database, flow_run.id, num_task_runs),),
+            {},
+        ),
+        rounds=3,
+    )
+
+    # Transitions per second and the statements each transition executes
+    transitions = get_orchestration_profiler().stats()["transitions"]
+    benchmark.extra_info["transitions_per_second"] = (
+        num_task_runs * 3 / benchmark.stats.stats.mean
+    )
+    benchmark.extra_info["mean_statements"] = {
+        transition: stats["statements"]["mean"]
+        for transition, stats in transitions.items()
+    }
@@ -0,0 +1,53 @@
+import datetime
+
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import prefect.server.schemas.schedules as schedules
+
+SCHEDULES = {
+    "cron": schedules.CronSchedule(cron="* * * * *", timezone="America/New_York"),
+    "interval": schedules.IntervalSchedule(
+        interval=datetime.timedelta(minutes=1),
+        anchor_date=pendulum.datetime(2023, 1, 1),
+        timezone="America/New_York",
+    ),
+    "rrule": schedules.RRuleSchedule(
+        rrule="DTSTART:20230531T000000\nRRULE:FREQ=MINUTELY",
+        timezone="America/New_York",
+    ),
+}
+
+
+@pytest.fixture(params=["bulk", "generator"])
+def date_generation(request, monkeypatch):
+    if request.param == "generator":
+        monkeypatch.setattr(schedules, "_get_cached_timestamps", lambda *_: None)
+    schedules._occurrence_cache.clear()
+    return request.param
+
+
+@pytest.mark.parametrize("schedule_type", SCHEDULES)
+def bench_schedule_dates_for_scheduler_loops(
+    benchmark: BenchmarkFixture, schedule_type: str, date_generation: str
+):
+    """
+    Generates the next 100 dates of a minutely schedule, as the scheduler does for a
+    deployment, for each minute of an hour of scheduler loops.
+    """
+    schedule = SCHEDULES[schedule_type]
+    start = pendulum.datetime(2023, 6, 1)
+
+    def generate():
+        for minute in range(60):
+            dates = list(
+                schedule._get_dates_generator(
+                    n=100,
+                    start=start.add(minutes=minute),
+                    end=start.add(days=100),
+                )
+            )
+            assert len(dates) == 100
+
+    benchmark(generate)
@@ -34,3 +34,17 @@ def bench_task_submit(benchmark: BenchmarkFixture, num_task_runs: int):
         benchmark.pedantic(noop_task.submit, rounds=num_task_runs)
 
     benchmark_flow()
+
+
+@pytest.mark.parametrize("num_task_runs", [100, 250])
+def bench_task_map(benchmark: BenchmarkFixture, num_task_runs: int):
+    identity_task = task(lambda x: x)
+
+    # The benchmark measures the time to create the mapped task runs, which are
+    # created in batches, without waiting for them to finish
+
+    @flow
+    def benchmark_flow():
+        benchmark.pedantic(identity_task.map, args=(range(num_task_runs),), rounds=1)
+
+    benchmark_flow()
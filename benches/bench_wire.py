@@ -0,0 +1,64 @@
+import json
+from uuid import uuid4
+
+import pendulum
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from prefect.server import schemas
+from prefect.utilities import wire
+
+FORMATS = {
+    "json": {},
+    "json-zstd": {"use_zstd": True},
+    "msgpack": {"use_msgpack": True},
+    "msgpack-zstd": {"use_msgpack": True, "use_zstd": True},
+}
+
+
+def flow_runs_payload(count: int = 1_000):
+    """
+    The body of a response to a read of many flow runs.
+    """
+    flow_id = uuid4()
+    return [
+        schemas.responses.FlowRunResponse(
+            id=uuid4(),
+            name=f"flow-run-{i}",
+            flow_id=flow_id,
+            parameters={"x": i, "y": "value"},
+            tags=["a", "b"],
+            state=schemas.states.Completed(timestamp=pendulum.now("UTC")),
+            start_time=pendulum.now("UTC"),
+        ).dict(json_compatible=True)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def require_wire_formats():
+    pytest.importorskip("msgpack")
+    pytest.importorskip("zstandard")
+
+
+@pytest.mark.parametrize("wire_format", FORMATS)
+def bench_encode_flow_runs(benchmark: BenchmarkFixture, wire_format: str):
+    payload = flow_runs_payload()
+    body, _ = benchmark(wire.encode_body, payload, **FORMATS[wire_format])
+    benchmark.extra_info["bytes"] = len(body)
+
+
+@pytest.mark.parametrize("wire_format", FORMATS)
+def bench_decode_flow_runs(benchmark: BenchmarkFixture, wire_format: str):
+    body, headers = wire.encode_body(flow_runs_payload(), **FORMATS[wire_format])
+    benchmark.extra_info["bytes"] = len(body)
+
+    def decode():
+        data = body
+        if headers.get("Content-Encoding") == wire.ZSTD_ENCODING:
+            data = wire.zstd_decompress(data)
+        if headers["Content-Type"] == wire.MSGPACK_MEDIA_TYPE:
+            return wire.msgpack_loads(data)
+        return json.loads(data)
+
+    assert len(benchmark(decode)) == 1_000
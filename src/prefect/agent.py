@@ -14,6 +14,7 @@ import pendulum
 from prefect._internal.compatibility.deprecated import deprecated_callable
 from prefect._internal.compatibility.experimental import experimental_parameter
 from prefect.blocks.core import Block
+from prefect.client.cache import MetadataCache
 from prefect.client.orchestration import PrefectClient, get_client
 from prefect.client.schemas.filters import (
     FlowRunFilter,
@@ -35,7 +36,11 @@ from prefect.exceptions import (
 )
 from prefect.infrastructure import Infrastructure, InfrastructureResult, Process
 from prefect.logging import get_logger
-from prefect.settings import PREFECT_AGENT_PREFETCH_SECONDS
+from prefect.settings import (
+    PREFECT_AGENT_LONG_POLL_SECONDS,
+    PREFECT_AGENT_METADATA_CACHE_TTL_SECONDS,
+    PREFECT_AGENT_PREFETCH_SECONDS,
+)
 from prefect.states import Crashed, Pending, StateType, exception_to_failed_state
 
 
@@ -71,6 +76,9 @@ class PrefectAgent:
         self.limit: Optional[int] = limit
         self.limiter: Optional[anyio.CapacityLimiter] = None
         self.client: Optional[PrefectClient] = None
+        self._metadata_cache: Optional[MetadataCache] = None
+        # whether the last query was a long poll that returned no flow runs
+        self._long_poll_returned_nothing = False
 
         if isinstance(work_queue_prefix, str):
             work_queue_prefix = [work_queue_prefix]
@@ -138,6 +146,9 @@ class PrefectAgent:
 
         await self.update_matched_agent_work_queues()
 
+        # refresh cached deployments and flows along with the work queues
+        await self._get_metadata_cache().revalidate()
+
         for name in self.work_queues:
             try:
                 work_queue = await self.client.read_work_queue_by_name(
@@ -171,6 +182,16 @@ class PrefectAgent:
             self._work_queue_cache.append(work_queue)
             yield work_queue
 
+    def next_query_interval(self, query_seconds: float) -> float:
+        """
+        Returns how long to wait before querying for scheduled flow runs again.
+
+        A long poll that returned no flow runs has already waited for flow runs to be
+        scheduled, so the next query is made after a second instead of
+        `query_seconds`.
+        """
+        return 1 if self._long_poll_returned_nothing else query_seconds
+
     async def get_and_submit_flow_runs(self) -> List[FlowRun]:
         """
         The principle method on agents. Queries for scheduled flow runs and submits
@@ -194,8 +215,12 @@ class PrefectAgent:
                 work_pool_name=self.work_pool_name,
                 work_queue_names=[wq.name async for wq in self.get_work_queues()],
                 scheduled_before=before,
+                wait_seconds=PREFECT_AGENT_LONG_POLL_SECONDS.value(),
             )
             submittable_runs.extend([response.flow_run for response in responses])
+            self._long_poll_returned_nothing = (
+                bool(PREFECT_AGENT_LONG_POLL_SECONDS.value()) and not responses
+            )
 
         else:
             # load runs from each work queue
@@ -375,17 +400,31 @@ class PrefectAgent:
             60 * 10, self.cancelling_flow_run_ids.remove, flow_run.id
         )
 
+    def _get_metadata_cache(self) -> MetadataCache:
+        # The cache is bound to the client it reads objects with
+        if (
+            self._metadata_cache is None
+            or self._metadata_cache.client is not self.client
+        ):
+            self._metadata_cache = MetadataCache(
+                self.client,
+                ttl_seconds=PREFECT_AGENT_METADATA_CACHE_TTL_SECONDS.value(),
+            )
+        return self._metadata_cache
+
     async def get_infrastructure(self, flow_run: FlowRun) -> Infrastructure:
-        deployment = await self.client.read_deployment(flow_run.deployment_id)
+        deployment = await self._get_metadata_cache().read_deployment(
+            flow_run.deployment_id
+        )
 
-        flow = await self.client.read_flow(deployment.flow_id)
+        flow = await self._get_metadata_cache().read_flow(deployment.flow_id)
 
         # overrides only apply when configuring known infra blocks
         if not deployment.infrastructure_document_id:
             if self.default_infrastructure:
                 infra_block = self.default_infrastructure
             else:
-                infra_document = await self.client.read_block_document(
+                infra_document = await self._get_metadata_cache().read_block_document(
                     self.default_infrastructure_document_id
                 )
                 infra_block = Block._from_block_document(infra_document)
@@ -397,7 +436,7 @@ class PrefectAgent:
             return prepared_infrastructure
 
         ## get infra
-        infra_document = await self.client.read_block_document(
+        infra_document = await self._get_metadata_cache().read_block_document(
             deployment.infrastructure_document_id
         )
 
@@ -643,6 +682,7 @@ class PrefectAgent:
         await self.client.__aexit__(*exc_info)
         self.task_group = None
         self.client = None
+        self._metadata_cache = None
         self.submitting_flow_run_ids.clear()
         self.cancelling_flow_run_ids.clear()
         self.scheduled_task_scopes.clear()
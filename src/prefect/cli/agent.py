@@ -198,7 +198,11 @@ async def start(
                 partial(
                     critical_service_loop,
                     agent.get_and_submit_flow_runs,
-                    PREFECT_AGENT_QUERY_INTERVAL.value(),
+                    # a long poll that returned nothing has already waited for flow
+                    # runs to be scheduled, so the agent can query again right away
+                    partial(
+                        agent.next_query_interval, PREFECT_AGENT_QUERY_INTERVAL.value()
+                    ),
                     printer=app.console.print,
                     run_once=run_once,
                     jitter_range=0.3,
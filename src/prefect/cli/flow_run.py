@@ -17,7 +17,7 @@ from prefect.cli._utilities import exit_with_error, exit_with_success
 from prefect.cli.root import app
 from prefect.client.orchestration import get_client
 from prefect.client.schemas.filters import FlowFilter, FlowRunFilter, LogFilter
-from prefect.client.schemas.objects import StateType
+from prefect.client.schemas.objects import Log, StateType
 from prefect.client.schemas.responses import SetStateStatus
 from prefect.client.schemas.sorting import FlowRunSort, LogSort
 from prefect.exceptions import ObjectNotFound
@@ -179,6 +179,12 @@ async def logs(
             " all logs."
         ),
     ),
+    follow: bool = typer.Option(
+        False,
+        "--follow",
+        "-f",
+        help="Stream logs as they are written until the flow run has finished.",
+    ),
 ):
     """
     View logs for a flow run.
@@ -192,6 +198,12 @@ async def logs(
     if head and tail:
         exit_with_error("Please provide either a `head` or `tail` option but not both.")
 
+    if follow and (head or tail or reverse or num_logs):
+        exit_with_error(
+            "The `follow` option cannot be used with the `head`, `tail`, `reverse`, or"
+            " `num-logs` options."
+        )
+
     user_specified_num_logs = (
         num_logs or LOGS_WITH_LIMIT_FLAG_DEFAULT_NUM_LOGS
         if head or tail or num_logs
@@ -211,6 +223,11 @@ async def logs(
         except ObjectNotFound:
             exit_with_error(f"Flow run {str(id)!r} not found!")
 
+        if follow:
+            async for log in client.stream_logs(id):
+                _print_log(log, flow_run.name)
+            return
+
         while more_logs:
             num_logs_to_return_from_page = (
                 LOGS_DEFAULT_PAGE_SIZE
@@ -231,15 +248,7 @@ async def logs(
             )
 
             for log in reversed(page_logs) if tail and not reverse else page_logs:
-                app.console.print(
-                    # Print following the flow run format (declared in logging.yml)
-                    (
-                        f"{pendulum.instance(log.timestamp).to_datetime_string()}.{log.timestamp.microsecond // 1000:03d} |"
-                        f" {logging.getLevelName(log.level):7s} | Flow run"
-                        f" {flow_run.name!r} - {log.message}"
-                    ),
-                    soft_wrap=True,
-                )
+                _print_log(log, flow_run.name)
 
             # Update the number of logs retrieved
             num_logs_returned += num_logs_to_return_from_page
@@ -261,3 +270,15 @@ async def logs(
                 else:
                     # No more logs to show, exit
                     more_logs = False
+
+
+def _print_log(log: Log, flow_run_name: str) -> None:
+    app.console.print(
+        # Print following the flow run format (declared in logging.yml)
+        (
+            f"{pendulum.instance(log.timestamp).to_datetime_string()}.{log.timestamp.microsecond // 1000:03d} |"
+            f" {logging.getLevelName(log.level):7s} | Flow run {flow_run_name!r} -"
+            f" {log.message}"
+        ),
+        soft_wrap=True,
+    )
@@ -279,6 +279,59 @@ async def downgrade(
     exit_with_success(f"Prefect database at {engine.url!r} downgraded!")
 
 
+@database_app.command()
+async def partition(yes: bool = typer.Option(False, "--yes", "-y")):
+    """
+    Partition the log and state tables by timestamp. Only supported on PostgreSQL.
+
+    The primary key of each partitioned table becomes its id and timestamp, so the
+    database no longer enforces that ids alone are unique.
+    """
+    import pendulum
+
+    from prefect.server.database import partitioning
+    from prefect.server.database.dependencies import provide_database_interface
+    from prefect.settings import (
+        PREFECT_API_DATABASE_PARTITION_INTERVAL,
+        PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE,
+    )
+
+    db = provide_database_interface()
+    engine = await db.engine()
+    if engine.dialect.name != "postgresql":
+        exit_with_error("Partitioning is only supported on PostgreSQL databases.")
+
+    if not yes:
+        confirm = typer.confirm(
+            "Are you sure you want to partition the tables of the Prefect database at"
+            f" {engine.url!r}? The server should be stopped while the tables are"
+            " copied."
+        )
+        if not confirm:
+            exit_with_error("Database partitioning aborted!")
+
+    interval = PREFECT_API_DATABASE_PARTITION_INTERVAL.value()
+    until = partitioning.upcoming_partitions_end(
+        pendulum.now("UTC"),
+        interval,
+        PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE.value(),
+    )
+
+    for table in partitioning.PARTITIONED_TABLES:
+        app.console.print(f"Partitioning {table!r} ...")
+        async with db.session_context(begin_transaction=True) as session:
+            partitioned = await partitioning.partition_table(
+                session=session,
+                table=db.Base.metadata.tables[table],
+                interval=interval,
+                until=until,
+            )
+        if not partitioned:
+            app.console.print(f"{table!r} is already partitioned.")
+
+    exit_with_success(f"Prefect database at {engine.url!r} partitioned!")
+
+
 @orion_database_app.command()
 @database_app.command()
 async def revision(
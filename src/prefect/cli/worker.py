@@ -126,7 +126,12 @@ async def start(
                 partial(
                     critical_service_loop,
                     workload=worker.get_and_submit_flow_runs,
-                    interval=PREFECT_WORKER_QUERY_SECONDS.value(),
+                    # a long poll that returned nothing has already waited for flow
+                    # runs to be scheduled, so the worker can query again right away
+                    interval=partial(
+                        worker.next_query_interval,
+                        PREFECT_WORKER_QUERY_SECONDS.value(),
+                    ),
                     run_once=run_once,
                     printer=app.console.print,
                     jitter_range=0.3,
@@ -1,10 +1,24 @@
-import copy
+import asyncio
+import bisect
+import re
 import sys
 import threading
+import time
+import weakref
 from collections import defaultdict
 from contextlib import asynccontextmanager
 from functools import partial
-from typing import Callable, ContextManager, Dict, Set, Tuple, Type
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
 
 import anyio
 import httpx
@@ -20,6 +34,7 @@ from prefect.settings import (
     PREFECT_CLIENT_RETRY_JITTER_FACTOR,
     PREFECT_CLIENT_MAX_RETRIES,
 )
+from prefect.utilities import wire
 from prefect.utilities.math import bounded_poisson_interval, clamped_poisson_interval
 
 # Datastores for lifespan management, keys should be a tuple of thread and app
@@ -30,6 +45,40 @@ APP_LIFESPANS_REF_COUNTS: Dict[Tuple[int, int], int] = {}
 # identity.
 APP_LIFESPANS_LOCKS: Dict[int, anyio.Lock] = defaultdict(anyio.Lock)
 
+# Connection pools shared by `SharedTransport`s, keyed by event loop and then by the key
+# of the transports. Loops are weakly referenced so pools are dropped with their loop.
+SHARED_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, _SharedPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Blocks concurrent access to the above dict from different threads
+SHARED_POOLS_LOCK = threading.Lock()
+
+# Upper bounds, in seconds, of the buckets of request latency histograms
+LATENCY_HISTOGRAM_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+# Latency histograms of the requests sent by clients in this process, by endpoint
+REQUEST_LATENCIES: Dict[str, "LatencyHistogram"] = {}
+REQUEST_LATENCIES_LOCK = threading.Lock()
+
+# Matches ids in request paths so requests for different objects share an endpoint
+_UUID_PATH_SEGMENT = re.compile(
+    r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"(?=/|$)"
+)
+
 
 logger = get_logger("client")
 
@@ -137,6 +186,15 @@ class PrefectResponse(httpx.Response):
         except HTTPStatusError as exc:
             raise PrefectHTTPStatusError.from_httpx_error(exc) from exc.__cause__
 
+    def json(self, **kwargs: Any) -> Any:
+        """
+        Decode the body of the response, which may be JSON or MessagePack.
+        """
+        content_type = self.headers.get("content-type", "")
+        if content_type.startswith(wire.MSGPACK_MEDIA_TYPE):
+            return wire.msgpack_loads(self.content)
+        return super().json(**kwargs)
+
     @classmethod
     def from_httpx_response(cls: Type[Self], response: httpx.Response) -> Self:
         """
@@ -146,11 +204,275 @@ class PrefectResponse(httpx.Response):
         resolution order to look for methods defined in PrefectResponse, while leaving
         everything else about the original Response instance intact.
         """
-        new_response = copy.copy(response)
-        new_response.__class__ = cls
+        # `copy.copy` would detach the body stream of streamed responses, so copy the
+        # attributes of the response directly
+        new_response = cls.__new__(cls)
+        new_response.__dict__.update(response.__dict__)
         return new_response
 
 
+def _decompress_zstd_response(response: httpx.Response) -> httpx.Response:
+    """
+    Returns a copy of a response compressed with Zstandard with its body decompressed.
+    """
+    headers = httpx.Headers(response.headers)
+    del headers["Content-Encoding"]
+    headers.pop("Content-Length", None)
+    return httpx.Response(
+        status_code=response.status_code,
+        headers=headers,
+        content=wire.zstd_decompress(response.content),
+        request=response.request,
+        extensions=response.extensions,
+    )
+
+
+def _is_wire_encoded(request: httpx.Request) -> bool:
+    """
+    Returns whether the body of a request is encoded as MessagePack or compressed with
+    Zstandard.
+    """
+    return request.headers.get("Content-Encoding") == wire.ZSTD_ENCODING or (
+        request.headers.get("Content-Type", "").startswith(wire.MSGPACK_MEDIA_TYPE)
+    )
+
+
+def _as_json_request(request: httpx.Request) -> httpx.Request:
+    """
+    Returns a copy of a request with a MessagePack or Zstandard compressed body with
+    its body encoded as uncompressed JSON.
+    """
+    headers = httpx.Headers(request.headers)
+    content = request.content
+    if headers.pop("Content-Encoding", None) == wire.ZSTD_ENCODING:
+        content = wire.zstd_decompress(content)
+    if headers.get("Content-Type", "").startswith(wire.MSGPACK_MEDIA_TYPE):
+        content, _ = wire.encode_body(wire.msgpack_loads(content))
+        headers["Content-Type"] = wire.JSON_MEDIA_TYPE
+    headers.pop("Content-Length", None)
+
+    return httpx.Request(
+        request.method,
+        request.url,
+        headers=headers,
+        content=content,
+        extensions=request.extensions,
+    )
+
+
+class _SharedPool:
+    __slots__ = ("transport", "ref_count")
+
+    def __init__(self, transport: httpx.AsyncHTTPTransport):
+        self.transport = transport
+        self.ref_count = 0
+
+
+class SharedTransport(httpx.AsyncBaseTransport):
+    """
+    An httpx transport that sends requests through connection pools shared by the
+    clients of an API within an event loop.
+
+    Transports for the same API URL with the same pool settings share a pool in each
+    event loop, so concurrent and nested clients reuse warm connections instead of
+    each opening their own. A transport acquires the pool of an event loop on its first
+    request in that loop and releases it when it is closed. Reference counts are used
+    to close the pool's connections once the last transport using it is closed.
+
+    Args:
+        api_url: The URL of the API the transport sends requests to
+        **transport_kwargs: Keyword arguments used to create the shared
+            `httpx.AsyncHTTPTransport`; these must be hashable, except for `limits`
+
+    Raises:
+        TypeError: If the transport arguments are not hashable
+    """
+
+    def __init__(self, api_url: str, **transport_kwargs: Any):
+        self.api_url = api_url
+        self.transport_kwargs = transport_kwargs
+        self.key = (
+            api_url,
+            tuple(
+                sorted(
+                    (name, _freeze_limits(value))
+                    for name, value in transport_kwargs.items()
+                )
+            ),
+        )
+        hash(self.key)
+
+        self._acquired: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncHTTPTransport]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        transport = self._acquired.get(loop)
+        if transport is None:
+            transport = self._acquired[loop] = self._acquire(loop)
+        return await transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        current_loop = asyncio.get_running_loop()
+        acquired, self._acquired = self._acquired, weakref.WeakKeyDictionary()
+
+        for loop in list(acquired):
+            transport = self._release(loop)
+            # Connections can only be closed from the loop they were opened in; the
+            # pools of other loops are dropped and closed with their loop
+            if transport is not None and loop is current_loop:
+                await transport.aclose()
+
+    def _acquire(self, loop: asyncio.AbstractEventLoop) -> httpx.AsyncHTTPTransport:
+        with SHARED_POOLS_LOCK:
+            pools = SHARED_POOLS.setdefault(loop, {})
+            pool = pools.get(self.key)
+            if pool is None:
+                pool = pools[self.key] = _SharedPool(
+                    httpx.AsyncHTTPTransport(**self.transport_kwargs)
+                )
+            pool.ref_count += 1
+            return pool.transport
+
+    def _release(
+        self, loop: asyncio.AbstractEventLoop
+    ) -> Optional[httpx.AsyncHTTPTransport]:
+        """
+        Release the pool of the given loop, returning its transport if it is no longer
+        in use and should be closed.
+        """
+        with SHARED_POOLS_LOCK:
+            pools = SHARED_POOLS.get(loop, {})
+            pool = pools.get(self.key)
+            if pool is None:
+                return None
+
+            pool.ref_count -= 1
+            if pool.ref_count > 0:
+                return None
+
+            del pools[self.key]
+            if not pools:
+                SHARED_POOLS.pop(loop, None)
+            return pool.transport
+
+
+def _freeze_limits(value: Any) -> Any:
+    if isinstance(value, httpx.Limits):
+        return (
+            value.max_connections,
+            value.max_keepalive_connections,
+            value.keepalive_expiry,
+        )
+    return value
+
+
+class LatencyHistogram:
+    """
+    A histogram of request latencies.
+
+    Each observation is counted in the first bucket of `LATENCY_HISTOGRAM_BUCKETS`
+    with an upper bound greater than or equal to the latency.
+    """
+
+    def __init__(self):
+        self.bucket_counts = [0] * len(LATENCY_HISTOGRAM_BUCKETS)
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Record the latency of a request.
+        """
+        self.bucket_counts[bisect.bisect_left(LATENCY_HISTOGRAM_BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total_seconds += seconds
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the `q` quantile of the observed latencies as the upper bound of the
+        bucket containing it. Returns zero if no latencies have been observed.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for upper_bound, bucket_count in zip(
+            LATENCY_HISTOGRAM_BUCKETS, self.bucket_counts
+        ):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return upper_bound
+        return LATENCY_HISTOGRAM_BUCKETS[-1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON compatible summary of the histogram.
+        """
+        return {
+            "count": self.count,
+            "mean_seconds": self.total_seconds / self.count if self.count else 0.0,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "p99_seconds": self.quantile(0.99),
+            "buckets": {
+                str(upper_bound): bucket_count
+                for upper_bound, bucket_count in zip(
+                    LATENCY_HISTOGRAM_BUCKETS, self.bucket_counts
+                )
+            },
+        }
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram()
+        histogram.bucket_counts = list(self.bucket_counts)
+        histogram.count = self.count
+        histogram.total_seconds = self.total_seconds
+        return histogram
+
+
+def request_endpoint(request: httpx.Request) -> str:
+    """
+    Returns the endpoint of a request: its method and its path, with ids replaced by
+    `{id}`.
+    """
+    return f"{request.method} {_UUID_PATH_SEGMENT.sub('/{id}', request.url.path)}"
+
+
+def record_request_latency(request: httpx.Request, seconds: float) -> None:
+    """
+    Record the latency of a request in the histogram of its endpoint.
+    """
+    endpoint = request_endpoint(request)
+    with REQUEST_LATENCIES_LOCK:
+        histogram = REQUEST_LATENCIES.get(endpoint)
+        if histogram is None:
+            histogram = REQUEST_LATENCIES[endpoint] = LatencyHistogram()
+        histogram.observe(seconds)
+
+
+def get_request_latencies() -> Dict[str, LatencyHistogram]:
+    """
+    Returns copies of the latency histograms of the requests sent by clients in this
+    process, by endpoint.
+    """
+    with REQUEST_LATENCIES_LOCK:
+        return {
+            endpoint: histogram.copy()
+            for endpoint, histogram in REQUEST_LATENCIES.items()
+        }
+
+
+def reset_request_latencies() -> None:
+    """
+    Discard the latency histograms of all endpoints.
+    """
+    with REQUEST_LATENCIES_LOCK:
+        REQUEST_LATENCIES.clear()
+
+
 class PrefectHttpxClient(httpx.AsyncClient):
     """
     A Prefect wrapper for the async httpx client with support for retry-after headers
@@ -159,12 +481,61 @@ class PrefectHttpxClient(httpx.AsyncClient):
     - 429 CloudFlare-style rate limiting
     - 503 Service unavailable
 
-    Additionally, this client will always call `raise_for_status` on responses.
+    Additionally, this client will always call `raise_for_status` on responses and
+    records the latency of each request; see `get_request_latencies`.
+
+    If `enable_msgpack` is set and `msgpack` is installed, MessagePack responses are
+    requested. If `enable_zstd` is set and `zstandard` is installed, compressed
+    responses are requested. Servers that do not support these formats respond with
+    uncompressed JSON.
+
+    Request bodies are only sent in these formats once the server has shown that it
+    decodes them: JSON bodies are sent as MessagePack after a MessagePack response is
+    received, and large bodies are compressed after a response advertises Zstandard in
+    its `Accept-Encoding` header. If the server rejects a request body with a 415
+    response, the request is sent again as JSON and the formats are no longer used
+    until the server advertises them again.
 
     For more details on rate limit headers, see:
     [Configuring Cloudflare Rate Limiting](https://support.cloudflare.com/hc/en-us/articles/115001635128-Configuring-Rate-Limiting-from-UI)
     """
 
+    def __init__(
+        self,
+        *args: Any,
+        enable_msgpack: bool = False,
+        enable_zstd: bool = False,
+        **kwargs: Any,
+    ):
+        super().__init__(*args, **kwargs)
+        self.enable_msgpack = enable_msgpack and wire.msgpack_available()
+        self.enable_zstd = enable_zstd and wire.zstd_available()
+
+        # Whether the server has shown that it decodes request bodies in each format
+        self._server_accepts_msgpack = False
+        self._server_accepts_zstd = False
+
+        if self.enable_msgpack:
+            self.headers["Accept"] = (
+                f"{wire.MSGPACK_MEDIA_TYPE}, {wire.JSON_MEDIA_TYPE};q=0.9"
+            )
+
+    def build_request(
+        self, *args: Any, json: Any = None, **kwargs: Any
+    ) -> httpx.Request:
+        use_msgpack = self.enable_msgpack and self._server_accepts_msgpack
+        use_zstd = self.enable_zstd and self._server_accepts_zstd
+        if json is None or not (use_msgpack or use_zstd):
+            return super().build_request(*args, json=json, **kwargs)
+
+        content, content_headers = wire.encode_body(
+            json, use_msgpack=use_msgpack, use_zstd=use_zstd
+        )
+        kwargs.pop("content", None)
+        headers = httpx.Headers(kwargs.pop("headers", None))
+        headers.update(content_headers)
+        return super().build_request(*args, content=content, headers=headers, **kwargs)
+
     async def _send_with_retry(
         self,
         request: Callable,
@@ -245,8 +616,27 @@ class PrefectHttpxClient(httpx.AsyncClient):
         # We ran out of retries, return the failed response
         return response
 
-    async def send(self, *args, **kwargs) -> Response:
-        api_request = partial(super().send, *args, **kwargs)
+    async def _send_and_record_latency(
+        self, request: httpx.Request, *args, **kwargs
+    ) -> Response:
+        start = time.perf_counter()
+        response = await super().send(request, *args, **kwargs)
+        record_request_latency(request, time.perf_counter() - start)
+        return response
+
+    async def send(self, request: httpx.Request, *args, **kwargs) -> Response:
+        # Compressed responses can only be decoded once they are read completely
+        decode_zstd = self.enable_zstd and not kwargs.get("stream")
+        if decode_zstd and not wire.accepts(
+            request.headers.get("Accept-Encoding"), wire.ZSTD_ENCODING
+        ):
+            request.headers["Accept-Encoding"] = ", ".join(
+                filter(
+                    None, [wire.ZSTD_ENCODING, request.headers.get("Accept-Encoding")]
+                )
+            )
+
+        api_request = partial(self._send_and_record_latency, request, *args, **kwargs)
 
         response = await self._send_with_retry(
             request=api_request,
@@ -271,6 +661,31 @@ class PrefectHttpxClient(httpx.AsyncClient):
             ),
         )
 
+        if response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE and (
+            _is_wire_encoded(request)
+        ):
+            # The server no longer decodes a format it accepted, for example after it
+            # was restarted without the package installed; fall back to JSON
+            await response.aclose()
+            self._server_accepts_msgpack = False
+            self._server_accepts_zstd = False
+            return await self.send(_as_json_request(request), *args, **kwargs)
+
+        if self.enable_msgpack and response.headers.get("Content-Type", "").startswith(
+            wire.MSGPACK_MEDIA_TYPE
+        ):
+            self._server_accepts_msgpack = True
+        if self.enable_zstd and wire.accepts(
+            response.headers.get("Accept-Encoding"), wire.ZSTD_ENCODING
+        ):
+            self._server_accepts_zstd = True
+
+        if (
+            decode_zstd
+            and response.headers.get("Content-Encoding") == wire.ZSTD_ENCODING
+        ):
+            response = _decompress_zstd_response(response)
+
         # Convert to a Prefect response to add nicer errors messages
         response = PrefectResponse.from_httpx_response(response)
 
@@ -0,0 +1,169 @@
+"""
+Caching of deployment and flow metadata read by workers and agents.
+
+Workers and agents read the deployment and flow of every flow run they submit. When a
+deployment produces many flow runs, the same objects are read from the API over and
+over. A `MetadataCache` keeps these objects for a limited time and revalidates them in
+bulk each time the worker or agent synchronizes with the API.
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas.filters import (
+    DeploymentFilter,
+    DeploymentFilterId,
+    FlowFilter,
+    FlowFilterId,
+)
+from prefect.client.schemas.objects import BlockDocument, Flow
+from prefect.client.schemas.responses import DeploymentResponse
+from prefect.logging import get_logger
+
+# The maximum number of objects to revalidate with a single request
+REVALIDATION_BATCH_SIZE = 200
+
+logger = get_logger("client.cache")
+
+
+class _CacheEntry(NamedTuple):
+    value: Any
+    expires: float
+
+
+class MetadataCache:
+    """
+    A cache of the deployments, flows, and block documents read by a worker or agent.
+
+    Objects are cached for `ttl_seconds` after they are read. Calling `revalidate`
+    re-reads all cached deployments and flows in bulk: objects whose `updated` timestamp
+    changed are replaced, deleted objects are dropped, and the expiration of unchanged
+    objects is extended. Block documents cannot be read in bulk and are dropped instead.
+
+    A `ttl_seconds` of zero disables caching.
+    """
+
+    def __init__(self, client: PrefectClient, ttl_seconds: float):
+        self.client = client
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, UUID], _CacheEntry] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    async def read_deployment(self, deployment_id: UUID) -> DeploymentResponse:
+        """
+        Read a deployment by id, from the cache if possible.
+        """
+        return await self._get("deployment", deployment_id, self.client.read_deployment)
+
+    async def read_flow(self, flow_id: UUID) -> Flow:
+        """
+        Read a flow by id, from the cache if possible.
+        """
+        return await self._get("flow", flow_id, self.client.read_flow)
+
+    async def read_block_document(self, block_document_id: UUID) -> BlockDocument:
+        """
+        Read a block document by id, including its secrets, from the cache if possible.
+        """
+        return await self._get(
+            "block_document", block_document_id, self.client.read_block_document
+        )
+
+    async def revalidate(self) -> None:
+        """
+        Replace changed cached objects with their latest version and drop deleted
+        ones.
+
+        If the objects cannot be read, the error is logged and the cache is cleared so
+        that objects are read again on their next use.
+        """
+        try:
+            await self._revalidate(
+                "deployment",
+                lambda ids: self.client.read_deployments(
+                    deployment_filter=DeploymentFilter(id=DeploymentFilterId(any_=ids)),
+                    limit=len(ids),
+                ),
+            )
+            await self._revalidate(
+                "flow",
+                lambda ids: self.client.read_flows(
+                    flow_filter=FlowFilter(id=FlowFilterId(any_=ids)),
+                    limit=len(ids),
+                ),
+            )
+        except Exception:
+            logger.warning(
+                (
+                    "Failed to revalidate cached deployments and flows. Clearing the"
+                    " cache."
+                ),
+                exc_info=True,
+            )
+            self.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] == "block_document"]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Drop all cached objects.
+        """
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the number of cached objects and counters for cache reads.
+        """
+        reads = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / reads if reads else None,
+            "invalidations": self.invalidations,
+        }
+
+    async def _get(
+        self, kind: str, id: UUID, read: Callable[[UUID], Awaitable[Any]]
+    ) -> Any:
+        entry = self._entries.get((kind, id))
+        if entry is not None and entry.expires > time.monotonic():
+            self.hits += 1
+            return entry.value
+
+        self.misses += 1
+        value = await read(id)
+        self._put(kind, id, value)
+        return value
+
+    def _put(self, kind: str, id: UUID, value: Any) -> None:
+        if self.ttl_seconds > 0:
+            self._entries[(kind, id)] = _CacheEntry(
+                value, time.monotonic() + self.ttl_seconds
+            )
+
+    async def _revalidate(
+        self, kind: str, read_many: Callable[[List[UUID]], Awaitable[List[Any]]]
+    ) -> None:
+        ids = [id for entry_kind, id in self._entries if entry_kind == kind]
+        for i in range(0, len(ids), REVALIDATION_BATCH_SIZE):
+            batch = ids[i : i + REVALIDATION_BATCH_SIZE]
+            latest = {obj.id: obj for obj in await read_many(batch)}
+
+            for id in batch:
+                entry: Optional[_CacheEntry] = self._entries.pop((kind, id), None)
+                value = latest.get(id)
+                if value is None:
+                    if entry is not None:
+                        self.invalidations += 1
+                    continue
+
+                if entry is not None and entry.value.updated != value.updated:
+                    self.invalidations += 1
+                self._put(kind, id, value)
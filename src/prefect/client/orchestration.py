@@ -1,7 +1,29 @@
+import asyncio
 import datetime
+import json
+import time
+import urllib.request
 import warnings
-from contextlib import AsyncExitStack
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
+from collections import OrderedDict
+from contextlib import AsyncExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from uuid import UUID
 
 import httpcore
@@ -34,6 +56,7 @@ from prefect.client.schemas.actions import (
     FlowRunUpdate,
     LogCreate,
     TaskRunCreate,
+    TaskRunStateProposal,
     TaskRunUpdate,
     WorkPoolCreate,
     WorkPoolUpdate,
@@ -92,8 +115,14 @@ from prefect.logging import get_logger
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
     PREFECT_API_ENABLE_HTTP2,
+    PREFECT_API_ENABLE_MSGPACK,
+    PREFECT_API_ENABLE_ZSTD,
+    PREFECT_API_KEEPALIVE_EXPIRY,
     PREFECT_API_KEY,
+    PREFECT_API_MAX_CONNECTIONS,
+    PREFECT_API_MAX_KEEPALIVE_CONNECTIONS,
     PREFECT_API_REQUEST_TIMEOUT,
+    PREFECT_API_SHARED_CONNECTION_POOLS,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
     PREFECT_CLOUD_API_URL,
@@ -104,7 +133,26 @@ if TYPE_CHECKING:
     from prefect.flows import Flow as FlowObject
     from prefect.tasks import Task as TaskObject
 
-from prefect.client.base import PrefectHttpxClient, app_lifespan_context
+from prefect.client.base import (
+    PrefectHttpxClient,
+    SharedTransport,
+    app_lifespan_context,
+)
+
+R = TypeVar("R")
+M = TypeVar("M", bound=pydantic.BaseModel)
+
+# The number of objects read per request when iterating over paginated results
+DEFAULT_PAGE_SIZE = 200
+
+# The maximum number of objects kept in the read cache of a client
+MAX_CACHED_READS = 1000
+
+# The client and number of seconds for which the client may serve reads from its cache
+# in the current context; see `PrefectClient.cached_reads`
+_read_cache_context: ContextVar[Optional[Tuple["PrefectClient", float]]] = ContextVar(
+    "prefect_client_read_cache", default=None
+)
 
 
 class ServerType(AutoEnum):
@@ -200,6 +248,13 @@ class PrefectClient:
         self._closed = False
         self._started = False
 
+        # Reads of flow runs, flows, and deployments that are in flight or were recently
+        # completed, by object type and id; see `_coalesce_read`
+        self._inflight_reads: Dict[Tuple[str, UUID], asyncio.Task] = {}
+        self._read_cache: "OrderedDict[Tuple[str, UUID], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+
         # Connect to an external application
         if isinstance(api, str):
             if httpx_settings.get("app"):
@@ -214,13 +269,9 @@ class PrefectClient:
             httpx_settings.setdefault(
                 "limits",
                 httpx.Limits(
-                    # We see instability when allowing the client to open many connections at once.
-                    # Limiting concurrency results in more stable performance.
-                    max_connections=16,
-                    max_keepalive_connections=8,
-                    # The Prefect Cloud LB will keep connections alive for 30s.
-                    # Only allow the client to keep connections alive for 25s.
-                    keepalive_expiry=25,
+                    max_connections=PREFECT_API_MAX_CONNECTIONS.value(),
+                    max_keepalive_connections=PREFECT_API_MAX_KEEPALIVE_CONNECTIONS.value(),
+                    keepalive_expiry=PREFECT_API_KEEPALIVE_EXPIRY.value(),
                 ),
             )
 
@@ -275,8 +326,45 @@ class PrefectClient:
             ),
         )
 
+        # Share the connection pool with other clients of the API in the same event
+        # loop unless the user provided their own transport. httpx ignores proxies
+        # configured in the environment when given a transport, so pools are not shared
+        # when proxies are used.
+        user_transport = httpx_settings.get("transport")
+        uses_proxies = httpx_settings.get("proxies") or (
+            httpx_settings.get("trust_env", True) and urllib.request.getproxies()
+        )
+        if (
+            isinstance(api, str)
+            and not user_transport
+            and not uses_proxies
+            and PREFECT_API_SHARED_CONNECTION_POOLS.value()
+        ):
+            try:
+                httpx_settings["transport"] = SharedTransport(
+                    api,
+                    retries=3,
+                    **{
+                        name: httpx_settings[name]
+                        for name in (
+                            "verify",
+                            "cert",
+                            "http1",
+                            "http2",
+                            "limits",
+                            "trust_env",
+                        )
+                        if name in httpx_settings
+                    },
+                )
+            except TypeError:
+                # Pools can only be shared when their settings are hashable
+                pass
+
         self._client = PrefectHttpxClient(
             **httpx_settings,
+            enable_msgpack=PREFECT_API_ENABLE_MSGPACK.value(),
+            enable_zstd=PREFECT_API_ENABLE_ZSTD.value(),
         )
 
         # See https://www.python-httpx.org/advanced/#custom-transports
@@ -287,11 +375,12 @@ class PrefectClient:
         # reproduce all of the logic to make it so.
         #
         # Only alter the transport to set our default of 3 retries, don't modify any
-        # transport a user may have provided via httpx_settings.
+        # transport a user may have provided via httpx_settings. Shared transports
+        # already create their pools with 3 retries.
         #
         # Making liberal use of getattr and isinstance checks here to avoid any
         # surprises if the internals of httpx or httpcore change on us
-        if isinstance(api, str) and not httpx_settings.get("transport"):
+        if isinstance(api, str) and not user_transport:
             transport_for_url = getattr(self._client, "_transport_for_url", None)
             if callable(transport_for_url):
                 server_transport = transport_for_url(httpx.URL(api))
@@ -311,6 +400,80 @@ class PrefectClient:
 
     # API methods ----------------------------------------------------------------------
 
+    @contextmanager
+    def cached_reads(
+        self, ttl_seconds: float
+    ) -> Generator["PrefectClient", None, None]:
+        """
+        Serve reads of flow runs, flows, and deployments made with this client in the
+        current context from a short-lived cache.
+
+        Objects read within the context are cached and reused by reads within the
+        context for up to `ttl_seconds`. Use this for code that reads the same objects
+        repeatedly and tolerates objects that are up to `ttl_seconds` old, such as
+        reads of metadata for logging.
+
+        Example:
+            ```python
+            with client.cached_reads(ttl_seconds=10):
+                flow_run = await client.read_flow_run(flow_run_id)
+            ```
+        """
+        token = _read_cache_context.set((self, ttl_seconds))
+        try:
+            yield self
+        finally:
+            _read_cache_context.reset(token)
+
+    async def _coalesce_read(
+        self, kind: str, id: UUID, read: Callable[[], Awaitable[R]]
+    ) -> R:
+        """
+        Read an object with `read`, sharing the request with concurrent reads of the
+        same object and serving it from the read cache within `cached_reads`.
+
+        Callers other than the one that started a request receive copies of the object
+        so it can be mutated safely.
+        """
+        key = (kind, id)
+        cache_context = _read_cache_context.get()
+        ttl_seconds = (
+            cache_context[1] if cache_context and cache_context[0] is self else 0
+        )
+
+        if ttl_seconds > 0:
+            cached = self._read_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < ttl_seconds:
+                return cached[1].copy(deep=True)
+
+        loop = asyncio.get_running_loop()
+        request = self._inflight_reads.get(key)
+        if request is not None and request.get_loop() is loop:
+            result = await asyncio.shield(request)
+            return result.copy(deep=True)
+
+        # Send the request in a separate task so it is not cancelled with the caller
+        request = loop.create_task(read())
+        self._inflight_reads[key] = request
+        request.add_done_callback(partial(self._finish_read, key))
+        result = await asyncio.shield(request)
+
+        if ttl_seconds > 0:
+            self._read_cache[key] = (time.monotonic(), result.copy(deep=True))
+            self._read_cache.move_to_end(key)
+            while len(self._read_cache) > MAX_CACHED_READS:
+                self._read_cache.popitem(last=False)
+
+        return result
+
+    def _finish_read(self, key: Tuple[str, UUID], request: asyncio.Task) -> None:
+        if self._inflight_reads.get(key) is request:
+            del self._inflight_reads[key]
+
+        # Retrieve the exception so it is not reported if every caller was cancelled
+        if not request.cancelled():
+            request.exception()
+
     async def api_healthcheck(self) -> Optional[Exception]:
         """
         Attempts to connect to the API and returns the encountered exception if not
@@ -374,12 +537,19 @@ class PrefectClient:
         """
         Query the Prefect API for a flow by id.
 
+        Concurrent reads of the same flow share a single request.
+
         Args:
             flow_id: the flow ID of interest
 
         Returns:
             a [Flow model][prefect.client.schemas.objects.Flow] representation of the flow
         """
+        return await self._coalesce_read(
+            "flow", flow_id, partial(self._read_flow, flow_id)
+        )
+
+    async def _read_flow(self, flow_id: UUID) -> Flow:
         response = await self._client.get(f"/flows/{flow_id}")
         return Flow.parse_obj(response.json())
 
@@ -1526,12 +1696,19 @@ class PrefectClient:
         """
         Query the Prefect API for a deployment by id.
 
+        Concurrent reads of the same deployment share a single request.
+
         Args:
             deployment_id: the deployment ID of interest
 
         Returns:
             a [Deployment model][prefect.client.schemas.objects.Deployment] representation of the deployment
         """
+        return await self._coalesce_read(
+            "deployment", deployment_id, partial(self._read_deployment, deployment_id)
+        )
+
+    async def _read_deployment(self, deployment_id: UUID) -> DeploymentResponse:
         try:
             response = await self._client.get(f"/deployments/{deployment_id}")
         except httpx.HTTPStatusError as e:
@@ -1657,12 +1834,19 @@ class PrefectClient:
         """
         Query the Prefect API for a flow run by id.
 
+        Concurrent reads of the same flow run share a single request.
+
         Args:
             flow_run_id: the flow run ID of interest
 
         Returns:
             a Flow Run model representation of the flow run
         """
+        return await self._coalesce_read(
+            "flow_run", flow_run_id, partial(self._read_flow_run, flow_run_id)
+        )
+
+    async def _read_flow_run(self, flow_run_id: UUID) -> FlowRun:
         try:
             response = await self._client.get(f"/flow_runs/{flow_run_id}")
         except httpx.HTTPStatusError as e:
@@ -1754,6 +1938,90 @@ class PrefectClient:
         response = await self._client.post("/flow_runs/filter", json=body)
         return pydantic.parse_obj_as(List[FlowRun], response.json())
 
+    async def iter_flow_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        work_pool_filter: WorkPoolFilter = None,
+        work_queue_filter: WorkQueueFilter = None,
+        sort: FlowRunSort = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[FlowRun]:
+        """
+        Iterate over all flow runs matching the given criteria.
+
+        Flow runs are read from the Prefect API in pages of `page_size` with keyset
+        pagination, so reading each page takes the same time no matter how many flow
+        runs precede it.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            work_pool_filter: filter criteria for work pools
+            work_queue_filter: filter criteria for work pool queues
+            sort: sort criteria for the flow runs
+            page_size: the number of flow runs to read per request
+
+        Yields:
+            Flow Run model representations of the flow runs
+        """
+        body = {
+            "flows": flow_filter.dict(json_compatible=True) if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.dict(json_compatible=True, exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.dict(json_compatible=True) if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.dict(json_compatible=True)
+                if deployment_filter
+                else None
+            ),
+            "work_pools": (
+                work_pool_filter.dict(json_compatible=True)
+                if work_pool_filter
+                else None
+            ),
+            "work_pool_queues": (
+                work_queue_filter.dict(json_compatible=True)
+                if work_queue_filter
+                else None
+            ),
+            "sort": sort,
+        }
+        async for flow_run in self._iter_pages(
+            "/flow_runs/paginate", body, FlowRun, page_size
+        ):
+            yield flow_run
+
+    async def _iter_pages(
+        self, path: str, body: Dict[str, Any], model: Type[M], page_size: int
+    ) -> AsyncIterator[M]:
+        """
+        Iterate over the results of a keyset paginated route, reading the next page
+        with the cursor returned with each page until the last page is read.
+        """
+        cursor = None
+        while True:
+            response = await self._client.post(
+                path, json={**body, "limit": page_size, "cursor": cursor}
+            )
+            page = response.json()
+            for result in pydantic.parse_obj_as(List[model], page["results"]):
+                yield result
+
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return
+
     async def set_flow_run_state(
         self,
         flow_run_id: UUID,
@@ -1874,6 +2142,27 @@ class PrefectClient:
         )
         return TaskRun.parse_obj(response.json())
 
+    async def create_task_runs(
+        self, task_runs: Iterable[TaskRunCreate]
+    ) -> List[TaskRun]:
+        """
+        Create many task runs in a single request
+
+        Args:
+            task_runs: An iterable of `TaskRunCreate` objects. Task runs without a
+                state will be created in a `Pending` state.
+
+        Returns:
+            The created task runs, in the same order as they were provided. If a task
+            run with the same flow run id, task key, and dynamic key already exists,
+            the existing task run is returned in its place.
+        """
+        response = await self._client.post(
+            "/task_runs/bulk",
+            json=[task_run.dict(json_compatible=True) for task_run in task_runs],
+        )
+        return pydantic.parse_obj_as(List[TaskRun], response.json())
+
     async def read_task_run(self, task_run_id: UUID) -> TaskRun:
         """
         Query the Prefect API for a task run by id.
@@ -1937,6 +2226,53 @@ class PrefectClient:
         response = await self._client.post("/task_runs/filter", json=body)
         return pydantic.parse_obj_as(List[TaskRun], response.json())
 
+    async def iter_task_runs(
+        self,
+        *,
+        flow_filter: FlowFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        deployment_filter: DeploymentFilter = None,
+        sort: TaskRunSort = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[TaskRun]:
+        """
+        Iterate over all task runs matching the given criteria, reading them from the
+        Prefect API in pages of `page_size` with keyset pagination.
+
+        Args:
+            flow_filter: filter criteria for flows
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            deployment_filter: filter criteria for deployments
+            sort: sort criteria for the task runs
+            page_size: the number of task runs to read per request
+
+        Yields:
+            Task Run model representations of the task runs
+        """
+        body = {
+            "flows": flow_filter.dict(json_compatible=True) if flow_filter else None,
+            "flow_runs": (
+                flow_run_filter.dict(json_compatible=True, exclude_unset=True)
+                if flow_run_filter
+                else None
+            ),
+            "task_runs": (
+                task_run_filter.dict(json_compatible=True) if task_run_filter else None
+            ),
+            "deployments": (
+                deployment_filter.dict(json_compatible=True)
+                if deployment_filter
+                else None
+            ),
+            "sort": sort,
+        }
+        async for task_run in self._iter_pages(
+            "/task_runs/paginate", body, TaskRun, page_size
+        ):
+            yield task_run
+
     async def set_task_run_state(
         self,
         task_run_id: UUID,
@@ -1963,6 +2299,28 @@ class PrefectClient:
         )
         return OrchestrationResult.parse_obj(response.json())
 
+    async def set_task_run_states(
+        self, proposals: Iterable[TaskRunStateProposal]
+    ) -> List[OrchestrationResult]:
+        """
+        Set the states of many task runs in a single request.
+
+        Each proposal is orchestrated as if it were sent to `set_task_run_state`, but
+        all proposals are evaluated in a single transaction by the Prefect API.
+
+        Args:
+            proposals: An iterable of `TaskRunStateProposal` objects
+
+        Returns:
+            a list of OrchestrationResult model representations of state orchestration
+                output, in the same order as the proposals
+        """
+        response = await self._client.post(
+            "/task_runs/set_states",
+            json=[proposal.dict(json_compatible=True) for proposal in proposals],
+        )
+        return pydantic.parse_obj_as(List[OrchestrationResult], response.json())
+
     async def read_task_run_states(
         self, task_run_id: UUID
     ) -> List[prefect.states.State]:
@@ -2087,6 +2445,61 @@ class PrefectClient:
         response = await self._client.post("/logs/filter", json=body)
         return pydantic.parse_obj_as(List[Log], response.json())
 
+    async def iter_logs(
+        self,
+        log_filter: LogFilter = None,
+        sort: LogSort = LogSort.TIMESTAMP_ASC,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Log]:
+        """
+        Iterate over all flow and task run logs matching the given criteria, reading
+        them from the Prefect API in pages of `page_size` with keyset pagination.
+        """
+        body = {
+            "logs": log_filter.dict(json_compatible=True) if log_filter else None,
+            "sort": sort,
+        }
+        async for log in self._iter_pages("/logs/paginate", body, Log, page_size):
+            yield log
+
+    async def stream_logs(
+        self, flow_run_id: UUID, cursor: Optional[str] = None
+    ) -> AsyncIterator[Log]:
+        """
+        Iterate over the logs of a flow run in timestamp order, following new logs as
+        they are written until the flow run has finished.
+
+        Args:
+            flow_run_id: the flow run ID of interest
+            cursor: only stream logs after this cursor
+
+        Raises:
+            prefect.exceptions.ObjectNotFound: If request returns 404
+            httpx.RequestError: If request fails
+        """
+        params = {"flow_run_id": str(flow_run_id)}
+        if cursor:
+            params["cursor"] = cursor
+
+        # Streamed logs must not be buffered by response compression
+        try:
+            async with self._client.stream(
+                "GET",
+                "/logs/stream",
+                params=params,
+                headers={"Accept-Encoding": "identity"},
+            ) as response:
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    for log in json.loads(line)["logs"]:
+                        yield Log.parse_obj(log)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == status.HTTP_404_NOT_FOUND:
+                raise prefect.exceptions.ObjectNotFound(http_exc=e) from e
+            else:
+                raise
+
     async def resolve_datadoc(self, datadoc: DataDocument) -> Any:
         """
         Recursively decode possibly nested data documents.
@@ -2317,6 +2730,7 @@ class PrefectClient:
         work_pool_name: str,
         work_queue_names: Optional[List[str]] = None,
         scheduled_before: Optional[datetime.datetime] = None,
+        wait_seconds: Optional[float] = None,
     ) -> List[WorkerFlowRunResponse]:
         """
         Retrieves scheduled flow runs for the provided set of work pool queues.
@@ -2328,6 +2742,8 @@ class PrefectClient:
                 to get scheduled flow runs.
             scheduled_before: Datetime used to filter returned flow runs. Flow runs
                 scheduled for after the given datetime string will not be returned.
+            wait_seconds: If no flow runs are scheduled, the maximum time for the API
+                to wait for flow runs to be scheduled before responding.
 
         Returns:
             A list of worker flow run responses containing information about the
@@ -2339,9 +2755,22 @@ class PrefectClient:
         if scheduled_before:
             body["scheduled_before"] = str(scheduled_before)
 
+        request_kwargs = {}
+        if wait_seconds:
+            body["wait_seconds"] = wait_seconds
+            # allow the API to hold the request open for the full wait
+            timeout = self._client.timeout
+            request_kwargs["timeout"] = httpx.Timeout(
+                connect=timeout.connect,
+                read=timeout.read + wait_seconds if timeout.read is not None else None,
+                write=timeout.write,
+                pool=timeout.pool,
+            )
+
         response = await self._client.post(
             f"/work_pools/{work_pool_name}/get_scheduled_flow_runs",
             json=body,
+            **request_kwargs,
         )
 
         return pydantic.parse_obj_as(List[WorkerFlowRunResponse], response.json())
@@ -2406,6 +2835,46 @@ class PrefectClient:
         response = await self._client.post("/artifacts/filter", json=body)
         return pydantic.parse_obj_as(List[Artifact], response.json())
 
+    async def iter_artifacts(
+        self,
+        *,
+        artifact_filter: ArtifactFilter = None,
+        flow_run_filter: FlowRunFilter = None,
+        task_run_filter: TaskRunFilter = None,
+        sort: ArtifactSort = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Artifact]:
+        """
+        Iterate over all artifacts matching the given criteria, reading them from the
+        Prefect API in pages of `page_size` with keyset pagination.
+
+        Args:
+            artifact_filter: filter criteria for artifacts
+            flow_run_filter: filter criteria for flow runs
+            task_run_filter: filter criteria for task runs
+            sort: sort criteria for the artifacts
+            page_size: the number of artifacts to read per request
+
+        Yields:
+            Artifact model representations of the artifacts
+        """
+        body = {
+            "artifacts": (
+                artifact_filter.dict(json_compatible=True) if artifact_filter else None
+            ),
+            "flow_runs": (
+                flow_run_filter.dict(json_compatible=True) if flow_run_filter else None
+            ),
+            "task_runs": (
+                task_run_filter.dict(json_compatible=True) if task_run_filter else None
+            ),
+            "sort": sort,
+        }
+        async for artifact in self._iter_pages(
+            "/artifacts/paginate", body, Artifact, page_size
+        ):
+            yield artifact
+
     async def read_latest_artifacts(
         self,
         *,
@@ -0,0 +1,132 @@
+"""
+Pipelining of task run state proposals.
+
+When `PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED` is set, each flow run creates a
+`TaskRunStatePipeline` which coalesces the state proposals made concurrently by its
+task runs into batched `POST /task_runs/set_states` requests, instead of sending a
+request per proposal.
+"""
+import asyncio
+from typing import List, Optional, Set, Tuple
+from uuid import UUID
+
+import prefect.states
+from prefect.client.orchestration import PrefectClient
+from prefect.client.schemas import OrchestrationResult
+from prefect.client.schemas.actions import TaskRunStateProposal
+from prefect.settings import (
+    PREFECT_TASK_RUN_STATE_PIPELINING_BATCH_SIZE,
+    PREFECT_TASK_RUN_STATE_PIPELINING_INTERVAL,
+)
+
+
+class TaskRunStatePipeline:
+    """
+    Coalesces task run state proposals into batched requests to the Prefect API.
+
+    Proposals are collected for up to `interval` seconds, or until `max_batch_size`
+    proposals are pending, then sent with a single call to
+    `PrefectClient.set_task_run_states`. Each caller waits for the orchestration result
+    of its own proposal.
+
+    The pipeline is bound to the event loop it was created on. Proposals made from any
+    other event loop are sent directly with `PrefectClient.set_task_run_state`.
+    """
+
+    def __init__(
+        self,
+        client: PrefectClient,
+        max_batch_size: Optional[int] = None,
+        interval: Optional[float] = None,
+    ):
+        self.client = client
+        self.max_batch_size = (
+            max_batch_size or PREFECT_TASK_RUN_STATE_PIPELINING_BATCH_SIZE.value()
+        )
+        self.interval = (
+            interval
+            if interval is not None
+            else PREFECT_TASK_RUN_STATE_PIPELINING_INTERVAL.value()
+        )
+
+        self._loop = asyncio.get_running_loop()
+        self._pending: List[Tuple[TaskRunStateProposal, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._requests: Set[asyncio.Task] = set()
+
+    async def set_task_run_state(
+        self,
+        task_run_id: UUID,
+        state: prefect.states.State,
+        force: bool = False,
+    ) -> OrchestrationResult:
+        """
+        Propose a state for a task run with the next batch of proposals.
+
+        Args:
+            task_run_id: the id of the task run
+            state: the state to set
+            force: if True, disregard orchestration logic when setting the state,
+                forcing the Prefect API to accept the state
+
+        Returns:
+            an OrchestrationResult model representation of state orchestration output
+        """
+        if asyncio.get_running_loop() is not self._loop:
+            return await self.client.set_task_run_state(task_run_id, state, force=force)
+
+        state_create = state.to_state_create()
+        state_create.state_details.task_run_id = task_run_id
+        proposal = TaskRunStateProposal(
+            task_run_id=task_run_id, state=state_create, force=force
+        )
+
+        future = self._loop.create_future()
+        self._pending.append((proposal, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.interval, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """
+        Send all pending proposals in a background request.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        request = self._loop.create_task(self._send(batch))
+
+        # Retain a reference to the request until it is done
+        self._requests.add(request)
+        request.add_done_callback(self._requests.discard)
+
+    async def _send(
+        self, batch: List[Tuple[TaskRunStateProposal, asyncio.Future]]
+    ) -> None:
+        try:
+            results = await self.client.set_task_run_states(
+                [proposal for proposal, _ in batch]
+            )
+        except Exception as exc:
+            # Report the failure to every caller in the batch
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        except BaseException:
+            for _, future in batch:
+                future.cancel()
+            raise
+        else:
+            for (_, future), result in zip(batch, results):
+                # The caller may have been cancelled while waiting
+                if not future.done():
+                    future.set_result(result)
@@ -286,6 +286,14 @@ class TaskRunCreate(ActionBaseModel):
     ] = FieldFrom(objects.TaskRun)
 
 
+class TaskRunStateProposal(ActionBaseModel):
+    """Data used by the Prefect REST API to propose a new state for a task run"""
+
+    task_run_id: UUID
+    state: StateCreate
+    force: bool = Field(default=False)
+
+
 @copy_model_fields
 class TaskRunUpdate(ActionBaseModel):
     """Data used by the Prefect REST API to update a task run"""
@@ -34,6 +34,7 @@ import prefect.logging.configuration
 import prefect.settings
 from prefect._internal.schemas.fields import DateTimeTZ
 from prefect.client.orchestration import PrefectClient
+from prefect.client.pipelining import TaskRunStatePipeline
 from prefect.client.schemas import FlowRun, TaskRun
 from prefect.events.worker import EventsWorker
 from prefect.exceptions import MissingContextError
@@ -218,6 +219,8 @@ class FlowRunContext(RunContext):
         flow_run_states: A list of states for flow runs created within this flow run
         sync_portal: A blocking portal for sync task/flow runs in an async flow
         timeout_scope: The cancellation scope for flow level timeouts
+        task_run_state_pipeline: An optional pipeline for batching task run state
+            proposals
     """
 
     flow: "Flow"
@@ -252,6 +255,9 @@ class FlowRunContext(RunContext):
     # Events worker to emit events to Prefect Cloud
     events: Optional[EventsWorker] = None
 
+    # Pipeline for batching the state proposals of task runs in this flow run
+    task_run_state_pipeline: Optional[TaskRunStatePipeline] = None
+
     __var__ = ContextVar("flow_run")
 
 
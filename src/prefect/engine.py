@@ -16,6 +16,7 @@ Engine process overview
     See `orchestrate_flow_run`, `orchestrate_task_run`
 """
 import asyncio
+import collections
 import contextlib
 import logging
 import os
@@ -25,7 +26,22 @@ import sys
 import time
 from contextlib import AsyncExitStack, asynccontextmanager, nullcontext
 from functools import partial
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Set, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from uuid import UUID, uuid4
 
 import anyio
@@ -42,12 +58,15 @@ from prefect._internal.concurrency.calls import get_current_call
 from prefect._internal.concurrency.threads import wait_for_global_loop_exit
 from prefect._internal.concurrency.timeouts import get_deadline
 from prefect.client.orchestration import PrefectClient, get_client
+from prefect.client.pipelining import TaskRunStatePipeline
 from prefect.client.schemas import FlowRun, OrchestrationResult, TaskRun
+from prefect.client.schemas.actions import TaskRunCreate
 from prefect.client.schemas.filters import FlowRunFilter
 from prefect.client.schemas.objects import (
     StateDetails,
     StateType,
     TaskRunInput,
+    TaskRunPolicy,
     TaskRunResult,
 )
 from prefect.client.schemas.responses import SetStateStatus
@@ -87,6 +106,9 @@ from prefect.results import BaseResult, ResultFactory
 from prefect.settings import (
     PREFECT_DEBUG_MODE,
     PREFECT_LOGGING_LOG_PRINTS,
+    PREFECT_TASK_MAP_CREATE_BATCH_SIZE,
+    PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT,
+    PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED,
     PREFECT_TASKS_REFRESH_CACHE,
     PREFECT_UI_URL,
 )
@@ -106,7 +128,12 @@ from prefect.task_runners import (
     TaskConcurrencyType,
 )
 from prefect.tasks import Task
-from prefect.utilities.annotations import allow_failure, quote, unmapped
+from prefect.utilities.annotations import (
+    BaseAnnotation,
+    allow_failure,
+    quote,
+    unmapped,
+)
 from prefect.utilities.asyncutils import (
     gather,
     is_async_fn,
@@ -119,7 +146,12 @@ from prefect.utilities.callables import (
     get_parameter_defaults,
     parameters_to_args_kwargs,
 )
-from prefect.utilities.collections import StopVisiting, isiterable, visit_collection
+from prefect.utilities.collections import (
+    StopVisiting,
+    batched_iterable,
+    isiterable,
+    visit_collection,
+)
 from prefect.utilities.pydantic import PartialModel
 
 R = TypeVar("R")
@@ -130,6 +162,10 @@ API_HEALTHCHECKS = {}
 UNTRACKABLE_TYPES = {bool, type(None), type(...), type(NotImplemented)}
 engine_logger = get_logger("engine")
 
+# The number of seconds a flow run read for the logger of a task run outside of its flow
+# run's context may be reused for other task runs of the flow run
+TASK_RUN_FLOW_RUN_CACHE_SECONDS = 60
+
 
 def enter_flow_run_engine_from_flow_call(
     flow: Flow,
@@ -695,6 +731,11 @@ async def orchestrate_flow_run(
                 flow_run=flow_run,
                 client=client,
                 parameters=parameters,
+                task_run_state_pipeline=(
+                    TaskRunStatePipeline(client)
+                    if PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED.value()
+                    else None
+                ),
             ) as flow_run_context:
                 # update flow run name
                 if not run_name_set and flow.flow_run_name:
@@ -1018,21 +1059,7 @@ def enter_task_run_engine(
     Sync entrypoint for task calls
     """
 
-    flow_run_context = FlowRunContext.get()
-    if not flow_run_context:
-        raise RuntimeError(
-            "Tasks cannot be run outside of a flow. To call the underlying task"
-            " function outside of a flow use `task.fn()`."
-        )
-
-    if TaskRunContext.get():
-        raise RuntimeError(
-            "Tasks cannot be run from within tasks. Did you mean to call this "
-            "task in a flow?"
-        )
-
-    if flow_run_context.timeout_scope and flow_run_context.timeout_scope.cancel_called:
-        raise TimeoutError("Flow run timed out")
+    flow_run_context = _get_flow_run_context_for_task_call()
 
     begin_run = create_call(
         begin_task_map if mapped else get_task_call_return_value,
@@ -1051,6 +1078,30 @@ def enter_task_run_engine(
         return from_sync.wait_for_call_in_loop_thread(begin_run)
 
 
+def _get_flow_run_context_for_task_call() -> FlowRunContext:
+    """
+    Retrieve the context of the flow run a task is called in, ensuring the task can be
+    called.
+    """
+    flow_run_context = FlowRunContext.get()
+    if not flow_run_context:
+        raise RuntimeError(
+            "Tasks cannot be run outside of a flow. To call the underlying task"
+            " function outside of a flow use `task.fn()`."
+        )
+
+    if TaskRunContext.get():
+        raise RuntimeError(
+            "Tasks cannot be run from within tasks. Did you mean to call this "
+            "task in a flow?"
+        )
+
+    if flow_run_context.timeout_scope and flow_run_context.timeout_scope.cancel_called:
+        raise TimeoutError("Flow run timed out")
+
+    return flow_run_context
+
+
 async def begin_task_map(
     task: Task,
     flow_run_context: FlowRunContext,
@@ -1108,7 +1159,9 @@ async def begin_task_map(
 
     map_length = list(lengths)[0]
 
-    task_runs = []
+    task_runner = task_runner or flow_run_context.task_runner
+
+    call_parameters_list = []
     for i in range(map_length):
         call_parameters = {key: value[i] for key, value in iterable_parameters.items()}
         call_parameters.update({key: value for key, value in static_parameters.items()})
@@ -1123,27 +1176,393 @@ async def begin_task_map(
             call_parameters[key] = annotation.rewrap(call_parameters[key])
 
         # Collapse any previously exploded kwargs
-        call_parameters = collapse_variadic_parameters(task.fn, call_parameters)
+        call_parameters_list.append(
+            collapse_variadic_parameters(task.fn, call_parameters)
+        )
+
+    futures = await create_mapped_task_run_futures(
+        task=task,
+        flow_run_context=flow_run_context,
+        parameters=call_parameters_list,
+        wait_for=wait_for,
+        task_runner=task_runner,
+        extra_task_inputs=task_inputs,
+    )
+
+    if return_type == "future":
+        return futures
+    elif return_type == "state":
+        return await gather(*[future._wait for future in futures])
+    elif return_type == "result":
+        return await gather(*[future._result for future in futures])
+    else:
+        raise ValueError(f"Invalid return type for task engine {return_type!r}.")
+
+
+def stream_task_map(
+    task: Task,
+    parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    return_type: EngineReturnType,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Union[State, Any]]:
+    """
+    Sync entrypoint for streaming task mapping.
+
+    Items are pulled from the iterable parameters as task runs complete, so at most
+    `max_in_flight` child task runs are submitted but not yet yielded at any time.
+    Children are created and submitted in chunks, once at least half of the in-flight
+    slots are free, and yielded in the order of their inputs.
+    """
+    flow_run_context = _get_flow_run_context_for_task_call()
+    streams, static_parameters = _split_streamed_parameters(parameters)
+    max_in_flight = _resolve_max_in_flight(max_in_flight)
+
+    for _, stream in streams.values():
+        if isinstance(stream, AsyncIterator):
+            raise TypeError(
+                "Async iterables can only be streamed to async tasks in async flows."
+            )
+
+    return _stream_task_map(
+        task,
+        flow_run_context=flow_run_context,
+        streams=streams,
+        static_parameters=static_parameters,
+        wait_for=wait_for,
+        return_type=return_type,
+        max_in_flight=max_in_flight,
+    )
+
+
+def _stream_task_map(
+    task: Task,
+    flow_run_context: FlowRunContext,
+    streams: Dict[str, Tuple[Any, Iterator]],
+    static_parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    return_type: EngineReturnType,
+    max_in_flight: int,
+) -> Iterator[Union[State, Any]]:
+    in_flight: Deque[PrefectFuture] = collections.deque()
+    exhausted = False
+
+    while True:
+        if not exhausted and len(in_flight) <= max_in_flight // 2:
+            chunk = _take_stream_chunk(streams, size=max_in_flight - len(in_flight))
+            exhausted = chunk is None
+            if not exhausted:
+                in_flight.extend(
+                    enter_task_run_engine(
+                        task,
+                        parameters={**static_parameters, **chunk},
+                        wait_for=wait_for,
+                        return_type="future",
+                        task_runner=None,
+                        mapped=True,
+                    )
+                )
+
+        if not in_flight:
+            return
+
+        future = in_flight.popleft()
+        retval = future.wait() if return_type == "state" else future.result()
+        _forget_task_run_future(flow_run_context, future)
+        yield retval
+
+
+def astream_task_map(
+    task: Task,
+    parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    return_type: EngineReturnType,
+    max_in_flight: Optional[int] = None,
+) -> AsyncIterator[Union[State, Any]]:
+    """
+    Async entrypoint for streaming task mapping.
+
+    See `stream_task_map`; async iterables are supported as parameters as well.
+    """
+    flow_run_context = _get_flow_run_context_for_task_call()
+    streams, static_parameters = _split_streamed_parameters(parameters)
+    max_in_flight = _resolve_max_in_flight(max_in_flight)
+
+    return _astream_task_map(
+        task,
+        flow_run_context=flow_run_context,
+        streams=streams,
+        static_parameters=static_parameters,
+        wait_for=wait_for,
+        return_type=return_type,
+        max_in_flight=max_in_flight,
+    )
+
+
+async def _astream_task_map(
+    task: Task,
+    flow_run_context: FlowRunContext,
+    streams: Dict[str, Tuple[Any, Union[Iterator, AsyncIterator]]],
+    static_parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    return_type: EngineReturnType,
+    max_in_flight: int,
+) -> AsyncIterator[Union[State, Any]]:
+    in_flight: Deque[PrefectFuture] = collections.deque()
+    exhausted = False
+
+    while True:
+        if not exhausted and len(in_flight) <= max_in_flight // 2:
+            chunk = await _atake_stream_chunk(
+                streams, size=max_in_flight - len(in_flight)
+            )
+            exhausted = chunk is None
+            if not exhausted:
+                in_flight.extend(
+                    await enter_task_run_engine(
+                        task,
+                        parameters={**static_parameters, **chunk},
+                        wait_for=wait_for,
+                        return_type="future",
+                        task_runner=None,
+                        mapped=True,
+                    )
+                )
+
+        if not in_flight:
+            return
+
+        future = in_flight.popleft()
+        retval = await (future.wait() if return_type == "state" else future.result())
+        _forget_task_run_future(flow_run_context, future)
+        yield retval
+
+
+def _split_streamed_parameters(
+    parameters: Dict[str, Any]
+) -> Tuple[Dict[str, Tuple[Any, Union[Iterator, AsyncIterator]]], Dict[str, Any]]:
+    """
+    Split parameters into iterators over the streamed values and static parameters.
+
+    Static parameters are marked as `unmapped` so they are passed as-is to each chunk
+    of the map. Annotations on streamed parameters are reapplied to each chunk.
+    """
+    streams = {}
+    static_parameters = {}
+
+    for key, val in parameters.items():
+        annotation = None
+        if isinstance(val, (allow_failure, quote)):
+            annotation, val = val, val.unwrap()
+
+        if isinstance(val, unmapped) or not (
+            isiterable(val) or isinstance(val, AsyncIterable)
+        ):
+            static_parameters[key] = unmapped(parameters[key])
+        elif isinstance(val, AsyncIterable):
+            streams[key] = (annotation, val.__aiter__())
+        else:
+            streams[key] = (annotation, iter(val))
+
+    if not streams:
+        raise MappingMissingIterable(
+            "No iterable parameters were received. Parameters for map must "
+            f"include at least one iterable. Parameters: {parameters}"
+        )
+
+    return streams, static_parameters
+
+
+def _resolve_max_in_flight(max_in_flight: Optional[int]) -> int:
+    if max_in_flight is None:
+        max_in_flight = PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT.value()
+    if max_in_flight < 1:
+        raise ValueError(
+            f"`max_in_flight` must be a positive integer. Got {max_in_flight!r}."
+        )
+    return max_in_flight
+
+
+def _build_stream_chunk(
+    streams: Dict[str, Tuple[Any, Any]], rows: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    if not rows:
+        return None
+
+    chunk = {}
+    for key, (annotation, _) in streams.items():
+        values = [row[key] for row in rows]
+        chunk[key] = annotation.rewrap(values) if annotation else values
+    return chunk
+
+
+def _check_stream_row(streams: Dict[str, Any], row: Dict[str, Any]) -> bool:
+    """
+    Returns `True` if a row of streamed values is complete or `False` if all of the
+    streams are exhausted.
+    """
+    if row and len(row) != len(streams):
+        raise MappingLengthMismatch(
+            "Received iterable parameters with different lengths. Parameters for map"
+            " must all be the same length. Exhausted:"
+            f" {sorted(set(streams) - set(row))}"
+        )
+    return bool(row)
+
+
+def _take_stream_chunk(
+    streams: Dict[str, Tuple[Any, Iterator]], size: int
+) -> Optional[Dict[str, Any]]:
+    rows = []
+    while len(rows) < size:
+        row = {}
+        for key, (_, stream) in streams.items():
+            try:
+                row[key] = next(stream)
+            except StopIteration:
+                pass
+
+        if not _check_stream_row(streams, row):
+            break
+        rows.append(row)
+
+    return _build_stream_chunk(streams, rows)
+
+
+async def _atake_stream_chunk(
+    streams: Dict[str, Tuple[Any, Union[Iterator, AsyncIterator]]], size: int
+) -> Optional[Dict[str, Any]]:
+    rows = []
+    while len(rows) < size:
+        row = {}
+        for key, (_, stream) in streams.items():
+            try:
+                if isinstance(stream, AsyncIterator):
+                    row[key] = await stream.__anext__()
+                else:
+                    row[key] = next(stream)
+            except (StopIteration, StopAsyncIteration):
+                pass
+
+        if not _check_stream_row(streams, row):
+            break
+        rows.append(row)
+
+    return _build_stream_chunk(streams, rows)
+
+
+def _forget_task_run_future(
+    flow_run_context: FlowRunContext, future: PrefectFuture
+) -> None:
+    """
+    Stop tracking a finished task run future in the flow run context so streamed task
+    runs do not accumulate in memory.
+    """
+    try:
+        flow_run_context.task_run_futures.remove(future)
+    except ValueError:
+        pass
+
+
+async def create_mapped_task_run_futures(
+    task: Task,
+    flow_run_context: FlowRunContext,
+    parameters: List[Dict[str, Any]],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: BaseTaskRunner,
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> List[PrefectFuture]:
+    """
+    Create a future for each set of mapped call parameters.
+
+    The task runs backing the futures are created in batches of
+    `PREFECT_TASK_MAP_CREATE_BATCH_SIZE` with a single API call per batch, rather
+    than with a call per task run.
+    """
+    dynamic_keys = []
+    futures = []
+    for _ in parameters:
+        dynamic_key = _dynamic_key_for_task_run(flow_run_context, task)
+        future = PrefectFuture(
+            name=f"{task.name}-{dynamic_key}",
+            key=uuid4(),
+            task_runner=task_runner,
+            asynchronous=task.isasync and flow_run_context.flow.isasync,
+        )
 
-        task_runs.append(
-            partial(
-                get_task_call_return_value,
+        # Track the task run future in the flow run context
+        flow_run_context.task_run_futures.append(future)
+
+        dynamic_keys.append(dynamic_key)
+        futures.append(future)
+
+    create_then_submit = partial(
+        create_task_runs_then_submit,
+        task=task,
+        futures=futures,
+        task_run_dynamic_keys=dynamic_keys,
+        flow_run_context=flow_run_context,
+        parameters=parameters,
+        wait_for=wait_for,
+        task_runner=task_runner,
+        extra_task_inputs=extra_task_inputs,
+    )
+
+    # Maintain the order of the task runs when using the sequential task runner
+    if task_runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
+        await create_then_submit()
+    else:
+        # Create and submit the task runs in the background
+        flow_run_context.background_tasks.start_soon(create_then_submit)
+
+    # Return the futures without waiting for task run creation or submission
+    return futures
+
+
+async def create_task_runs_then_submit(
+    task: Task,
+    futures: List[PrefectFuture],
+    task_run_dynamic_keys: List[str],
+    flow_run_context: FlowRunContext,
+    parameters: List[Dict[str, Any]],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    task_runner: BaseTaskRunner,
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> None:
+    batches = batched_iterable(
+        zip(futures, task_run_dynamic_keys, parameters),
+        PREFECT_TASK_MAP_CREATE_BATCH_SIZE.value(),
+    )
+    for batch in batches:
+        batch_futures, batch_dynamic_keys, batch_parameters = zip(*batch)
+
+        task_runs = await create_task_runs(
+            task=task,
+            names=[future.name for future in batch_futures],
+            flow_run_context=flow_run_context,
+            parameters=batch_parameters,
+            dynamic_keys=batch_dynamic_keys,
+            wait_for=wait_for,
+            extra_task_inputs=extra_task_inputs,
+        )
+
+        for future, call_parameters, task_run in zip(
+            batch_futures, batch_parameters, task_runs
+        ):
+            # Attach the task run to the future to support `get_state` operations
+            future.task_run = task_run
+
+            await submit_task_run(
                 task=task,
+                future=future,
                 flow_run_context=flow_run_context,
                 parameters=call_parameters,
+                task_run=task_run,
                 wait_for=wait_for,
-                return_type=return_type,
                 task_runner=task_runner,
-                extra_task_inputs=task_inputs,
             )
-        )
 
-    # Maintain the order of the task runs when using the sequential task runner
-    runner = task_runner if task_runner else flow_run_context.task_runner
-    if runner.concurrency_type == TaskConcurrencyType.SEQUENTIAL:
-        return [await task_run() for task_run in task_runs]
-
-    return await gather(*task_runs)
+            future._submitted.set()
 
 
 async def collect_task_run_inputs(expr: Any, max_depth: int = -1) -> Set[TaskRunInput]:
@@ -1313,13 +1732,11 @@ async def create_task_run(
     wait_for: Optional[Iterable[PrefectFuture]],
     extra_task_inputs: Dict[str, Set[TaskRunInput]],
 ) -> TaskRun:
-    task_inputs = {k: await collect_task_run_inputs(v) for k, v in parameters.items()}
-    if wait_for:
-        task_inputs["wait_for"] = await collect_task_run_inputs(wait_for)
-
-    # Join extra task inputs
-    for k, extras in extra_task_inputs.items():
-        task_inputs[k] = task_inputs[k].union(extras)
+    task_inputs = await collect_task_run_inputs_for_call(
+        parameters=parameters,
+        wait_for=wait_for,
+        extra_task_inputs=extra_task_inputs,
+    )
 
     logger = get_run_logger(flow_run_context)
 
@@ -1338,6 +1755,76 @@ async def create_task_run(
     return task_run
 
 
+async def create_task_runs(
+    task: Task,
+    names: List[str],
+    flow_run_context: FlowRunContext,
+    parameters: List[Dict[str, Any]],
+    dynamic_keys: List[str],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> List[TaskRun]:
+    """
+    Create many runs of the same task with a single API call.
+    """
+    tags = set(task.tags).union(TagsContext.get().current_tags)
+    empirical_policy = TaskRunPolicy(
+        retries=task.retries,
+        retry_delay=task.retry_delay_seconds,
+        retry_jitter_factor=task.retry_jitter_factor,
+    )
+
+    task_run_data = []
+    for name, dynamic_key, call_parameters in zip(names, dynamic_keys, parameters):
+        task_inputs = await collect_task_run_inputs_for_call(
+            parameters=call_parameters,
+            wait_for=wait_for,
+            extra_task_inputs=extra_task_inputs,
+        )
+        task_run_data.append(
+            TaskRunCreate(
+                name=name,
+                flow_run_id=flow_run_context.flow_run.id,
+                task_key=task.task_key,
+                dynamic_key=dynamic_key,
+                tags=list(tags),
+                task_version=task.version,
+                empirical_policy=empirical_policy,
+                state=Pending().to_state_create(),
+                task_inputs=task_inputs,
+            )
+        )
+
+    logger = get_run_logger(flow_run_context)
+
+    task_runs = await flow_run_context.client.create_task_runs(task_run_data)
+
+    for task_run in task_runs:
+        logger.info(f"Created task run {task_run.name!r} for task {task.name!r}")
+
+    return task_runs
+
+
+async def collect_task_run_inputs_for_call(
+    parameters: Dict[str, Any],
+    wait_for: Optional[Iterable[PrefectFuture]],
+    extra_task_inputs: Dict[str, Set[TaskRunInput]],
+) -> Dict[str, Set[TaskRunInput]]:
+    """
+    Collect the task run inputs for each parameter of a task call, including any
+    upstream `wait_for` dependencies and extra inputs tracked by the caller.
+    """
+    task_inputs = {k: await collect_task_run_inputs(v) for k, v in parameters.items()}
+    if wait_for:
+        task_inputs["wait_for"] = await collect_task_run_inputs(wait_for)
+
+    # Join extra task inputs
+    for k, extras in extra_task_inputs.items():
+        task_inputs[k] = task_inputs[k].union(extras)
+
+    return task_inputs
+
+
 async def submit_task_run(
     task: Task,
     future: PrefectFuture,
@@ -1382,12 +1869,17 @@ async def begin_task_run(
     result_factory: ResultFactory,
     log_prints: bool,
     settings: prefect.context.SettingsContext,
+    client: Optional[PrefectClient] = None,
 ):
     """
     Entrypoint for task run execution.
 
     This function is intended for submission to the task runner.
 
+    If the task run is not executed in the same thread as its flow run, a new client
+    is created for it unless an open `client` is provided, e.g. by a task runner that
+    reuses its clients across task runs.
+
     This method may be called from a worker so we ensure the settings context has been
     entered. For example, with a runner that is executing tasks in the same event loop,
     we will likely not enter the context again because the current context already
@@ -1427,8 +1919,9 @@ async def begin_task_run(
             # worker, the flow run timeout will not be raised in the worker process.
             interruptible = maybe_flow_run_context.timeout_scope is not None
         else:
-            # Otherwise, retrieve a new client
-            client = await stack.enter_async_context(get_client())
+            # Otherwise, use the given client or retrieve a new one
+            if client is None:
+                client = await stack.enter_async_context(get_client())
             interruptible = False
             await stack.enter_async_context(anyio.create_task_group())
 
@@ -1520,7 +2013,14 @@ async def orchestrate_task_run(
     Returns:
         The final state of the run
     """
-    flow_run = await client.read_flow_run(task_run.flow_run_id)
+    # The flow run is only used for logging; reuse the flow run of the current context
+    # if possible and otherwise allow a recently read flow run to be reused
+    flow_run_context = FlowRunContext.get()
+    if flow_run_context and flow_run_context.flow_run.id == task_run.flow_run_id:
+        flow_run = flow_run_context.flow_run
+    else:
+        with client.cached_reads(ttl_seconds=TASK_RUN_FLOW_RUN_CACHE_SECONDS):
+            flow_run = await client.read_flow_run(task_run.flow_run_id)
     logger = task_run_logger(task_run, task=task, flow_run=flow_run)
 
     partial_task_run_context = PartialModel(
@@ -1873,6 +2373,9 @@ async def resolve_inputs(
     futures = set()
     states = set()
     result_by_state = {}
+    # Parameters that contain futures, states, or annotations; when data is not
+    # returned, all others are not visited again
+    parameters_to_resolve = set()
 
     if not parameters:
         return {}
@@ -1884,18 +2387,24 @@ async def resolve_inputs(
 
         if isinstance(expr, PrefectFuture):
             futures.add(expr)
-        if is_state(expr):
+        elif is_state(expr):
             states.add(expr)
+        elif not isinstance(expr, BaseAnnotation):
+            return expr
 
+        parameters_to_resolve.add(context["parameter"])
         return expr
 
-    visit_collection(
-        parameters,
-        visit_fn=collect_futures_and_states,
-        return_data=False,
-        max_depth=max_depth,
-        context={},
-    )
+    if max_depth != 0:
+        for parameter, value in parameters.items():
+            visit_collection(
+                value,
+                visit_fn=collect_futures_and_states,
+                return_data=False,
+                # we're manually going 1 layer deeper here
+                max_depth=max_depth - 1,
+                context={"parameter": parameter},
+            )
 
     # Wait for all futures so we do not block when we retrieve the state in `resolve_input`
     states.update(await asyncio.gather(*[future._wait() for future in futures]))
@@ -1948,6 +2457,10 @@ async def resolve_inputs(
 
     resolved_parameters = {}
     for parameter, value in parameters.items():
+        if not return_data and parameter not in parameters_to_resolve:
+            resolved_parameters[parameter] = None
+            continue
+
         try:
             resolved_parameters[parameter] = visit_collection(
                 value,
@@ -1957,6 +2470,8 @@ async def resolve_inputs(
                 max_depth=max_depth - 1,
                 remove_annotations=True,
                 context={},
+                # collections without futures or states are passed to the task as-is
+                copy_unchanged=False,
             )
         except UpstreamTaskError:
             raise
@@ -2037,7 +2552,20 @@ async def propose_state(
 
     # Attempt to set the state
     if task_run_id:
-        set_state = partial(client.set_task_run_state, task_run_id, state, force=force)
+        flow_run_context = FlowRunContext.get()
+        pipeline = (
+            flow_run_context.task_run_state_pipeline if flow_run_context else None
+        )
+
+        if pipeline and pipeline.client is client:
+            # Batch the proposal with those of other task runs in the flow run
+            set_state = partial(
+                pipeline.set_task_run_state, task_run_id, state, force=force
+            )
+        else:
+            set_state = partial(
+                client.set_task_run_state, task_run_id, state, force=force
+            )
         response = await set_state_and_handle_waits(set_state)
     elif flow_run_id:
         set_state = partial(client.set_flow_run_state, flow_run_id, state, force=force)
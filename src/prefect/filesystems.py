@@ -1,7 +1,10 @@
 import abc
 import io
 import json
+import mmap
+import os
 import urllib.parse
+import uuid
 from pathlib import Path
 from shutil import ignore_patterns
 from tempfile import TemporaryDirectory
@@ -65,6 +68,14 @@ class WritableDeploymentStorage(Block, abc.ABC):
         pass
 
 
+def _map_file(path: Path) -> memoryview:
+    with open(path, mode="rb") as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b"")
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY))
+
+
 class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
     """
     Store data as a file on a local file system.
@@ -193,8 +204,7 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
                 dirs_exist_ok=True,
             )
 
-    @sync_compatible
-    async def read_path(self, path: str) -> bytes:
+    def _resolve_file_path(self, path: str) -> Path:
         path: Path = self._resolve_path(path)
 
         # Check if the path exists
@@ -205,11 +215,28 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         if not path.is_file():
             raise ValueError(f"Path {path} is not a file.")
 
+        return path
+
+    @sync_compatible
+    async def read_path(self, path: str) -> bytes:
+        path = self._resolve_file_path(path)
+
         async with await anyio.open_file(str(path), mode="rb") as f:
             content = await f.read()
 
         return content
 
+    @sync_compatible
+    async def read_path_mapped(self, path: str) -> memoryview:
+        """
+        Map a file into memory instead of reading it.
+
+        Pages of the file are only loaded when accessed. The returned view is
+        writable, but writes are private to this process and are not persisted.
+        """
+        path = self._resolve_file_path(path)
+        return await run_sync_in_worker_thread(_map_file, path)
+
     @sync_compatible
     async def write_path(self, path: str, content: bytes) -> str:
         path: Path = self._resolve_path(path)
@@ -221,8 +248,22 @@ class LocalFileSystem(WritableFileSystem, WritableDeploymentStorage):
         if path.exists() and not path.is_file():
             raise ValueError(f"Path {path} already exists and is not a file.")
 
-        async with await anyio.open_file(path, mode="wb") as f:
-            await f.write(content)
+        # Write to a temporary file and move it into place so that existing memory
+        # mappings of the file are never truncated
+        temporary_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            async with await anyio.open_file(temporary_path, mode="wb") as f:
+                await f.write(content)
+            os.replace(temporary_path, path)
+        except PermissionError:
+            # Windows does not allow replacing a file that is open or mapped; write
+            # it in place instead, which fails in turn if the file is still mapped
+            async with await anyio.open_file(path, mode="wb") as f:
+                await f.write(content)
+        finally:
+            if temporary_path.exists():
+                temporary_path.unlink()
+
         # Leave path stringify to the OS
         return str(path)
 
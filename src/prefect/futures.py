@@ -355,6 +355,7 @@ async def resolve_futures_to_data(
         visit_fn=replace_futures_with_results,
         return_data=True,
         context={},
+        copy_unchanged=False,
     )
 
 
@@ -403,6 +404,7 @@ async def resolve_futures_to_states(
         visit_fn=replace_futures_with_states,
         return_data=True,
         context={},
+        copy_unchanged=False,
     )
 
 
@@ -1,11 +1,17 @@
 import abc
+import json
+import struct
+import threading
 import uuid
+from collections import OrderedDict
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Dict,
     Generic,
+    Iterable,
     Optional,
     Tuple,
     Type,
@@ -25,6 +31,8 @@ from prefect.logging import get_logger
 from prefect.serializers import Serializer
 from prefect.settings import (
     PREFECT_LOCAL_STORAGE_PATH,
+    PREFECT_RESULTS_BINARY_BLOBS,
+    PREFECT_RESULTS_CACHE_MAX_BYTES,
     PREFECT_RESULTS_DEFAULT_SERIALIZER,
     PREFECT_RESULTS_PERSIST_BY_DEFAULT,
 )
@@ -40,6 +48,8 @@ if TYPE_CHECKING:
 ResultStorage = Union[WritableFileSystem, str]
 ResultSerializer = Union[Serializer, str]
 LITERAL_TYPES = {type(None), bool}
+BINARY_BLOB_MAGIC = b"PREFECT\x01"
+BINARY_BLOB_ALIGNMENT = 64
 
 
 def DEFAULT_STORAGE_KEY_FN():
@@ -110,6 +120,120 @@ def _format_user_supplied_storage_key(key):
     return key.format(**runtime_vars, parameters=prefect.runtime.task_run.parameters)
 
 
+class ResultCache:
+    """
+    A process-wide, thread-safe cache of persisted result objects.
+
+    Entries are keyed by storage block id and storage key and are sized by the length
+    of their serialized data. When the total size exceeds the byte budget, the least
+    recently used entries are evicted. The budget defaults to the value of
+    `PREFECT_RESULTS_CACHE_MAX_BYTES` at the time of each insertion.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries: "OrderedDict[Tuple[uuid.UUID, str], Tuple[Any, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, storage_block_id: uuid.UUID, storage_key: str) -> Any:
+        """
+        Retrieve a cached object, marking it as recently used.
+
+        Returns `NotSet` if the object is not in the cache.
+        """
+        key = (storage_block_id, storage_key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return NotSet
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(
+        self, storage_block_id: uuid.UUID, storage_key: str, obj: Any, size: int
+    ) -> None:
+        """
+        Add an object to the cache, replacing any existing entry for the same key.
+
+        Objects larger than the byte budget are not cached.
+        """
+        key = (storage_block_id, storage_key)
+        max_bytes = self._get_max_bytes()
+
+        with self._lock:
+            self._discard(key)
+            if size > max_bytes:
+                return
+
+            self._entries[key] = (obj, size)
+            self.size += size
+
+            while self.size > max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+
+    def discard(self, storage_block_id: uuid.UUID, storage_key: str) -> None:
+        """
+        Remove an object from the cache if present.
+        """
+        with self._lock:
+            self._discard((storage_block_id, storage_key))
+
+    def clear(self) -> None:
+        """
+        Remove all objects from the cache and reset its counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters.
+        """
+        with self._lock:
+            return dict(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                size=self.size,
+            )
+
+    def _discard(self, key: Tuple[uuid.UUID, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def _get_max_bytes(self) -> int:
+        if self.max_bytes is not None:
+            return self.max_bytes
+        return PREFECT_RESULTS_CACHE_MAX_BYTES.value()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_result_cache = ResultCache()
+
+
+def get_result_cache() -> ResultCache:
+    """
+    Get the process-wide cache used to retrieve persisted results.
+    """
+    return _result_cache
+
+
 class ResultFactory(pydantic.BaseModel):
     """
     A utility to generate `Result` types.
@@ -453,7 +577,8 @@ class PersistedResult(BaseResult):
     Result type which stores a reference to a persisted result.
 
     When created, the user's object is serialized and stored. The format for the content
-    is defined by `PersistedResultBlob`. This reference contains metadata necessary for retrieval
+    is defined by `PersistedResultBlob`, or by `BinaryPersistedResultBlob` if
+    `PREFECT_RESULTS_BINARY_BLOBS` is enabled. This reference contains metadata necessary for retrieval
     of the object, such as a reference to the storage block and the key where the
     content was written.
     """
@@ -476,21 +601,49 @@ class PersistedResult(BaseResult):
         if self.has_cached_object():
             return self._cache
 
-        blob = await self._read_blob(client=client)
-        obj = blob.serializer.loads(blob.data)
+        result_cache = get_result_cache()
+        if self._should_cache_object:
+            obj = result_cache.get(self.storage_block_id, self.storage_key)
+            if obj is not NotSet:
+                self._cache_object(obj)
+                return obj
+
+        content = await self._read_content(client=client)
+        obj = self._load_blob(content).load()
 
         if self._should_cache_object:
             self._cache_object(obj)
+            result_cache.put(
+                self.storage_block_id, self.storage_key, obj, size=len(content)
+            )
 
         return obj
 
     @inject_client
-    async def _read_blob(self, client: "PrefectClient") -> "PersistedResultBlob":
+    async def _read_blob(
+        self, client: "PrefectClient"
+    ) -> Union["PersistedResultBlob", "BinaryPersistedResultBlob"]:
+        content = await self._read_content(client=client)
+        return self._load_blob(content)
+
+    @inject_client
+    async def _read_content(self, client: "PrefectClient") -> Union[bytes, memoryview]:
         block_document = await client.read_block_document(self.storage_block_id)
         storage_block: ReadableFileSystem = Block._from_block_document(block_document)
-        content = await storage_block.read_path(self.storage_key)
-        blob = PersistedResultBlob.parse_raw(content)
-        return blob
+
+        if isinstance(storage_block, LocalFileSystem):
+            # Map local files into memory so binary blobs are loaded without copies
+            return await storage_block.read_path_mapped(self.storage_key)
+
+        return await storage_block.read_path(self.storage_key)
+
+    @staticmethod
+    def _load_blob(
+        content: Union[bytes, memoryview]
+    ) -> Union["PersistedResultBlob", "BinaryPersistedResultBlob"]:
+        if BinaryPersistedResultBlob.is_binary(content):
+            return BinaryPersistedResultBlob.from_buffer(content)
+        return PersistedResultBlob.parse_raw(bytes(content))
 
     @staticmethod
     def _infer_path(storage_block, key) -> str:
@@ -521,8 +674,16 @@ class PersistedResult(BaseResult):
         The object will be serialized and written to the storage block under a unique
         key. It will then be cached on the returned result.
         """
-        data = serializer.dumps(obj)
-        blob = PersistedResultBlob(serializer=serializer, data=data)
+        if PREFECT_RESULTS_BINARY_BLOBS.value():
+            payload, buffers = serializer.dumps_raw(obj)
+            blob = BinaryPersistedResultBlob(
+                serializer=serializer, payload=payload, buffers=buffers
+            )
+        else:
+            blob = PersistedResultBlob(
+                serializer=serializer, data=serializer.dumps(obj)
+            )
+        content = blob.to_bytes()
 
         key = storage_key_fn()
         if not isinstance(key, str):
@@ -530,7 +691,7 @@ class PersistedResult(BaseResult):
                 f"Expected type 'str' for result storage key; got value {key!r}"
             )
 
-        await storage_block.write_path(key, content=blob.to_bytes())
+        await storage_block.write_path(key, content=content)
 
         description = f"Result of type `{type(obj).__name__}`"
         uri = cls._infer_path(storage_block, key)
@@ -553,6 +714,10 @@ class PersistedResult(BaseResult):
         if cache_object:
             # Attach the object to the result so it's available without deserialization
             result._cache_object(obj)
+            get_result_cache().put(storage_block_id, key, obj, size=len(content))
+        else:
+            # The key may have been written before; do not serve the stale object
+            get_result_cache().discard(storage_block_id, key)
 
         object.__setattr__(result, "_should_cache_object", cache_object)
 
@@ -570,5 +735,96 @@ class PersistedResultBlob(pydantic.BaseModel):
     data: bytes
     prefect_version: str = pydantic.Field(default=prefect.__version__)
 
+    def load(self) -> Any:
+        return self.serializer.loads(self.data)
+
     def to_bytes(self) -> bytes:
         return self.json().encode()
+
+
+class BinaryPersistedResultBlob:
+    """
+    The binary format of the content stored by a persisted result.
+
+    The content starts with `BINARY_BLOB_MAGIC` and the length of a JSON header as a
+    little-endian unsigned 32-bit integer. The header describes the serializer and the
+    location of the serializer's raw payload and out-of-band buffers, which follow it
+    aligned to `BINARY_BLOB_ALIGNMENT` bytes. Since the payload and buffers are stored
+    as-is, they can be loaded straight from a memory-mapped file.
+    """
+
+    def __init__(
+        self,
+        serializer: Serializer,
+        payload: Union[bytes, memoryview],
+        buffers: Iterable[Union[bytes, memoryview]] = (),
+        prefect_version: str = prefect.__version__,
+    ):
+        self.serializer = serializer
+        self.payload = payload
+        self.buffers = list(buffers)
+        self.prefect_version = prefect_version
+
+    def load(self) -> Any:
+        return self.serializer.loads_raw(memoryview(self.payload), self.buffers)
+
+    def to_bytes(self) -> bytes:
+        sections = [
+            memoryview(section).cast("B") for section in (self.payload, *self.buffers)
+        ]
+
+        # Section offsets are relative to the aligned end of the header
+        locations = []
+        offset = 0
+        for section in sections:
+            locations.append((offset, len(section)))
+            offset = _align(offset + len(section))
+
+        header = json.dumps(
+            dict(
+                serializer=json.loads(self.serializer.json()),
+                prefect_version=self.prefect_version,
+                sections=locations,
+            )
+        ).encode()
+        prefix = BINARY_BLOB_MAGIC + struct.pack("<I", len(header)) + header
+
+        parts = [prefix, _padding(len(prefix))]
+        for section in sections:
+            parts += [section, _padding(len(section))]
+        return b"".join(parts)
+
+    @classmethod
+    def from_buffer(cls, content: Union[bytes, memoryview]) -> Self:
+        """
+        Load a blob from its binary content without copying its payload or buffers.
+        """
+        content = memoryview(content)
+        position = len(BINARY_BLOB_MAGIC)
+        (header_size,) = struct.unpack("<I", content[position : position + 4])
+        position += 4
+        header = json.loads(bytes(content[position : position + header_size]))
+        position = _align(position + header_size)
+
+        payload, *buffers = [
+            content[position + start : position + start + length]
+            for start, length in header["sections"]
+        ]
+        return cls(
+            serializer=Serializer.parse_obj(header["serializer"]),
+            payload=payload,
+            buffers=buffers,
+            prefect_version=header["prefect_version"],
+        )
+
+    @staticmethod
+    def is_binary(content: Union[bytes, memoryview]) -> bool:
+        return bytes(content[: len(BINARY_BLOB_MAGIC)]) == BINARY_BLOB_MAGIC
+
+
+def _align(offset: int) -> int:
+    return -(-offset // BINARY_BLOB_ALIGNMENT) * BINARY_BLOB_ALIGNMENT
+
+
+def _padding(offset: int) -> bytes:
+    return bytes(_align(offset) - offset)
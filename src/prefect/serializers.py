@@ -13,7 +13,7 @@ bytes to an object respectively.
 import abc
 import base64
 import warnings
-from typing import Any, Generic, Optional, TypeVar
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
 
 import pydantic
 from pydantic import BaseModel
@@ -72,6 +72,21 @@ class Serializer(BaseModel, Generic[D], abc.ABC):
     def loads(self, blob: bytes) -> D:
         """Decode the blob of bytes into an object."""
 
+    def dumps_raw(self, obj: D) -> Tuple[bytes, List[memoryview]]:
+        """
+        Encode the object into a raw payload and a list of out-of-band buffers.
+
+        Used for binary result blobs, which store the payload and buffers without any
+        further encoding. Defaults to the output of `dumps` with no buffers.
+        """
+        return self.dumps(obj), []
+
+    def loads_raw(self, payload: memoryview, buffers: List[memoryview]) -> D:
+        """
+        Decode a raw payload and its out-of-band buffers into an object.
+        """
+        return self.loads(bytes(payload))
+
     class Config:
         extra = "forbid"
 
@@ -154,6 +169,24 @@ class PickleSerializer(Serializer):
         pickler = from_qualified_name(self.picklelib)
         return pickler.loads(base64.decodebytes(blob))
 
+    def dumps_raw(self, obj: Any) -> Tuple[bytes, List[memoryview]]:
+        pickler = from_qualified_name(self.picklelib)
+        buffers = []
+        try:
+            # Protocol 5 allows large buffers, e.g. NumPy arrays, to be stored
+            # out-of-band and loaded later without copying them
+            payload = pickler.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        except (TypeError, ValueError):
+            # The pickle library does not support protocol 5 or out-of-band buffers
+            return pickler.dumps(obj), []
+        return payload, [buffer.raw() for buffer in buffers]
+
+    def loads_raw(self, payload: memoryview, buffers: List[memoryview]) -> Any:
+        pickler = from_qualified_name(self.picklelib)
+        if buffers:
+            return pickler.loads(payload, buffers=buffers)
+        return pickler.loads(payload)
+
 
 class JSONSerializer(Serializer):
     """
@@ -1,12 +1,15 @@
 """
 Routes for admin-level interactions with the Prefect REST API.
 """
+from typing import Any, Dict
+
 from fastapi import Body, Depends, Response, status
 
 import prefect
 import prefect.settings
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.orchestration.profiling import get_orchestration_profiler
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(prefix="/admin", tags=["Admin"])
@@ -28,6 +31,23 @@ async def read_version() -> str:
     return prefect.__version__
 
 
+@router.get("/orchestration/stats")
+async def read_orchestration_stats() -> Dict[str, Any]:
+    """
+    Get histograms of the duration, database statement count, and time spent in each
+    orchestration rule of the state transitions orchestrated by this API server process.
+
+    Durations are in seconds.
+    """
+    return get_orchestration_profiler().stats()
+
+
+@router.delete("/orchestration/stats", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_orchestration_stats():
+    """Discard the recorded orchestration statistics."""
+    get_orchestration_profiler().reset()
+
+
 @router.post("/database/clear", status_code=status.HTTP_204_NO_CONTENT)
 async def clear_database(
     db: PrefectDBInterface = Depends(provide_database_interface),
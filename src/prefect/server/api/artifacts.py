@@ -1,7 +1,7 @@
 """
 Routes for interacting with artifact objects.
 """
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 import pendulum
@@ -11,7 +11,8 @@ import prefect.server.api.dependencies as dependencies
 from prefect.server import models
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.schemas import actions, core, filters, sorting
+from prefect.server.schemas import actions, core, filters, responses, sorting
+from prefect.server.utilities import pagination
 from prefect.server.utilities.server import PrefectRouter
 
 router = PrefectRouter(
@@ -109,6 +110,48 @@ async def read_artifacts(
         )
 
 
+@router.post("/paginate")
+async def paginate_artifacts(
+    sort: sorting.ArtifactSort = Body(sorting.ArtifactSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page, if any."
+    ),
+    artifacts: filters.ArtifactFilter = None,
+    flow_runs: filters.FlowRunFilter = None,
+    task_runs: filters.TaskRunFilter = None,
+    flows: filters.FlowFilter = None,
+    deployments: filters.DeploymentFilter = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> responses.ArtifactPage:
+    """
+    Retrieve a page of artifacts, starting after the cursor of the previous page.
+    """
+    async with db.session_context() as session:
+
+        async def read(after: pagination.KeysetCursor, limit: int):
+            return await models.artifacts.read_artifacts(
+                session=session,
+                artifact_filter=artifacts,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                flow_filter=flows,
+                deployment_filter=deployments,
+                limit=limit,
+                sort=sort,
+                cursor=after,
+            )
+
+        try:
+            results, next_cursor = await pagination.read_page(
+                read, sort, sort.as_sql_sort(db), cursor, limit
+            )
+        except pagination.InvalidCursorError as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+        return responses.ArtifactPage(results=results, next_cursor=next_cursor)
+
+
 @router.post("/latest/filter")
 async def read_latest_artifacts(
     sort: sorting.ArtifactCollectionSort = Body(sorting.ArtifactCollectionSort.ID_DESC),
@@ -12,11 +12,30 @@ import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.orchestration.concurrency_slots import get_concurrency_slot_manager
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED
 
 router = PrefectRouter(prefix="/concurrency_limits", tags=["Concurrency Limits"])
 
 
+def _with_leased_slots(model) -> schemas.core.ConcurrencyLimit:
+    """
+    Report the slots tracked in memory as the active slots of a concurrency limit when
+    concurrency slot leases are enabled.
+    """
+    manager = get_concurrency_slot_manager()
+    if (
+        not PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED.value()
+        or not manager.is_tracking(model.tag)
+    ):
+        return model
+
+    return schemas.core.ConcurrencyLimit.from_orm(model).copy(
+        update={"active_slots": manager.active_slots(model.tag)}
+    )
+
+
 @router.post("/")
 async def create_concurrency_limit(
     concurrency_limit: schemas.actions.ConcurrencyLimitCreate,
@@ -58,7 +77,7 @@ async def read_concurrency_limit(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Concurrency limit not found"
         )
-    return model
+    return _with_leased_slots(model)
 
 
 @router.get("/tag/{tag}")
@@ -82,7 +101,7 @@ async def read_concurrency_limit_by_tag(
         raise HTTPException(
             status.HTTP_404_NOT_FOUND, detail="Concurrency limit not found"
         )
-    return model
+    return _with_leased_slots(model)
 
 
 @router.post("/filter")
@@ -98,11 +117,12 @@ async def read_concurrency_limits(
     currently using a concurrency slot for the specified tag.
     """
     async with db.session_context() as session:
-        return await models.concurrency_limits.read_concurrency_limits(
+        concurrency_limits = await models.concurrency_limits.read_concurrency_limits(
             session=session,
             limit=limit,
             offset=offset,
         )
+    return [_with_leased_slots(model) for model in concurrency_limits]
 
 
 @router.post("/tag/{tag}/reset")
@@ -124,6 +144,9 @@ async def reset_concurrency_limit_by_tag(
             status_code=status.HTTP_404_NOT_FOUND, detail="Concurrency limit not found"
         )
 
+    if PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED.value():
+        get_concurrency_slot_manager().reset_slots(tag, slot_override or [])
+
 
 @router.delete("/{id}")
 async def delete_concurrency_limit(
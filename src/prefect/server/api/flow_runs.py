@@ -3,12 +3,11 @@ Routes for interacting with flow run objects.
 """
 
 import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 import pendulum
-from fastapi import Body, Depends, HTTPException, Path, Response, status
-from fastapi.responses import ORJSONResponse
+from fastapi import Body, Depends, HTTPException, Path, Query, Response, status
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
@@ -17,12 +16,13 @@ from prefect.logging import get_logger
 from prefect.server.api.run_history import run_history
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.models.flow_runs import DependencyResult
+from prefect.server.models.flow_runs import DependencyGraphUpdate, DependencyResult
 from prefect.server.orchestration import dependencies as orchestration_dependencies
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities import pagination
 from prefect.server.utilities.schemas import DateTimeTZ
-from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.server import PrefectORJSONResponse, PrefectRouter
 
 logger = get_logger("server.api")
 
@@ -185,6 +185,28 @@ async def read_flow_run_graph(
         )
 
 
+@router.get("/{id}/graph/updates")
+async def read_flow_run_graph_updates(
+    flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
+    since: Optional[DateTimeTZ] = Query(
+        None,
+        description=(
+            "Only return task runs updated at or after this time. Pass the cursor of"
+            " the previous response to read subsequent updates. Task runs updated"
+            " shortly before the cursor are returned again and should be merged by id."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> DependencyGraphUpdate:
+    """
+    Get the task runs of a flow run's dependency map that changed since a cursor.
+    """
+    async with db.session_context() as session:
+        return await models.flow_runs.read_task_run_dependency_updates(
+            session=session, flow_run_id=flow_run_id, since=since
+        )
+
+
 @router.post("/{id}/resume")
 async def resume_flow_run(
     flow_run_id: UUID = Path(..., description="The flow run id", alias="id"),
@@ -247,7 +269,7 @@ async def resume_flow_run(
         return orchestration_result
 
 
-@router.post("/filter", response_class=ORJSONResponse)
+@router.post("/filter", response_class=PrefectORJSONResponse)
 async def read_flow_runs(
     sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
     limit: int = dependencies.LimitBody(),
@@ -285,7 +307,58 @@ async def read_flow_runs(
             schemas.responses.FlowRunResponse.from_orm(fr).dict(json_compatible=True)
             for fr in db_flow_runs
         ]
-        return ORJSONResponse(content=encoded)
+        return PrefectORJSONResponse(content=encoded)
+
+
+@router.post("/paginate", response_class=PrefectORJSONResponse)
+async def paginate_flow_runs(
+    sort: schemas.sorting.FlowRunSort = Body(schemas.sorting.FlowRunSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page, if any."
+    ),
+    flows: schemas.filters.FlowFilter = None,
+    flow_runs: schemas.filters.FlowRunFilter = None,
+    task_runs: schemas.filters.TaskRunFilter = None,
+    deployments: schemas.filters.DeploymentFilter = None,
+    work_pools: schemas.filters.WorkPoolFilter = None,
+    work_pool_queues: schemas.filters.WorkQueueFilter = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> schemas.responses.FlowRunPage:
+    """
+    Query for a page of flow runs, starting after the cursor of the previous page.
+    """
+    async with db.session_context() as session:
+
+        async def read(after: pagination.KeysetCursor, limit: int):
+            return await models.flow_runs.read_flow_runs(
+                session=session,
+                flow_filter=flows,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                deployment_filter=deployments,
+                work_pool_filter=work_pools,
+                work_queue_filter=work_pool_queues,
+                limit=limit,
+                sort=sort,
+                cursor=after,
+            )
+
+        try:
+            db_flow_runs, next_cursor = await pagination.read_page(
+                read, sort, sort.as_sql_sort(db), cursor, limit
+            )
+        except pagination.InvalidCursorError as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+        # Encode flow runs efficiently, as in `read_flow_runs`
+        encoded = [
+            schemas.responses.FlowRunResponse.from_orm(fr).dict(json_compatible=True)
+            for fr in db_flow_runs
+        ]
+        return PrefectORJSONResponse(
+            content={"results": encoded, "next_cursor": next_cursor}
+        )
 
 
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -2,19 +2,34 @@
 Routes for interacting with log objects.
 """
 
-from typing import List
+import datetime
+import json
+from typing import AsyncIterator, Dict, List, Optional
+from uuid import UUID
 
-from fastapi import Body, Depends, status
+from fastapi import Body, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 import prefect.server.api.dependencies as dependencies
 import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.log_buffer import get_log_buffer
+from prefect.server.utilities import pagination
+from prefect.server.utilities.log_notifications import get_log_notifier
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import (
+    PREFECT_API_DEFAULT_LIMIT,
+    PREFECT_API_LOG_STREAM_POLL_SECONDS,
+)
 
 router = PrefectRouter(prefix="/logs", tags=["Logs"])
 
+# Streams re-read logs with timestamps up to this long before the last streamed log, so
+# logs written late are still streamed
+LOG_STREAM_OVERLAP = datetime.timedelta(seconds=30)
+
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def create_logs(
@@ -22,6 +37,10 @@ async def create_logs(
     db: PrefectDBInterface = Depends(provide_database_interface),
 ):
     """Create new logs from the provided schema."""
+    log_buffer = get_log_buffer()
+    if log_buffer is not None and await log_buffer.put(logs):
+        return
+
     for batch in models.logs.split_logs_into_batches(logs):
         async with db.session_context(begin_transaction=True) as session:
             await models.logs.create_logs(session=session, logs=batch)
@@ -42,3 +61,166 @@ async def read_logs(
         return await models.logs.read_logs(
             session=session, log_filter=logs, offset=offset, limit=limit, sort=sort
         )
+
+
+@router.post("/paginate")
+async def paginate_logs(
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page, if any."
+    ),
+    logs: schemas.filters.LogFilter = None,
+    sort: schemas.sorting.LogSort = Body(schemas.sorting.LogSort.TIMESTAMP_ASC),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> schemas.responses.LogPage:
+    """
+    Query for a page of logs, starting after the cursor of the previous page.
+    """
+    async with db.session_context() as session:
+
+        async def read(after: pagination.KeysetCursor, limit: int):
+            return await models.logs.read_logs(
+                session=session, log_filter=logs, limit=limit, sort=sort, cursor=after
+            )
+
+        try:
+            results, next_cursor = await pagination.read_page(
+                read, sort, sort.as_sql_sort(db), cursor, limit
+            )
+        except pagination.InvalidCursorError as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+        return schemas.responses.LogPage(results=results, next_cursor=next_cursor)
+
+
+@router.get("/stream")
+async def stream_logs(
+    flow_run_id: UUID = Query(..., description="The flow run to stream logs for."),
+    cursor: Optional[str] = Query(
+        None,
+        description=(
+            "Only stream logs after this cursor, which is returned with every batch of"
+            " streamed logs."
+        ),
+    ),
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> StreamingResponse:
+    """
+    Stream the logs of a flow run in timestamp order, following new logs as they are
+    written until the flow run has finished.
+
+    The response is newline-delimited JSON. Each line is a batch of logs with the
+    cursor after the latest log streamed so far, `{"logs": [...], "cursor": "..."}`.
+    Batches without logs are sent as heartbeats while waiting for new logs.
+
+    Log timestamps are set by clients, so logs may be written after logs with later
+    timestamps. Logs written up to 30 seconds late are still streamed, after the logs
+    that were streamed before them.
+    """
+    sort = schemas.sorting.LogSort.TIMESTAMP_ASC
+    try:
+        after = pagination.decode_cursor(cursor, sort)
+    except pagination.InvalidCursorError as exc:
+        raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+    async with db.session_context() as session:
+        flow_run = await models.flow_runs.read_flow_run(
+            session=session, flow_run_id=flow_run_id
+        )
+    if not flow_run:
+        raise HTTPException(status.HTTP_404_NOT_FOUND, detail="Flow run not found")
+
+    return StreamingResponse(
+        _stream_flow_run_logs(db, flow_run_id, sort, after),
+        media_type="application/x-ndjson",
+    )
+
+
+async def _stream_flow_run_logs(
+    db: PrefectDBInterface,
+    flow_run_id: UUID,
+    sort: schemas.sorting.LogSort,
+    after: pagination.KeysetCursor,
+) -> AsyncIterator[bytes]:
+    log_filter = schemas.filters.LogFilter(flow_run_id={"any_": [flow_run_id]})
+    notifier = get_log_notifier()
+    poll_seconds = PREFECT_API_LOG_STREAM_POLL_SECONDS.value()
+    limit = PREFECT_API_DEFAULT_LIMIT.value()
+    cursor = pagination.encode_cursor(sort, after) if after.id else None
+    # Logs are never streamed from before the cursor the stream started at
+    start = after
+    # The ids and timestamps of the logs sent within the overlap window
+    sent: Dict[UUID, datetime.datetime] = {}
+    finished = False
+
+    while True:
+        # Log timestamps are set by clients, so logs may be written after logs with
+        # later timestamps; re-read the overlap window before the last sent log and
+        # skip the logs that were already sent
+        scan_from = start
+        if after.id is not None:
+            window_start = after.value - LOG_STREAM_OVERLAP
+            if start.id is None or window_start > start.value:
+                scan_from = pagination.KeysetCursor(window_start, UUID(int=0))
+
+        # Each page is read in its own session and sent as soon as it is read, so
+        # that a stream of a flow run with many logs starts at once and does not hold
+        # a connection or its logs in memory while catching up
+        sent_logs = False
+        while True:
+            async with db.session_context() as session:
+                logs = await models.logs.read_logs(
+                    session=session,
+                    log_filter=log_filter,
+                    limit=limit,
+                    sort=sort,
+                    cursor=scan_from,
+                )
+
+            batch = [log for log in logs if log.id not in sent]
+            if batch:
+                sent_logs = True
+                for log in batch:
+                    sent[log.id] = log.timestamp
+                # New logs are read in order, so the last one is the latest so far
+                # unless all of them were written late
+                last = pagination.cursor_after(batch[-1], sort.as_sql_sort(db))
+                if after.id is None or last > after:
+                    after = last
+                cursor = pagination.encode_cursor(sort, after)
+                yield json.dumps(
+                    {
+                        "logs": [
+                            schemas.core.Log.from_orm(log).dict(json_compatible=True)
+                            for log in batch
+                        ],
+                        "cursor": cursor,
+                    }
+                ).encode() + b"\n"
+
+                window_start = after.value - LOG_STREAM_OVERLAP
+                for log_id, timestamp in list(sent.items()):
+                    if timestamp < window_start:
+                        del sent[log_id]
+
+            if len(logs) < limit:
+                break
+            scan_from = pagination.cursor_after(logs[-1], sort.as_sql_sort(db))
+
+        if sent_logs:
+            continue
+
+        async with db.session_context() as session:
+            flow_run = await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=flow_run_id
+            )
+
+        if flow_run is None or flow_run.state_type in schemas.states.TERMINAL_STATES:
+            # logs may still be written shortly after the flow run finishes, so wait
+            # for them once more before ending the stream
+            if finished:
+                return
+            finished = True
+
+        yield json.dumps({"logs": [], "cursor": cursor}).encode() + b"\n"
+        await notifier.wait([flow_run_id], timeout=poll_seconds)
@@ -4,7 +4,9 @@ Utilities for querying flow and task run history.
 
 import datetime
 import json
-from typing import List
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Set
 
 import pydantic
 import sqlalchemy as sa
@@ -15,7 +17,12 @@ import prefect.server.schemas as schemas
 from prefect.logging import get_logger
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.models.run_history_rollups import (
+    RUN_HISTORY_ROLLUP_INTERVALS,
+    floor_datetime,
+)
 from prefect.server.utilities.schemas import DateTimeTZ
+from prefect.settings import PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED
 
 logger = get_logger("server.api")
 
@@ -37,6 +44,11 @@ async def run_history(
 ) -> List[schemas.responses.HistoryResponse]:
     """
     Produce a history of runs aggregated by interval and state
+
+    If the run history rollups service is enabled, intervals that have been rolled up
+    are read from the rollups when the filters only select flow runs by flow id,
+    deployment id, or work queue name. The remaining intervals are aggregated from the
+    runs.
     """
 
     # SQLite has issues with very small intervals
@@ -44,6 +56,236 @@ async def run_history(
     if history_interval < datetime.timedelta(seconds=1):
         raise ValueError("History interval must not be less than 1 second.")
 
+    history = []
+    rollup_filters = _rollup_filters(
+        run_type=run_type,
+        flows=flows,
+        flow_runs=flow_runs,
+        task_runs=task_runs,
+        deployments=deployments,
+        work_pools=work_pools,
+        work_queues=work_queues,
+    )
+    rollup_interval_seconds = _rollup_interval_seconds(history_start, history_interval)
+    if (
+        PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value()
+        and rollup_filters is not None
+        and rollup_interval_seconds is not None
+        and history_end > history_start
+    ):
+        state = await models.run_history_rollups.read_run_history_rollup_state(
+            session=session
+        )
+        rolled_up_until = state.get(run_type, {}).get("rolled_up_until")
+        if rolled_up_until is not None:
+            # only intervals that end before the rollups do are read from them
+            interval_seconds = history_interval.total_seconds()
+            count_intervals = min(
+                math.ceil(
+                    (history_end - history_start).total_seconds() / interval_seconds
+                ),
+                500,
+            )
+            count_rolled_up = min(
+                int(
+                    (rolled_up_until - history_start).total_seconds()
+                    // interval_seconds
+                ),
+                count_intervals,
+            )
+            if count_rolled_up > 0:
+                history = await _read_run_history_rollups(
+                    session=session,
+                    run_type=run_type,
+                    history_start=history_start,
+                    history_interval=history_interval,
+                    count_intervals=count_rolled_up,
+                    rollup_interval_seconds=rollup_interval_seconds,
+                    **rollup_filters,
+                )
+                if count_rolled_up == count_intervals:
+                    return history
+                history_start = history_start + count_rolled_up * history_interval
+
+    history += await _read_run_history(
+        session=session,
+        db=db,
+        run_type=run_type,
+        history_start=history_start,
+        history_end=history_end,
+        history_interval=history_interval,
+        flows=flows,
+        flow_runs=flow_runs,
+        task_runs=task_runs,
+        deployments=deployments,
+        work_pools=work_pools,
+        work_queues=work_queues,
+    )
+    # return no more than 500 bars
+    return history[:500]
+
+
+def _filter_any_criteria(
+    filter: Optional[schemas.filters.PrefectFilterBaseModel], fields: Set[str]
+) -> Optional[Dict[str, list]]:
+    """
+    Returns the `any_` values of the criteria of a filter, or `None` if the filter has
+    criteria other than `any_` on the given fields.
+    """
+    if filter is None:
+        return {}
+
+    criteria = filter.dict(exclude_none=True)
+    operator = criteria.pop("operator", schemas.filters.Operator.and_)
+    if len(criteria) > 1 and operator != schemas.filters.Operator.and_:
+        return None
+
+    values = {}
+    for field, criterion in criteria.items():
+        criterion.pop("operator", None)
+        if field not in fields or list(criterion) != ["any_"]:
+            return None
+        values[field] = criterion["any_"]
+    return values
+
+
+def _rollup_filters(
+    run_type: Literal["flow_run", "task_run"],
+    flows: Optional[schemas.filters.FlowFilter],
+    flow_runs: Optional[schemas.filters.FlowRunFilter],
+    task_runs: Optional[schemas.filters.TaskRunFilter],
+    deployments: Optional[schemas.filters.DeploymentFilter],
+    work_pools: Optional[schemas.filters.WorkPoolFilter],
+    work_queues: Optional[schemas.filters.WorkQueueFilter],
+) -> Optional[Dict[str, list]]:
+    """
+    Translates run history filters into filters on the dimensions of run history
+    rollups, returning `None` if the filters cannot be answered from rollups.
+    """
+    flow_criteria = _filter_any_criteria(flows, {"id"})
+    flow_run_criteria = _filter_any_criteria(
+        flow_runs, {"deployment_id", "work_queue_name"}
+    )
+    deployment_criteria = _filter_any_criteria(deployments, {"id"})
+    other_criteria = [
+        _filter_any_criteria(filter, set())
+        for filter in (task_runs, work_pools, work_queues)
+    ]
+    if None in (flow_criteria, flow_run_criteria, deployment_criteria, *other_criteria):
+        return None
+
+    # task runs are only rolled up by state
+    if run_type == "task_run" and (
+        flow_criteria or flow_run_criteria or deployment_criteria
+    ):
+        return None
+
+    deployment_ids = None
+    for ids in (deployment_criteria.get("id"), flow_run_criteria.get("deployment_id")):
+        if ids is not None:
+            deployment_ids = (
+                set(ids) if deployment_ids is None else deployment_ids.intersection(ids)
+            )
+
+    return dict(
+        flow_ids=flow_criteria.get("id"),
+        deployment_ids=list(deployment_ids) if deployment_ids is not None else None,
+        work_queue_names=flow_run_criteria.get("work_queue_name"),
+    )
+
+
+def _rollup_interval_seconds(
+    history_start: datetime.datetime, history_interval: datetime.timedelta
+) -> Optional[int]:
+    """
+    Returns the longest rollup interval the history intervals can be built from, or
+    `None` if the history intervals do not align with any rollup interval.
+    """
+    for interval_seconds in sorted(RUN_HISTORY_ROLLUP_INTERVALS, reverse=True):
+        if (
+            history_interval.total_seconds() % interval_seconds == 0
+            and floor_datetime(history_start, interval_seconds) == history_start
+        ):
+            return interval_seconds
+    return None
+
+
+async def _read_run_history_rollups(
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTimeTZ,
+    history_interval: datetime.timedelta,
+    count_intervals: int,
+    rollup_interval_seconds: int,
+    flow_ids: List = None,
+    deployment_ids: List = None,
+    work_queue_names: List[str] = None,
+) -> List[schemas.responses.HistoryResponse]:
+    """
+    Produce a history of runs aggregated by interval and state from run history rollups
+    """
+    rollups = await models.run_history_rollups.read_run_history_rollups(
+        session=session,
+        run_type=run_type,
+        interval_seconds=rollup_interval_seconds,
+        start_time=history_start,
+        end_time=history_start + count_intervals * history_interval,
+        flow_ids=flow_ids,
+        deployment_ids=deployment_ids,
+        work_queue_names=work_queue_names,
+    )
+
+    states = [defaultdict(lambda: [0, 0.0, 0.0]) for _ in range(count_intervals)]
+    for rollup in rollups:
+        interval = int(
+            (rollup.interval_start - history_start).total_seconds()
+            // history_interval.total_seconds()
+        )
+        state = states[interval][(rollup.state_type, rollup.state_name)]
+        state[0] += rollup.count_runs
+        state[1] += rollup.sum_estimated_run_time
+        state[2] += rollup.sum_estimated_lateness
+
+    return [
+        schemas.responses.HistoryResponse(
+            interval_start=history_start + i * history_interval,
+            interval_end=history_start + (i + 1) * history_interval,
+            states=[
+                schemas.responses.HistoryResponseState(
+                    state_type=state_type,
+                    state_name=state_name,
+                    count_runs=count_runs,
+                    sum_estimated_run_time=datetime.timedelta(seconds=run_time),
+                    sum_estimated_lateness=datetime.timedelta(seconds=lateness),
+                )
+                for (state_type, state_name), (
+                    count_runs,
+                    run_time,
+                    lateness,
+                ) in interval_states.items()
+            ],
+        )
+        for i, interval_states in enumerate(states)
+    ]
+
+
+async def _read_run_history(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    run_type: Literal["flow_run", "task_run"],
+    history_start: DateTimeTZ,
+    history_end: DateTimeTZ,
+    history_interval: datetime.timedelta,
+    flows: schemas.filters.FlowFilter = None,
+    flow_runs: schemas.filters.FlowRunFilter = None,
+    task_runs: schemas.filters.TaskRunFilter = None,
+    deployments: schemas.filters.DeploymentFilter = None,
+    work_pools: schemas.filters.WorkPoolFilter = None,
+    work_queues: schemas.filters.WorkQueueFilter = None,
+) -> List[schemas.responses.HistoryResponse]:
+    """
+    Produce a history of runs aggregated by interval and state from the runs
+    """
     # prepare run-specific models
     if run_type == "flow_run":
         run_model = db.FlowRun
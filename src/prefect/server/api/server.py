@@ -13,6 +13,7 @@ from hashlib import sha256
 from typing import Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 import anyio
+import orjson
 import sqlalchemy as sa
 import sqlalchemy.exc
 import sqlalchemy.orm.exc
@@ -24,6 +25,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.exceptions import HTTPException
 
 import prefect
@@ -35,13 +37,19 @@ from prefect.logging import get_logger
 from prefect.server.api.dependencies import EnforceMinimumAPIVersion
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.utilities.database import get_dialect
-from prefect.server.utilities.server import method_paths_from_routes
+from prefect.server.utilities.server import (
+    PrefectJSONResponse,
+    accepts_msgpack,
+    method_paths_from_routes,
+)
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_MAX_DECODED_BODY_SIZE,
     PREFECT_DEBUG_MODE,
     PREFECT_MEMO_STORE_PATH,
     PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION,
 )
+from prefect.utilities import wire
 from prefect.utilities.hashing import hash_objects
 
 TITLE = "Prefect Server"
@@ -120,6 +128,208 @@ class RequestLimitMiddleware:
             await self.app(scope, receive, send)
 
 
+class WireFormatMiddleware:
+    """
+    A middleware that negotiates MessagePack bodies and Zstandard compression with
+    clients.
+
+    Request bodies sent as MessagePack or compressed with Zstandard are converted to
+    JSON before they reach the routes; bodies in formats that are not installed are
+    rejected with a 415 response, and bodies larger than
+    `PREFECT_API_MAX_DECODED_BODY_SIZE` with a 413 response. Every response advertises
+    Zstandard request compression in an `Accept-Encoding` header when it is available.
+
+    Responses rendered by `PrefectJSONResponse` are encoded as MessagePack for clients
+    that accept it, and responses to clients that accept Zstandard are compressed with
+    it instead of gzip.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        headers = Headers(scope=scope)
+        decode_msgpack = headers.get("content-type", "").startswith(
+            wire.MSGPACK_MEDIA_TYPE
+        )
+        decode_zstd = headers.get("content-encoding") == wire.ZSTD_ENCODING
+        if (decode_msgpack and not wire.msgpack_available()) or (
+            decode_zstd and not wire.zstd_available()
+        ):
+            response = JSONResponse(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                content={"exception_message": "Request body format is not supported."},
+            )
+            return await response(scope, receive, send)
+
+        if decode_msgpack or decode_zstd:
+            max_size = PREFECT_API_MAX_DECODED_BODY_SIZE.value()
+            chunks = []
+            size = 0
+            more_body = True
+            while more_body:
+                message = await receive()
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if size > max_size:
+                    return await _body_too_large(scope, receive, send)
+                chunks.append(chunk)
+                more_body = message.get("more_body", False)
+            body = b"".join(chunks)
+
+            try:
+                if decode_zstd:
+                    body = wire.zstd_decompress(body, max_size=max_size)
+            except ValueError:
+                return await _body_too_large(scope, receive, send)
+            except Exception:
+                return await _body_not_decodable(scope, receive, send)
+
+            try:
+                if decode_msgpack:
+                    body = orjson.dumps(wire.msgpack_loads(body))
+            except Exception:
+                return await _body_not_decodable(scope, receive, send)
+
+            scope = dict(scope, headers=list(scope["headers"]))
+            request_headers = MutableHeaders(scope=scope)
+            if decode_msgpack:
+                request_headers["content-type"] = wire.JSON_MEDIA_TYPE
+            if decode_zstd:
+                del request_headers["content-encoding"]
+            request_headers["content-length"] = str(len(body))
+            receive = _replay_body(body, receive)
+
+        if wire.zstd_available():
+            send = _advertise_zstd_requests(send)
+
+            if wire.accepts(headers.get("accept-encoding"), wire.ZSTD_ENCODING):
+                # Prevent the gzip middleware from compressing the response as well
+                scope = dict(scope, headers=list(scope["headers"]))
+                del MutableHeaders(scope=scope)["accept-encoding"]
+                send = _ZstdSender(send)
+
+        token = accepts_msgpack.set(
+            wire.msgpack_available()
+            and wire.accepts(headers.get("accept"), wire.MSGPACK_MEDIA_TYPE)
+        )
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            accepts_msgpack.reset(token)
+
+
+async def _body_too_large(scope, receive, send) -> None:
+    response = JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"exception_message": "Request body is too large."},
+    )
+    await response(scope, receive, send)
+
+
+async def _body_not_decodable(scope, receive, send) -> None:
+    response = JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"exception_message": "Request body could not be decoded."},
+    )
+    await response(scope, receive, send)
+
+
+def _advertise_zstd_requests(send):
+    """
+    Returns an ASGI `send` callable that adds an `Accept-Encoding` header to responses
+    to let clients know that they can compress request bodies with Zstandard
+    (RFC 7694).
+    """
+
+    async def advertise(message):
+        if message["type"] == "http.response.start":
+            MutableHeaders(raw=message["headers"]).append(
+                "Accept-Encoding", wire.ZSTD_ENCODING
+            )
+        await send(message)
+
+    return advertise
+
+
+def _replay_body(body: bytes, receive):
+    """
+    Returns an ASGI `receive` callable that returns the given body before receiving
+    further messages, such as disconnects, from `receive`.
+    """
+    sent = False
+
+    async def replay():
+        nonlocal sent
+        if sent:
+            return await receive()
+        sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    return replay
+
+
+class _ZstdSender:
+    """
+    Wraps an ASGI `send` callable to compress response bodies with Zstandard.
+
+    Small responses and responses that are already encoded are sent unchanged.
+    Streaming responses are compressed chunk by chunk.
+    """
+
+    def __init__(self, send):
+        self.send = send
+        self.start_message = None
+        self.compressor: Optional[wire.ZstdStreamCompressor] = None
+        self.passthrough = False
+
+    async def __call__(self, message) -> None:
+        if self.passthrough:
+            return await self.send(message)
+
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            return await self.send(message)
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if "content-encoding" in headers or (
+                not more_body and len(body) < wire.MINIMUM_COMPRESSION_SIZE
+            ):
+                self.passthrough = True
+                await self.send(self.start_message)
+                return await self.send(message)
+
+            headers["Content-Encoding"] = wire.ZSTD_ENCODING
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                body = wire.zstd_compress(body)
+                headers["Content-Length"] = str(len(body))
+                self.passthrough = True
+                await self.send(self.start_message)
+                return await self.send({"type": "http.response.body", "body": body})
+
+            del headers["Content-Length"]
+            self.compressor = wire.ZstdStreamCompressor()
+            await self.send(self.start_message)
+
+        await self.send(
+            {
+                "type": "http.response.body",
+                "body": self.compressor.compress(body, final=not more_body),
+                "more_body": more_body,
+            }
+        )
+
+
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Provide a detailed message for request validation errors."""
     return JSONResponse(
@@ -231,8 +441,10 @@ def create_orion_api(
         a FastAPI app that serves the Prefect REST API
     """
     fast_api_app_kwargs = fast_api_app_kwargs or {}
+    fast_api_app_kwargs.setdefault("default_response_class", PrefectJSONResponse)
     api_app = FastAPI(title=API_TITLE, **fast_api_app_kwargs)
     api_app.add_middleware(GZipMiddleware)
+    api_app.add_middleware(WireFormatMiddleware)
 
     @api_app.get(health_check_path, tags=["Root"])
     async def health_check():
@@ -470,6 +682,23 @@ def create_app(
                 services.cancellation_cleanup.CancellationCleanup()
             )
 
+        if prefect.settings.PREFECT_API_SERVICES_LOG_BUFFER_ENABLED.value():
+            service_instances.append(services.log_buffer.LogBuffer())
+
+        if prefect.settings.PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED.value():
+            service_instances.append(services.run_history_rollups.RunHistoryRollups())
+
+        if prefect.settings.PREFECT_API_SERVICES_PARTITION_MAINTENANCE_ENABLED.value():
+            service_instances.append(
+                services.partition_maintenance.PartitionMaintenance()
+            )
+
+        if prefect.settings.PREFECT_API_SERVICES_TASK_CACHE_SWEEPER_ENABLED.value():
+            service_instances.append(services.task_cache_sweeper.TaskCacheSweeper())
+
+        if prefect.settings.PREFECT_API_SERVICES_RETENTION_ENABLED.value():
+            service_instances.append(services.retention.Retention())
+
         if prefect.settings.PREFECT_SERVER_ANALYTICS_ENABLED.value():
             service_instances.append(services.telemetry.Telemetry())
 
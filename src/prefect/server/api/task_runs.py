@@ -3,7 +3,7 @@ Routes for interacting with task run objects.
 """
 
 import datetime
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 import pendulum
@@ -15,11 +15,21 @@ import prefect.server.schemas as schemas
 from prefect.server.api.run_history import run_history
 from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.orchestration import dependencies as orchestration_dependencies
+from prefect.server.orchestration.concurrency_slots import (
+    get_concurrency_slot_manager,
+    read_task_run_concurrency_tags,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities import pagination
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
+from prefect.settings import (
+    PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED,
+    PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT,
+)
 
 router = PrefectRouter(prefix="/task_runs", tags=["Task Runs"])
 
@@ -60,6 +70,37 @@ async def create_task_run(
     return model
 
 
+@router.post("/bulk")
+async def create_task_runs(
+    task_runs: List[schemas.actions.TaskRunCreate],
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[schemas.core.TaskRun]:
+    """
+    Create many task runs in a single request. If a task run with the same
+    flow_run_id, task_key, and dynamic_key already exists, the existing task
+    run will be returned in its place.
+
+    Task runs are returned in the same order they were provided. If no state is
+    provided, a task run will be created in a PENDING state.
+    """
+    # hydrate the input models into full task run / state models
+    task_runs = [schemas.core.TaskRun(**task_run.dict()) for task_run in task_runs]
+
+    for task_run in task_runs:
+        if not task_run.state:
+            task_run.state = schemas.states.Pending()
+
+    async with db.session_context(begin_transaction=True) as session:
+        return await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=task_runs,
+            orchestration_parameters=orchestration_parameters,
+        )
+
+
 @router.patch("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def update_task_run(
     task_run: schemas.actions.TaskRunUpdate,
@@ -182,6 +223,46 @@ async def read_task_runs(
         )
 
 
+@router.post("/paginate")
+async def paginate_task_runs(
+    sort: schemas.sorting.TaskRunSort = Body(schemas.sorting.TaskRunSort.ID_DESC),
+    limit: int = dependencies.LimitBody(),
+    cursor: Optional[str] = Body(
+        None, description="The cursor returned with the previous page, if any."
+    ),
+    flows: schemas.filters.FlowFilter = None,
+    flow_runs: schemas.filters.FlowRunFilter = None,
+    task_runs: schemas.filters.TaskRunFilter = None,
+    deployments: schemas.filters.DeploymentFilter = None,
+    db: PrefectDBInterface = Depends(provide_database_interface),
+) -> schemas.responses.TaskRunPage:
+    """
+    Query for a page of task runs, starting after the cursor of the previous page.
+    """
+    async with db.session_context() as session:
+
+        async def read(after: pagination.KeysetCursor, limit: int):
+            return await models.task_runs.read_task_runs(
+                session=session,
+                flow_filter=flows,
+                flow_run_filter=flow_runs,
+                task_run_filter=task_runs,
+                deployment_filter=deployments,
+                limit=limit,
+                sort=sort,
+                cursor=after,
+            )
+
+        try:
+            results, next_cursor = await pagination.read_page(
+                read, sort, sort.as_sql_sort(db), cursor, limit
+            )
+        except pagination.InvalidCursorError as exc:
+            raise HTTPException(status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+
+        return schemas.responses.TaskRunPage(results=results, next_cursor=next_cursor)
+
+
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_task_run(
     task_run_id: UUID = Path(..., description="The task run id", alias="id"),
@@ -220,6 +301,24 @@ async def set_task_run_state(
 ) -> OrchestrationResult:
     """Set a task run state, invoking any orchestration rules."""
 
+    if (
+        PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED.value()
+        and state.type == schemas.states.StateType.RUNNING
+        and not force
+    ):
+        # wait for concurrency slots outside of the orchestration transaction; the
+        # slots are leased to the task run until orchestration holds them
+        async with db.session_context() as session:
+            tags = await read_task_run_concurrency_tags(
+                session=session, task_run_id=task_run_id
+            )
+        if tags:
+            await get_concurrency_slot_manager().acquire(
+                tags,
+                task_run_id,
+                timeout=PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT.value(),
+            )
+
     now = pendulum.now()
 
     # create the state
@@ -244,3 +343,50 @@ async def set_task_run_state(
         response.status_code = status.HTTP_200_OK
 
     return orchestration_result
+
+
+@router.post("/set_states")
+async def set_task_run_states(
+    proposals: List[schemas.actions.TaskRunStateProposal],
+    db: PrefectDBInterface = Depends(provide_database_interface),
+    task_policy: BaseOrchestrationPolicy = Depends(
+        orchestration_dependencies.provide_task_policy
+    ),
+    orchestration_parameters: dict = Depends(
+        orchestration_dependencies.provide_task_orchestration_parameters
+    ),
+) -> List[OrchestrationResult]:
+    """
+    Set the states of many task runs in a single transaction, invoking any
+    orchestration rules for each transition.
+
+    Results are returned in the same order as the proposals. A proposal for a task
+    run that does not exist is aborted without affecting the other proposals.
+    """
+    orchestration_results = []
+
+    async with db.session_context(
+        begin_transaction=True, with_for_update=True
+    ) as session:
+        for proposal in proposals:
+            try:
+                orchestration_result = await models.task_runs.set_task_run_state(
+                    session=session,
+                    task_run_id=proposal.task_run_id,
+                    state=schemas.states.State.parse_obj(
+                        proposal.state
+                    ),  # convert to a full State object
+                    force=proposal.force,
+                    task_policy=task_policy,
+                    orchestration_parameters=orchestration_parameters,
+                )
+            except ObjectNotFoundError as exc:
+                orchestration_result = OrchestrationResult(
+                    state=None,
+                    status=schemas.responses.SetStateStatus.ABORT,
+                    details=schemas.responses.StateAbortDetails(reason=str(exc)),
+                )
+
+            orchestration_results.append(orchestration_result)
+
+    return orchestration_results
@@ -1,6 +1,7 @@
 """
 Routes for interacting with work queue objects.
 """
+import time
 from typing import List, Optional
 from uuid import UUID
 
@@ -16,6 +17,7 @@ from prefect.server.database.dependencies import provide_database_interface
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.utilities.schemas import DateTimeTZ
 from prefect.server.utilities.server import PrefectRouter
+from prefect.server.utilities.work_queue_notifications import get_work_queue_notifier
 
 router = PrefectRouter(
     prefix="/work_pools",
@@ -268,12 +270,27 @@ async def get_scheduled_flow_runs(
         None, description="The minimum time to look for scheduled flow runs"
     ),
     limit: int = dependencies.LimitBody(),
+    wait_seconds: float = Body(
+        0,
+        ge=0,
+        le=60,
+        description=(
+            "If no flow runs are scheduled, the maximum time to wait for flow runs to"
+            " be scheduled before responding"
+        ),
+    ),
     worker_lookups: WorkerLookups = Depends(WorkerLookups),
     db: PrefectDBInterface = Depends(provide_database_interface),
 ) -> List[schemas.responses.WorkerFlowRunResponse]:
     """
-    Load scheduled runs for a worker
+    Load scheduled runs for a worker.
+
+    If `wait_seconds` is provided and no flow runs are scheduled, the request is held
+    open until flow runs are scheduled in the work pool queues by this server or the
+    wait times out, and the scheduled runs are loaded again.
     """
+    deadline = time.monotonic() + wait_seconds
+
     async with db.session_context(begin_transaction=True) as session:
         work_pool_id = await worker_lookups._get_work_pool_id_from_name(
             session=session, work_pool_name=work_pool_name
@@ -309,7 +326,43 @@ async def get_scheduled_flow_runs(
             work_queue_names=work_queue_names,
         )
 
-        return queue_response
+        if queue_response or wait_seconds <= 0:
+            return queue_response
+
+        if work_queue_ids is None:
+            work_queues = await models.workers.read_work_queues(
+                session=session, work_pool_id=work_pool_id
+            )
+            wait_work_queue_ids = [work_queue.id for work_queue in work_queues]
+        else:
+            wait_work_queue_ids = work_queue_ids
+
+    # wait for runs to be scheduled without holding a connection, and load the
+    # scheduled runs again when woken up or, to pick up runs scheduled by other
+    # servers, when the wait times out
+    notifier = get_work_queue_notifier()
+    while not queue_response:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+
+        notified = await notifier.wait(wait_work_queue_ids, timeout=remaining)
+
+        async with db.session_context() as session:
+            queue_response = await models.workers.get_scheduled_flow_runs(
+                session=session,
+                db=db,
+                work_pool_ids=[work_pool_id],
+                work_queue_ids=work_queue_ids,
+                scheduled_before=scheduled_before,
+                scheduled_after=scheduled_after,
+                limit=limit,
+            )
+
+        if not notified:
+            break
+
+    return queue_response
 
 
 async def _record_work_queue_polls(
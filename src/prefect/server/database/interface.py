@@ -1,5 +1,6 @@
 import datetime
 from contextlib import asynccontextmanager
+from typing import List
 
 import sqlalchemy as sa
 
@@ -249,6 +250,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """A variable model"""
         return self.orm.Variable
 
+    @property
+    def RunHistoryRollup(self):
+        """A run history rollup model"""
+        return self.orm.RunHistoryRollup
+
     @property
     def deployment_unique_upsert_columns(self):
         """Unique columns for upserting a Deployment"""
@@ -299,6 +305,11 @@ class PrefectDBInterface(metaclass=DBSingleton):
         """Unique columns for upserting a BlockDocument"""
         return self.orm.block_document_unique_upsert_columns
 
+    @property
+    def task_run_state_cache_unique_upsert_columns(self):
+        """Unique columns for upserting a TaskRunStateCache"""
+        return self.orm.task_run_state_cache_unique_upsert_columns
+
     async def insert(self, model):
         """INSERTs a model into the database"""
         return self.queries.insert(model)
@@ -346,6 +357,10 @@ class PrefectDBInterface(metaclass=DBSingleton):
             session=session, db=self, limit=limit
         )
 
+    async def bulk_insert_logs(self, session: sa.orm.Session, logs: List):
+        """Insert many logs at once with the fastest method of the database"""
+        return await self.queries.bulk_insert_logs(session=session, db=self, logs=logs)
+
     async def read_configuration_value(self, session: sa.orm.Session, key: str):
         """Read a configuration value"""
         return await self.queries.read_configuration_value(
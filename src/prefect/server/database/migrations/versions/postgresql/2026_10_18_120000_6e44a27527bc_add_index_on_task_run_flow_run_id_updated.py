@@ -0,0 +1,27 @@
+"""Add index on task run flow run id and updated
+
+Revision ID: 6e44a27527bc
+Revises: 15f5083c16bd
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6e44a27527bc"
+down_revision = "15f5083c16bd"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_task_run__flow_run_id_updated",
+        "task_run",
+        ["flow_run_id", "updated"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_task_run__flow_run_id_updated", table_name="task_run")
@@ -0,0 +1,70 @@
+"""Make task run state cache keys unique
+
+Revision ID: c342236c09ea
+Revises: c16917255513
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c342236c09ea"
+down_revision = "c16917255513"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # keep only the most recently cached state of each cache key
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM task_run_state_cache
+            WHERE EXISTS (
+                SELECT 1 FROM task_run_state_cache AS newer
+                WHERE newer.cache_key = task_run_state_cache.cache_key
+                AND (
+                    newer.created > task_run_state_cache.created
+                    OR (
+                        newer.created = task_run_state_cache.created
+                        AND newer.id > task_run_state_cache.id
+                    )
+                )
+            )
+            """
+        )
+    )
+
+    op.drop_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        table_name="task_run_state_cache",
+    )
+    op.create_index(
+        "uq_task_run_state_cache__cache_key",
+        "task_run_state_cache",
+        ["cache_key"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_expiration",
+        "task_run_state_cache",
+        ["cache_expiration"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_task_run_state_cache__cache_expiration",
+        table_name="task_run_state_cache",
+    )
+    op.drop_index(
+        "uq_task_run_state_cache__cache_key", table_name="task_run_state_cache"
+    )
+    op.create_index(
+        "ix_task_run_state_cache__cache_key_created_desc",
+        "task_run_state_cache",
+        ["cache_key", sa.text("created DESC")],
+        unique=False,
+    )
@@ -0,0 +1,36 @@
+"""Add index on task run flow run id and updated
+
+Revision ID: cbe7959a3e51
+Revises: 2dbcec43c857
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "cbe7959a3e51"
+down_revision = "2dbcec43c857"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("task_run", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_task_run__flow_run_id_updated",
+            ["flow_run_id", "updated"],
+            unique=False,
+        )
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("task_run", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_run__flow_run_id_updated")
+
+    op.execute("PRAGMA foreign_keys=ON")
@@ -0,0 +1,67 @@
+"""Make task run state cache keys unique
+
+Revision ID: 481848909c48
+Revises: 0dcc4fd94362
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "481848909c48"
+down_revision = "0dcc4fd94362"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    # keep only the most recently cached state of each cache key
+    op.execute(
+        sa.text(
+            """
+            DELETE FROM task_run_state_cache
+            WHERE EXISTS (
+                SELECT 1 FROM task_run_state_cache AS newer
+                WHERE newer.cache_key = task_run_state_cache.cache_key
+                AND (
+                    newer.created > task_run_state_cache.created
+                    OR (
+                        newer.created = task_run_state_cache.created
+                        AND newer.id > task_run_state_cache.id
+                    )
+                )
+            )
+            """
+        )
+    )
+
+    with op.batch_alter_table("task_run_state_cache", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_run_state_cache__cache_key_created_desc")
+        batch_op.create_index(
+            "uq_task_run_state_cache__cache_key", ["cache_key"], unique=True
+        )
+        batch_op.create_index(
+            "ix_task_run_state_cache__cache_expiration",
+            ["cache_expiration"],
+            unique=False,
+        )
+
+    op.execute("PRAGMA foreign_keys=ON")
+
+
+def downgrade():
+    op.execute("PRAGMA foreign_keys=OFF")
+
+    with op.batch_alter_table("task_run_state_cache", schema=None) as batch_op:
+        batch_op.drop_index("ix_task_run_state_cache__cache_expiration")
+        batch_op.drop_index("uq_task_run_state_cache__cache_key")
+        batch_op.create_index(
+            "ix_task_run_state_cache__cache_key_created_desc",
+            ["cache_key", sa.text("created DESC")],
+            unique=False,
+        )
+
+    op.execute("PRAGMA foreign_keys=ON")
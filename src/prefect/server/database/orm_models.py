@@ -374,9 +374,13 @@ class ORMTaskRunStateCache:
     def __table_args__(cls):
         return (
             sa.Index(
-                "ix_task_run_state_cache__cache_key_created_desc",
+                "uq_task_run_state_cache__cache_key",
                 "cache_key",
-                sa.desc("created"),
+                unique=True,
+            ),
+            sa.Index(
+                "ix_task_run_state_cache__cache_expiration",
+                "cache_expiration",
             ),
         )
 
@@ -830,6 +834,11 @@ class ORMTaskRun(ORMRun):
                 "ix_task_run__state_timestamp",
                 "state_timestamp",
             ),
+            sa.Index(
+                "ix_task_run__flow_run_id_updated",
+                "flow_run_id",
+                "updated",
+            ),
         )
 
 
@@ -1315,6 +1324,37 @@ class ORMVariable:
     __table_args__ = (sa.UniqueConstraint("name"),)
 
 
+@declarative_mixin
+class ORMRunHistoryRollup:
+    """
+    SQLAlchemy model of the runs that were expected to start in an interval, counted by
+    state and the flow, deployment, and work queue of the runs.
+    """
+
+    run_type = sa.Column(sa.String, nullable=False)
+    interval_seconds = sa.Column(sa.Integer, nullable=False)
+    interval_start = sa.Column(Timestamp(), nullable=False)
+    flow_id = sa.Column(UUID(), nullable=True)
+    deployment_id = sa.Column(UUID(), nullable=True)
+    work_queue_name = sa.Column(sa.String, nullable=True)
+    state_type = sa.Column(sa.String, nullable=False)
+    state_name = sa.Column(sa.String, nullable=False)
+    count_runs = sa.Column(sa.Integer, nullable=False)
+    sum_estimated_run_time = sa.Column(sa.Float, nullable=False)
+    sum_estimated_lateness = sa.Column(sa.Float, nullable=False)
+
+    @declared_attr
+    def __table_args__(cls):
+        return (
+            sa.Index(
+                "ix_run_history_rollup__run_type_interval_seconds_interval_start",
+                "run_type",
+                "interval_seconds",
+                "interval_start",
+            ),
+        )
+
+
 class BaseORMConfiguration(ABC):
     """
     Abstract base class used to inject database-specific ORM configuration into Prefect.
@@ -1343,6 +1383,7 @@ class BaseORMConfiguration(ABC):
         block_document_mixin: block_document orm mixin, combined with Base orm class
         block_document_reference_mixin: block_document_reference orm mixin, combined with Base orm class
         configuration_mixin: configuration orm mixin, combined with Base orm class
+        run_history_rollup_mixin: run history rollup orm mixin, combined with Base orm class
 
     """
 
@@ -1373,6 +1414,7 @@ class BaseORMConfiguration(ABC):
         agent_mixin=ORMAgent,
         configuration_mixin=ORMConfiguration,
         variable_mixin=ORMVariable,
+        run_history_rollup_mixin=ORMRunHistoryRollup,
     ):
         self.base_metadata = base_metadata or sa.schema.MetaData(
             # define naming conventions for our Base class to use
@@ -1425,6 +1467,7 @@ class BaseORMConfiguration(ABC):
             block_document_reference_mixin=block_document_reference_mixin,
             configuration_mixin=configuration_mixin,
             variable_mixin=variable_mixin,
+            run_history_rollup_mixin=run_history_rollup_mixin,
         )
 
     def _unique_key(self) -> Tuple[Hashable, ...]:
@@ -1473,6 +1516,7 @@ class BaseORMConfiguration(ABC):
         agent_mixin=ORMAgent,
         configuration_mixin=ORMConfiguration,
         variable_mixin=ORMVariable,
+        run_history_rollup_mixin=ORMRunHistoryRollup,
     ):
         """
         Defines the ORM models used in Prefect REST API and binds them to the `self`. This method
@@ -1554,6 +1598,9 @@ class BaseORMConfiguration(ABC):
         class Variable(variable_mixin, self.Base):
             pass
 
+        class RunHistoryRollup(run_history_rollup_mixin, self.Base):
+            pass
+
         self.Flow = Flow
         self.FlowRunState = FlowRunState
         self.TaskRunState = TaskRunState
@@ -1579,6 +1626,7 @@ class BaseORMConfiguration(ABC):
         self.FlowRunNotificationQueue = FlowRunNotificationQueue
         self.Configuration = Configuration
         self.Variable = Variable
+        self.RunHistoryRollup = RunHistoryRollup
 
     @property
     @abstractmethod
@@ -1640,6 +1688,11 @@ class BaseORMConfiguration(ABC):
         """Unique columns for upserting a BlockDocument"""
         return [self.BlockDocument.block_type_id, self.BlockDocument.name]
 
+    @property
+    def task_run_state_cache_unique_upsert_columns(self):
+        """Unique columns for upserting a TaskRunStateCache"""
+        return [self.TaskRunStateCache.cache_key]
+
 
 class AsyncPostgresORMConfiguration(BaseORMConfiguration):
     """Postgres specific orm configuration"""
@@ -0,0 +1,452 @@
+"""
+Range partitioning of the log and state tables by timestamp on PostgreSQL.
+
+The `log`, `flow_run_state`, and `task_run_state` tables grow with every run, and reads
+and deletes of old rows get slower as they grow. On PostgreSQL, these tables can be
+converted to tables partitioned by the range of their `timestamp` column with
+`prefect server database partition`. Each partition holds the rows of one day, week,
+or month, as configured by `PREFECT_API_DATABASE_PARTITION_INTERVAL`, and a default
+partition holds rows outside every range so that writes never fail. Rows written to the
+default partition are moved into the partition for their range when it is created.
+
+Once converted:
+
+- the `PartitionMaintenance` service creates partitions ahead of time
+- the `Retention` service drops whole partitions older than the retention period,
+  then deletes the old rows of partitions it could not drop one batch at a time
+
+Partitioned tables cannot enforce the uniqueness of a key that does not include the
+partition key, so the primary key of a partitioned table is `(id, timestamp)` and the
+foreign keys from `flow_run.state_id` and `task_run.state_id` to the state tables are
+dropped by the conversion. The database no longer enforces that `id` alone is unique in
+a partitioned table; ids are random UUIDs generated for each new row, so this relies on
+them not colliding.
+
+SQLite databases are never partitioned; every function in this module treats their
+tables as unpartitioned.
+"""
+
+import re
+from typing import Iterable, List, NamedTuple, Optional, Set
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import Literal
+
+from prefect.server.schemas.states import StateType
+
+# The tables that can be partitioned and the column they are partitioned by
+PARTITIONED_TABLES = ("log", "flow_run_state", "task_run_state")
+PARTITION_KEY = "timestamp"
+
+# The runs whose current states are stored in each state table
+CURRENT_STATE_RUN_TABLES = {
+    "flow_run_state": "flow_run",
+    "task_run_state": "task_run",
+}
+
+# The joins from the rows of a partition of each table to the flow runs they belong to
+FLOW_RUN_JOINS = {
+    "log": "JOIN flow_run ON flow_run.id = {partition}.flow_run_id",
+    "flow_run_state": "JOIN flow_run ON flow_run.id = {partition}.flow_run_id",
+    "task_run_state": (
+        "JOIN task_run ON task_run.id = {partition}.task_run_id "
+        "JOIN flow_run ON flow_run.id = task_run.flow_run_id"
+    ),
+}
+
+PartitionInterval = Literal["day", "week", "month"]
+
+_BOUNDS_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+
+class Partition(NamedTuple):
+    """
+    A partition holding the rows of a table with a partition key in `[lower, upper)`.
+    """
+
+    name: str
+    lower: pendulum.DateTime
+    upper: pendulum.DateTime
+
+
+def _quote(name: str) -> str:
+    return postgresql.dialect().identifier_preparer.quote(name)
+
+
+def _literal(value: pendulum.DateTime) -> str:
+    return f"'{value.isoformat()}'"
+
+
+def _parse_bound(value: str) -> pendulum.DateTime:
+    # PostgreSQL abbreviates whole hour offsets, as in `2023-01-01 00:00:00+00`
+    if re.search(r"[+-]\d\d$", value):
+        value += ":00"
+    return pendulum.parse(value).in_tz("UTC")
+
+
+def partition_start(
+    dt: pendulum.DateTime, interval: PartitionInterval
+) -> pendulum.DateTime:
+    """
+    Returns the start of the partition interval containing a datetime, in UTC. Weeks
+    start on Monday.
+    """
+    return pendulum.instance(dt).in_tz("UTC").start_of(interval)
+
+
+def partition_end(
+    start: pendulum.DateTime, interval: PartitionInterval
+) -> pendulum.DateTime:
+    """
+    Returns the end of the partition interval starting at a datetime.
+    """
+    return start.add(**{f"{interval}s": 1})
+
+
+def upcoming_partitions_end(
+    now: pendulum.DateTime, interval: PartitionInterval, count: int
+) -> pendulum.DateTime:
+    """
+    Returns the end of the `count`th partition interval after the one containing
+    `now`.
+    """
+    end = partition_start(now, interval)
+    for _ in range(count + 1):
+        end = partition_end(end, interval)
+    return end
+
+
+def partition_name(table: str, lower: pendulum.DateTime) -> str:
+    """
+    Returns the name of the partition of a table starting at `lower`, for example
+    `log_p20230102`.
+    """
+    return f"{table}_p{lower.format('YYYYMMDD')}"
+
+
+def is_postgres(session: AsyncSession) -> bool:
+    """
+    Returns whether a session is connected to PostgreSQL, the only database whose
+    tables can be partitioned.
+    """
+    return session.bind.dialect.name == "postgresql"
+
+
+async def _read_partitioned_table_names(session: AsyncSession) -> Set[str]:
+    result = await session.execute(
+        sa.text(
+            """
+            SELECT parent.relname
+            FROM pg_partitioned_table
+            JOIN pg_class parent ON parent.oid = pg_partitioned_table.partrelid
+            JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace
+            WHERE pg_namespace.nspname = current_schema()
+            """
+        )
+    )
+    return set(result.scalars().all())
+
+
+async def read_partitioned_tables(session: AsyncSession) -> Set[str]:
+    """
+    Returns the tables in `PARTITIONED_TABLES` that have been partitioned.
+    """
+    if not is_postgres(session):
+        return set()
+
+    return await _read_partitioned_table_names(session) & set(PARTITIONED_TABLES)
+
+
+async def read_partitions(session: AsyncSession, table: str) -> List[Partition]:
+    """
+    Returns the range partitions of a table, ordered by their lower bound. The default
+    partition is not included.
+    """
+    if not is_postgres(session):
+        return []
+
+    result = await session.execute(
+        sa.text(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            JOIN pg_namespace ON pg_namespace.oid = parent.relnamespace
+            WHERE pg_namespace.nspname = current_schema()
+            AND parent.relname = :table
+            """
+        ),
+        {"table": table},
+    )
+
+    partitions = []
+    for name, bounds in result.all():
+        match = _BOUNDS_PATTERN.search(bounds or "")
+        if match is None:
+            # the default partition, or a partition bounded by MINVALUE or MAXVALUE
+            continue
+        partitions.append(
+            Partition(
+                name=name,
+                lower=_parse_bound(match.group(1)),
+                upper=_parse_bound(match.group(2)),
+            )
+        )
+    return sorted(partitions, key=lambda partition: partition.lower)
+
+
+def default_partition_name(table: str) -> str:
+    """
+    Returns the name of the default partition of a table, for example `log_default`.
+    """
+    return f"{table}_default"
+
+
+async def _default_partition_has_rows(
+    session: AsyncSession,
+    table: str,
+    lower: pendulum.DateTime,
+    upper: pendulum.DateTime,
+) -> bool:
+    default = _quote(default_partition_name(table))
+    result = await session.execute(
+        sa.text("SELECT to_regclass(:name) IS NOT NULL"), {"name": default}
+    )
+    if not result.scalar():
+        return False
+
+    key = _quote(PARTITION_KEY)
+    result = await session.execute(
+        sa.text(
+            f"SELECT EXISTS (SELECT 1 FROM {default} "
+            f"WHERE {key} >= {_literal(lower)} AND {key} < {_literal(upper)})"
+        )
+    )
+    return result.scalar()
+
+
+async def _create_partition(
+    session: AsyncSession,
+    table: str,
+    lower: pendulum.DateTime,
+    upper: pendulum.DateTime,
+) -> Partition:
+    name = _quote(partition_name(table, lower))
+    bounds = f"FOR VALUES FROM ({_literal(lower)}) TO ({_literal(upper)})"
+
+    if not await _default_partition_has_rows(session, table, lower, upper):
+        await session.execute(
+            sa.text(f"CREATE TABLE {name} PARTITION OF {_quote(table)} {bounds}")
+        )
+        return Partition(name=partition_name(table, lower), lower=lower, upper=upper)
+
+    # PostgreSQL refuses to create a partition for a range that the default partition
+    # holds rows of, so those rows are moved into a new table that is then attached
+    # as the partition
+    default = _quote(default_partition_name(table))
+    key = _quote(PARTITION_KEY)
+    await session.execute(
+        sa.text(
+            f"CREATE TABLE {name} "
+            f"(LIKE {_quote(table)} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        )
+    )
+    await session.execute(
+        sa.text(
+            f"WITH moved AS (DELETE FROM {default} "
+            f"WHERE {key} >= {_literal(lower)} AND {key} < {_literal(upper)} "
+            "RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved"
+        )
+    )
+    await session.execute(
+        sa.text(f"ALTER TABLE {_quote(table)} ATTACH PARTITION {name} {bounds}")
+    )
+    return Partition(name=partition_name(table, lower), lower=lower, upper=upper)
+
+
+async def create_partitions(
+    session: AsyncSession,
+    table: str,
+    until: pendulum.DateTime,
+    interval: PartitionInterval,
+    start: Optional[pendulum.DateTime] = None,
+) -> List[Partition]:
+    """
+    Create the partitions of a partitioned table needed to hold rows up to `until`.
+
+    Partitions are created after the last existing partition, or from the interval
+    containing `start` (the current time by default) if the table has no partitions.
+    Rows of the default partition within the range of a new partition are moved into
+    it.
+
+    Returns:
+        List[Partition]: The partitions created
+    """
+    partitions = await read_partitions(session, table)
+    if partitions:
+        lower = partitions[-1].upper
+    else:
+        lower = partition_start(start or pendulum.now("UTC"), interval)
+
+    created = []
+    while lower < until:
+        upper = partition_end(partition_start(lower, interval), interval)
+        created.append(await _create_partition(session, table, lower, upper))
+        lower = upper
+    return created
+
+
+async def drop_partitions(
+    session: AsyncSession,
+    table: str,
+    older_than: pendulum.DateTime,
+    state_types: Optional[Iterable[StateType]] = None,
+) -> List[Partition]:
+    """
+    Drop the partitions of a partitioned table that only hold rows older than
+    `older_than`.
+
+    Partitions of state tables that hold the current state of a run are kept, as are
+    partitions holding rows of flow runs that are not in one of `state_types`, if
+    given. Their rows are left to be pruned one batch at a time instead.
+
+    Returns:
+        List[Partition]: The partitions dropped
+    """
+    run_table = CURRENT_STATE_RUN_TABLES.get(table)
+
+    dropped = []
+    for partition in await read_partitions(session, table):
+        if partition.upper > older_than:
+            break
+
+        name = _quote(partition.name)
+        if run_table is not None:
+            holds_current_states = await session.execute(
+                sa.text(
+                    f"SELECT EXISTS (SELECT 1 FROM {_quote(run_table)} "
+                    f"JOIN {name} ON {_quote(run_table)}.state_id = {name}.id)"
+                )
+            )
+            if holds_current_states.scalar():
+                continue
+
+        if state_types is not None and table in FLOW_RUN_JOINS:
+            holds_unprunable_runs = await session.execute(
+                sa.text(
+                    f"SELECT EXISTS (SELECT 1 FROM {name} "
+                    f"{FLOW_RUN_JOINS[table].format(partition=name)} "
+                    "WHERE flow_run.state_type IS NULL "
+                    "OR CAST(flow_run.state_type AS TEXT) NOT IN :state_types)"
+                ).bindparams(sa.bindparam("state_types", expanding=True)),
+                {"state_types": [StateType(type_).value for type_ in state_types]},
+            )
+            if holds_unprunable_runs.scalar():
+                continue
+
+        await session.execute(sa.text(f"DROP TABLE {name}"))
+        dropped.append(partition)
+    return dropped
+
+
+async def partition_table(
+    session: AsyncSession,
+    table: sa.Table,
+    interval: PartitionInterval,
+    until: pendulum.DateTime,
+) -> bool:
+    """
+    Convert a table to a table partitioned by the range of its `timestamp` column.
+
+    The existing rows are copied into partitions covering every interval from the
+    oldest row to `until`, and into a default partition for rows outside those
+    intervals. Indexes and foreign keys are recreated as defined by `table`, and
+    foreign keys referencing the table are dropped. The conversion takes an exclusive
+    lock on the table and should be run in its own transaction while the server is
+    stopped. The primary key of the partitioned table is `(id, timestamp)`, so the
+    uniqueness of `id` alone is no longer enforced.
+
+    Args:
+        session: A database session connected to PostgreSQL
+        table: The SQLAlchemy table to partition
+        interval: The interval of time each partition holds
+        until: Partitions are created for rows up to this time
+
+    Returns:
+        bool: True if the table was partitioned, False if it already was
+
+    Raises:
+        ValueError: If the table has a unique index that does not include the
+            partition key, which partitioned tables cannot enforce
+    """
+    if not is_postgres(session):
+        raise ValueError("Only PostgreSQL tables can be partitioned.")
+
+    for index in table.indexes:
+        if index.unique and PARTITION_KEY not in {
+            column.name for column in index.columns
+        }:
+            raise ValueError(
+                f"Unique index {index.name!r} of table {table.name!r} does not "
+                f"include the partition key {PARTITION_KEY!r}."
+            )
+
+    if table.name in await _read_partitioned_table_names(session):
+        return False
+
+    name = _quote(table.name)
+    staging_name = _quote(f"{table.name}_partitioned")
+    key = _quote(PARTITION_KEY)
+
+    await session.execute(
+        sa.text(
+            f"CREATE TABLE {staging_name} "
+            f"(LIKE {name} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({key})"
+        )
+    )
+
+    oldest = (await session.execute(sa.text(f"SELECT min({key}) FROM {name}"))).scalar()
+    lower = partition_start(oldest or pendulum.now("UTC"), interval)
+    while lower < until:
+        upper = partition_end(lower, interval)
+        await session.execute(
+            sa.text(
+                f"CREATE TABLE {_quote(partition_name(table.name, lower))} "
+                f"PARTITION OF {staging_name} "
+                f"FOR VALUES FROM ({_literal(lower)}) TO ({_literal(upper)})"
+            )
+        )
+        lower = upper
+    await session.execute(
+        sa.text(
+            f"CREATE TABLE {_quote(default_partition_name(table.name))} "
+            f"PARTITION OF {staging_name} DEFAULT"
+        )
+    )
+
+    await session.execute(sa.text(f"INSERT INTO {staging_name} SELECT * FROM {name}"))
+
+    # dropping the table drops the foreign keys that reference it, but not the tables
+    # they belong to
+    await session.execute(sa.text(f"DROP TABLE {name} CASCADE"))
+    await session.execute(sa.text(f"ALTER TABLE {staging_name} RENAME TO {name}"))
+
+    await session.execute(
+        sa.text(
+            f"ALTER TABLE {name} ADD CONSTRAINT {_quote(f'pk_{table.name}')} "
+            f"PRIMARY KEY (id, {key})"
+        )
+    )
+    for index in table.indexes:
+        await session.execute(sa.schema.CreateIndex(index))
+    for foreign_key in table.foreign_key_constraints:
+        await session.execute(sa.schema.AddConstraint(foreign_key))
+
+    await session.execute(sa.text(f"ANALYZE {name}"))
+    return True
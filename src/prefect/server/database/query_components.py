@@ -1,7 +1,7 @@
 import datetime
 from abc import ABC, abstractmethod, abstractproperty
 from typing import TYPE_CHECKING, Dict, Hashable, List, Optional, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pendulum
 import sqlalchemy as sa
@@ -99,6 +99,31 @@ class BaseQueryComponents(ABC):
     ):
         """Database-specific implementation of reading notifications from the queue and deleting them"""
 
+    async def bulk_insert_logs(
+        self,
+        session: AsyncSession,
+        db: "PrefectDBInterface",
+        logs: List[schemas.actions.LogCreate],
+    ):
+        """
+        Insert many logs at once with a single `executemany` on the session's
+        transaction.
+        """
+        await session.execute(
+            sa.insert(db.Log),
+            [
+                dict(
+                    name=log.name,
+                    level=log.level,
+                    message=log.message,
+                    timestamp=log.timestamp,
+                    flow_run_id=log.flow_run_id,
+                    task_run_id=log.task_run_id,
+                )
+                for log in logs
+            ],
+        )
+
     async def queue_flow_run_notifications(
         self,
         session: sa.orm.session,
@@ -589,6 +614,50 @@ class AsyncPostgresQueryComponents(BaseQueryComponents):
         )
         return stmt
 
+    async def bulk_insert_logs(
+        self,
+        session: AsyncSession,
+        db: "PrefectDBInterface",
+        logs: List[schemas.actions.LogCreate],
+    ):
+        """
+        Insert many logs at once with `COPY`, which is much faster than `INSERT` for
+        large batches.
+        """
+        now = pendulum.now("UTC")
+        table = db.Log.__table__
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            table.name,
+            schema_name=table.schema,
+            columns=[
+                "id",
+                "created",
+                "updated",
+                "name",
+                "level",
+                "message",
+                "timestamp",
+                "flow_run_id",
+                "task_run_id",
+            ],
+            records=[
+                (
+                    uuid4(),
+                    now,
+                    now,
+                    log.name,
+                    log.level,
+                    log.message,
+                    log.timestamp,
+                    log.flow_run_id,
+                    log.task_run_id,
+                )
+                for log in logs
+            ],
+        )
+
     async def get_flow_run_notifications_from_queue(
         self, session: AsyncSession, db: "PrefectDBInterface", limit: int
     ) -> List:
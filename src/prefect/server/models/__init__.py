@@ -13,7 +13,10 @@ from . import (
     flow_runs,
     flows,
     logs,
+    retention,
+    run_history_rollups,
     saved_searches,
+    task_run_state_cache,
     task_run_states,
     task_runs,
     variables,
@@ -1,3 +1,4 @@
+from typing import Optional
 from uuid import UUID
 
 import pendulum
@@ -8,6 +9,7 @@ from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.schemas import actions, filters, sorting
 from prefect.server.schemas.core import Artifact
+from prefect.server.utilities.pagination import KeysetCursor, apply_keyset_pagination
 
 
 @inject_db
@@ -262,6 +264,7 @@ async def read_artifacts(
     deployment_filter: filters.DeploymentFilter = None,
     flow_filter: filters.FlowFilter = None,
     sort: sorting.ArtifactSort = sorting.ArtifactSort.ID_DESC,
+    cursor: Optional[KeysetCursor] = None,
 ):
     """
     Reads artifacts.
@@ -276,6 +279,7 @@ async def read_artifacts(
         deployment_filter: Only select artifacts whose flow runs belong to deployments matching this filter
         flow_filter: Only select artifacts whose flow runs belong to flows matching this filter
         work_pool_filter: Only select artifacts whose flow runs belong to work pools matching this filter
+        cursor: If provided, only select artifacts after this cursor, with ties in the sort broken by id
     """
     query = sa.select(db.Artifact).order_by(sort.as_sql_sort(db))
 
@@ -289,6 +293,11 @@ async def read_artifacts(
         flow_filter=flow_filter,
     )
 
+    if cursor is not None:
+        query = apply_keyset_pagination(
+            query, sort.as_sql_sort(db), db.Artifact.id, cursor
+        )
+
     if offset is not None:
         query = query.offset(offset)
     if limit is not None:
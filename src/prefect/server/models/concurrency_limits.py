@@ -132,6 +132,25 @@ async def filter_concurrency_limits_for_orchestration(
     return result.scalars().all()
 
 
+@inject_db
+async def read_concurrency_limits_by_tags(
+    session: sa.orm.Session,
+    tags: List[str],
+    db: PrefectDBInterface,
+):
+    """
+    Reads the concurrency limits on the given tags without locking them.
+    """
+
+    query = (
+        sa.select(db.ConcurrencyLimit)
+        .filter(db.ConcurrencyLimit.tag.in_(tags))
+        .order_by(db.ConcurrencyLimit.tag)
+    )
+    result = await session.execute(query)
+    return result.scalars().all()
+
+
 @inject_db
 async def delete_concurrency_limit(
     session: sa.orm.Session,
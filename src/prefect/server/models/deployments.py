@@ -17,6 +17,7 @@ from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.utilities.database import json_contains
+from prefect.server.utilities.work_queue_notifications import get_work_queue_notifier
 from prefect.settings import (
     PREFECT_API_SERVICES_SCHEDULER_MAX_RUNS,
     PREFECT_API_SERVICES_SCHEDULER_MAX_SCHEDULED_TIME,
@@ -638,6 +639,12 @@ async def _insert_scheduled_flow_runs(
 
         await session.execute(stmt)
 
+        # wake up workers waiting for runs to be scheduled in these work queues
+        get_work_queue_notifier().notify_on_commit(
+            session,
+            [r["work_queue_id"] for r in runs if r["id"] in inserted_flow_run_ids],
+        )
+
     return inserted_flow_run_ids
 
 
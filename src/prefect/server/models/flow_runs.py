@@ -22,12 +22,18 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.orchestration.core_policy import MinimalFlowPolicy
 from prefect.server.orchestration.global_policy import GlobalFlowPolicy
+from prefect.server.orchestration.profiling import (
+    profile_transition,
+    profile_validation,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import FlowOrchestrationContext
 from prefect.server.schemas.core import TaskRunResult
 from prefect.server.schemas.responses import OrchestrationResult, SetStateStatus
 from prefect.server.schemas.states import State
+from prefect.server.utilities.pagination import KeysetCursor, apply_keyset_pagination
 from prefect.server.utilities.schemas import PrefectBaseModel
+from prefect.server.utilities.work_queue_notifications import get_work_queue_notifier
 
 
 @inject_db
@@ -254,6 +260,7 @@ async def read_flow_runs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.FlowRunSort = schemas.sorting.FlowRunSort.ID_DESC,
+    cursor: Optional[KeysetCursor] = None,
 ):
     """
     Read flow runs.
@@ -268,6 +275,8 @@ async def read_flow_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, only select flow runs after this cursor, with ties in the
+            sort broken by id
 
     Returns:
         List[db.FlowRun]: flow runs
@@ -294,6 +303,11 @@ async def read_flow_runs(
         db=db,
     )
 
+    if cursor is not None:
+        query = apply_keyset_pagination(
+            query, sort.as_sql_sort(db), db.FlowRun.id, cursor
+        )
+
     if offset is not None:
         query = query.offset(offset)
 
@@ -304,6 +318,12 @@ async def read_flow_runs(
     return result.scalars().unique().all()
 
 
+# Task runs are stamped as updated when their transaction starts, so a task run can be
+# committed after another task run stamped later has been read. Updates are read from
+# this long before their cursor to pick up such task runs.
+DEPENDENCY_UPDATES_OVERLAP = datetime.timedelta(seconds=30)
+
+
 class DependencyResult(PrefectBaseModel):
     id: UUID
     name: str
@@ -317,6 +337,11 @@ class DependencyResult(PrefectBaseModel):
     untrackable_result: bool
 
 
+class DependencyGraphUpdate(PrefectBaseModel):
+    nodes: List[DependencyResult]
+    cursor: Optional[datetime.datetime]
+
+
 async def read_task_run_dependencies(
     session: AsyncSession,
     flow_run_id: UUID,
@@ -324,44 +349,109 @@ async def read_task_run_dependencies(
     """
     Get a task run dependency map for a given flow run.
     """
-    flow_run = await models.flow_runs.read_flow_run(
+    dependency_graph, _ = await _read_task_run_dependency_nodes(
         session=session, flow_run_id=flow_run_id
     )
-    if not flow_run:
-        raise ObjectNotFoundError(f"Flow run with id {flow_run_id} not found")
+    return dependency_graph
+
+
+async def read_task_run_dependency_updates(
+    session: AsyncSession,
+    flow_run_id: UUID,
+    since: Optional[datetime.datetime] = None,
+) -> DependencyGraphUpdate:
+    """
+    Get the task runs of a flow run's dependency map that were updated at or after
+    `since`, along with a cursor to read subsequent updates with.
 
-    task_runs = await models.task_runs.read_task_runs(
+    Task runs updated up to `DEPENDENCY_UPDATES_OVERLAP` before the cursor are
+    included again in the next update, so that task runs committed out of order are
+    not missed. Updates should be merged into the dependency map by task run id.
+    """
+    dependency_graph, cursor = await _read_task_run_dependency_nodes(
         session=session,
-        flow_run_filter=schemas.filters.FlowRunFilter(
-            id=schemas.filters.FlowRunFilterId(any_=[flow_run_id])
-        ),
+        flow_run_id=flow_run_id,
+        since=since - DEPENDENCY_UPDATES_OVERLAP if since is not None else None,
     )
+    return DependencyGraphUpdate(nodes=dependency_graph, cursor=cursor or since)
+
 
+@inject_db
+async def _read_task_run_dependency_nodes(
+    session: AsyncSession,
+    flow_run_id: UUID,
+    db: PrefectDBInterface,
+    since: Optional[datetime.datetime] = None,
+):
+    """
+    Read the nodes of a flow run's dependency map, returning them with the latest time
+    one of them was updated.
+
+    Only the columns required for the map are read, rather than full task runs.
+    """
+    flow_run_exists = await session.execute(
+        sa.select(db.FlowRun.id).where(db.FlowRun.id == flow_run_id)
+    )
+    if not flow_run_exists.scalar():
+        raise ObjectNotFoundError(f"Flow run with id {flow_run_id} not found")
+
+    query = (
+        sa.select(
+            db.TaskRun.id,
+            db.TaskRun.name,
+            db.TaskRun.task_inputs,
+            db.TaskRun.expected_start_time,
+            db.TaskRun.start_time,
+            db.TaskRun.end_time,
+            db.TaskRun.total_run_time,
+            db.TaskRun.state_type,
+            db.TaskRun.state_timestamp,
+            db.TaskRun.updated,
+            db.TaskRunState,
+        )
+        .outerjoin(db.TaskRunState, db.TaskRunState.id == db.TaskRun.state_id)
+        .where(db.TaskRun.flow_run_id == flow_run_id)
+        .order_by(db.TaskRun.updated)
+    )
+    if since is not None:
+        query = query.where(db.TaskRun.updated >= since)
+
+    result = await session.execute(query)
+
+    now = pendulum.now("UTC")
     dependency_graph = []
+    cursor = None
 
-    for task_run in task_runs:
+    for task_run in result:
         inputs = list(set(chain(*task_run.task_inputs.values())))
         untrackable_result_status = (
             False
-            if task_run.state is None
-            else task_run.state.state_details.untrackable_result
+            if task_run.TaskRunState is None
+            else task_run.TaskRunState.state_details.untrackable_result
         )
+
+        # mirrors `ORMRun.estimated_run_time` without loading the task run
+        estimated_run_time = task_run.total_run_time
+        if task_run.state_type == schemas.states.StateType.RUNNING:
+            estimated_run_time += now - task_run.state_timestamp
+
         dependency_graph.append(
             {
                 "id": task_run.id,
                 "upstream_dependencies": inputs,
-                "state": task_run.state,
+                "state": task_run.TaskRunState,
                 "expected_start_time": task_run.expected_start_time,
                 "name": task_run.name,
                 "start_time": task_run.start_time,
                 "end_time": task_run.end_time,
                 "total_run_time": task_run.total_run_time,
-                "estimated_run_time": task_run.estimated_run_time,
+                "estimated_run_time": estimated_run_time,
                 "untrackable_result": untrackable_result_status,
             }
         )
+        cursor = task_run.updated
 
-    return dependency_graph
+    return dependency_graph, cursor
 
 
 @inject_db
@@ -424,6 +514,8 @@ async def delete_flow_run(
     result = await session.execute(
         delete(db.FlowRun).where(db.FlowRun.id == flow_run_id)
     )
+    if result.rowcount > 0:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
     return result.rowcount > 0
 
 
@@ -489,18 +581,20 @@ async def set_flow_run_state(
         context.parameters = orchestration_parameters
 
     # apply orchestration rules and create the new flow run state
-    async with contextlib.AsyncExitStack() as stack:
-        for rule in orchestration_rules:
-            context = await stack.enter_async_context(
-                rule(context, *intended_transition)
-            )
+    with profile_transition("flow_run", *intended_transition):
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in orchestration_rules:
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
 
-        for rule in global_rules:
-            context = await stack.enter_async_context(
-                rule(context, *intended_transition)
-            )
+            for rule in global_rules:
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
 
-        await context.validate_proposed_state()
+            with profile_validation():
+                await context.validate_proposed_state()
 
     if context.orchestration_error is not None:
         raise context.orchestration_error
@@ -518,4 +612,8 @@ async def set_flow_run_state(
             session=session, flow_run=run
         )
 
+    # wake up workers waiting for runs to be scheduled in the run's work queue
+    if result.state and result.state.type == schemas.states.StateType.SCHEDULED:
+        get_work_queue_notifier().notify_on_commit(session, [run.work_queue_id])
+
     return result
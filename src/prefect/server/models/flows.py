@@ -8,6 +8,7 @@ from uuid import UUID
 import sqlalchemy as sa
 from sqlalchemy import delete, select
 
+import prefect.server.models as models
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
@@ -276,4 +277,6 @@ async def delete_flow(
     """
 
     result = await session.execute(delete(db.Flow).where(db.Flow.id == flow_id))
+    if result.rowcount > 0:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
     return result.rowcount > 0
@@ -2,7 +2,7 @@
 Functions for interacting with log ORM objects.
 Intended for internal use by the Prefect REST API.
 """
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 import prefect.server.schemas as schemas
 from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.utilities.log_notifications import get_log_notifier
+from prefect.server.utilities.pagination import KeysetCursor, apply_keyset_pagination
 from prefect.utilities.collections import batched_iterable
 
 # We have a limit of 32,767 parameters at a time for a single query...
@@ -44,6 +46,34 @@ async def create_logs(
     log_insert = await db.insert(db.Log)
     await session.execute(log_insert.values([log.dict() for log in logs]))
 
+    # wake up requests streaming the logs of these flow runs
+    get_log_notifier().notify_on_commit(session, [log.flow_run_id for log in logs])
+
+
+@inject_db
+async def bulk_create_logs(
+    session: AsyncSession,
+    db: PrefectDBInterface,
+    logs: List[schemas.actions.LogCreate],
+):
+    """
+    Creates many new logs at once, without the parameter limits of `create_logs`
+
+    On PostgreSQL, logs are loaded with `COPY`. On SQLite, they are inserted with a
+    single `executemany`.
+
+    Args:
+        session: a database session
+        logs: a list of log schemas
+
+    Returns:
+        None
+    """
+    await db.bulk_insert_logs(session=session, logs=logs)
+
+    # wake up requests streaming the logs of these flow runs
+    get_log_notifier().notify_on_commit(session, [log.flow_run_id for log in logs])
+
 
 @inject_db
 async def read_logs(
@@ -53,6 +83,7 @@ async def read_logs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.LogSort = schemas.sorting.LogSort.TIMESTAMP_ASC,
+    cursor: Optional[KeysetCursor] = None,
 ):
     """
     Read logs.
@@ -64,6 +95,8 @@ async def read_logs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, only select logs after this cursor, with ties in the sort
+            broken by id
 
     Returns:
         List[db.Log]: the matching logs
@@ -73,5 +106,8 @@ async def read_logs(
     if log_filter:
         query = query.where(log_filter.as_sql_filter(db))
 
+    if cursor is not None:
+        query = apply_keyset_pagination(query, sort.as_sql_sort(db), db.Log.id, cursor)
+
     result = await session.execute(query)
     return result.scalars().unique().all()
@@ -0,0 +1,386 @@
+"""
+Functions for pruning old runs, states, logs, artifacts, and cached task run states.
+
+Each function deletes one batch of rows older than a given time and returns the number
+of rows it deleted, so callers can prune large tables in short transactions. Rows that
+belong to a flow run are only pruned if the flow run is in one of the given state types
+and, if deployment ids are given, was created by one of those deployments. Rows of flow
+runs that no longer exist are pruned unless deployment ids are given.
+
+The current state of a run is never pruned, nor are artifacts that are the latest
+version of their key or the result of a state that has not been pruned.
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas.states import StateType
+
+# Called with a table's name and the rows of a batch before they are deleted from it
+ArchiveCallback = Callable[[str, List[Dict[str, Any]]], Awaitable[None]]
+
+
+def _flow_run_is_prunable(
+    db: PrefectDBInterface,
+    flow_run_id: sa.Column,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]],
+) -> sa.sql.ColumnElement:
+    """
+    Returns a condition selecting rows of the flow run `flow_run_id` that can be
+    pruned.
+    """
+    conditions = [
+        db.FlowRun.id == flow_run_id,
+        db.FlowRun.state_type.in_(list(state_types)),
+    ]
+    if deployment_ids is not None:
+        conditions.append(db.FlowRun.deployment_id.in_(list(deployment_ids)))
+    prunable = sa.exists().where(*conditions)
+
+    if deployment_ids is not None:
+        return prunable
+
+    flow_run_exists = sa.exists().where(db.FlowRun.id == flow_run_id)
+    return sa.or_(flow_run_id.is_(None), ~flow_run_exists, prunable)
+
+
+async def _delete_batch(
+    session: sa.orm.Session,
+    model,
+    ids_query: sa.sql.Select,
+    archive: Optional[ArchiveCallback],
+) -> int:
+    """
+    Deletes the rows of `model` with the ids selected by `ids_query`, passing them to
+    `archive` first if given.
+    """
+    ids = (await session.execute(ids_query)).scalars().all()
+    if not ids:
+        return 0
+
+    if archive is not None:
+        rows = await session.execute(
+            sa.select(model.__table__).where(model.id.in_(ids)).order_by(model.id)
+        )
+        await archive(model.__table__.name, [dict(row) for row in rows.mappings()])
+
+    await session.execute(
+        sa.delete(model)
+        .where(model.id.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    return len(ids)
+
+
+@inject_db
+async def prune_flow_runs(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: pendulum.DateTime,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes flow runs that entered their current state before `older_than`.
+
+    The task run states, task runs, and flow run states of the flow runs are deleted
+    before the flow runs themselves, so that they are passed to `archive` rather than
+    removed by cascading deletes of unbounded size. At most `limit` rows are deleted
+    from all tables together, so a flow run with many task runs is pruned over
+    several calls.
+
+    Args:
+        session: A database session
+        older_than: Flow runs that entered their current state before this time are
+            pruned
+        state_types: Only flow runs in these state types are pruned
+        deployment_ids: If given, only flow runs of these deployments are pruned
+        limit: The maximum number of rows to prune
+        archive: A function called with the flow runs and their task runs and states
+            before they are deleted
+
+    Returns:
+        int: The number of flow runs, task runs, and states pruned
+    """
+    query = (
+        sa.select(db.FlowRun.id)
+        .where(
+            db.FlowRun.state_timestamp < older_than,
+            db.FlowRun.state_type.in_(list(state_types)),
+        )
+        .order_by(db.FlowRun.state_timestamp)
+        .limit(limit)
+    )
+    if deployment_ids is not None:
+        query = query.where(db.FlowRun.deployment_id.in_(list(deployment_ids)))
+
+    flow_run_ids = (await session.execute(query)).scalars().all()
+    if not flow_run_ids:
+        return 0
+
+    task_run_ids = sa.select(db.TaskRun.id).where(
+        db.TaskRun.flow_run_id.in_(flow_run_ids)
+    )
+    pruned = 0
+    for model, ids_query in [
+        (
+            db.TaskRunState,
+            sa.select(db.TaskRunState.id).where(
+                db.TaskRunState.task_run_id.in_(task_run_ids)
+            ),
+        ),
+        (db.TaskRun, task_run_ids),
+        (
+            db.FlowRunState,
+            sa.select(db.FlowRunState.id).where(
+                db.FlowRunState.flow_run_id.in_(flow_run_ids)
+            ),
+        ),
+        (db.FlowRun, sa.select(db.FlowRun.id).where(db.FlowRun.id.in_(flow_run_ids))),
+    ]:
+        # the rows of each table are only reached once those before it are gone, so
+        # flow runs are only deleted once all of their task runs and states are
+        pruned += await _delete_batch(
+            session, model, ids_query.limit(limit - pruned), archive
+        )
+        if pruned == limit:
+            break
+
+    if pruned:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
+    return pruned
+
+
+@inject_db
+async def prune_flow_run_states(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: pendulum.DateTime,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes flow run states entered before `older_than`, except the current states of
+    flow runs.
+
+    Args:
+        session: A database session
+        older_than: States entered before this time are pruned
+        state_types: Only states of flow runs in these state types are pruned
+        deployment_ids: If given, only states of flow runs of these deployments are
+            pruned
+        limit: The maximum number of states to prune
+        archive: A function called with the states before they are deleted
+
+    Returns:
+        int: The number of states pruned
+    """
+    is_current_state = sa.exists().where(
+        db.FlowRun.state_id == db.FlowRunState.id,
+    )
+    query = (
+        sa.select(db.FlowRunState.id)
+        .where(
+            db.FlowRunState.timestamp < older_than,
+            ~is_current_state,
+            _flow_run_is_prunable(
+                db, db.FlowRunState.flow_run_id, state_types, deployment_ids
+            ),
+        )
+        .limit(limit)
+    )
+    return await _delete_batch(session, db.FlowRunState, query, archive)
+
+
+@inject_db
+async def prune_task_run_states(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: pendulum.DateTime,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes task run states entered before `older_than`, except the current states of
+    task runs.
+
+    Args:
+        session: A database session
+        older_than: States entered before this time are pruned
+        state_types: Only states of task runs of flow runs in these state types are
+            pruned
+        deployment_ids: If given, only states of task runs of flow runs of these
+            deployments are pruned
+        limit: The maximum number of states to prune
+        archive: A function called with the states before they are deleted
+
+    Returns:
+        int: The number of states pruned
+    """
+    is_current_state = sa.exists().where(
+        db.TaskRun.state_id == db.TaskRunState.id,
+    )
+    task_run_is_prunable = (
+        sa.select(db.TaskRun.id)
+        .where(
+            db.TaskRun.id == db.TaskRunState.task_run_id,
+            _flow_run_is_prunable(
+                db, db.TaskRun.flow_run_id, state_types, deployment_ids
+            ),
+        )
+        .exists()
+    )
+    query = (
+        sa.select(db.TaskRunState.id)
+        .where(
+            db.TaskRunState.timestamp < older_than,
+            ~is_current_state,
+            task_run_is_prunable,
+        )
+        .limit(limit)
+    )
+    pruned = await _delete_batch(session, db.TaskRunState, query, archive)
+    if pruned:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
+    return pruned
+
+
+@inject_db
+async def prune_logs(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: pendulum.DateTime,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes logs emitted before `older_than`.
+
+    Args:
+        session: A database session
+        older_than: Logs emitted before this time are pruned
+        state_types: Only logs of flow runs in these state types are pruned
+        deployment_ids: If given, only logs of flow runs of these deployments are
+            pruned
+        limit: The maximum number of logs to prune
+        archive: A function called with the logs before they are deleted
+
+    Returns:
+        int: The number of logs pruned
+    """
+    query = (
+        sa.select(db.Log.id)
+        .where(
+            db.Log.timestamp < older_than,
+            _flow_run_is_prunable(db, db.Log.flow_run_id, state_types, deployment_ids),
+        )
+        .limit(limit)
+    )
+    return await _delete_batch(session, db.Log, query, archive)
+
+
+@inject_db
+async def prune_artifacts(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: pendulum.DateTime,
+    state_types: Iterable[StateType],
+    deployment_ids: Optional[Iterable[UUID]] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes artifacts created before `older_than`, except the latest artifact of each
+    key and the results of remaining states.
+
+    Args:
+        session: A database session
+        older_than: Artifacts created before this time are pruned
+        state_types: Only artifacts of flow runs in these state types are pruned
+        deployment_ids: If given, only artifacts of flow runs of these deployments are
+            pruned
+        limit: The maximum number of artifacts to prune
+        archive: A function called with the artifacts before they are deleted
+
+    Returns:
+        int: The number of artifacts pruned
+    """
+    # matching on the key as well lets the latest artifact be found by the
+    # `(key, latest_id)` index of artifact collections
+    is_latest = sa.exists().where(
+        db.ArtifactCollection.key == db.Artifact.key,
+        db.ArtifactCollection.latest_id == db.Artifact.id,
+    )
+    is_flow_run_result = sa.exists().where(
+        db.FlowRunState.result_artifact_id == db.Artifact.id
+    )
+    is_task_run_result = sa.exists().where(
+        db.TaskRunState.result_artifact_id == db.Artifact.id
+    )
+    query = (
+        sa.select(db.Artifact.id)
+        .where(
+            db.Artifact.created < older_than,
+            ~is_latest,
+            ~is_flow_run_result,
+            ~is_task_run_result,
+            _flow_run_is_prunable(
+                db, db.Artifact.flow_run_id, state_types, deployment_ids
+            ),
+        )
+        .limit(limit)
+    )
+    return await _delete_batch(session, db.Artifact, query, archive)
+
+
+@inject_db
+async def prune_task_run_state_cache(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    older_than: Optional[pendulum.DateTime] = None,
+    limit: int = 1000,
+    archive: Optional[ArchiveCallback] = None,
+) -> int:
+    """
+    Deletes cached task run states that have expired or whose state no longer exists,
+    and those last cached before `older_than` if given.
+
+    Args:
+        session: A database session
+        older_than: If given, cached states last cached before this time are pruned
+        limit: The maximum number of cached states to prune
+        archive: A function called with the cached states before they are deleted
+
+    Returns:
+        int: The number of cached states pruned
+    """
+    state_exists = sa.exists().where(
+        db.TaskRunState.id == db.TaskRunStateCache.task_run_state_id
+    )
+    conditions = [
+        db.TaskRunStateCache.cache_expiration < pendulum.now("UTC"),
+        ~state_exists,
+    ]
+    if older_than is not None:
+        conditions.append(db.TaskRunStateCache.updated < older_than)
+
+    query = sa.select(db.TaskRunStateCache.id).where(sa.or_(*conditions)).limit(limit)
+    pruned = await _delete_batch(session, db.TaskRunStateCache, query, archive)
+    if pruned:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
+    return pruned
@@ -0,0 +1,318 @@
+"""
+Functions for interacting with run history rollup ORM objects.
+
+Rollups count the runs expected to start in each minute and hour by state, along with
+the sums of their estimated run time and lateness. Flow runs are also counted by flow,
+deployment, and work queue. Rollups are maintained by the `RunHistoryRollups` service
+one hour at a time and every hour before the `rolled_up_until` time recorded for a run
+type has been rolled up.
+"""
+
+import datetime
+from typing import Dict, List, Optional, Set
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from typing_extensions import Literal
+
+from prefect.server import schemas
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.models.configuration import write_configuration
+
+RUN_HISTORY_ROLLUP_STATE_KEY = "RUN_HISTORY_ROLLUPS"
+
+# The lengths of the intervals runs are rolled up by, in seconds
+RUN_HISTORY_ROLLUP_INTERVALS = (60, 3600)
+
+RUN_HISTORY_ROLLUP_RUN_TYPES = ("flow_run", "task_run")
+
+
+def floor_datetime(dt: datetime.datetime, seconds: int) -> pendulum.DateTime:
+    """
+    Round a datetime down to a multiple of `seconds` since the epoch, in UTC.
+    """
+    timestamp = pendulum.instance(dt).int_timestamp
+    return pendulum.from_timestamp(timestamp - timestamp % seconds)
+
+
+def _run_model(db: PrefectDBInterface, run_type: Literal["flow_run", "task_run"]):
+    if run_type == "flow_run":
+        return db.FlowRun
+    elif run_type == "task_run":
+        return db.TaskRun
+    raise ValueError(
+        f"Unknown run type {run_type!r}. Expected 'flow_run' or 'task_run'."
+    )
+
+
+@inject_db
+async def read_run_history_rollup_state(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+) -> Dict[str, Dict[str, pendulum.DateTime]]:
+    """
+    Read the progress of the rollups of each run type.
+
+    The state is read from the configuration table directly instead of through the
+    configuration cache, as it is updated by the service on every loop.
+
+    Returns:
+        Dict: a mapping of run type to the `rolled_up_until` time of its rollups and the
+            `updated_after` time runs must be checked for changes after
+    """
+    result = await session.execute(
+        sa.select(db.Configuration.value).where(
+            db.Configuration.key == RUN_HISTORY_ROLLUP_STATE_KEY
+        )
+    )
+    state = result.scalar() or {}
+    return {
+        run_type: {key: pendulum.parse(value) for key, value in progress.items()}
+        for run_type, progress in state.items()
+    }
+
+
+async def write_run_history_rollup_state(
+    session: sa.orm.Session,
+    state: Dict[str, Dict[str, datetime.datetime]],
+):
+    """
+    Record the progress of the rollups of each run type.
+    """
+    await write_configuration(
+        session=session,
+        configuration=schemas.core.Configuration(
+            key=RUN_HISTORY_ROLLUP_STATE_KEY,
+            value={
+                run_type: {key: value.isoformat() for key, value in progress.items()}
+                for run_type, progress in state.items()
+            },
+        ),
+    )
+
+
+@inject_db
+async def read_run_history_hours_updated_after(
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    updated_after: datetime.datetime,
+    expected_start_time_before: datetime.datetime,
+    db: PrefectDBInterface,
+) -> Set[pendulum.DateTime]:
+    """
+    Read the hours of the expected start times of runs updated after the given time.
+    """
+    run_model = _run_model(db, run_type)
+    result = await session.execute(
+        sa.select(run_model.expected_start_time)
+        .where(
+            run_model.updated >= updated_after,
+            run_model.expected_start_time < expected_start_time_before,
+        )
+        .distinct()
+    )
+    return {floor_datetime(start_time, 3600) for start_time in result.scalars()}
+
+
+@inject_db
+async def read_next_run_history_hour(
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    after: Optional[datetime.datetime],
+    before: datetime.datetime,
+    db: PrefectDBInterface,
+) -> Optional[pendulum.DateTime]:
+    """
+    Read the first hour at or after `after` and before `before` with runs expected to
+    start in it.
+    """
+    run_model = _run_model(db, run_type)
+    query = sa.select(sa.func.min(run_model.expected_start_time)).where(
+        run_model.expected_start_time < before
+    )
+    if after is not None:
+        query = query.where(run_model.expected_start_time >= after)
+
+    result = await session.execute(query)
+    start_time = result.scalar()
+    return floor_datetime(start_time, 3600) if start_time is not None else None
+
+
+@inject_db
+async def rollup_run_history(
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    hour_start: datetime.datetime,
+    db: PrefectDBInterface,
+) -> int:
+    """
+    Replace the rollups of the runs expected to start in the hour beginning at
+    `hour_start`.
+
+    Returns:
+        int: the number of runs rolled up
+    """
+    run_model = _run_model(db, run_type)
+    hour_start = floor_datetime(hour_start, 3600)
+    hour_end = hour_start.add(hours=1)
+
+    await session.execute(
+        sa.delete(db.RunHistoryRollup).where(
+            db.RunHistoryRollup.run_type == run_type,
+            db.RunHistoryRollup.interval_start >= hour_start,
+            db.RunHistoryRollup.interval_start < hour_end,
+        )
+    )
+
+    dimensions = (
+        [run_model.flow_id, run_model.deployment_id, run_model.work_queue_name]
+        if run_type == "flow_run"
+        else []
+    )
+    runs = (
+        sa.select(
+            run_model.expected_start_time,
+            run_model.state_type,
+            run_model.state_name,
+            # estimates are clamped at 0 for each run, as when run history is
+            # aggregated from the runs themselves
+            db.greatest(0, sa.extract("epoch", run_model.estimated_run_time)).label(
+                "estimated_run_time"
+            ),
+            db.greatest(
+                0, sa.extract("epoch", run_model.estimated_start_time_delta)
+            ).label("estimated_lateness"),
+            *dimensions,
+        )
+        .where(
+            run_model.expected_start_time >= hour_start,
+            run_model.expected_start_time < hour_end,
+            run_model.state_type.is_not(None),
+        )
+        .alias("runs")
+    )
+    dimension_columns = [runs.c[column.key] for column in dimensions]
+
+    rollups = []
+    count = 0
+    for interval_seconds in RUN_HISTORY_ROLLUP_INTERVALS:
+        intervals = db.make_timestamp_intervals(
+            hour_start, hour_end, datetime.timedelta(seconds=interval_seconds)
+        ).cte(f"intervals_{interval_seconds}")
+
+        # count the runs in each interval of the hour by state and dimension
+        result = await session.execute(
+            sa.select(
+                intervals.c.interval_start,
+                runs.c.state_type,
+                runs.c.state_name,
+                *dimension_columns,
+                sa.func.count().label("count_runs"),
+                sa.func.coalesce(sa.func.sum(runs.c.estimated_run_time), 0),
+                sa.func.coalesce(sa.func.sum(runs.c.estimated_lateness), 0),
+            )
+            .select_from(intervals)
+            .join(
+                runs,
+                sa.and_(
+                    runs.c.expected_start_time >= intervals.c.interval_start,
+                    runs.c.expected_start_time < intervals.c.interval_end,
+                ),
+            )
+            .group_by(
+                intervals.c.interval_start,
+                runs.c.state_type,
+                runs.c.state_name,
+                *dimension_columns,
+            )
+        )
+
+        for row in result:
+            (
+                interval_start,
+                state_type,
+                state_name,
+                *dimension_values,
+                count_runs,
+                sum_estimated_run_time,
+                sum_estimated_lateness,
+            ) = row
+            flow_id, deployment_id, work_queue_name = dimension_values or (
+                None,
+                None,
+                None,
+            )
+            rollups.append(
+                dict(
+                    run_type=run_type,
+                    interval_seconds=interval_seconds,
+                    interval_start=interval_start,
+                    state_type=state_type.value,
+                    state_name=state_name,
+                    flow_id=flow_id,
+                    deployment_id=deployment_id,
+                    work_queue_name=work_queue_name,
+                    count_runs=count_runs,
+                    sum_estimated_run_time=sum_estimated_run_time,
+                    sum_estimated_lateness=sum_estimated_lateness,
+                )
+            )
+            if interval_seconds == RUN_HISTORY_ROLLUP_INTERVALS[-1]:
+                count += count_runs
+
+    if rollups:
+        await session.execute(sa.insert(db.RunHistoryRollup), rollups)
+
+    return count
+
+
+@inject_db
+async def read_run_history_rollups(
+    session: sa.orm.Session,
+    run_type: Literal["flow_run", "task_run"],
+    interval_seconds: int,
+    start_time: datetime.datetime,
+    end_time: datetime.datetime,
+    db: PrefectDBInterface,
+    flow_ids: List[UUID] = None,
+    deployment_ids: List[UUID] = None,
+    work_queue_names: List[str] = None,
+):
+    """
+    Read the rollups of runs expected to start between `start_time` and `end_time`,
+    summed by interval and state.
+
+    Returns:
+        List[Row]: rows of `interval_start`, `state_type`, `state_name`, `count_runs`,
+            `sum_estimated_run_time` and `sum_estimated_lateness`
+    """
+    rollup = db.RunHistoryRollup
+    query = (
+        sa.select(
+            rollup.interval_start,
+            rollup.state_type,
+            rollup.state_name,
+            sa.func.sum(rollup.count_runs).label("count_runs"),
+            sa.func.sum(rollup.sum_estimated_run_time).label("sum_estimated_run_time"),
+            sa.func.sum(rollup.sum_estimated_lateness).label("sum_estimated_lateness"),
+        )
+        .where(
+            rollup.run_type == run_type,
+            rollup.interval_seconds == interval_seconds,
+            rollup.interval_start >= start_time,
+            rollup.interval_start < end_time,
+        )
+        .group_by(rollup.interval_start, rollup.state_type, rollup.state_name)
+        .order_by(rollup.interval_start)
+    )
+    if flow_ids is not None:
+        query = query.where(rollup.flow_id.in_(flow_ids))
+    if deployment_ids is not None:
+        query = query.where(rollup.deployment_id.in_(deployment_ids))
+    if work_queue_names is not None:
+        query = query.where(rollup.work_queue_name.in_(work_queue_names))
+
+    result = await session.execute(query)
+    return result.all()
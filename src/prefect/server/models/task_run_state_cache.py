@@ -0,0 +1,229 @@
+"""
+Functions for interacting with cached task run state ORM objects.
+Intended for internal use by the Prefect REST API.
+
+Each cache key is stored once, pointing to the most recent completed state cached with
+it. Recently retrieved cached states are also kept in the memory of the server so that
+repeated cache hits do not read the database.
+"""
+
+import threading
+from typing import Iterable, Optional, Tuple
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from cachetools import TTLCache
+
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas import states
+from prefect.settings import (
+    PREFECT_API_TASK_CACHE_MEMORY_SIZE,
+    PREFECT_API_TASK_CACHE_MEMORY_TTL,
+)
+
+# Cached states by cache key, with their cache expiration
+_memory_cache: Optional[
+    "TTLCache[str, Tuple[states.State, Optional[pendulum.DateTime]]]"
+] = None
+_memory_cache_lock = threading.Lock()
+
+# The session info keys of the cache keys to forget when a transaction commits, and of
+# whether the session is listening for its transactions to end
+_PENDING_INVALIDATIONS_KEY = "task_run_state_cache_pending_invalidations"
+_LISTENING_KEY = "task_run_state_cache_listening"
+
+
+def _get_memory_cache() -> Optional[TTLCache]:
+    global _memory_cache
+    if _memory_cache is None:
+        size = PREFECT_API_TASK_CACHE_MEMORY_SIZE.value()
+        if size <= 0:
+            return None
+        _memory_cache = TTLCache(
+            maxsize=size, ttl=PREFECT_API_TASK_CACHE_MEMORY_TTL.value()
+        )
+    return _memory_cache
+
+
+def _is_expired(cache_expiration: Optional[pendulum.DateTime]) -> bool:
+    return cache_expiration is not None and cache_expiration <= pendulum.now("UTC")
+
+
+def clear_memory_cache() -> None:
+    """
+    Forget the cached states kept in memory. The memory cache is recreated from the
+    current settings when it is next used.
+    """
+    global _memory_cache
+    with _memory_cache_lock:
+        _memory_cache = None
+
+
+def _forget(cache_keys: Optional[Iterable[str]]) -> None:
+    with _memory_cache_lock:
+        if _memory_cache is None:
+            return
+        if cache_keys is None:
+            _memory_cache.clear()
+        else:
+            for cache_key in cache_keys:
+                _memory_cache.pop(cache_key, None)
+
+
+def _after_commit(session: sa.orm.Session) -> None:
+    if _PENDING_INVALIDATIONS_KEY in session.info:
+        _forget(session.info.pop(_PENDING_INVALIDATIONS_KEY))
+
+
+def _after_rollback(session: sa.orm.Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
+
+def invalidate_memory_cache_on_commit(
+    session: sa.orm.Session, cache_keys: Optional[Iterable[str]] = None
+) -> None:
+    """
+    Forget the states cached in memory with the given cache keys, or all of them if no
+    keys are given, once the session's current transaction commits.
+
+    Forgetting them on commit rather than immediately keeps a concurrent read from
+    putting the state replaced by an uncommitted transaction back into memory.
+    """
+    sync_session = getattr(session, "sync_session", session)
+    if not sync_session.info.get(_LISTENING_KEY):
+        sync_session.info[_LISTENING_KEY] = True
+        sa.event.listen(sync_session, "after_commit", _after_commit)
+        sa.event.listen(sync_session, "after_rollback", _after_rollback)
+
+    pending = sync_session.info.get(_PENDING_INVALIDATIONS_KEY, set())
+    if pending is None:
+        # every cached state is already forgotten on commit
+        return
+    if cache_keys is None:
+        sync_session.info[_PENDING_INVALIDATIONS_KEY] = None
+    else:
+        pending.update(cache_keys)
+        sync_session.info[_PENDING_INVALIDATIONS_KEY] = pending
+
+
+@inject_db
+async def upsert_cached_state(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    cache_key: str,
+    task_run_state_id: UUID,
+    cache_expiration: Optional[pendulum.DateTime] = None,
+) -> None:
+    """
+    Caches a task run state with a cache key, replacing the state previously cached
+    with the key.
+
+    Args:
+        session: A database session
+        cache_key: The cache key
+        task_run_state_id: The id of the task run state to cache
+        cache_expiration: The time after which the cached state is no longer used
+    """
+    insert_values = dict(
+        cache_key=cache_key,
+        task_run_state_id=task_run_state_id,
+        cache_expiration=cache_expiration,
+        # known limitation of `on_conflict_do_update`, will not use `Column.onupdate`
+        # https://docs.sqlalchemy.org/en/14/dialects/sqlite.html#the-set-clause
+        updated=pendulum.now("UTC"),
+    )
+    insert_stmt = (
+        (await db.insert(db.TaskRunStateCache))
+        .values(**insert_values)
+        .on_conflict_do_update(
+            index_elements=db.task_run_state_cache_unique_upsert_columns,
+            set_=insert_values,
+        )
+    )
+    await session.execute(insert_stmt)
+    invalidate_memory_cache_on_commit(session, [cache_key])
+
+
+@inject_db
+async def read_cached_state(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    cache_key: str,
+) -> Optional[states.State]:
+    """
+    Reads the unexpired state cached with a cache key.
+
+    The returned state may be shared with other callers and must be copied before it
+    is modified.
+
+    Args:
+        session: A database session
+        cache_key: The cache key
+
+    Returns:
+        states.State: The cached state, or `None` if there is none
+    """
+    with _memory_cache_lock:
+        memory_cache = _get_memory_cache()
+        cached = memory_cache.get(cache_key) if memory_cache is not None else None
+    if cached is not None:
+        state, cache_expiration = cached
+        if not _is_expired(cache_expiration):
+            return state
+
+    query = (
+        sa.select(db.TaskRunState, db.TaskRunStateCache.cache_expiration)
+        .join(
+            db.TaskRunStateCache,
+            db.TaskRunStateCache.task_run_state_id == db.TaskRunState.id,
+        )
+        .where(
+            db.TaskRunStateCache.cache_key == cache_key,
+            sa.or_(
+                db.TaskRunStateCache.cache_expiration.is_(None),
+                db.TaskRunStateCache.cache_expiration > pendulum.now("UTC"),
+            ),
+        )
+    )
+    row = (await session.execute(query)).first()
+    if row is None:
+        return None
+
+    state = row[0].as_state()
+    with _memory_cache_lock:
+        memory_cache = _get_memory_cache()
+        if memory_cache is not None:
+            memory_cache[cache_key] = (state, row[1])
+    return state
+
+
+@inject_db
+async def delete_expired_cached_states(
+    session: sa.orm.Session,
+    db: PrefectDBInterface,
+    limit: int = 1000,
+) -> int:
+    """
+    Deletes cached states whose cache expiration has passed.
+
+    Args:
+        session: A database session
+        limit: The maximum number of cached states to delete
+
+    Returns:
+        int: The number of cached states deleted
+    """
+    expired = (
+        sa.select(db.TaskRunStateCache.id)
+        .where(db.TaskRunStateCache.cache_expiration <= pendulum.now("UTC"))
+        .limit(limit)
+        .scalar_subquery()
+    )
+    result = await session.execute(
+        sa.delete(db.TaskRunStateCache)
+        .where(db.TaskRunStateCache.id.in_(expired))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
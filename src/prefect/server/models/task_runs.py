@@ -4,6 +4,7 @@ Intended for internal use by the Prefect REST API.
 """
 
 import contextlib
+from typing import List, Optional
 from uuid import UUID
 
 import pendulum
@@ -18,9 +19,23 @@ from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.orchestration.core_policy import MinimalTaskPolicy
 from prefect.server.orchestration.global_policy import GlobalTaskPolicy
+from prefect.server.orchestration.profiling import (
+    profile_transition,
+    profile_validation,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import TaskOrchestrationContext
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.server.utilities.pagination import KeysetCursor, apply_keyset_pagination
+from prefect.utilities.collections import batched_iterable
+
+# The fields that may be provided when creating a task run; bulk inserts only write
+# these columns so that every row shares the same set of keys
+TASK_RUN_CREATE_FIELDS = set(schemas.actions.TaskRunCreate.__fields__) - {"state"}
+
+# We have a limit of 32,767 parameters at a time for a single query, so existing task
+# runs are looked up by dynamic key in batches
+TASK_RUN_LOOKUP_BATCH_SIZE = 10_000
 
 
 @inject_db
@@ -88,6 +103,161 @@ async def create_task_run(
     return model
 
 
+@inject_db
+async def create_task_runs(
+    session: sa.orm.Session,
+    task_runs: List[schemas.core.TaskRun],
+    db: PrefectDBInterface,
+    orchestration_parameters: dict = None,
+):
+    """
+    Creates many task runs at once.
+
+    All task runs are inserted with a single statement. As with `create_task_run`,
+    if a task run with the same flow_run_id, task_key, and dynamic_key already
+    exists, the existing task run will be returned instead. States are only created
+    for task runs that were newly inserted.
+
+    Args:
+        session: a database session
+        task_runs: a list of task run models
+
+    Returns:
+        List[db.TaskRun]: the newly-created or existing task runs, in the same order
+            as the provided task runs
+    """
+    if not task_runs:
+        return []
+
+    now = pendulum.now("UTC")
+
+    # A new task run entering a PENDING state is not governed by any orchestration
+    # rules, only by the bookkeeping of the global policy. These states are written
+    # in bulk with their bookkeeping columns set directly on the inserted rows.
+    bulk_states = {
+        task_run.id: task_run.state
+        for task_run in task_runs
+        if task_run.state
+        and task_run.state.type == schemas.states.StateType.PENDING
+        and task_run.state.data is None
+    }
+
+    # passing the rows separately from the statement executes a single statement
+    # with many parameter sets (executemany) rather than one statement per row
+    insert_stmt = (await db.insert(db.TaskRun)).on_conflict_do_nothing(
+        index_elements=db.task_run_unique_upsert_columns,
+    )
+    await session.execute(
+        insert_stmt,
+        [
+            dict(
+                id=task_run.id,
+                created=now,
+                **_bulk_state_bookkeeping(bulk_states.get(task_run.id)),
+                **task_run.dict(shallow=True, include=TASK_RUN_CREATE_FIELDS),
+            )
+            for task_run in task_runs
+        ],
+    )
+
+    # query for the rows that were newly inserted
+    inserted_task_run_ids = set()
+    for batch in batched_iterable(task_runs, TASK_RUN_LOOKUP_BATCH_SIZE):
+        result = await session.execute(
+            sa.select(db.TaskRun.id).where(
+                db.TaskRun.id.in_([task_run.id for task_run in batch])
+            )
+        )
+        inserted_task_run_ids.update(result.scalars().all())
+
+    insert_task_run_states = []
+    for task_run in task_runs:
+        if task_run.id not in inserted_task_run_ids:
+            continue
+
+        if task_run.id in bulk_states:
+            state = bulk_states[task_run.id]
+            state.state_details.flow_run_id = task_run.flow_run_id
+            state.state_details.task_run_id = task_run.id
+            insert_task_run_states.append(
+                {
+                    "task_run_id": task_run.id,
+                    **state.dict(shallow=True, exclude={"data"}),
+                }
+            )
+        elif task_run.state:
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=task_run.id,
+                state=task_run.state,
+                force=True,
+                orchestration_parameters=orchestration_parameters,
+            )
+
+    if insert_task_run_states:
+        await session.execute(
+            db.TaskRunState.__table__.insert(), insert_task_run_states
+        )
+
+        # set the `state_id` on the newly inserted runs
+        task_run_table = db.TaskRun.__table__
+        await session.execute(
+            sa.update(task_run_table)
+            .where(task_run_table.c.id == sa.bindparam("_task_run_id"))
+            .values(state_id=sa.bindparam("_state_id")),
+            [
+                {"_task_run_id": state["task_run_id"], "_state_id": state["id"]}
+                for state in insert_task_run_states
+            ],
+        )
+
+    # read back both the inserted rows and any rows that already existed
+    models_by_key = {}
+    for batch in batched_iterable(task_runs, TASK_RUN_LOOKUP_BATCH_SIZE):
+        # match the keys as tuples, since matching each column separately would
+        # also read the runs of every other combination of the keys
+        query = (
+            sa.select(db.TaskRun)
+            .where(
+                sa.tuple_(
+                    db.TaskRun.flow_run_id,
+                    db.TaskRun.task_key,
+                    db.TaskRun.dynamic_key,
+                ).in_(
+                    {
+                        (task_run.flow_run_id, task_run.task_key, task_run.dynamic_key)
+                        for task_run in batch
+                    }
+                )
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await session.execute(query)
+        for model in result.scalars().all():
+            models_by_key[(model.flow_run_id, model.task_key, model.dynamic_key)] = (
+                model
+            )
+
+    return [
+        models_by_key[(task_run.flow_run_id, task_run.task_key, task_run.dynamic_key)]
+        for task_run in task_runs
+    ]
+
+
+def _bulk_state_bookkeeping(state: schemas.states.State = None) -> dict:
+    """
+    The run columns the global task policy would set when a new task run enters the
+    given state. Returns empty values if there is no state, so that every row inserted
+    by `create_task_runs` shares the same set of keys.
+    """
+    return dict(
+        state_type=state.type if state else None,
+        state_name=state.name if state else None,
+        state_timestamp=state.timestamp if state else None,
+        expected_start_time=state.timestamp if state else None,
+    )
+
+
 @inject_db
 async def update_task_run(
     session: AsyncSession,
@@ -208,6 +378,7 @@ async def read_task_runs(
     offset: int = None,
     limit: int = None,
     sort: schemas.sorting.TaskRunSort = schemas.sorting.TaskRunSort.ID_DESC,
+    cursor: Optional[KeysetCursor] = None,
 ):
     """
     Read task runs.
@@ -221,6 +392,8 @@ async def read_task_runs(
         offset: Query offset
         limit: Query limit
         sort: Query sort
+        cursor: if provided, only select task runs after this cursor, with ties in the
+            sort broken by id
 
     Returns:
         List[db.TaskRun]: the task runs
@@ -237,6 +410,11 @@ async def read_task_runs(
         db=db,
     )
 
+    if cursor is not None:
+        query = apply_keyset_pagination(
+            query, sort.as_sql_sort(db), db.TaskRun.id, cursor
+        )
+
     if offset is not None:
         query = query.offset(offset)
 
@@ -302,6 +480,8 @@ async def delete_task_run(
     result = await session.execute(
         delete(db.TaskRun).where(db.TaskRun.id == task_run_id)
     )
+    if result.rowcount > 0:
+        models.task_run_state_cache.invalidate_memory_cache_on_commit(session)
     return result.rowcount > 0
 
 
@@ -362,18 +542,20 @@ async def set_task_run_state(
         context.parameters = orchestration_parameters
 
     # apply orchestration rules and create the new task run state
-    async with contextlib.AsyncExitStack() as stack:
-        for rule in orchestration_rules:
-            context = await stack.enter_async_context(
-                rule(context, *intended_transition)
-            )
-
-        for rule in global_rules:
-            context = await stack.enter_async_context(
-                rule(context, *intended_transition)
-            )
-
-        await context.validate_proposed_state()
+    with profile_transition("task_run", *intended_transition):
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in orchestration_rules:
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
+
+            for rule in global_rules:
+                context = await stack.enter_async_context(
+                    rule(context, *intended_transition)
+                )
+
+            with profile_validation():
+                await context.validate_proposed_state()
 
     if context.orchestration_error is not None:
         raise context.orchestration_error
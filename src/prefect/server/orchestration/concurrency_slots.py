@@ -0,0 +1,436 @@
+"""
+In-memory management of task run concurrency slots.
+
+When `PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED` is set, the slots of tag-based
+concurrency limits are tracked by a `ConcurrencySlotManager` in the memory of the server
+instead of the `active_slots` of each limit in the database. Acquiring and releasing
+slots does not lock or rewrite concurrency limit rows, and task runs waiting for a slot
+are queued and woken as soon as one is released.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional
+from uuid import UUID
+
+import sqlalchemy as sa
+
+from prefect.server import models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas.states import StateType
+from prefect.server.utilities.database import json_has_all_keys
+from prefect.settings import PREFECT_API_TASK_CONCURRENCY_SLOT_LEASE_DURATION
+
+
+class _SlotWaiter:
+    """
+    A request for slots waiting in the queue of a `ConcurrencySlotManager`.
+    """
+
+    def __init__(self, tags: List[str], holder: UUID, future: asyncio.Future):
+        self.tags = tags
+        self.holder = holder
+        self.future = future
+        self.granted = False
+
+    def grant(self) -> None:
+        self.granted = True
+        try:
+            self.future.get_loop().call_soon_threadsafe(self._set_result)
+        except RuntimeError:
+            # The event loop of the waiter has been closed
+            pass
+
+    def _set_result(self) -> None:
+        if not self.future.done():
+            self.future.set_result(True)
+
+
+class ConcurrencySlotManager:
+    """
+    Tracks the concurrency slots of tag-based concurrency limits.
+
+    A slot is acquired for every limited tag at once or not at all. Slots are first
+    granted as leases which expire after `lease_duration` seconds unless they are
+    converted into held slots with `hold`. Held slots do not expire and must be given
+    back with `release`, or reclaimed with `reclaim` once their holder is no longer
+    running.
+
+    Requests that cannot be granted immediately can wait in a first-in, first-out queue.
+    A queued request blocks later requests for any of the same tags, so requests for
+    several tags are not starved by requests for a single one.
+
+    The manager is safe to use from multiple threads and event loops.
+    """
+
+    def __init__(self, lease_duration: Optional[float] = None):
+        self.lease_duration = (
+            lease_duration
+            if lease_duration is not None
+            else PREFECT_API_TASK_CONCURRENCY_SLOT_LEASE_DURATION.value()
+        )
+
+        self._lock = threading.Lock()
+        self._limits: Dict[str, int] = {}
+        # Slots by tag, mapping each holder to the expiration of its lease or `None` if
+        # the slot is held until it is released
+        self._slots: Dict[str, Dict[UUID, Optional[float]]] = {}
+        self._waiters: Deque[_SlotWaiter] = deque()
+        # The time each holder of held slots was last granted a hold
+        self._held_at: Dict[UUID, float] = {}
+
+        self.granted = 0
+        self.queued = 0
+        self.timeouts = 0
+        self.expirations = 0
+
+    def is_tracking(self, tag: str) -> bool:
+        """
+        Returns `True` if the slots of the limit on the tag are tracked.
+        """
+        return tag in self._limits
+
+    def track_limit(
+        self, tag: str, limit: int, active_slots: Iterable[str] = ()
+    ) -> None:
+        """
+        Track the slots of the concurrency limit on a tag or update its limit.
+
+        When a tag is first tracked, its slots are held by `active_slots`, the task
+        runs currently holding a slot according to the database.
+        """
+        with self._lock:
+            if tag not in self._limits:
+                self._slots[tag] = {UUID(str(slot)): None for slot in active_slots}
+            elif limit <= self._limits[tag]:
+                self._limits[tag] = limit
+                return
+
+            self._limits[tag] = limit
+            self._wake_waiters()
+
+    def active_slots(self, tag: str) -> List[UUID]:
+        """
+        Returns the holders of the slots on a tag.
+        """
+        with self._lock:
+            slots = self._slots.get(tag, {})
+            self._expire_leases(tag, time.monotonic())
+            return list(slots)
+
+    def reset_slots(self, tag: str, slot_override: Iterable[UUID] = ()) -> None:
+        """
+        Release all of the slots on a tag, optionally replacing them with held slots.
+        """
+        with self._lock:
+            if tag not in self._limits:
+                return
+            self._slots[tag] = {UUID(str(slot)): None for slot in slot_override}
+            self._wake_waiters()
+
+    def try_acquire(self, tags: Iterable[str], holder: UUID) -> bool:
+        """
+        Lease a slot on each tracked tag for the holder without waiting.
+
+        Slots already leased or held by the holder are kept. Returns `False` if any of
+        the tags has no slot available or has requests waiting for a slot.
+        """
+        tags = self._tracked_tags(tags)
+        with self._lock:
+            now = time.monotonic()
+            if not self._holds_all(tags, holder, now):
+                blocked = {tag for waiter in self._waiters for tag in waiter.tags}
+                if blocked.intersection(tags) or not self._can_acquire(
+                    tags, holder, now
+                ):
+                    return False
+
+            self._grant(tags, holder, now)
+            return True
+
+    async def acquire(
+        self, tags: Iterable[str], holder: UUID, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Lease a slot on each tracked tag for the holder, waiting in the queue for up to
+        `timeout` seconds if necessary.
+
+        Returns `True` if the slots were leased.
+        """
+        if self.try_acquire(tags, holder):
+            return True
+
+        tags = self._tracked_tags(tags)
+        waiter = _SlotWaiter(tags, holder, asyncio.get_running_loop().create_future())
+        with self._lock:
+            self._waiters.append(waiter)
+            self.queued += 1
+            # Slots may have been released since the attempt to acquire them
+            self._wake_waiters()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while not waiter.granted:
+                # Leases expire without a release waking the queue, so wait no longer
+                # than the next expiration of a lease on one of the tags
+                delay = self._next_expiration(tags)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    delay = remaining if delay is None else min(delay, remaining)
+
+                try:
+                    await asyncio.wait_for(asyncio.shield(waiter.future), delay)
+                except asyncio.TimeoutError:
+                    with self._lock:
+                        self._wake_waiters()
+        except BaseException:
+            with self._lock:
+                self._remove_waiter(waiter)
+                if waiter.granted:
+                    # Give back the slots granted while the caller was cancelled
+                    self._release(tags, holder)
+            raise
+
+        with self._lock:
+            self._remove_waiter(waiter)
+            if not waiter.granted:
+                self.timeouts += 1
+            return waiter.granted
+
+    def hold(self, tags: Iterable[str], holder: UUID) -> None:
+        """
+        Hold the slots leased by the holder until they are released.
+        """
+        with self._lock:
+            for tag in self._tracked_tags(tags):
+                if holder in self._slots[tag]:
+                    self._slots[tag][holder] = None
+                    self._held_at[holder] = time.monotonic()
+
+    def reclaim(self, tag: str, running: Iterable[UUID]) -> int:
+        """
+        Release the slots held on a tag by holders that are not running.
+
+        A slot is held as a transition into a Running state is validated, before the
+        transition is committed, and is not given back if the transaction fails. Slots
+        held for less than `lease_duration` seconds are kept, since their holder's
+        transition may not have been committed yet.
+
+        Returns the number of slots released.
+        """
+        running = {UUID(str(holder)) for holder in running}
+        with self._lock:
+            slots = self._slots.get(tag, {})
+            now = time.monotonic()
+            stale = [
+                holder
+                for holder, expiration in slots.items()
+                if expiration is None
+                and holder not in running
+                and self._held_at.get(holder, now - self.lease_duration)
+                <= now - self.lease_duration
+            ]
+            for holder in stale:
+                del slots[holder]
+                self._forget_hold(holder)
+            if stale:
+                self._wake_waiters()
+            return len(stale)
+
+    def release(self, tags: Iterable[str], holder: UUID) -> None:
+        """
+        Release the slots leased or held by the holder and wake any waiting requests.
+        """
+        with self._lock:
+            self._release(self._tracked_tags(tags), holder)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns counters for the slots granted by the manager.
+        """
+        with self._lock:
+            return {
+                "granted": self.granted,
+                "queued": self.queued,
+                "timeouts": self.timeouts,
+                "expirations": self.expirations,
+                "waiting": len(self._waiters),
+            }
+
+    def _tracked_tags(self, tags: Iterable[str]) -> List[str]:
+        return sorted(tag for tag in set(tags) if tag in self._limits)
+
+    def _expire_leases(self, tag: str, now: float) -> None:
+        slots = self._slots.get(tag, {})
+        for holder, expiration in list(slots.items()):
+            if expiration is not None and expiration <= now:
+                del slots[holder]
+                self.expirations += 1
+
+    def _holds_all(self, tags: List[str], holder: UUID, now: float) -> bool:
+        for tag in tags:
+            self._expire_leases(tag, now)
+            if holder not in self._slots[tag]:
+                return False
+        return True
+
+    def _can_acquire(self, tags: List[str], holder: UUID, now: float) -> bool:
+        for tag in tags:
+            self._expire_leases(tag, now)
+            slots = self._slots[tag]
+            if holder not in slots and len(slots) >= self._limits[tag]:
+                return False
+        return True
+
+    def _grant(self, tags: List[str], holder: UUID, now: float) -> None:
+        for tag in tags:
+            slots = self._slots[tag]
+            if holder not in slots or slots[holder] is not None:
+                slots[holder] = now + self.lease_duration
+        self.granted += 1
+
+    def _release(self, tags: List[str], holder: UUID) -> None:
+        released = False
+        for tag in tags:
+            released |= self._slots[tag].pop(holder, False) is not False
+        self._forget_hold(holder)
+        if released:
+            self._wake_waiters()
+
+    def _forget_hold(self, holder: UUID) -> None:
+        if not any(holder in slots for slots in self._slots.values()):
+            self._held_at.pop(holder, None)
+
+    def _wake_waiters(self) -> None:
+        """
+        Grant slots to waiting requests in the order they were queued.
+        """
+        now = time.monotonic()
+        blocked = set()
+        for waiter in list(self._waiters):
+            if not blocked.intersection(waiter.tags) and self._can_acquire(
+                waiter.tags, waiter.holder, now
+            ):
+                self._grant(waiter.tags, waiter.holder, now)
+                self._remove_waiter(waiter)
+                waiter.grant()
+            else:
+                blocked.update(waiter.tags)
+
+    def _remove_waiter(self, waiter: _SlotWaiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _next_expiration(self, tags: List[str]) -> Optional[float]:
+        with self._lock:
+            expirations = [
+                expiration
+                for tag in tags
+                for expiration in self._slots.get(tag, {}).values()
+                if expiration is not None
+            ]
+        if not expirations:
+            return None
+        return max(min(expirations) - time.monotonic(), 0)
+
+
+_concurrency_slot_manager: Optional[ConcurrencySlotManager] = None
+
+
+def get_concurrency_slot_manager() -> ConcurrencySlotManager:
+    """
+    Returns the concurrency slot manager of the server process.
+    """
+    global _concurrency_slot_manager
+    if _concurrency_slot_manager is None:
+        _concurrency_slot_manager = ConcurrencySlotManager()
+    return _concurrency_slot_manager
+
+
+@inject_db
+async def read_running_task_run_ids(
+    session: sa.orm.Session, tag: str, db: PrefectDBInterface
+) -> List[UUID]:
+    """
+    Returns the ids of the task runs with a tag that are in a Running state, which hold
+    a slot of the concurrency limit on the tag.
+    """
+    result = await session.execute(
+        sa.select(db.TaskRun.id).where(
+            db.TaskRun.state_type == StateType.RUNNING,
+            json_has_all_keys(db.TaskRun.tags, [tag]),
+        )
+    )
+    return result.scalars().all()
+
+
+async def track_concurrency_limits(
+    session: sa.orm.Session, limits: Iterable
+) -> List[str]:
+    """
+    Track the slots of the given concurrency limit ORM objects with the concurrency slot
+    manager, returning their tags.
+
+    The slots of a limit that is not tracked yet are populated with the task runs
+    currently running with its tag, so that slots held before the server started are
+    respected. The `active_slots` of limits are not maintained while slots are managed
+    in memory and are ignored.
+    """
+    manager = get_concurrency_slot_manager()
+    tags = []
+    for limit in limits:
+        active_slots = (
+            []
+            if manager.is_tracking(limit.tag)
+            else await read_running_task_run_ids(session, limit.tag)
+        )
+        manager.track_limit(limit.tag, limit.concurrency_limit, active_slots)
+        tags.append(limit.tag)
+    return tags
+
+
+async def reclaim_concurrency_slots(
+    session: sa.orm.Session, tags: Iterable[str]
+) -> int:
+    """
+    Release the slots held on the given tags by task runs that are no longer running,
+    such as task runs whose transition into a Running state failed to commit after
+    their slots were held.
+
+    Returns the number of slots released.
+    """
+    manager = get_concurrency_slot_manager()
+    reclaimed = 0
+    for tag in tags:
+        reclaimed += manager.reclaim(tag, await read_running_task_run_ids(session, tag))
+    return reclaimed
+
+
+async def read_task_run_concurrency_tags(
+    session: sa.orm.Session, task_run_id: UUID
+) -> List[str]:
+    """
+    Read the concurrency limits on the tags of a task run, tracking them with the
+    concurrency slot manager.
+
+    Returns the tags of the limits a slot can be acquired for; limits of 0 are left to
+    orchestration to reject.
+    """
+    task_run = await models.task_runs.read_task_run(
+        session=session, task_run_id=task_run_id
+    )
+    if not task_run or not task_run.tags:
+        return []
+
+    limits = await models.concurrency_limits.read_concurrency_limits_by_tags(
+        session=session, tags=task_run.tags
+    )
+    return await track_concurrency_limits(
+        session, [limit for limit in limits if limit.concurrency_limit > 0]
+    )
@@ -9,15 +9,15 @@ from typing import Optional
 from uuid import uuid4
 
 import pendulum
-import sqlalchemy as sa
 from packaging.version import Version
-from sqlalchemy import select
 
 from prefect.server import models
-from prefect.server.database.dependencies import inject_db
-from prefect.server.database.interface import PrefectDBInterface
-from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models import concurrency_limits
+from prefect.server.orchestration.concurrency_slots import (
+    get_concurrency_slot_manager,
+    reclaim_concurrency_slots,
+    track_concurrency_limits,
+)
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
@@ -30,6 +30,7 @@ from prefect.server.orchestration.rules import (
 )
 from prefect.server.schemas import core, filters, states
 from prefect.server.schemas.states import StateType
+from prefect.settings import PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED
 from prefect.utilities.math import clamped_poisson_interval
 
 
@@ -95,6 +96,11 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
     been reached, the client will be instructed to delay the transition for 30 seconds
     before trying again. If the concurrency limit set on a tag is 0, the transition will
     be aborted to prevent deadlocks.
+
+    If `PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED` is set, slots are acquired
+    from the in-memory concurrency slot manager instead. The client will be instructed
+    to try again after a second if a concurrency limit has been reached; requests to
+    set a Running state already wait for slots to be released before orchestration.
     """
 
     FROM_STATES = ALL_ORCHESTRATION_STATES
@@ -107,6 +113,14 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
         context: TaskOrchestrationContext,
     ) -> None:
         self._applied_limits = []
+        self._leased_tags = []
+        if not context.run.tags:
+            # only tags can be concurrency limited
+            return
+
+        if PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED.value():
+            return await self._acquire_slot_leases(context)
+
         filtered_limits = (
             await concurrency_limits.filter_concurrency_limits_for_orchestration(
                 context.session, tags=context.run.tags
@@ -148,12 +162,53 @@ class SecureTaskConcurrencySlots(BaseOrchestrationRule):
                 active_slots.add(str(context.run.id))
                 cl.active_slots = list(active_slots)
 
+    async def _acquire_slot_leases(self, context: TaskOrchestrationContext) -> None:
+        limits = await concurrency_limits.read_concurrency_limits_by_tags(
+            context.session, tags=context.run.tags
+        )
+        for cl in limits:
+            if cl.concurrency_limit == 0:
+                # limits of 0 will deadlock, and the transition needs to abort
+                await self.abort_transition(
+                    reason=(
+                        f'The concurrency limit on tag "{cl.tag}" is 0 and will'
+                        " deadlock if the task tries to run again."
+                    ),
+                )
+                return
+
+        tags = await track_concurrency_limits(context.session, limits)
+        manager = get_concurrency_slot_manager()
+        if manager.try_acquire(tags, context.run.id) or (
+            # slots may be held by task runs whose transition failed to commit
+            await reclaim_concurrency_slots(context.session, tags)
+            and manager.try_acquire(tags, context.run.id)
+        ):
+            self._leased_tags = tags
+        else:
+            await self.delay_transition(
+                1,
+                f"Concurrency limits for the {', '.join(tags)} tags have been reached",
+            )
+
+    async def after_transition(
+        self,
+        initial_state: Optional[states.State],
+        validated_state: Optional[states.State],
+        context: OrchestrationContext,
+    ) -> None:
+        if self._leased_tags:
+            get_concurrency_slot_manager().hold(self._leased_tags, context.run.id)
+
     async def cleanup(
         self,
         initial_state: Optional[states.State],
         validated_state: Optional[states.State],
         context: OrchestrationContext,
     ) -> None:
+        if self._leased_tags:
+            get_concurrency_slot_manager().release(self._leased_tags, context.run.id)
+
         for tag in self._applied_limits:
             cl = await concurrency_limits.read_concurrency_limit_by_tag(
                 context.session, tag
@@ -173,13 +228,17 @@ class ReleaseTaskConcurrencySlots(BaseUniversalTransform):
         self,
         context: OrchestrationContext,
     ):
-        if self.nullified_transition():
+        if self.nullified_transition() or not context.run.tags:
             return
 
         if context.validated_state and context.validated_state.type not in [
             states.StateType.RUNNING,
             states.StateType.CANCELLING,
         ]:
+            if PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED.value():
+                get_concurrency_slot_manager().release(context.run.tags, context.run.id)
+                return
+
             filtered_limits = (
                 await concurrency_limits.filter_concurrency_limits_for_orchestration(
                     context.session, tags=context.run.tags
@@ -200,25 +259,23 @@ class CacheInsertion(BaseOrchestrationRule):
     FROM_STATES = ALL_ORCHESTRATION_STATES
     TO_STATES = [StateType.COMPLETED]
 
-    @inject_db
     async def after_transition(
         self,
         initial_state: Optional[states.State],
         validated_state: Optional[states.State],
         context: TaskOrchestrationContext,
-        db: PrefectDBInterface,
     ) -> None:
         if not validated_state or not context.session:
             return
 
         cache_key = validated_state.state_details.cache_key
         if cache_key:
-            new_cache_item = db.TaskRunStateCache(
+            await models.task_run_state_cache.upsert_cached_state(
+                session=context.session,
                 cache_key=cache_key,
-                cache_expiration=validated_state.state_details.cache_expiration,
                 task_run_state_id=validated_state.id,
+                cache_expiration=validated_state.state_details.cache_expiration,
             )
-            context.session.add(new_cache_item)
 
 
 class CacheRetrieval(BaseOrchestrationRule):
@@ -233,35 +290,20 @@ class CacheRetrieval(BaseOrchestrationRule):
     FROM_STATES = ALL_ORCHESTRATION_STATES
     TO_STATES = [StateType.RUNNING]
 
-    @inject_db
     async def before_transition(
         self,
         initial_state: Optional[states.State],
         proposed_state: Optional[states.State],
         context: TaskOrchestrationContext,
-        db: PrefectDBInterface,
     ) -> None:
         cache_key = proposed_state.state_details.cache_key
         if cache_key and not proposed_state.state_details.refresh_cache:
-            # Check for cached states matching the cache key
-            cached_state_id = (
-                select(db.TaskRunStateCache.task_run_state_id)
-                .where(
-                    sa.and_(
-                        db.TaskRunStateCache.cache_key == cache_key,
-                        sa.or_(
-                            db.TaskRunStateCache.cache_expiration.is_(None),
-                            db.TaskRunStateCache.cache_expiration > pendulum.now("utc"),
-                        ),
-                    ),
-                )
-                .order_by(db.TaskRunStateCache.created.desc())
-                .limit(1)
-            ).scalar_subquery()
-            query = select(db.TaskRunState).where(db.TaskRunState.id == cached_state_id)
-            cached_state = (await context.session.execute(query)).scalar()
+            cached_state = await models.task_run_state_cache.read_cached_state(
+                session=context.session, cache_key=cache_key
+            )
             if cached_state:
-                new_state = cached_state.as_state().copy(reset_fields=True)
+                # the cached state may be shared with other requests
+                new_state = cached_state.copy(reset_fields=True, deep=True)
                 new_state.name = "Cached"
                 await self.reject_transition(
                     state=new_state, reason="Retrieved state from cache"
@@ -585,28 +627,41 @@ class HandleResumingPausedFlows(BaseOrchestrationRule):
 class UpdateFlowRunTrackerOnTasks(BaseOrchestrationRule):
     """
     Tracks the flow run attempt a task run state is associated with.
+
+    The tracker is updated before the proposed state is validated so that it is written
+    with the new state in a single update of the task run, and reverted if the
+    transition does not go through.
     """
 
     FROM_STATES = ALL_ORCHESTRATION_STATES
     TO_STATES = [StateType.RUNNING]
 
-    async def after_transition(
+    async def before_transition(
         self,
         initial_state: Optional[states.State],
-        validated_state: Optional[states.State],
+        proposed_state: Optional[states.State],
         context: TaskOrchestrationContext,
     ) -> None:
+        self.original_flow_run_run_count = context.run.flow_run_run_count
         self.flow_run = await context.flow_run()
         if self.flow_run:
             context.run.flow_run_run_count = self.flow_run.run_count
         else:
-            raise ObjectNotFoundError(
-                (
+            await self.abort_transition(
+                reason=(
                     "Unable to read flow run associated with task run:"
                     f" {context.run.id}, this flow run might have been deleted"
                 ),
             )
 
+    async def cleanup(
+        self,
+        initial_state: Optional[states.State],
+        validated_state: Optional[states.State],
+        context: OrchestrationContext,
+    ):
+        context.run.flow_run_run_count = self.original_flow_run_run_count
+
 
 class HandleTaskTerminalStateTransitions(BaseOrchestrationRule):
     """
@@ -798,12 +853,18 @@ class PreventRunningTasksFromStoppedFlows(BaseOrchestrationRule):
         proposed_state: Optional[states.State],
         context: TaskOrchestrationContext,
     ) -> None:
+        # the state type of the flow run is read from its own row so that its state
+        # does not have to be loaded
         flow_run = await context.flow_run()
-        if flow_run.state is None:
+        if flow_run is None:
+            # transitions of task runs whose flow run is missing are aborted by
+            # `UpdateFlowRunTrackerOnTasks`
+            return
+        elif flow_run.state_type is None:
             await self.abort_transition(
                 reason="The enclosing flow must be running to begin task execution."
             )
-        elif flow_run.state.type == StateType.PAUSED:
+        elif flow_run.state_type == StateType.PAUSED:
             await self.reject_transition(
                 state=states.Paused(name="NotReady"),
                 reason=(
@@ -811,7 +872,7 @@ class PreventRunningTasksFromStoppedFlows(BaseOrchestrationRule):
                     f" run: {flow_run.id}."
                 ),
             )
-        elif not flow_run.state.type == StateType.RUNNING:
+        elif not flow_run.state_type == StateType.RUNNING:
             # task runners should abort task run execution
             await self.abort_transition(
                 reason="The enclosing flow must be running to begin task execution.",
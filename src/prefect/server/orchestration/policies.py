@@ -13,6 +13,12 @@ mechanism to configure and observe exactly what logic will fire against a transi
 """
 
 from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from prefect.server.schemas.states import StateType
+
+# all state types a run can transition from or to
+_ALL_STATE_TYPES = (*StateType, None)
 
 
 class BaseOrchestrationPolicy(ABC):
@@ -22,6 +28,9 @@ class BaseOrchestrationPolicy(ABC):
     Different collections of orchestration rules might be used to govern various kinds
     of transitions. For example, flow-run states and task-run states might require
     different orchestration logic.
+
+    The rules of a policy are compiled into a table of the rules valid for each
+    transition the first time the rules of a transition are requested.
     """
 
     @staticmethod
@@ -38,9 +47,40 @@ class BaseOrchestrationPolicy(ABC):
         """
         Returns rules in policy that are valid for the specified state transition.
         """
+        # the table is stored on each policy class rather than inherited
+        transition_table = cls.__dict__.get("_transition_table")
+        if transition_table is None:
+            transition_table = cls._compile_transition_table()
+            cls._transition_table = transition_table
+
+        rules = transition_table.get((from_state, to_state))
+        if rules is None:
+            # transitions between unknown state types are not precompiled
+            rules = [
+                rule
+                for rule in cls.priority()
+                if from_state in rule.FROM_STATES and to_state in rule.TO_STATES
+            ]
+        return list(rules)
 
-        transition_rules = []
+    @classmethod
+    def _compile_transition_table(
+        cls,
+    ) -> Dict[Tuple[Optional[StateType], Optional[StateType]], List]:
+        """
+        Returns the rules in policy that are valid for every state transition, in
+        priority order.
+        """
+        transition_table = {
+            (from_state, to_state): []
+            for from_state in _ALL_STATE_TYPES
+            for to_state in _ALL_STATE_TYPES
+        }
         for rule in cls.priority():
-            if from_state in rule.FROM_STATES and to_state in rule.TO_STATES:
-                transition_rules.append(rule)
-        return transition_rules
+            for from_state in _ALL_STATE_TYPES:
+                if from_state not in rule.FROM_STATES:
+                    continue
+                for to_state in _ALL_STATE_TYPES:
+                    if to_state in rule.TO_STATES:
+                        transition_table[(from_state, to_state)].append(rule)
+        return transition_table
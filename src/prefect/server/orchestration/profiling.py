@@ -0,0 +1,277 @@
+"""
+Profiling of state transitions orchestrated by the Prefect REST API.
+
+Every orchestrated transition records its duration, the number of database statements
+it executed, and the time spent in the hooks of each orchestration rule. The recordings
+are aggregated into histograms in memory, which are served by
+`GET /admin/orchestration/stats`.
+
+Recording a transition takes a few microseconds, so profiling is enabled by default.
+It can be disabled with `PREFECT_API_ORCHESTRATION_PROFILING_ENABLED`.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import sqlalchemy as sa
+
+from prefect.server.schemas.states import StateType
+from prefect.settings import PREFECT_API_ORCHESTRATION_PROFILING_ENABLED
+
+DURATION_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    float("inf"),
+)
+
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, float("inf"))
+
+
+class Histogram:
+    """
+    A histogram of observed values.
+
+    Each observation is counted in the first bucket with an upper bound greater than or
+    equal to the value.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the `q` quantile of the observed values as the upper bound of the
+        bucket containing it, or the largest observed value if that is smaller. Returns
+        zero if no values have been observed.
+        """
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for upper_bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                return min(upper_bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Returns a JSON compatible summary of the histogram.
+        """
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": {
+                str(upper_bound): bucket_count
+                for upper_bound, bucket_count in zip(self.buckets, self.bucket_counts)
+            },
+        }
+
+
+class TransitionProfile:
+    """
+    The recordings of a single orchestrated transition.
+    """
+
+    def __init__(self, transition: str):
+        self.transition = transition
+        self.rule_timings: List[Tuple[str, str, float]] = []
+        self.validation_seconds: Optional[float] = None
+        self.statements = 0
+
+    def record_rule(self, rule: str, hook: str, seconds: float) -> None:
+        """
+        Record the time spent in a hook of an orchestration rule.
+        """
+        self.rule_timings.append((rule, hook, seconds))
+
+
+class OrchestrationProfiler:
+    """
+    Aggregates the profiles of orchestrated transitions into histograms.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Discard all recorded profiles.
+        """
+        with self._lock:
+            self._transitions: Dict[str, Dict[str, Histogram]] = {}
+            self._rules: Dict[str, Dict[str, Histogram]] = {}
+
+    def record(self, profile: TransitionProfile, seconds: float) -> None:
+        """
+        Record the profile of a completed transition.
+        """
+        with self._lock:
+            transition = self._transitions.get(profile.transition)
+            if transition is None:
+                transition = self._transitions[profile.transition] = {
+                    "duration_seconds": Histogram(DURATION_BUCKETS),
+                    "validation_seconds": Histogram(DURATION_BUCKETS),
+                    "statements": Histogram(STATEMENT_COUNT_BUCKETS),
+                }
+            transition["duration_seconds"].observe(seconds)
+            transition["statements"].observe(profile.statements)
+            if profile.validation_seconds is not None:
+                transition["validation_seconds"].observe(profile.validation_seconds)
+
+            for rule, hook, hook_seconds in profile.rule_timings:
+                hooks = self._rules.setdefault(rule, {})
+                histogram = hooks.get(hook)
+                if histogram is None:
+                    histogram = hooks[hook] = Histogram(DURATION_BUCKETS)
+                histogram.observe(hook_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns a JSON compatible summary of the recorded profiles.
+        """
+        with self._lock:
+            return {
+                "transitions": {
+                    transition: {
+                        name: histogram.to_dict()
+                        for name, histogram in histograms.items()
+                    }
+                    for transition, histograms in sorted(self._transitions.items())
+                },
+                "rules": {
+                    rule: {
+                        hook: histogram.to_dict() for hook, histogram in hooks.items()
+                    }
+                    for rule, hooks in sorted(self._rules.items())
+                },
+            }
+
+
+_orchestration_profiler = OrchestrationProfiler()
+
+_current_transition_profile: ContextVar[Optional[TransitionProfile]] = ContextVar(
+    "current_transition_profile", default=None
+)
+
+
+def get_orchestration_profiler() -> OrchestrationProfiler:
+    """
+    Returns the orchestration profiler of this process.
+    """
+    return _orchestration_profiler
+
+
+def current_transition_profile() -> Optional[TransitionProfile]:
+    """
+    Returns the profile of the transition being orchestrated, if it is being profiled.
+    """
+    return _current_transition_profile.get()
+
+
+def transition_name(
+    run_type: str,
+    from_state_type: Optional[StateType],
+    to_state_type: Optional[StateType],
+) -> str:
+    """
+    Returns the name under which transitions of a run between two state types are
+    recorded, for example `task_run PENDING => RUNNING`.
+    """
+    from_name = from_state_type.value if from_state_type else None
+    to_name = to_state_type.value if to_state_type else None
+    return f"{run_type} {from_name} => {to_name}"
+
+
+@contextmanager
+def profile_transition(
+    run_type: str,
+    from_state_type: Optional[StateType],
+    to_state_type: Optional[StateType],
+) -> Iterator[Optional[TransitionProfile]]:
+    """
+    Profile the orchestration of a transition.
+
+    Yields the profile of the transition, or `None` if profiling is disabled.
+    """
+    if not PREFECT_API_ORCHESTRATION_PROFILING_ENABLED.value():
+        yield None
+        return
+
+    profile = TransitionProfile(
+        transition_name(run_type, from_state_type, to_state_type)
+    )
+    token = _current_transition_profile.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        seconds = time.perf_counter() - start
+        _current_transition_profile.reset(token)
+
+        # statements of nested transitions are also statements of the outer one
+        outer_profile = _current_transition_profile.get()
+        if outer_profile is not None:
+            outer_profile.statements += profile.statements
+
+        _orchestration_profiler.record(profile, seconds)
+
+
+@contextmanager
+def profile_validation() -> Iterator[None]:
+    """
+    Records the time spent validating and committing the proposed state of the
+    transition being profiled, if any.
+    """
+    profile = _current_transition_profile.get()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.validation_seconds = time.perf_counter() - start
+
+
+@sa.event.listens_for(sa.engine.Engine, "before_cursor_execute")
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    # statements run in greenlets that share the context of the awaiting task, so
+    # they are counted against the transition that awaits them
+    profile = _current_transition_profile.get()
+    if profile is not None:
+        profile.statements += 1
@@ -18,11 +18,12 @@ single line of user code.
 """
 
 import contextlib
+import time
 from types import TracebackType
 from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
 import sqlalchemy as sa
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from prefect.logging import get_logger
@@ -30,6 +31,7 @@ from prefect.server.database.dependencies import inject_db
 from prefect.server.database.interface import PrefectDBInterface
 from prefect.server.exceptions import OrchestrationError
 from prefect.server.models import artifacts, flow_runs
+from prefect.server.orchestration.profiling import current_transition_profile
 from prefect.server.schemas import core, states
 from prefect.server.schemas.responses import (
     SetStateStatus,
@@ -50,6 +52,23 @@ TERMINAL_STATES = states.TERMINAL_STATES
 logger = get_logger("server")
 
 
+@contextlib.contextmanager
+def _profile_hook(rule: Any, hook: str):
+    """
+    Records the time spent in a hook of a rule if the transition is being profiled.
+    """
+    profile = current_transition_profile()
+    if profile is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record_rule(type(rule).__name__, hook, time.perf_counter() - start)
+
+
 class OrchestrationContext(PrefectBaseModel):
     """
     A container for a state transition, governed by orchestration rules.
@@ -366,6 +385,10 @@ class TaskOrchestrationContext(OrchestrationContext):
     # run: db.TaskRun = ...
     run: Any = ...
 
+    # the flow run of the task run, read once for all rules; copies of the context
+    # share this cache
+    _flow_run_cache: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
     @inject_db
     async def validate_proposed_state(
         self,
@@ -480,10 +503,12 @@ class TaskOrchestrationContext(OrchestrationContext):
         return self.run
 
     async def flow_run(self):
-        return await flow_runs.read_flow_run(
-            session=self.session,
-            flow_run_id=self.run.flow_run_id,
-        )
+        if "flow_run" not in self._flow_run_cache:
+            self._flow_run_cache["flow_run"] = await flow_runs.read_flow_run(
+                session=self.session,
+                flow_run_id=self.run.flow_run_id,
+            )
+        return self._flow_run_cache["flow_run"]
 
 
 class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
@@ -595,8 +620,12 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
             pass
         else:
             try:
-                entry_context = self.context.entry_context()
-                await self.before_transition(*entry_context)
+                # hooks that are not implemented are skipped along with the copy of
+                # the context they would receive
+                if self._implements_hook("before_transition"):
+                    entry_context = self.context.entry_context()
+                    with _profile_hook(self, "before_transition"):
+                        await self.before_transition(*entry_context)
                 self.context.rule_signature.append(str(self.__class__))
             except Exception as before_transition_error:
                 reason = (
@@ -632,15 +661,27 @@ class BaseOrchestrationRule(contextlib.AbstractAsyncContextManager):
         any side-effects produced by `self.before_transition`.
         """
 
-        exit_context = self.context.exit_context()
         if await self.invalid():
             pass
         elif await self.fizzled():
-            await self.cleanup(*exit_context)
+            if self._implements_hook("cleanup"):
+                exit_context = self.context.exit_context()
+                with _profile_hook(self, "cleanup"):
+                    await self.cleanup(*exit_context)
         else:
-            await self.after_transition(*exit_context)
+            if self._implements_hook("after_transition"):
+                exit_context = self.context.exit_context()
+                with _profile_hook(self, "after_transition"):
+                    await self.after_transition(*exit_context)
             self.context.finalization_signature.append(str(self.__class__))
 
+    @classmethod
+    def _implements_hook(cls, hook: str) -> bool:
+        """
+        Returns whether the rule overrides the given no-op hook of the base class.
+        """
+        return getattr(cls, hook) is not getattr(BaseOrchestrationRule, hook)
+
     async def before_transition(
         self,
         initial_state: Optional[states.State],
@@ -945,7 +986,8 @@ class BaseUniversalTransform(contextlib.AbstractAsyncContextManager):
         `self.before_transition` will fire.
         """
 
-        await self.before_transition(self.context)
+        with _profile_hook(self, "before_transition"):
+            await self.before_transition(self.context)
         self.context.rule_signature.append(str(self.__class__))
         return self.context
 
@@ -964,7 +1006,8 @@ class BaseUniversalTransform(contextlib.AbstractAsyncContextManager):
         """
 
         if not self.exception_in_transition():
-            await self.after_transition(self.context)
+            with _profile_hook(self, "after_transition"):
+                await self.after_transition(self.context)
             self.context.finalization_signature.append(str(self.__class__))
 
     async def before_transition(self, context) -> None:
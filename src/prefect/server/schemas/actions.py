@@ -321,6 +321,20 @@ class TaskRunCreate(ActionBaseModel):
     ] = FieldFrom(schemas.core.TaskRun)
 
 
+class TaskRunStateProposal(ActionBaseModel):
+    """Data used by the Prefect REST API to propose a new state for a task run"""
+
+    task_run_id: UUID = Field(default=..., description="The task run id.")
+    state: StateCreate = Field(default=..., description="The intended state.")
+    force: bool = Field(
+        default=False,
+        description=(
+            "If false, orchestration rules will be applied that may alter or prevent"
+            " the state transition. If True, orchestration rules are not applied."
+        ),
+    )
+
+
 @copy_model_fields
 class TaskRunUpdate(ActionBaseModel):
     """Data used by the Prefect REST API to update a task run"""
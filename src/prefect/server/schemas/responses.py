@@ -267,3 +267,32 @@ class DeploymentResponse(ORMBaseModel):
                 response.work_pool_name = orm_deployment.work_queue.work_pool.name
 
         return response
+
+
+class CursorPage(PrefectBaseModel):
+    """
+    A page of objects read with keyset pagination.
+    """
+
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description=(
+            "The cursor to read the next page with, or null if this is the last page."
+        ),
+    )
+
+
+class FlowRunPage(CursorPage):
+    results: List[FlowRunResponse]
+
+
+class TaskRunPage(CursorPage):
+    results: List[schemas.core.TaskRun]
+
+
+class LogPage(CursorPage):
+    results: List[schemas.core.Log]
+
+
+class ArtifactPage(CursorPage):
+    results: List[schemas.core.Artifact]
@@ -2,8 +2,12 @@
 Schedule schemas
 """
 
+import calendar
 import datetime
-from typing import Any, Generator, List, Optional, Tuple, Union
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Generator, List, NamedTuple, Optional, Tuple, Union
 
 import dateutil
 import dateutil.rrule
@@ -18,6 +22,215 @@ MAX_ITERATIONS = 1000
 # approx. 1 years worth of RDATEs + buffer
 MAX_RRULE_LENGTH = 6500
 
+# The number of occurrences of a schedule computed at once and cached. No call to
+# generate dates returns more than this many dates.
+OCCURRENCE_BATCH_SIZE = MAX_ITERATIONS + 2
+
+# The maximum number of occurrences cached across all schedules, about 8 MB of
+# timestamps. The least recently used schedules are evicted first.
+MAX_CACHED_OCCURRENCES = 200_000
+
+_MICROSECONDS_PER_SECOND = 1_000_000
+_ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECONDS_PER_DAY = 86_400 * _MICROSECONDS_PER_SECOND
+
+# The longest span of time searched for cron occurrences at once
+_MAX_CRON_SPAN = 2 * 366 * _MICROSECONDS_PER_DAY
+
+# Local times this close to a DST transition may be ambiguous or nonexistent, so dates
+# this close to one are never computed in bulk
+_DST_TRANSITION_MARGIN = 3 * 3600 * _MICROSECONDS_PER_SECOND
+
+
+class _Occurrences(NamedTuple):
+    """
+    Occurrences of a schedule as microsecond UTC timestamps. Every occurrence from
+    `start` through `covered_until` is included in `timestamps`.
+    """
+
+    start: int
+    covered_until: float
+    timestamps: List[int]
+
+
+_occurrence_cache: "OrderedDict[str, _Occurrences]" = OrderedDict()
+_cached_occurrence_count = 0
+
+
+def _to_timestamp(dt: datetime.datetime) -> int:
+    """Convert a timezone-aware datetime to a UTC timestamp in microseconds."""
+    return (
+        int(dt.replace(microsecond=0).timestamp()) * _MICROSECONDS_PER_SECOND
+        + dt.microsecond
+    )
+
+
+class _Transitions(NamedTuple):
+    """
+    The UTC timestamps in microseconds at which the UTC offset of a timezone changes,
+    starting before any supported date, and the UTC offsets from each in microseconds.
+    """
+
+    timestamps: List[float]
+    offsets: List[int]
+
+
+@lru_cache(maxsize=None)
+def _get_transitions(timezone: str) -> Optional[_Transitions]:
+    """
+    Returns the UTC offset transitions of a timezone, or `None` if the timezone is
+    unknown.
+    """
+    try:
+        tz = pytz.timezone(timezone)
+    except pytz.UnknownTimeZoneError:
+        return None
+
+    if not hasattr(tz, "_utc_transition_times"):
+        offset = tz.utcoffset(datetime.datetime(2000, 1, 1))
+        return _Transitions([float("-inf")], [offset // _ONE_MICROSECOND])
+
+    return _Transitions(
+        [
+            calendar.timegm(transition.timetuple()) * _MICROSECONDS_PER_SECOND
+            for transition in tz._utc_transition_times
+        ],
+        [offset // _ONE_MICROSECOND for offset, _, _ in tz._transition_info],
+    )
+
+
+def _is_near_transition(transitions: _Transitions, timestamp: int) -> bool:
+    """
+    Whether a timestamp is within `_DST_TRANSITION_MARGIN` of a UTC offset transition.
+    """
+    index = bisect_right(transitions.timestamps, timestamp)
+    return (
+        not index
+        or timestamp - transitions.timestamps[index - 1] < _DST_TRANSITION_MARGIN
+        or (
+            index < len(transitions.timestamps)
+            and transitions.timestamps[index] - timestamp < _DST_TRANSITION_MARGIN
+        )
+    )
+
+
+def _get_utc_offset(transitions: _Transitions, timestamp: int) -> int:
+    """Returns the UTC offset at a timestamp, in microseconds."""
+    return transitions.offsets[bisect_right(transitions.timestamps, timestamp) - 1]
+
+
+def _from_timestamp(timestamp: int, timezone: str) -> pendulum.DateTime:
+    """
+    Convert a UTC timestamp in microseconds to a datetime in the given timezone.
+
+    Away from UTC offset transitions, the local time is computed from the offset
+    directly, which is much faster than converting through pendulum.
+    """
+    transitions = _get_transitions(timezone)
+    if transitions is not None and not _is_near_transition(transitions, timestamp):
+        offset = _get_utc_offset(transitions, timestamp)
+        local = _EPOCH + datetime.timedelta(microseconds=timestamp + offset)
+        dt = pendulum.DateTime(
+            local.year,
+            local.month,
+            local.day,
+            local.hour,
+            local.minute,
+            local.second,
+            local.microsecond,
+            tzinfo=pendulum.timezone(timezone),
+        )
+        # guard against timezone databases that disagree
+        if dt.utcoffset() // _ONE_MICROSECOND == offset:
+            return dt
+
+    seconds, microseconds = divmod(timestamp, _MICROSECONDS_PER_SECOND)
+    return pendulum.from_timestamp(seconds, tz=timezone).replace(
+        microsecond=microseconds
+    )
+
+
+def _get_cached_timestamps(
+    key: str,
+    n: int,
+    start: datetime.datetime,
+    end: Optional[datetime.datetime],
+    get_timestamps: Callable[[int, int], Optional[Tuple[float, List[int]]]],
+) -> Optional[List[int]]:
+    """
+    Returns the timestamps of the first `n` occurrences of a schedule from `start`
+    through `end`, or `None` if they cannot be computed in bulk.
+
+    Occurrences are computed `OCCURRENCE_BATCH_SIZE` at a time by `get_timestamps` and
+    cached by `key`, so that later calls for overlapping windows, like those made by the
+    scheduler on every loop, only select from the cached occurrences.
+    """
+    n = min(n, OCCURRENCE_BATCH_SIZE)
+    start = _to_timestamp(start)
+    end = _to_timestamp(end) if end is not None else None
+
+    occurrences = _occurrence_cache.get(key)
+    if occurrences is not None:
+        timestamps = _select_timestamps(occurrences, n, start, end)
+        if timestamps is not None:
+            _occurrence_cache.move_to_end(key)
+            return timestamps
+
+    result = get_timestamps(start, OCCURRENCE_BATCH_SIZE)
+    if result is None:
+        return None
+
+    occurrences = _Occurrences(start, *result)
+    _cache_occurrences(key, occurrences)
+    return _select_timestamps(occurrences, n, start, end)
+
+
+def _cache_occurrences(key: str, occurrences: _Occurrences) -> None:
+    """
+    Cache the occurrences of a schedule, evicting the least recently used schedules
+    until no more than `MAX_CACHED_OCCURRENCES` occurrences are cached.
+    """
+    global _cached_occurrence_count
+
+    previous = _occurrence_cache.pop(key, None)
+    if previous is not None:
+        _cached_occurrence_count -= len(previous.timestamps)
+
+    _occurrence_cache[key] = occurrences
+    _cached_occurrence_count += len(occurrences.timestamps)
+    while _cached_occurrence_count > MAX_CACHED_OCCURRENCES:
+        _, evicted = _occurrence_cache.popitem(last=False)
+        _cached_occurrence_count -= len(evicted.timestamps)
+
+
+def _schedule_cache_key(schedule: "PrefectBaseModel") -> str:
+    return f"{type(schedule).__name__}:{schedule.json()}"
+
+
+def _select_timestamps(
+    occurrences: _Occurrences, n: int, start: int, end: Optional[int]
+) -> Optional[List[int]]:
+    """
+    Select the first `n` occurrences from `start` through `end`, or return `None` if
+    the occurrences do not cover them.
+    """
+    if start < occurrences.start:
+        return None
+
+    timestamps = occurrences.timestamps
+    first = bisect_left(timestamps, start)
+    last = bisect_right(timestamps, end) if end is not None else len(timestamps)
+    selected = timestamps[first : min(last, first + n)]
+
+    # fewer than `n` occurrences are only complete if no occurrence after the covered
+    # ones could be selected
+    if len(selected) < n and (end if end is not None else float("inf")) > (
+        occurrences.covered_until
+    ):
+        return None
+    return selected
+
 
 def _prepare_scheduling_start_and_end(
     start: Any, end: Any, timezone: str
@@ -161,6 +374,14 @@ class IntervalSchedule(PrefectBaseModel):
         anchor_tz = self.anchor_date.in_tz(self.timezone)
         start, end = _prepare_scheduling_start_and_end(start, end, self.timezone)
 
+        timestamps = _get_cached_timestamps(
+            _schedule_cache_key(self), n, start, end, self._get_timestamps
+        )
+        if timestamps is not None:
+            for timestamp in timestamps:
+                yield _from_timestamp(timestamp, anchor_tz.timezone_name)
+            return
+
         # compute the offset between the anchor date and the start date to jump to the
         # next date
         offset = (start - anchor_tz).total_seconds() / self.interval.total_seconds()
@@ -201,6 +422,40 @@ class IntervalSchedule(PrefectBaseModel):
 
             next_date = next_date.add(days=interval_days, seconds=interval_seconds)
 
+    def _get_timestamps(
+        self, start: int, count: int
+    ) -> Optional[Tuple[float, List[int]]]:
+        """
+        Computes the timestamps of the first `count` dates on or after the `start`
+        timestamp at once, along with the timestamp they cover the schedule until.
+
+        Returns `None` if the dates cannot be computed at once because they, or the
+        anchor date, are close to a DST boundary.
+        """
+        interval = (
+            self.interval.days * 86_400 + self.interval.seconds
+        ) * _MICROSECONDS_PER_SECOND + self.interval.microseconds
+        anchor = _to_timestamp(self.anchor_date)
+        first = anchor - (anchor - start) // interval * interval
+        timestamps = list(range(first, first + count * interval, interval))
+
+        # dates follow UTC intervals away from DST boundaries
+        transitions = _get_transitions(self.timezone)
+        if transitions is None or _is_near_transition(transitions, anchor):
+            return None
+
+        next_transition = bisect_right(
+            transitions.timestamps, first - interval - _DST_TRANSITION_MARGIN
+        )
+        if next_transition == len(transitions.timestamps):
+            return timestamps[-1], timestamps
+        until = transitions.timestamps[next_transition] - _DST_TRANSITION_MARGIN
+        if until < first:
+            return None
+        if timestamps[-1] <= until:
+            return timestamps[-1], timestamps
+        return until, timestamps[: bisect_right(timestamps, until)]
+
 
 class CronSchedule(PrefectBaseModel):
     """
@@ -316,6 +571,14 @@ class CronSchedule(PrefectBaseModel):
         elif self.timezone:
             start = start.in_tz(self.timezone)
 
+        timestamps = _get_cached_timestamps(
+            _schedule_cache_key(self), n, start, end, self._get_timestamps
+        )
+        if timestamps is not None:
+            for timestamp in timestamps:
+                yield _from_timestamp(timestamp, start.timezone_name)
+            return
+
         # subtract one second from the start date, so that croniter returns it
         # as an event (if it meets the cron criteria)
         start = start.subtract(seconds=1)
@@ -357,6 +620,87 @@ class CronSchedule(PrefectBaseModel):
 
             counter += 1
 
+    def _get_timestamps(
+        self, start: int, count: int
+    ) -> Optional[Tuple[float, List[int]]]:
+        """
+        Computes the timestamps of the first `count` dates on or after the `start`
+        timestamp at once, along with the timestamp they cover the schedule until.
+
+        Dates are matched against the expanded cron fields one day at a time in local
+        time, using the UTC offset at `start` until the next DST boundary. Returns
+        `None` for cron strings with special day expressions, seconds, or a `start`
+        close to a DST boundary, which are left to croniter.
+        """
+        if len(self.cron.split()) != 5:
+            return None
+        cron = croniter(self.cron, day_or=self.day_or)
+        if cron.nth_weekday_of_month or any(
+            value != "*" and not isinstance(value, int)
+            for field in cron.expanded
+            for value in field
+        ):
+            return None
+
+        timezone = self.timezone or "UTC"
+        transitions = _get_transitions(timezone)
+        if transitions is None or _is_near_transition(transitions, start):
+            return None
+        until = start + _MAX_CRON_SPAN
+        next_transition = bisect_right(transitions.timestamps, start)
+        if next_transition < len(transitions.timestamps):
+            until = min(
+                until,
+                transitions.timestamps[next_transition] - _DST_TRANSITION_MARGIN,
+            )
+
+        minutes, hours, days, months, weekdays = (
+            None if field == ["*"] else set(field) for field in cron.expanded
+        )
+        if weekdays is not None:
+            weekdays = {weekday % 7 for weekday in weekdays}
+        times_of_day = sorted(
+            (hour * 3600 + minute * 60) * _MICROSECONDS_PER_SECOND
+            for hour in (range(24) if hours is None else hours)
+            for minute in (range(60) if minutes is None else minutes)
+        )
+
+        # find occurrences in local time and convert them back to UTC
+        offset = _get_utc_offset(transitions, start)
+        local_start, local_until = start + offset, until + offset
+        epoch_ordinal = _EPOCH.toordinal()
+        timestamps = []
+        day = local_start // _MICROSECONDS_PER_DAY
+        while len(timestamps) < count:
+            day_start = day * _MICROSECONDS_PER_DAY
+            if day_start > local_until:
+                break
+            date = datetime.date.fromordinal(epoch_ordinal + day)
+            day += 1
+
+            if months is not None and date.month not in months:
+                continue
+            day_matches = days is None or date.day in days
+            weekday_matches = weekdays is None or date.isoweekday() % 7 in weekdays
+            if days is None or weekdays is None or not self.day_or:
+                matches = day_matches and weekday_matches
+            else:
+                matches = day_matches or weekday_matches
+            if not matches:
+                continue
+
+            first = bisect_left(times_of_day, local_start - day_start)
+            last = bisect_right(times_of_day, local_until - day_start)
+            last = min(last, first + count - len(timestamps))
+            timestamps.extend(
+                day_start - offset + time_of_day
+                for time_of_day in times_of_day[first:last]
+            )
+
+        if len(timestamps) == count:
+            return timestamps[-1], timestamps
+        return until, timestamps
+
 
 class RRuleSchedule(PrefectBaseModel):
     """
@@ -565,6 +909,14 @@ class RRuleSchedule(PrefectBaseModel):
             else:
                 n = 1
 
+        timestamps = _get_cached_timestamps(
+            _schedule_cache_key(self), n, start, end, self._get_timestamps
+        )
+        if timestamps is not None:
+            for timestamp in timestamps:
+                yield _from_timestamp(timestamp, self.timezone)
+            return
+
         dates = set()
         counter = 0
 
@@ -588,5 +940,31 @@ class RRuleSchedule(PrefectBaseModel):
 
             counter += 1
 
+    def _get_timestamps(
+        self, start: int, count: int
+    ) -> Optional[Tuple[float, List[int]]]:
+        """
+        Computes the timestamps of the first `count` dates on or after the `start`
+        timestamp at once, along with the timestamp they cover the schedule until.
+
+        Returns `None` if the rule produces duplicate or out of order dates, which
+        can happen around DST boundaries.
+        """
+        timestamps = []
+        seconds, microseconds = divmod(start, _MICROSECONDS_PER_SECOND)
+        start = datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc).replace(
+            microsecond=microseconds
+        )
+        for next_date in self.to_rrule().xafter(start, count=None, inc=True):
+            timestamp = _to_timestamp(next_date)
+            if timestamps and timestamp <= timestamps[-1]:
+                return None
+            timestamps.append(timestamp)
+            if len(timestamps) == count:
+                return timestamp, timestamps
+
+        # the rule has no more dates
+        return float("inf"), timestamps
+
 
 SCHEDULE_TYPES = Union[IntervalSchedule, CronSchedule, RRuleSchedule]
@@ -1,6 +1,11 @@
 import prefect.server.services.cancellation_cleanup
 import prefect.server.services.flow_run_notifications
 import prefect.server.services.late_runs
+import prefect.server.services.log_buffer
+import prefect.server.services.partition_maintenance
 import prefect.server.services.pause_expirations
+import prefect.server.services.retention
+import prefect.server.services.run_history_rollups
 import prefect.server.services.scheduler
+import prefect.server.services.task_cache_sweeper
 import prefect.server.services.telemetry
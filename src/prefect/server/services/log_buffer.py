@@ -0,0 +1,229 @@
+"""
+The LogBuffer service. Responsible for writing logs sent to the API to the database in
+large batches.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+import prefect.server.models as models
+import prefect.server.schemas as schemas
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_SERVICES_LOG_BUFFER_LOOP_SECONDS,
+    PREFECT_API_SERVICES_LOG_BUFFER_MAX_SIZE,
+)
+
+# The log buffer running in this process, if any
+_log_buffer: Optional["LogBuffer"] = None
+
+
+def get_log_buffer() -> Optional["LogBuffer"]:
+    """
+    Returns the log buffer service running in this process, or `None` if it is not
+    running.
+    """
+    return _log_buffer
+
+
+class LogBuffer(LoopService):
+    """
+    A write-behind buffer for logs.
+
+    Logs are added to the buffer with `put` and written to the database in batches on
+    each loop, using the bulk loading method of the database. When the buffer is full,
+    `put` waits for buffered logs to be written. Any logs left in the buffer are written
+    when the service stops.
+    """
+
+    def __init__(
+        self, loop_seconds: float = None, max_size: Optional[int] = None, **kwargs
+    ):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_LOG_BUFFER_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+        self.max_size = max_size or PREFECT_API_SERVICES_LOG_BUFFER_MAX_SIZE.value()
+
+        # write at most this many logs in a single transaction
+        self.batch_size = 10_000
+
+        # retry a batch that fails to be written this many times before writing it in
+        # smaller pieces and dropping the logs that cannot be written
+        self.max_retries = 3
+        self._failed_writes = 0
+
+        # report ingest rates this often, in seconds
+        self.report_seconds = 60
+
+        self._logs: Deque[schemas.actions.LogCreate] = deque()
+        self._space = asyncio.Condition()
+        self._accepting = False
+
+        self.received = 0
+        self.written = 0
+        self._last_report = time.monotonic()
+        self._received_at_last_report = 0
+        self._written_at_last_report = 0
+
+    async def _on_start(self) -> None:
+        global _log_buffer
+        await super()._on_start()
+        self._accepting = True
+        _log_buffer = self
+
+    async def _on_stop(self) -> None:
+        global _log_buffer
+        if _log_buffer is self:
+            _log_buffer = None
+
+        # stop accepting logs and release any requests waiting for space, which will
+        # write their logs themselves
+        self._accepting = False
+        async with self._space:
+            self._space.notify_all()
+
+        try:
+            await self.flush()
+        except Exception:
+            self.logger.error(
+                f"Failed to write {len(self._logs)} buffered logs on shutdown.",
+                exc_info=True,
+            )
+        await super()._on_stop()
+
+    async def stop(self, block=True) -> None:
+        """
+        Stops the service, optionally blocking until all buffered logs have been
+        written.
+        """
+        self._stop()
+        if block:
+            while self._is_running:
+                await asyncio.sleep(0.1)
+
+    async def put(self, logs: List[schemas.actions.LogCreate]) -> bool:
+        """
+        Add logs to the buffer, waiting for space if the buffer is full.
+
+        Returns `False` if the buffer is not accepting logs and the caller must write
+        them itself.
+        """
+        async with self._space:
+            await self._space.wait_for(
+                lambda: not self._accepting
+                or not self._logs
+                or len(self._logs) + len(logs) <= self.max_size
+            )
+            if not self._accepting:
+                return False
+
+            self._logs.extend(logs)
+            self.received += len(logs)
+            return True
+
+    async def run_once(self) -> None:
+        """
+        Write the buffered logs to the database and periodically report ingest rates.
+        """
+        await self.flush()
+
+        now = time.monotonic()
+        if now - self._last_report >= self.report_seconds:
+            stats = self.stats(now)
+            self.logger.info(
+                f"Received {stats['receive_rate']:.1f} logs/sec and wrote"
+                f" {stats['write_rate']:.1f} logs/sec over the last"
+                f" {now - self._last_report:.0f} seconds."
+            )
+            self._last_report = now
+            self._received_at_last_report = self.received
+            self._written_at_last_report = self.written
+
+    @inject_db
+    async def flush(self, db: PrefectDBInterface) -> None:
+        """
+        Write all buffered logs to the database in batches.
+
+        If a batch fails to be written, it is returned to the front of the buffer so
+        that it is retried on the next flush. Once it has failed `max_retries` times,
+        it is split in halves until the logs that cannot be written are found, and
+        those logs are dropped so that they do not hold up the logs behind them.
+        """
+        while self._logs:
+            batch = [
+                self._logs.popleft()
+                for _ in range(min(self.batch_size, len(self._logs)))
+            ]
+            started = time.monotonic()
+            try:
+                await self._write(db, batch)
+                written = len(batch)
+            except Exception:
+                self._failed_writes += 1
+                if self._failed_writes <= self.max_retries:
+                    self._logs.extendleft(reversed(batch))
+                    raise
+
+                self.logger.warning(
+                    f"Failed to write a batch of {len(batch)} logs"
+                    f" {self._failed_writes} times, writing it in smaller batches."
+                )
+                written = await self._write_bisected(db, batch)
+            self._failed_writes = 0
+
+            self.written += written
+            self.logger.debug(
+                f"Wrote {written} logs in {time.monotonic() - started:.3f} seconds."
+            )
+            async with self._space:
+                self._space.notify_all()
+
+    async def _write(
+        self, db: PrefectDBInterface, logs: List[schemas.actions.LogCreate]
+    ) -> None:
+        async with db.session_context(begin_transaction=True) as session:
+            await models.logs.bulk_create_logs(session=session, logs=logs)
+
+    async def _write_bisected(
+        self, db: PrefectDBInterface, logs: List[schemas.actions.LogCreate]
+    ) -> int:
+        """
+        Write logs in halves until each half is written or is a single log that cannot
+        be written, which is dropped. Returns the number of logs written.
+        """
+        try:
+            await self._write(db, logs)
+            return len(logs)
+        except Exception:
+            if len(logs) == 1:
+                self.logger.exception(
+                    f"Dropping a log of flow run {logs[0].flow_run_id} that could not"
+                    " be written."
+                )
+                return 0
+
+        middle = len(logs) // 2
+        return await self._write_bisected(
+            db, logs[:middle]
+        ) + await self._write_bisected(db, logs[middle:])
+
+    def stats(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Returns counters for the buffer and its receive and write rates, in logs per
+        second, since the ingest rates were last reported.
+        """
+        now = now if now is not None else time.monotonic()
+        elapsed = max(now - self._last_report, 1e-9)
+        return {
+            "received": self.received,
+            "written": self.written,
+            "buffered": len(self._logs),
+            "receive_rate": (self.received - self._received_at_last_report) / elapsed,
+            "write_rate": (self.written - self._written_at_last_report) / elapsed,
+        }
@@ -0,0 +1,74 @@
+"""
+The PartitionMaintenance service. Responsible for creating the upcoming partitions of
+partitioned tables on PostgreSQL, so that new rows are always written to the partition
+of their interval instead of the default partition.
+"""
+
+import asyncio
+
+import pendulum
+
+from prefect.server.database import partitioning
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_DATABASE_PARTITION_INTERVAL,
+    PREFECT_API_SERVICES_PARTITION_MAINTENANCE_LOOP_SECONDS,
+    PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE,
+)
+
+
+class PartitionMaintenance(LoopService):
+    """
+    A loop service that creates partitions of partitioned tables ahead of time.
+
+    On each loop, every partitioned table is given partitions up to the end of the
+    `PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE`th interval after the current
+    one. Old partitions are dropped by the `Retention` service.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_PARTITION_MAINTENANCE_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        self.interval: partitioning.PartitionInterval = (
+            PREFECT_API_DATABASE_PARTITION_INTERVAL.value()
+        )
+        self.premake: int = PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE.value()
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Creates the upcoming partitions of each partitioned table.
+        """
+        until = partitioning.upcoming_partitions_end(
+            pendulum.now("UTC"), self.interval, self.premake
+        )
+
+        async with db.session_context() as session:
+            tables = await partitioning.read_partitioned_tables(session)
+
+        if not tables:
+            self.logger.debug("No partitioned tables to maintain.")
+            return
+
+        for table in sorted(tables):
+            # each table is maintained in its own transaction so that the lock taken
+            # on it to attach partitions is held briefly
+            async with db.session_context(begin_transaction=True) as session:
+                created = await partitioning.create_partitions(
+                    session=session,
+                    table=table,
+                    until=until,
+                    interval=self.interval,
+                )
+            if created:
+                self.logger.info(
+                    f"Created {len(created)} partitions of {table!r}: "
+                    + ", ".join(partition.name for partition in created)
+                )
+            await asyncio.sleep(0)
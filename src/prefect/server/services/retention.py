@@ -0,0 +1,254 @@
+"""
+The Retention service. Responsible for pruning runs, states, logs, artifacts, and cached
+task run states once they are older than their retention periods.
+The retention periods can be configured with the `PREFECT_API_SERVICES_RETENTION_*`
+settings; data is kept forever by default.
+"""
+
+import asyncio
+import datetime
+import gzip
+import json
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+import pendulum
+from pydantic.json import pydantic_encoder
+
+import prefect.server.models as models
+from prefect.server.database import partitioning
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.schemas.states import StateType
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import (
+    PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH,
+    PREFECT_API_SERVICES_RETENTION_ARTIFACTS_AFTER,
+    PREFECT_API_SERVICES_RETENTION_BATCH_SIZE,
+    PREFECT_API_SERVICES_RETENTION_DEPLOYMENT_IDS,
+    PREFECT_API_SERVICES_RETENTION_FLOW_RUNS_AFTER,
+    PREFECT_API_SERVICES_RETENTION_LOGS_AFTER,
+    PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS,
+    PREFECT_API_SERVICES_RETENTION_STATE_TYPES,
+    PREFECT_API_SERVICES_RETENTION_STATES_AFTER,
+    PREFECT_API_SERVICES_RETENTION_TASK_RUN_STATE_CACHE_AFTER,
+    comma_separated_values,
+)
+from prefect.utilities.asyncutils import run_sync_in_worker_thread
+
+
+def _write_archive(
+    directory: Path, suffix: str, table: str, rows: List[Dict[str, Any]]
+) -> None:
+    path = directory / f"{table}-{suffix}.jsonl.gz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # each batch is appended as a separate gzip member, which readers decompress as
+    # one stream
+    with gzip.open(path, "at", encoding="utf-8") as archive:
+        for row in rows:
+            archive.write(json.dumps(row, default=pydantic_encoder) + "\n")
+
+
+class Retention(LoopService):
+    """
+    A loop service that prunes data older than its retention period.
+
+    On each loop, flow runs, flow and task run states, logs, artifacts, and cached task
+    run states are pruned in that order. Each table is pruned in batches of
+    `PREFECT_API_SERVICES_RETENTION_BATCH_SIZE` rows, one transaction per batch, and
+    the number of rows pruned from each table is logged. Tables partitioned on
+    PostgreSQL are first pruned by dropping their partitions older than the retention
+    period, unless the pruned runs are limited to other state types than the
+    default or to some deployments, or pruned rows are archived.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        self.batch_size: int = PREFECT_API_SERVICES_RETENTION_BATCH_SIZE.value()
+        self.flow_runs_after: Optional[datetime.timedelta] = (
+            PREFECT_API_SERVICES_RETENTION_FLOW_RUNS_AFTER.value()
+        )
+        self.states_after: Optional[datetime.timedelta] = (
+            PREFECT_API_SERVICES_RETENTION_STATES_AFTER.value()
+        )
+        self.logs_after: Optional[datetime.timedelta] = (
+            PREFECT_API_SERVICES_RETENTION_LOGS_AFTER.value()
+        )
+        self.artifacts_after: Optional[datetime.timedelta] = (
+            PREFECT_API_SERVICES_RETENTION_ARTIFACTS_AFTER.value()
+        )
+        self.task_run_state_cache_after: Optional[datetime.timedelta] = (
+            PREFECT_API_SERVICES_RETENTION_TASK_RUN_STATE_CACHE_AFTER.value()
+        )
+        self.state_types: List[StateType] = [
+            StateType(state_type.upper())
+            for state_type in PREFECT_API_SERVICES_RETENTION_STATE_TYPES.value()
+        ]
+        self.deployment_ids: Optional[List[UUID]] = [
+            UUID(deployment_id)
+            for deployment_id in PREFECT_API_SERVICES_RETENTION_DEPLOYMENT_IDS.value()
+        ] or None
+
+        archive_path = PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH.value()
+        self.archive_path: Optional[Path] = (
+            archive_path.expanduser() if archive_path else None
+        )
+
+        # dropping a partition prunes every row in it without filtering or archiving
+        # them, so partitions are only dropped if neither is configured
+        default_state_types = {
+            StateType(state_type.upper())
+            for state_type in comma_separated_values(
+                None, PREFECT_API_SERVICES_RETENTION_STATE_TYPES.field.default
+            )
+        }
+        self.drop_partitions: bool = (
+            set(self.state_types) == default_state_types
+            and self.deployment_ids is None
+            and self.archive_path is None
+        )
+
+        # the number of rows pruned from each table by the most recent loop, and the
+        # number of partitions dropped from each partitioned table
+        self.pruned: Dict[str, int] = {}
+        self.dropped_partitions: Dict[str, int] = {}
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Prunes each table with a retention period, in batches.
+        """
+        now = pendulum.now("UTC")
+        run_filters = dict(
+            state_types=self.state_types, deployment_ids=self.deployment_ids
+        )
+
+        # the tables to prune, the time before which their rows are pruned, and the
+        # function that prunes a batch of their rows; the rows pruned with flow runs
+        # include their task runs and states
+        pruners = []
+        for table, retention_period, prune in [
+            ("flow_run", self.flow_runs_after, models.retention.prune_flow_runs),
+            (
+                "flow_run_state",
+                self.states_after,
+                models.retention.prune_flow_run_states,
+            ),
+            (
+                "task_run_state",
+                self.states_after,
+                models.retention.prune_task_run_states,
+            ),
+            ("log", self.logs_after, models.retention.prune_logs),
+            ("artifact", self.artifacts_after, models.retention.prune_artifacts),
+        ]:
+            if retention_period is not None:
+                older_than = now - retention_period
+                pruners.append(
+                    (
+                        table,
+                        older_than,
+                        partial(prune, older_than=older_than, **run_filters),
+                    )
+                )
+
+        # expired cached states are always pruned
+        cache_older_than = (
+            now - self.task_run_state_cache_after
+            if self.task_run_state_cache_after is not None
+            else None
+        )
+        pruners.append(
+            (
+                "task_run_state_cache",
+                cache_older_than,
+                partial(
+                    models.retention.prune_task_run_state_cache,
+                    older_than=cache_older_than,
+                ),
+            )
+        )
+
+        partitioned_tables = set()
+        if self.drop_partitions:
+            async with db.session_context() as session:
+                partitioned_tables = await partitioning.read_partitioned_tables(session)
+
+        self.pruned = {}
+        self.dropped_partitions = {}
+        for table, older_than, prune in pruners:
+            if table in partitioned_tables:
+                # partitioned tables are pruned by dropping whole partitions, which
+                # is far cheaper than deleting their rows; the rows of partitions that
+                # hold current states or rows of unprunable runs are pruned in batches
+                async with db.session_context(begin_transaction=True) as session:
+                    dropped = await partitioning.drop_partitions(
+                        session=session,
+                        table=table,
+                        older_than=older_than,
+                        state_types=self.state_types,
+                    )
+                    if dropped and table == "task_run_state":
+                        models.task_run_state_cache.invalidate_memory_cache_on_commit(
+                            session
+                        )
+                self.dropped_partitions[table] = len(dropped)
+
+            self.pruned[table] = await self._prune_in_batches(db, prune, now)
+
+        self.logger.info(
+            "Pruned "
+            + ", ".join(f"{count} {table} rows" for table, count in self.pruned.items())
+            + "".join(
+                f", {count} {table} partitions"
+                for table, count in self.dropped_partitions.items()
+            )
+            + "."
+        )
+
+    async def _prune_in_batches(
+        self,
+        db: PrefectDBInterface,
+        prune,
+        loop_started: pendulum.DateTime,
+    ) -> int:
+        archived = []
+
+        async def archive(table: str, rows: List[Dict[str, Any]]) -> None:
+            archived.append((table, rows))
+
+        pruned = 0
+        while True:
+            archived.clear()
+            async with db.session_context(begin_transaction=True) as session:
+                count = await prune(
+                    session=session,
+                    limit=self.batch_size,
+                    archive=archive if self.archive_path is not None else None,
+                )
+            pruned += count
+
+            # archives are written once the batch is committed so that the
+            # transaction is not held open while they are compressed; rows are
+            # archived to a file per table, including the child rows of flow runs
+            for table, rows in archived:
+                await run_sync_in_worker_thread(
+                    _write_archive,
+                    self.archive_path,
+                    loop_started.format("YYYYMMDDTHHmmss"),
+                    table,
+                    rows,
+                )
+
+            if count < self.batch_size:
+                return pruned
+
+            # yield to other tasks between batches of a large backlog
+            await asyncio.sleep(0)
@@ -0,0 +1,124 @@
+"""
+The RunHistoryRollups service. Responsible for maintaining the rollups of flow and task
+run history used to answer run history queries without scanning every run.
+"""
+
+import asyncio
+import datetime
+from typing import Optional, Set
+
+import pendulum
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.models.run_history_rollups import (
+    RUN_HISTORY_ROLLUP_RUN_TYPES,
+    floor_datetime,
+)
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS
+
+
+class RunHistoryRollups(LoopService):
+    """
+    A loop service that rolls up flow and task run history by minute and hour.
+
+    On each loop, every hour before the current one that has not been rolled up yet is
+    rolled up, and hours with runs updated since the previous loop are rolled up again.
+    The current hour is never rolled up, so run history for it is always read from the
+    runs themselves.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # runs updated up to this long before the previous loop started are checked
+        # for changes again, so that changes committed while the previous loop was
+        # running are not missed
+        self.update_overlap = datetime.timedelta(seconds=60)
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        - Rolls up the hours that have passed since the previous loop
+        - Rolls up the hours with runs updated since the previous loop again
+        - Records the progress of the rollups for `run_history` to read
+        """
+        started = pendulum.now("UTC")
+        rolled_up_until = floor_datetime(started, 3600)
+
+        async with db.session_context() as session:
+            state = await models.run_history_rollups.read_run_history_rollup_state(
+                session=session
+            )
+
+        rolled_up_hours = 0
+        for run_type in RUN_HISTORY_ROLLUP_RUN_TYPES:
+            hours = await self._hours_to_rollup(
+                db, run_type, state.get(run_type, {}), rolled_up_until
+            )
+            for hour in sorted(hours):
+                async with db.session_context(begin_transaction=True) as session:
+                    await models.run_history_rollups.rollup_run_history(
+                        session=session, run_type=run_type, hour_start=hour
+                    )
+                # yield to other tasks between hours during a long backfill
+                await asyncio.sleep(0)
+
+            rolled_up_hours += len(hours)
+            state[run_type] = {
+                "rolled_up_until": rolled_up_until,
+                "updated_after": started - self.update_overlap,
+            }
+
+        async with db.session_context(begin_transaction=True) as session:
+            await models.run_history_rollups.write_run_history_rollup_state(
+                session=session, state=state
+            )
+
+        self.logger.info(f"Rolled up {rolled_up_hours} hours of run history.")
+
+    async def _hours_to_rollup(
+        self,
+        db: PrefectDBInterface,
+        run_type: str,
+        progress: dict,
+        rolled_up_until: datetime.datetime,
+    ) -> Set[pendulum.DateTime]:
+        previously_rolled_up_until: Optional[datetime.datetime] = progress.get(
+            "rolled_up_until"
+        )
+
+        async with db.session_context() as session:
+            hours = set()
+            if "updated_after" in progress:
+                hours.update(
+                    await models.run_history_rollups.read_run_history_hours_updated_after(
+                        session=session,
+                        run_type=run_type,
+                        updated_after=progress["updated_after"],
+                        expected_start_time_before=rolled_up_until,
+                    )
+                )
+
+            # find every hour with runs that has passed since the previous loop, or
+            # every hour with runs if this run type has never been rolled up
+            hour = previously_rolled_up_until
+            while True:
+                hour = await models.run_history_rollups.read_next_run_history_hour(
+                    session=session,
+                    run_type=run_type,
+                    after=hour,
+                    before=rolled_up_until,
+                )
+                if hour is None:
+                    break
+                hours.add(hour)
+                hour = hour.add(hours=1)
+
+        return hours
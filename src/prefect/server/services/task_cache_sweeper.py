@@ -0,0 +1,52 @@
+"""
+The TaskCacheSweeper service. Responsible for deleting expired cached task run states.
+"""
+
+import asyncio
+
+import prefect.server.models as models
+from prefect.server.database.dependencies import inject_db
+from prefect.server.database.interface import PrefectDBInterface
+from prefect.server.services.loop_service import LoopService
+from prefect.settings import PREFECT_API_SERVICES_TASK_CACHE_SWEEPER_LOOP_SECONDS
+
+
+class TaskCacheSweeper(LoopService):
+    """
+    A simple loop service responsible for deleting cached task run states whose cache
+    expiration has passed.
+    """
+
+    def __init__(self, loop_seconds: float = None, **kwargs):
+        super().__init__(
+            loop_seconds=loop_seconds
+            or PREFECT_API_SERVICES_TASK_CACHE_SWEEPER_LOOP_SECONDS.value(),
+            **kwargs,
+        )
+
+        # delete this many cached states at once
+        self.batch_size = 1000
+
+        # the number of cached states deleted by the most recent loop
+        self.deleted = 0
+
+    @inject_db
+    async def run_once(self, db: PrefectDBInterface):
+        """
+        Deletes expired cached states in batches until there are none left.
+        """
+        self.deleted = 0
+        while True:
+            async with db.session_context(begin_transaction=True) as session:
+                count = await models.task_run_state_cache.delete_expired_cached_states(
+                    session=session, limit=self.batch_size
+                )
+            self.deleted += count
+
+            if count < self.batch_size:
+                break
+
+            # yield to other tasks between batches of a large backlog
+            await asyncio.sleep(0)
+
+        self.logger.info(f"Deleted {self.deleted} expired cached task run states.")
@@ -0,0 +1,28 @@
+"""
+In-process notifications of logs being written for flow runs.
+
+Requests streaming the logs of a flow run can wait on the notifier for new logs instead
+of polling for them. Logs are only announced to waiters in the same API server process
+once the transaction that wrote them has committed; logs written by other processes are
+picked up when the wait times out.
+"""
+from prefect.server.utilities.notifications import CommitNotifier
+
+
+class LogNotifier(CommitNotifier):
+    """
+    Wakes up requests waiting for logs to be written for flow runs.
+    """
+
+    def __init__(self):
+        super().__init__(name="log")
+
+
+_log_notifier = LogNotifier()
+
+
+def get_log_notifier() -> LogNotifier:
+    """
+    Returns the log notifier of this process.
+    """
+    return _log_notifier
@@ -0,0 +1,101 @@
+"""
+In-process notifications of database changes to objects.
+
+Requests can wait on a notifier for objects to change instead of polling the database
+for them. Changes are only announced to waiters in the same API server process once
+the transaction that made them has committed; changes made by other processes are
+picked up when the wait times out.
+"""
+import asyncio
+from collections import defaultdict
+from typing import Dict, Iterable, Set
+from uuid import UUID
+
+import sqlalchemy as sa
+
+
+class CommitNotifier:
+    """
+    Wakes up requests waiting for changes to objects, identified by their ids.
+
+    Args:
+        name: A name for the kind of change, unique among the notifiers that may
+            notify on commit of the same session
+    """
+
+    def __init__(self, name: str):
+        self._waiters: Dict[UUID, Set[asyncio.Future]] = defaultdict(set)
+
+        # The keys of the ids to notify and of whether the notifier is listening for
+        # transactions to end in `Session.info`
+        self._pending_ids_key = f"prefect_{name}_notifier_pending_ids"
+        self._listening_key = f"prefect_{name}_notifier_listening"
+
+    async def wait(self, ids: Iterable[UUID], timeout: float) -> bool:
+        """
+        Wait until any of the given objects change.
+
+        Returns:
+            bool: `True` if an object changed, `False` if the wait timed out
+        """
+        ids = set(ids)
+        if not ids or timeout <= 0:
+            return False
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        for id in ids:
+            self._waiters[id].add(waiter)
+
+        try:
+            await asyncio.wait_for(waiter, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            for id in ids:
+                waiters = self._waiters.get(id)
+                if waiters is not None:
+                    waiters.discard(waiter)
+                    if not waiters:
+                        del self._waiters[id]
+
+    def notify(self, ids: Iterable[UUID]) -> None:
+        """
+        Wake up every request waiting on any of the given objects.
+        """
+        for id in set(ids):
+            for waiter in self._waiters.pop(id, ()):
+                if not waiter.done():
+                    waiter.get_loop().call_soon_threadsafe(_set_waiter_result, waiter)
+
+    def notify_on_commit(self, session: sa.orm.Session, ids: Iterable[UUID]) -> None:
+        """
+        Wake up requests waiting on any of the given objects once the session's current
+        transaction commits.
+        """
+        ids = {id for id in ids if id is not None}
+        if not ids:
+            return
+
+        pending_ids_key = self._pending_ids_key
+        sync_session = getattr(session, "sync_session", session)
+        if not sync_session.info.get(self._listening_key):
+            sync_session.info[self._listening_key] = True
+
+            def after_commit(session: sa.orm.Session):
+                self.notify(session.info.pop(pending_ids_key, ()))
+
+            def after_rollback(session: sa.orm.Session):
+                session.info.pop(pending_ids_key, None)
+
+            sa.event.listen(sync_session, "after_commit", after_commit)
+            sa.event.listen(sync_session, "after_rollback", after_rollback)
+
+        pending = sync_session.info.setdefault(pending_ids_key, set())
+        pending.update(ids)
+
+
+def _set_waiter_result(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
@@ -0,0 +1,204 @@
+"""
+Keyset pagination of Prefect REST API objects.
+
+Reading a deep page with `OFFSET` requires the database to scan every earlier row.
+Keyset pagination instead selects the rows that sort after the last row of the
+previous page, which uses the same index as the first page no matter how deep the page
+is. Rows are sorted by one of the sort options in `schemas.sorting`, with ties broken
+by id so that every row has a unique, stable position.
+
+The position after the last row of a page is returned to clients as an opaque cursor.
+"""
+import base64
+import datetime
+import json
+from typing import Any, Awaitable, Callable, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+import pendulum
+import sqlalchemy as sa
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import ColumnElement, FunctionElement
+
+from prefect.utilities.collections import AutoEnum
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised when a pagination cursor cannot be decoded or was created for another sort.
+    """
+
+
+class KeysetCursor(NamedTuple):
+    """
+    The position after which a page starts: the sort value and id of the last row of
+    the previous page. The first page has no id.
+    """
+
+    value: Any = None
+    id: Optional[UUID] = None
+
+
+def _sort_expression(sort_clause: ColumnElement) -> Tuple[ColumnElement, bool]:
+    """
+    Returns the expression sorted by a sort clause and whether it is sorted in
+    descending order.
+    """
+    return sort_clause.element, sort_clause.modifier is operators.desc_op
+
+
+def apply_keyset_pagination(
+    query: sa.sql.Select,
+    sort_clause: ColumnElement,
+    id_column: ColumnElement,
+    cursor: KeysetCursor,
+) -> sa.sql.Select:
+    """
+    Order a query by a sort clause with ties broken by id, and only select the rows
+    after the given cursor.
+
+    Null values of the sort expression are sorted last in both directions so that the
+    position of a row does not depend on the database.
+    """
+    expression, descending = _sort_expression(sort_clause)
+    after = operators.lt if descending else operators.gt
+    nullable = getattr(expression, "nullable", True)
+
+    if getattr(expression, "key", None) == id_column.key:
+        order_by = [sort_clause]
+        if cursor.id is not None:
+            query = query.where(after(id_column, cursor.id))
+        return query.order_by(None).order_by(*order_by)
+
+    order_by = [
+        expression.desc() if descending else expression.asc(),
+        id_column.desc() if descending else id_column.asc(),
+    ]
+    if nullable:
+        order_by[0] = order_by[0].nulls_last()
+
+    if cursor.id is not None:
+        if cursor.value is None:
+            query = query.where(
+                sa.and_(expression.is_(None), after(id_column, cursor.id))
+            )
+        else:
+            conditions = [
+                after(expression, cursor.value),
+                sa.and_(expression == cursor.value, after(id_column, cursor.id)),
+            ]
+            if nullable:
+                conditions.append(expression.is_(None))
+            query = query.where(sa.or_(*conditions))
+
+    return query.order_by(None).order_by(*order_by)
+
+
+def _sort_value(obj: Any, expression: ColumnElement) -> Any:
+    if isinstance(expression, FunctionElement):
+        # Sorts by functions of columns are limited to `coalesce`
+        for clause in expression.clauses:
+            value = _sort_value(obj, clause)
+            if value is not None:
+                return value
+        return None
+    return getattr(obj, expression.key)
+
+
+def cursor_after(obj: Any, sort_clause: ColumnElement) -> KeysetCursor:
+    """
+    Returns the cursor positioned after the given ORM object.
+    """
+    expression, _ = _sort_expression(sort_clause)
+    return KeysetCursor(value=_sort_value(obj, expression), id=obj.id)
+
+
+def encode_cursor(sort: AutoEnum, cursor: KeysetCursor) -> str:
+    """
+    Encode a cursor for the given sort as an opaque string.
+    """
+    value = cursor.value
+    if isinstance(value, datetime.datetime):
+        value_type, value = "datetime", value.isoformat()
+    elif isinstance(value, UUID):
+        value_type, value = "uuid", str(value)
+    else:
+        value_type = "json"
+
+    data = {
+        "sort": sort.value,
+        "type": value_type,
+        "value": value,
+        "id": str(cursor.id),
+    }
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).decode()
+
+
+def decode_cursor(cursor: Optional[str], sort: AutoEnum) -> KeysetCursor:
+    """
+    Decode a cursor created by `encode_cursor`. A missing cursor selects the first
+    page.
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid or was created for another sort
+    """
+    if not cursor:
+        return KeysetCursor()
+
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        value = data["value"]
+        if value is not None and data["type"] == "datetime":
+            value = pendulum.parse(value)
+        elif value is not None and data["type"] == "uuid":
+            value = UUID(value)
+        decoded = KeysetCursor(value=value, id=UUID(data["id"]))
+        cursor_sort = data["sort"]
+    except Exception as exc:
+        raise InvalidCursorError("Invalid pagination cursor.") from exc
+
+    if cursor_sort != sort.value:
+        raise InvalidCursorError(
+            f"Pagination cursor was created for sort {cursor_sort!r}, not"
+            f" {sort.value!r}."
+        )
+    return decoded
+
+
+async def read_page(
+    read: Callable[[KeysetCursor, int], Awaitable[List[Any]]],
+    sort: AutoEnum,
+    sort_clause: ColumnElement,
+    cursor: Optional[str],
+    limit: int,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Read the page of objects after a cursor.
+
+    Args:
+        read: A function that reads up to the given number of objects after a cursor
+            with `apply_keyset_pagination`
+        sort: The sort of the objects
+        sort_clause: The SQL clause of the sort
+        cursor: The cursor returned with the previous page, if any
+        limit: The maximum number of objects in the page
+
+    Returns:
+        The objects in the page and the cursor of the next page, or `None` if this is
+        the last page
+
+    Raises:
+        InvalidCursorError: If the cursor is invalid
+    """
+    after = decode_cursor(cursor, sort)
+
+    # Read one more object than requested to learn if there is a next page
+    objects = await read(after, limit + 1)
+    if len(objects) <= limit:
+        return objects, None
+    if limit == 0:
+        return [], cursor
+
+    return objects[:limit], encode_cursor(
+        sort, cursor_after(objects[limit - 1], sort_clause)
+    )
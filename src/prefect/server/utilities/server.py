@@ -4,12 +4,19 @@ Utilities for the Prefect REST API server.
 import functools
 import inspect
 from contextlib import AsyncExitStack, asynccontextmanager
+from contextvars import ContextVar
 from typing import Any, Callable, Coroutine, Iterable, Set, get_type_hints
 
 from fastapi import APIRouter, Request, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.routing import APIRoute
 
 from prefect._internal.compatibility.deprecated import deprecated_callable
+from prefect.utilities import wire
+
+# Whether the client of the current request accepts MessagePack responses; set by the
+# API's `WireFormatMiddleware`
+accepts_msgpack: ContextVar[bool] = ContextVar("accepts_msgpack", default=False)
 
 
 def method_paths_from_routes(routes: Iterable[APIRoute]) -> Set[str]:
@@ -81,6 +88,26 @@ def response_scoped_dependency(dependency: Callable):
     return wrapper
 
 
+class _MsgPackNegotiationMixin:
+    def render(self, content: Any) -> bytes:
+        if accepts_msgpack.get():
+            self.media_type = wire.MSGPACK_MEDIA_TYPE
+            return wire.msgpack_dumps(content)
+        return super().render(content)
+
+
+class PrefectJSONResponse(_MsgPackNegotiationMixin, JSONResponse):
+    """
+    A JSON response that is encoded as MessagePack for clients that accept it.
+    """
+
+
+class PrefectORJSONResponse(_MsgPackNegotiationMixin, ORJSONResponse):
+    """
+    An ORJSON response that is encoded as MessagePack for clients that accept it.
+    """
+
+
 class PrefectAPIRoute(APIRoute):
     """
     A FastAPIRoute class which attaches an async stack to requests that exits before
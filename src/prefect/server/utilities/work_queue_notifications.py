@@ -0,0 +1,28 @@
+"""
+In-process notifications of flow runs being scheduled in work queues.
+
+Requests for scheduled flow runs can wait on the notifier for runs to be scheduled in
+their work queues instead of polling for them. Runs are only announced to waiters in
+the same API server process once the transaction that scheduled them has committed;
+runs scheduled by other processes are picked up when the wait times out.
+"""
+from prefect.server.utilities.notifications import CommitNotifier
+
+
+class WorkQueueNotifier(CommitNotifier):
+    """
+    Wakes up requests waiting for flow runs to be scheduled in work queues.
+    """
+
+    def __init__(self):
+        super().__init__(name="work_queue")
+
+
+_work_queue_notifier = WorkQueueNotifier()
+
+
+def get_work_queue_notifier() -> WorkQueueNotifier:
+    """
+    Returns the work queue notifier of this process.
+    """
+    return _work_queue_notifier
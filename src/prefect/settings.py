@@ -235,6 +235,14 @@ def get_extra_loggers(_: "Settings", value: str) -> List[str]:
     return [name.strip() for name in value.split(",")] if value else []
 
 
+def comma_separated_values(_: "Settings", value: str) -> List[str]:
+    """
+    `value_callback` that parses a CSV string into a list of values with whitespace
+    trimmed, skipping empty values.
+    """
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
 def expanduser_in_path(_, value: Path) -> Path:
     return value.expanduser()
 
@@ -536,6 +544,46 @@ If the API does not support HTTP/2, this will have no effect and connections wil
 made via HTTP/1.1.
 """
 
+PREFECT_API_ENABLE_MSGPACK = Setting(bool, default=False)
+"""
+If true, send request bodies to the API as MessagePack and request MessagePack
+responses, which are smaller and faster to encode and decode than JSON. Requires the
+`msgpack` package on clients and servers; otherwise, JSON is used. Defaults to `False`.
+"""
+
+PREFECT_API_ENABLE_ZSTD = Setting(bool, default=False)
+"""
+If true, compress large request bodies sent to the API with Zstandard and request
+Zstandard compressed responses. Requires the `zstandard` package on clients and
+servers; otherwise, responses are compressed with gzip. Defaults to `False`.
+"""
+
+PREFECT_API_MAX_CONNECTIONS = Setting(int, default=16)
+"""
+The maximum number of concurrent connections a client may open to the API. We see
+instability when allowing clients to open many connections at once, limiting
+concurrency results in more stable performance. Defaults to `16`.
+"""
+
+PREFECT_API_MAX_KEEPALIVE_CONNECTIONS = Setting(int, default=8)
+"""
+The maximum number of idle connections a client keeps open to the API for reuse.
+Defaults to `8`.
+"""
+
+PREFECT_API_KEEPALIVE_EXPIRY = Setting(float, default=25)
+"""
+The number of seconds an idle connection to the API is kept open for reuse. The Prefect
+Cloud load balancer keeps connections alive for 30 seconds. Defaults to `25`.
+"""
+
+PREFECT_API_SHARED_CONNECTION_POOLS = Setting(bool, default=True)
+"""
+If true, clients of the same API in the same event loop share their connection pool, so
+concurrent and nested clients reuse open connections instead of opening their own. The
+pool is closed when the last client using it is closed. Defaults to `True`.
+"""
+
 
 PREFECT_CLIENT_MAX_RETRIES = Setting(int, default=5)
 """
@@ -645,6 +693,29 @@ The default setting for persisting results when not otherwise specified. If enab
 flow and task results will be persisted unless they opt out.
 """
 
+PREFECT_RESULTS_BINARY_BLOBS = Setting(
+    bool,
+    default=False,
+)
+"""
+If enabled, persisted results are written in a binary format which stores the
+serializer's output without further encoding. Results in this format are read from
+local file systems through a memory map, so large objects such as NumPy arrays can be
+loaded without copying. Results written in this format cannot be read by Prefect
+versions that do not support it.
+"""
+
+PREFECT_RESULTS_CACHE_MAX_BYTES = Setting(
+    int,
+    default=100 * 1024 * 1024,
+)
+"""
+The maximum total size, in bytes, of persisted result data to keep in the
+process-wide result cache. Results read from storage are kept in memory, least
+recently used first out, so that consumers in the same process do not retrieve and
+deserialize the same result repeatedly. Set to 0 to disable the cache.
+"""
+
 PREFECT_TASKS_REFRESH_CACHE = Setting(
     bool,
     default=False,
@@ -680,6 +751,38 @@ This value sets the default retry delay seconds for all tasks.
 This value does not overwrite invidually set retry delay seconds
 """
 
+PREFECT_TASK_MAP_CREATE_BATCH_SIZE = Setting(int, default=500)
+"""
+The number of task runs created with a single API call when mapping a task.
+If more tasks are mapped than this amount, their task runs will be created
+in batches of this size. Defaults to `500`.
+"""
+
+PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT = Setting(int, default=100)
+"""
+The default maximum number of child task runs that a streaming map (`Task.imap`)
+submits ahead of the results it has yielded. Defaults to `100`.
+"""
+
+PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED = Setting(bool, default=False)
+"""
+If `True`, state proposals made concurrently by the task runs of a flow run are
+sent to the API in batches instead of with a request per proposal. Defaults to
+`False`.
+"""
+
+PREFECT_TASK_RUN_STATE_PIPELINING_BATCH_SIZE = Setting(int, default=100)
+"""
+The maximum number of task run state proposals sent in one batch when state
+pipelining is enabled. Defaults to `100`.
+"""
+
+PREFECT_TASK_RUN_STATE_PIPELINING_INTERVAL = Setting(float, default=0.01)
+"""
+The number of seconds task run state proposals are collected before a batch
+is sent when state pipelining is enabled. Defaults to `0.01`.
+"""
+
 PREFECT_LOCAL_STORAGE_PATH = Setting(
     Path,
     default=Path("${PREFECT_HOME}") / "storage",
@@ -835,6 +938,29 @@ The agent loop interval, in seconds. Agents will check for new runs this often.
 Defaults to `15`.
 """
 
+PREFECT_AGENT_LONG_POLL_SECONDS = Setting(
+    float,
+    default=0,
+)
+"""
+If set, the number of seconds an agent polling a work pool should wait on the API for
+flow runs to be scheduled each time it queries for scheduled flow runs. Flow runs
+scheduled while the agent waits are picked up immediately, and the agent queries again
+one second after the previous query returns instead of waiting
+`PREFECT_AGENT_QUERY_INTERVAL`. Requires an API that supports waiting for scheduled flow
+runs; defaults to `0` (disabled).
+"""
+
+PREFECT_AGENT_METADATA_CACHE_TTL_SECONDS = Setting(
+    float,
+    default=300,
+)
+"""
+The number of seconds an agent caches the deployments, flows, and infrastructure blocks
+of the flow runs it submits. Cached objects are revalidated each time the agent reloads
+its work queues. Set to `0` to disable caching.
+"""
+
 PREFECT_AGENT_PREFETCH_SECONDS = Setting(
     int,
     default=15,
@@ -940,6 +1066,15 @@ PREFECT_API_DATABASE_CONNECTION_TIMEOUT = Setting(
 connections. Defaults to `5`.
 """
 
+PREFECT_API_DATABASE_PARTITION_INTERVAL = Setting(
+    Literal["day", "week", "month"],
+    default="week",
+)
+"""The interval of time each partition of a partitioned table holds, on PostgreSQL
+databases converted with `prefect server database partition`. Changing the interval
+only affects partitions created afterwards. Defaults to `week`.
+"""
+
 PREFECT_API_SERVICES_SCHEDULER_LOOP_SECONDS = Setting(
     float,
     default=60,
@@ -1046,6 +1181,160 @@ PREFECT_API_SERVICES_CANCELLATION_CLEANUP_LOOP_SECONDS = Setting(
 this often. Defaults to `20`.
 """
 
+PREFECT_API_SERVICES_LOG_BUFFER_LOOP_SECONDS = Setting(
+    float,
+    default=1,
+)
+"""The log buffer service will write the logs it has buffered to the database this
+often. Defaults to `1`.
+"""
+
+PREFECT_API_SERVICES_LOG_BUFFER_MAX_SIZE = Setting(
+    int,
+    default=100_000,
+)
+"""The maximum number of logs the log buffer service holds in memory. Requests to
+create logs wait for buffered logs to be written while the buffer is full. Defaults to
+`100000`.
+"""
+
+PREFECT_API_LOG_STREAM_POLL_SECONDS = Setting(
+    float,
+    default=5,
+)
+"""Requests streaming the logs of a flow run are woken up as soon as logs are written
+by the same API server process, and check for logs written by other processes this
+often. A heartbeat is sent to the client whenever no logs were found. Defaults to `5`.
+"""
+
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_LOOP_SECONDS = Setting(
+    float,
+    default=60,
+)
+"""The run history rollups service will update the rollups of runs changed since its
+last loop this often. Run history served from the rollups may be out of date by up to
+this many seconds. Defaults to `60`.
+"""
+
+PREFECT_API_SERVICES_TASK_CACHE_SWEEPER_LOOP_SECONDS = Setting(
+    float,
+    default=300,
+)
+"""The task cache sweeper service will delete expired cached task run states this
+often. Defaults to `300`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_LOOP_SECONDS = Setting(
+    float,
+    default=3600,
+)
+"""The retention service will prune data older than its retention period this often.
+Defaults to `3600`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_BATCH_SIZE = Setting(
+    int,
+    default=1000,
+)
+"""The retention service deletes at most this many rows of a table per transaction, so
+that pruning a large backlog does not hold locks for long. Defaults to `1000`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_FLOW_RUNS_AFTER = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The retention service will delete flow runs, along with their task runs and states,
+this long after they entered their current state. Flow runs are kept forever if not
+set. Defaults to `None`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_STATES_AFTER = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The retention service will delete the flow and task run states of flow runs this
+long after they were entered. The current state of a run is never deleted. States are
+kept forever if not set. Defaults to `None`.
+
+If the state tables are partitioned, whole partitions older than this are dropped
+instead, regardless of the state type and deployment of their runs.
+"""
+
+PREFECT_API_SERVICES_RETENTION_LOGS_AFTER = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The retention service will delete logs this long after they were emitted. Logs are
+kept forever if not set. Defaults to `None`.
+
+If the log table is partitioned, whole partitions older than this are dropped instead,
+regardless of the state type and deployment of their runs.
+"""
+
+PREFECT_API_SERVICES_RETENTION_ARTIFACTS_AFTER = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The retention service will delete artifacts this long after they were created. The
+latest artifact of each key and the results of remaining states are never deleted.
+Artifacts are kept forever if not set. Defaults to `None`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_TASK_RUN_STATE_CACHE_AFTER = Setting(
+    Optional[timedelta],
+    default=None,
+)
+"""The retention service will delete cached task run states this long after they were
+cached. Expired cached states are always deleted. Defaults to `None`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_STATE_TYPES = Setting(
+    str,
+    default="COMPLETED,CANCELLED,FAILED,CRASHED",
+    value_callback=comma_separated_values,
+)
+"""The retention service only prunes flow runs in these state types, and the states,
+logs, and artifacts of those flow runs. Values should be comma separated. Defaults to
+`COMPLETED,CANCELLED,FAILED,CRASHED`.
+"""
+
+PREFECT_API_SERVICES_RETENTION_DEPLOYMENT_IDS = Setting(
+    str,
+    default="",
+    value_callback=comma_separated_values,
+)
+"""If set, the retention service only prunes flow runs created by these deployments,
+and the states, logs, and artifacts of those flow runs. Values should be comma
+separated. Defaults to pruning the runs of all deployments and of no deployment.
+"""
+
+PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH = Setting(
+    Optional[Path],
+    default=None,
+)
+"""If set, the retention service writes the rows it prunes to gzip compressed JSON
+lines files in this directory before deleting them, one file per table per loop.
+Defaults to `None`.
+"""
+
+PREFECT_API_SERVICES_PARTITION_MAINTENANCE_LOOP_SECONDS = Setting(
+    float,
+    default=3600,
+)
+"""The partition maintenance service will create upcoming partitions of partitioned
+tables this often. Defaults to `3600`.
+"""
+
+PREFECT_API_SERVICES_PARTITION_MAINTENANCE_PREMAKE = Setting(
+    int,
+    default=4,
+)
+"""The partition maintenance service keeps this many partitions after the current one
+created ahead of time, so that rows are never written to the default partition.
+Defaults to `4`.
+"""
+
 PREFECT_API_DEFAULT_LIMIT = Setting(
     int,
     default=200,
@@ -1054,6 +1343,16 @@ PREFECT_API_DEFAULT_LIMIT = Setting(
 multiple objects, such as `POST /flow_runs/filter`.
 """
 
+PREFECT_API_MAX_DECODED_BODY_SIZE = Setting(
+    int,
+    default=100 * 1024 * 1024,
+)
+"""
+The maximum size, in bytes, of MessagePack or Zstandard compressed request bodies
+received by the API, both before and after they are decoded. Larger requests are
+rejected. Defaults to 100 MiB.
+"""
+
 PREFECT_SERVER_API_HOST = Setting(
     str,
     default="127.0.0.1",
@@ -1147,6 +1446,46 @@ The maximum number of characters allowed for a task run cache key.
 This setting cannot be changed client-side, it must be set on the server.
 """
 
+PREFECT_API_TASK_CACHE_MEMORY_SIZE = Setting(int, default=1000)
+"""
+The maximum number of recently retrieved cached task run states kept in the memory of
+the server, so that repeated cache hits do not read the database. Set to `0` to always
+read cached states from the database.
+This setting cannot be changed client-side, it must be set on the server.
+"""
+
+PREFECT_API_TASK_CACHE_MEMORY_TTL = Setting(float, default=60)
+"""
+The number of seconds a cached task run state is kept in the memory of the server.
+When several server processes share a database, a process may return the state it
+retrieved for a cache key for this long after another process cached a newer one.
+This setting cannot be changed client-side, it must be set on the server.
+"""
+
+PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED = Setting(bool, default=False)
+"""
+Whether or not task run concurrency slots should be managed in the memory of the
+server instead of the `active_slots` of concurrency limits in the database. Task runs
+waiting for a slot are queued and woken as soon as a slot is released instead of
+retrying every 30 seconds. Only enable this for a single server process; after a
+restart, slots are held again by the task runs that are in a Running state.
+This setting cannot be changed client-side, it must be set on the server.
+"""
+
+PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT = Setting(float, default=10.0)
+"""
+When concurrency slot leases are enabled, the maximum number of seconds a request to
+move a task run into a Running state waits in the queue for a concurrency slot before
+the client is instructed to try again.
+"""
+
+PREFECT_API_TASK_CONCURRENCY_SLOT_LEASE_DURATION = Setting(float, default=30.0)
+"""
+When concurrency slot leases are enabled, the number of seconds a slot granted to a
+waiting task run is reserved for. If the task run does not enter a Running state
+before its lease expires, the slot is released to the next waiter.
+"""
+
 PREFECT_API_SERVICES_CANCELLATION_CLEANUP_ENABLED = Setting(
     bool,
     default=True,
@@ -1156,6 +1495,63 @@ application. If disabled, task runs and subflow runs belonging to cancelled flow
 remain in non-terminal states.
 """
 
+PREFECT_API_ORCHESTRATION_PROFILING_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to profile state transitions orchestrated by the API. The duration,
+database statement count, and time spent in each orchestration rule of transitions are
+served by `GET /admin/orchestration/stats`. Defaults to `True`.
+"""
+
+PREFECT_API_SERVICES_LOG_BUFFER_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the log buffer service in the server application. If
+enabled, logs sent to the API are acknowledged as soon as they are buffered in memory
+and are written to the database in large batches, so they may take up to
+`PREFECT_API_SERVICES_LOG_BUFFER_LOOP_SECONDS` to be readable. Buffered logs are lost
+if the server exits without shutting down.
+"""
+
+PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the run history rollups service in the server application.
+If enabled, flow and task run history is aggregated by minute and hour in the
+background and queries for run history are answered from the aggregates where
+possible instead of scanning every run.
+"""
+
+PREFECT_API_SERVICES_TASK_CACHE_SWEEPER_ENABLED = Setting(
+    bool,
+    default=True,
+)
+"""Whether or not to start the task cache sweeper service in the server application.
+If disabled, expired cached task run states are only deleted by the retention service.
+"""
+
+PREFECT_API_SERVICES_RETENTION_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the retention service in the server application. If
+enabled, runs, states, logs, artifacts, and cached task run states are pruned once
+they are older than the retention periods configured by the
+`PREFECT_API_SERVICES_RETENTION_*` settings.
+"""
+
+PREFECT_API_SERVICES_PARTITION_MAINTENANCE_ENABLED = Setting(
+    bool,
+    default=False,
+)
+"""Whether or not to start the partition maintenance service in the server application.
+It should be enabled once the database has been partitioned with
+`prefect server database partition`, and does nothing on SQLite.
+"""
+
 PREFECT_EXPERIMENTAL_ENABLE_EVENTS_CLIENT = Setting(bool, default=True)
 """
 Whether or not to enable experimental Prefect work pools.
@@ -1202,6 +1598,23 @@ The number of seconds into the future a worker should query for scheduled flow r
 Can be used to compensate for infrastructure start up time for a worker.
 """
 
+PREFECT_WORKER_LONG_POLL_SECONDS = Setting(float, default=0)
+"""
+If set, the number of seconds a worker should wait on the API for flow runs to be
+scheduled each time it queries for scheduled flow runs. Flow runs scheduled while the
+worker waits are picked up immediately, and the worker queries again one second after
+the previous query returns instead of waiting `PREFECT_WORKER_QUERY_SECONDS`. Requires
+an API that supports waiting for scheduled flow runs; defaults to `0` (disabled).
+"""
+
+PREFECT_WORKER_METADATA_CACHE_TTL_SECONDS = Setting(float, default=300)
+"""
+The number of seconds a worker caches the deployments and flows of the flow runs it
+submits. Cached objects are revalidated each time the worker sends a heartbeat, so
+changes to deployments are picked up within `PREFECT_WORKER_HEARTBEAT_SECONDS`. Set to
+`0` to disable caching.
+"""
+
 PREFECT_EXPERIMENTAL_ENABLE_ARTIFACTS = Setting(bool, default=True)
 """
 Whether or not to enable experimental Prefect artifacts.
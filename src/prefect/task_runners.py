@@ -34,6 +34,21 @@ Example:
     goodbye marvin
     ```
 
+    Switching to a `ProcessPoolTaskRunner`:
+    ```
+    >>> from prefect.task_runners import ProcessPoolTaskRunner
+    >>> flow.task_runner = ProcessPoolTaskRunner()
+    >>> greetings(["arthur", "trillian", "ford", "marvin"])
+    hello arthur
+    hello trillian
+    goodbye arthur
+    hello ford
+    goodbye trillian
+    hello marvin
+    goodbye ford
+    goodbye marvin
+    ```
+
     Switching to a `DaskTaskRunner`:
     ```
     >>> from prefect_dask.task_runners import DaskTaskRunner
@@ -52,7 +67,14 @@ Example:
 For usage details, see the [Task Runners](/concepts/task-runners/) documentation.
 """
 import abc
+import asyncio
+import multiprocessing
+import multiprocessing.util
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -62,21 +84,32 @@ from typing import (
     Dict,
     Optional,
     Set,
+    Tuple,
     TypeVar,
 )
 from uuid import UUID
 
 import anyio
+import cloudpickle
 
 from prefect._internal.concurrency.primitives import Event
 from prefect.client.schemas.objects import State
 from prefect.logging import get_logger
+from prefect.results import PersistedResult, ResultFactory
+from prefect.settings import (
+    PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_KEY,
+    PREFECT_API_URL,
+)
 from prefect.states import exception_to_crashed_state
-from prefect.utilities.collections import AutoEnum
+from prefect.utilities.annotations import NotSet, quote
+from prefect.utilities.collections import AutoEnum, StopVisiting, visit_collection
 
 if TYPE_CHECKING:
     import anyio.abc
 
+    from prefect.client.orchestration import PrefectClient
+
 
 T = TypeVar("T", bound="BaseTaskRunner")
 R = TypeVar("R")
@@ -363,3 +396,328 @@ class ConcurrentTaskRunner(BaseTaskRunner):
         """
         self.__dict__.update(data)
         self._task_group = None
+
+
+class ProcessPoolTaskRunner(BaseTaskRunner):
+    """
+    A parallel task runner that executes task runs in a pool of worker processes.
+
+    Unlike the `ConcurrentTaskRunner`, synchronous tasks are not limited by the global
+    interpreter lock. The worker processes are started with the task runner and are
+    reused for every task run submitted while it is running; each worker keeps its API
+    clients open between task runs.
+
+    Task run results are persisted by the worker and returned to the flow by reference,
+    unless the task explicitly disables result persistence. Result storage must be
+    accessible from both the flow and the workers.
+
+    Args:
+        max_workers: The number of worker processes. Defaults to the number of CPUs.
+
+    Example:
+        ```
+        Using processes for parallelism:
+        >>> from prefect import flow
+        >>> from prefect.task_runners import ProcessPoolTaskRunner
+        >>> @flow(task_runner=ProcessPoolTaskRunner(max_workers=4))
+        >>> def my_flow():
+        >>>     ...
+        ```
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+
+        # Runtime attributes
+        self._executor: ProcessPoolExecutor = None
+        self._task_group: anyio.abc.TaskGroup = None
+        self._result_events: Dict[UUID, Event] = {}
+        self._results: Dict[UUID, Any] = {}
+
+        super().__init__()
+
+    @property
+    def concurrency_type(self) -> TaskConcurrencyType:
+        return TaskConcurrencyType.PARALLEL
+
+    def duplicate(self):
+        return type(self)(max_workers=self.max_workers)
+
+    async def submit(
+        self,
+        key: UUID,
+        call: Callable[[], Awaitable[State[R]]],
+    ) -> None:
+        if not self._started:
+            raise RuntimeError(
+                "The task runner must be started before submitting work."
+            )
+
+        if not self._executor:
+            raise RuntimeError(
+                "The process pool task runner cannot be used to submit work after "
+                "serialization."
+            )
+
+        # Create an event to set on completion
+        self._result_events[key] = Event()
+
+        self._task_group.start_soon(self._run_and_store_result, key, call)
+
+    async def wait(
+        self,
+        key: UUID,
+        timeout: float = None,
+    ) -> Optional[State]:
+        if not self._executor:
+            raise RuntimeError(
+                "The process pool task runner cannot be used to wait for work after "
+                "serialization."
+            )
+
+        result = None  # retval on timeout
+
+        with anyio.move_on_after(timeout):
+            await self._result_events[key].wait()
+            result = self._results[key]
+
+        return result
+
+    async def _run_and_store_result(
+        self, key: UUID, call: Callable[[], Awaitable[State[R]]]
+    ):
+        """
+        Run the call in a worker process and store the resulting state in memory on
+        completion.
+
+        Failures to submit the call or to retrieve its result are captured as crashed
+        states to prevent them from crashing the flow run.
+        """
+        try:
+            if isinstance(call, partial):
+                call = partial(
+                    call.func,
+                    *call.args,
+                    **self._prepare_call_kwargs(
+                        await self._resolve_futures(call.keywords)
+                    ),
+                )
+
+            future = self._executor.submit(_run_in_worker, cloudpickle.dumps(call))
+            result = cloudpickle.loads(await asyncio.wrap_future(future))
+        except BaseException as exc:
+            result = await exception_to_crashed_state(exc)
+
+        self._results[key] = result
+        self._result_events[key].set()
+
+    async def _resolve_futures(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Replace the futures in the call's arguments with their final states.
+
+        Futures cannot be waited for in the worker processes, but their states can be
+        resolved there just like futures.
+        """
+        from prefect.futures import PrefectFuture
+
+        futures = set()
+
+        def collect_futures(expr, context):
+            # Expressions inside quotes should not be traversed
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+
+            if isinstance(expr, PrefectFuture):
+                futures.add(expr)
+
+            return expr
+
+        visit_collection(kwargs, visit_fn=collect_futures, context={})
+
+        if not futures:
+            return kwargs
+
+        states = dict(
+            zip(futures, await asyncio.gather(*[future._wait() for future in futures]))
+        )
+
+        def replace_futures(expr, context):
+            if isinstance(context.get("annotation"), quote):
+                raise StopVisiting()
+
+            return states.get(expr, expr) if isinstance(expr, PrefectFuture) else expr
+
+        return visit_collection(
+            kwargs,
+            visit_fn=replace_futures,
+            return_data=True,
+            context={},
+            copy_unchanged=False,
+        )
+
+    def _prepare_call_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Persist task run results so they are returned by reference instead of being
+        sent back through the process pool, unless the task opted out of persistence.
+        """
+        result_factory = kwargs.get("result_factory")
+        task = kwargs.get("task")
+
+        if (
+            isinstance(result_factory, ResultFactory)
+            and not result_factory.persist_result
+            and getattr(task, "persist_result", None) is None
+        ):
+            kwargs["result_factory"] = result_factory.copy(
+                update={"persist_result": True}
+            )
+
+        return kwargs
+
+    async def _start(self, exit_stack: AsyncExitStack):
+        """
+        Start the process pool and wait for all of its workers to be ready
+        """
+        max_workers = self.max_workers or os.cpu_count() or 1
+
+        context = multiprocessing.get_context("spawn")
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=_initialize_worker,
+            initargs=(context.Barrier(max_workers),),
+        )
+        exit_stack.callback(self._executor.shutdown, wait=True)
+
+        # Submitting a call per worker starts all of the workers; each waits for the
+        # others during initialization so the pool is warm once these calls return
+        await asyncio.gather(
+            *[
+                asyncio.wrap_future(self._executor.submit(os.getpid))
+                for _ in range(max_workers)
+            ]
+        )
+
+        self._task_group = await exit_stack.enter_async_context(
+            anyio.create_task_group()
+        )
+
+    def __getstate__(self):
+        """
+        Allow the `ProcessPoolTaskRunner` to be serialized by dropping the process pool
+        and task group.
+        """
+        data = self.__dict__.copy()
+        data.update({k: None for k in {"_executor", "_task_group"}})
+        return data
+
+    def __setstate__(self, data: dict):
+        """
+        When deserialized, we will no longer have a reference to the process pool or
+        the task group.
+        """
+        self.__dict__.update(data)
+        self._executor = None
+        self._task_group = None
+
+
+# Worker process state for the `ProcessPoolTaskRunner`
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+_worker_clients: Dict[Tuple[Any, ...], "PrefectClient"] = {}
+
+# The time to wait for the rest of the pool to start before running work in a worker
+WORKER_STARTUP_TIMEOUT = 60
+
+
+def _initialize_worker(barrier: threading.Barrier) -> None:
+    global _worker_loop
+
+    # Import the engine ahead of the first task run
+    import prefect.engine  # noqa
+
+    _worker_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(_worker_loop)
+
+    # Exit the worker's clients when the pool shuts down. Finalizers with an exit
+    # priority are run as worker processes exit, unlike `atexit` callbacks which are
+    # skipped by forked processes.
+    multiprocessing.util.Finalize(None, _shutdown_worker, exitpriority=10)
+
+    try:
+        barrier.wait(timeout=WORKER_STARTUP_TIMEOUT)
+    except threading.BrokenBarrierError:
+        # Other workers are slow to start; this one can start without them
+        pass
+
+
+def _shutdown_worker() -> None:
+    """
+    Exit the clients opened by this worker and close its event loop.
+    """
+    global _worker_loop
+
+    if _worker_loop is None:
+        return
+
+    while _worker_clients:
+        _, client = _worker_clients.popitem()
+        try:
+            _worker_loop.run_until_complete(client.__aexit__(None, None, None))
+        except Exception:
+            get_logger("task_runner").debug(
+                "Failed to close task runner worker client", exc_info=True
+            )
+
+    _worker_loop.close()
+    _worker_loop = None
+
+
+def _run_in_worker(payload: bytes) -> bytes:
+    """
+    Run a pickled call submitted by a `ProcessPoolTaskRunner` on the worker's event
+    loop and return its pickled final state.
+    """
+    return cloudpickle.dumps(_worker_loop.run_until_complete(_run_call(payload)))
+
+
+async def _run_call(payload: bytes) -> State:
+    from prefect.engine import begin_task_run
+
+    try:
+        call = cloudpickle.loads(payload)
+
+        if isinstance(call, partial) and call.func is begin_task_run:
+            call = partial(
+                call, client=await _get_worker_client(call.keywords["settings"])
+            )
+
+        state = await call()
+    except BaseException as exc:
+        state = await exception_to_crashed_state(exc)
+
+    if isinstance(state, State) and isinstance(state.data, PersistedResult):
+        # Only send the reference to the result back to the flow
+        state.data._cache = NotSet
+
+    return state
+
+
+async def _get_worker_client(settings) -> "PrefectClient":
+    """
+    Retrieve a client for the API configured by the given settings, reusing clients
+    across the task runs executed by this worker.
+    """
+    from prefect.client.orchestration import get_client
+
+    with settings:
+        key = (
+            PREFECT_API_URL.value(),
+            PREFECT_API_KEY.value(),
+            PREFECT_API_DATABASE_CONNECTION_URL.value(),
+        )
+        if key not in _worker_clients:
+            client = get_client()
+            await client.__aenter__()
+            _worker_clients[key] = client
+
+    return _worker_clients[key]
@@ -12,12 +12,14 @@ from functools import partial, update_wrapper
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Awaitable,
     Callable,
     Coroutine,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     NoReturn,
     Optional,
@@ -44,7 +46,7 @@ from prefect.utilities.callables import (
     get_call_parameters,
     raise_for_reserved_arguments,
 )
-from prefect.utilities.hashing import hash_objects
+from prefect.utilities.hashing import hash_structure
 from prefect.utilities.importtools import to_qualified_name
 
 if TYPE_CHECKING:
@@ -60,10 +62,13 @@ def task_input_hash(
     context: "TaskRunContext", arguments: Dict[str, Any]
 ) -> Optional[str]:
     """
-    A task cache key implementation which hashes all inputs to the task using a JSON or
-    cloudpickle serializer. If any arguments are not JSON serializable, the pickle
-    serializer is used as a fallback. If cloudpickle fails, this will return a null key
-    indicating that a cache key could not be generated for the given inputs.
+    A task cache key implementation which hashes all inputs to the task by streaming
+    their contents into the hash with `hash_structure`. Arrays, dataframes, and bytes
+    are hashed from their buffers without being serialized. Other arguments are
+    serialized with a JSON or cloudpickle serializer. If any arguments are not JSON
+    serializable, the pickle serializer is used as a fallback. If cloudpickle fails,
+    this will return a null key indicating that a cache key could not be generated for
+    the given inputs.
 
     Arguments:
         context: the active `TaskRunContext`
@@ -72,7 +77,7 @@ def task_input_hash(
     Returns:
         a string hash if hashing succeeded, else `None`
     """
-    return hash_objects(
+    return hash_structure(
         # We use the task key to get the qualified name for the task and include the
         # task functions `co_code` bytes to avoid caching when the underlying function
         # changes
@@ -879,6 +884,102 @@ class Task(Generic[P, R]):
             mapped=True,
         )
 
+    def imap(
+        self,
+        *args: Any,
+        max_in_flight: Optional[int] = None,
+        return_state: bool = False,
+        wait_for: Optional[Iterable[PrefectFuture]] = None,
+        **kwargs: Any,
+    ) -> Union[Iterator[Any], AsyncIterator[Any]]:
+        """
+        Lazily map a task over iterables, yielding results as they become available.
+
+        Unlike `Task.map`, the iterables are not materialized up front: they may be
+        generators, unbounded iterators, or, for async tasks in async flows, async
+        iterables. Task runs are created in chunks as the iterables are consumed and
+        at most `max_in_flight` mapped task runs are unfinished at any time. Results
+        are yielded in the same order as the inputs, similar to
+        `multiprocessing.Pool.imap`.
+
+        Iterable arguments are consumed in lockstep and must have the same length.
+        Any arguments that are not iterable, or are wrapped with `unmapped`, will be
+        treated as a static value and each task run will receive the same value.
+
+        The returned iterator must be consumed inside the flow that created it. For
+        an async task called from an async flow, an async iterator is returned.
+
+        Args:
+            *args: Iterable and static arguments to run the tasks with
+            max_in_flight: The maximum number of mapped task runs that may be
+                unfinished at once. Defaults to
+                `PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT`.
+            return_state: Yield Prefect States that wrap the results of each task
+                run instead of the results.
+            wait_for: Upstream task futures to wait for before starting the
+                task
+            **kwargs: Keyword iterable arguments to run the task with
+
+        Returns:
+            An iterator over the results of the mapped task runs
+
+        Examples:
+
+            Map a task over a generator
+
+            >>> from prefect import flow, task
+            >>> @task
+            >>> def my_task(x):
+            >>>     return x + 1
+            >>>
+            >>> @flow
+            >>> def my_flow():
+            >>>     for result in my_task.imap(x for x in range(3)):
+            >>>         print(result)
+            >>> my_flow()
+            1
+            2
+            3
+
+            Map an async task over an async iterable
+
+            >>> @task
+            >>> async def my_async_task(x):
+            >>>     return x + 1
+            >>>
+            >>> async def numbers():
+            >>>     for x in range(3):
+            >>>         yield x
+            >>>
+            >>> @flow
+            >>> async def my_async_flow():
+            >>>     return [y async for y in my_async_task.imap(numbers())]
+        """
+        from prefect.engine import (
+            _get_flow_run_context_for_task_call,
+            astream_task_map,
+            stream_task_map,
+        )
+
+        # Convert the call args/kwargs to a parameter dict; do not apply defaults
+        # since they should not be mapped over
+        parameters = get_call_parameters(self.fn, args, kwargs, apply_defaults=False)
+        return_type = "state" if return_state else "result"
+
+        flow_run_context = _get_flow_run_context_for_task_call()
+        if self.isasync and flow_run_context.flow.isasync:
+            stream = astream_task_map
+        else:
+            stream = stream_task_map
+
+        return stream(
+            self,
+            parameters=parameters,
+            wait_for=wait_for,
+            return_type=return_type,
+            max_in_flight=max_in_flight,
+        )
+
 
 @overload
 def task(__fn: Callable[P, R]) -> Task[P, R]:
@@ -208,6 +208,27 @@ def batched_iterable(iterable: Iterable[T], size: int) -> Iterator[Tuple[T, ...]
         yield batch
 
 
+# Types that are never traversed by `visit_collection`
+_ATOMIC_TYPES = frozenset({type(None), bool, int, float, complex, str, bytes})
+
+# The kinds of collections traversed by `visit_collection`
+_SEQUENCE = "sequence"
+_ITERATOR = "iterator"
+_MAPPING = "mapping"
+_ANNOTATION = "annotation"
+_DATACLASS = "dataclass"
+_MODEL = "model"
+
+# The kinds of the builtin collection types, which are dispatched on by exact type
+_COLLECTION_KINDS = {
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+    set: _SEQUENCE,
+    dict: _MAPPING,
+    OrderedDict: _MAPPING,
+}
+
+
 class StopVisiting(BaseException):
     """
     A special exception used to stop recursive visits in `visit_collection`.
@@ -217,6 +238,138 @@ class StopVisiting(BaseException):
     """
 
 
+class _VisitFrame:
+    """
+    A collection whose children are being visited by `visit_collection`.
+    """
+
+    __slots__ = (
+        "expr",
+        "original",
+        "kind",
+        "children",
+        "names",
+        "index",
+        "results",
+        "changed",
+        "context",
+        "max_depth",
+    )
+
+    def __init__(self, expr, kind, children, context, max_depth, names=None):
+        self.expr = expr
+        # The expression before it was visited, set once the frame is on the stack
+        self.original = expr
+        self.kind = kind
+        self.children = children
+        # The field names of dataclasses and pydantic models
+        self.names = names
+        self.index = 0
+        self.results = []
+        self.changed = False
+        self.context = context
+        self.max_depth = max_depth
+
+
+def _get_visit_frame(
+    expr, context: Optional[dict], max_depth: int
+) -> Optional[_VisitFrame]:
+    """
+    Returns a frame for visiting the children of `expr` or `None` if it is not a
+    supported collection.
+    """
+    kind = _COLLECTION_KINDS.get(type(expr))
+
+    if kind is _SEQUENCE:
+        children = expr if type(expr) is not set else list(expr)
+        return _VisitFrame(expr, kind, children, context, max_depth)
+
+    elif kind is _MAPPING:
+        children = list(itertools.chain.from_iterable(expr.items()))
+        return _VisitFrame(expr, kind, children, context, max_depth)
+
+    elif isinstance(expr, Mock):
+        # Do not attempt to recurse into mock objects
+        return None
+
+    elif isinstance(expr, BaseAnnotation):
+        if context is not None:
+            context["annotation"] = expr
+        return _VisitFrame(expr, _ANNOTATION, [expr.unwrap()], context, max_depth)
+
+    elif isinstance(expr, IteratorABC) and isiterable(expr):
+        # Treat iterators like lists
+        return _VisitFrame(expr, _ITERATOR, list(expr), context, max_depth)
+
+    elif is_dataclass(expr) and not isinstance(expr, type):
+        names = [field.name for field in fields(expr)]
+        children = [getattr(expr, name) for name in names]
+        return _VisitFrame(expr, _DATACLASS, children, context, max_depth, names)
+
+    elif isinstance(expr, pydantic.BaseModel):
+        # NOTE: This implementation *does not* traverse private attributes
+        # Pydantic does not expose extras in `__fields__` so we use `__fields_set__`
+        # as well to get all of the relevant attributes
+        # Check for presence of attrs even if they're in the field set due to pydantic#4916
+        names = [
+            f for f in expr.__fields_set__.union(expr.__fields__) if hasattr(expr, f)
+        ]
+        children = [getattr(expr, name) for name in names]
+        return _VisitFrame(expr, _MODEL, children, context, max_depth, names)
+
+    return None
+
+
+def _rebuild_visited(
+    frame: _VisitFrame, remove_annotations: bool, copy_unchanged: bool
+):
+    """
+    Returns the collection of a visited frame with the results of visiting its
+    children. Unless `copy_unchanged` is set, the collection is only copied if a child
+    changed.
+    """
+    expr, kind, results = frame.expr, frame.kind, frame.results
+    changed = frame.changed or copy_unchanged
+
+    if kind is _ITERATOR:
+        return results
+
+    elif kind is _ANNOTATION:
+        if remove_annotations:
+            return results[0]
+        return expr.rewrap(results[0]) if changed else expr
+
+    elif not changed:
+        return expr
+
+    elif kind is _SEQUENCE:
+        return type(expr)(results)
+
+    elif kind is _MAPPING:
+        return type(expr)(zip(results[::2], results[1::2]))
+
+    elif kind is _DATACLASS:
+        return type(expr)(**dict(zip(frame.names, results)))
+
+    # Collect fields with aliases so reconstruction can use the correct field name
+    aliases = {
+        key: value.alias for key, value in expr.__fields__.items() if value.has_alias
+    }
+
+    model_instance = type(expr)(
+        **{aliases.get(key) or key: value for key, value in zip(frame.names, results)}
+    )
+
+    # Private attributes are not included in `__fields_set__` but we do not want
+    # to drop them from the model so we restore them after constructing a new
+    # model
+    for attr in expr.__private_attributes__:
+        # Use `object.__setattr__` to avoid errors on immutable models
+        object.__setattr__(model_instance, attr, getattr(expr, attr))
+
+    return model_instance
+
+
 def visit_collection(
     expr,
     visit_fn: Callable[[Any], Any],
@@ -224,6 +377,7 @@ def visit_collection(
     max_depth: int = -1,
     context: Optional[dict] = None,
     remove_annotations: bool = False,
+    copy_unchanged: bool = True,
 ):
     """
     This function visits every element of an arbitrary Python collection. If an element
@@ -233,7 +387,12 @@ def visit_collection(
 
     Note that when using `return_data` a copy of each collection is created to avoid
     mutating the original object. This may have significant performance penalities and
-    should only be used if you intend to transform the collection.
+    should only be used if you intend to transform the collection. Pass
+    `copy_unchanged=False` to only copy collections with elements altered by
+    `visit_fn`.
+
+    Collections are visited with an explicit stack rather than recursive calls, so
+    deeply nested collections will not exceed the recursion limit.
 
     Supported types:
     - List
@@ -266,116 +425,69 @@ def visit_collection(
             caller to pass `context={}` and will not be activated by default.
         remove_annotations: If set, annotations will be replaced by their contents. By
             default, annotations are preserved but their contents are visited.
+        copy_unchanged: If `False`, collections without elements altered by `visit_fn`
+            are returned as-is instead of being copied, so the result may share
+            objects with `expr`. By default, every collection is copied.
     """
 
-    def visit_nested(expr):
-        # Utility for a recursive call, preserving options and updating the depth.
-        return visit_collection(
-            expr,
-            visit_fn=visit_fn,
-            return_data=return_data,
-            remove_annotations=remove_annotations,
-            max_depth=max_depth - 1,
-            # Copy the context on nested calls so it does not "propagate up"
-            context=context.copy() if context is not None else None,
-        )
-
-    def visit_expression(expr):
-        if context is not None:
-            return visit_fn(expr, context)
-        else:
-            return visit_fn(expr)
-
-    # Visit every expression
-    try:
-        result = visit_expression(expr)
-    except StopVisiting:
-        max_depth = 0
-        result = expr
-
-    if return_data:
-        # Only mutate the expression while returning data, otherwise it could be null
-        expr = result
-
-    # Then, visit every child of the expression recursively
-
-    # If we have reached the maximum depth, do not perform any recursion
-    if max_depth == 0:
-        return result if return_data else None
-
-    # Get the expression type; treat iterators like lists
-    typ = list if isinstance(expr, IteratorABC) and isiterable(expr) else type(expr)
-    typ = cast(type, typ)  # mypy treats this as 'object' otherwise and complains
+    def visit_expression(expr, context, max_depth):
+        # Visit an expression, returning the result and a frame for visiting its
+        # children if it is a collection that should be traversed
+        try:
+            result = visit_fn(expr, context) if context is not None else visit_fn(expr)
+        except StopVisiting:
+            return expr, None
 
-    # Then visit every item in the expression if it is a collection
-    if isinstance(expr, Mock):
-        # Do not attempt to recurse into mock objects
-        result = expr
-
-    elif isinstance(expr, BaseAnnotation):
-        if context is not None:
-            context["annotation"] = expr
-        value = visit_nested(expr.unwrap())
-
-        if remove_annotations:
-            result = value if return_data else None
-        else:
-            result = expr.rewrap(value) if return_data else None
+        if return_data:
+            # Only mutate the expression while returning data, otherwise it could be null
+            expr = result
 
-    elif typ in (list, tuple, set):
-        items = [visit_nested(o) for o in expr]
-        result = typ(items) if return_data else None
+        # If we have reached the maximum depth, do not perform any recursion
+        if max_depth == 0 or type(expr) in _ATOMIC_TYPES:
+            return result, None
 
-    elif typ in (dict, OrderedDict):
-        assert isinstance(expr, (dict, OrderedDict))  # typecheck assertion
-        items = [(visit_nested(k), visit_nested(v)) for k, v in expr.items()]
-        result = typ(items) if return_data else None
+        return result, _get_visit_frame(expr, context, max_depth)
 
-    elif is_dataclass(expr) and not isinstance(expr, type):
-        values = [visit_nested(getattr(expr, f.name)) for f in fields(expr)]
-        items = {field.name: value for field, value in zip(fields(expr), values)}
-        result = typ(**items) if return_data else None
+    value, frame = visit_expression(expr, context, max_depth)
+    if frame is None:
+        return value if return_data else None
 
-    elif isinstance(expr, pydantic.BaseModel):
-        # NOTE: This implementation *does not* traverse private attributes
-        # Pydantic does not expose extras in `__fields__` so we use `__fields_set__`
-        # as well to get all of the relevant attributes
-        # Check for presence of attrs even if they're in the field set due to pydantic#4916
-        model_fields = {
-            f for f in expr.__fields_set__.union(expr.__fields__) if hasattr(expr, f)
-        }
-        items = [visit_nested(getattr(expr, key)) for key in model_fields]
-
-        if return_data:
-            # Collect fields with aliases so reconstruction can use the correct field name
-            aliases = {
-                key: value.alias
-                for key, value in expr.__fields__.items()
-                if value.has_alias
-            }
-
-            model_instance = typ(
-                **{
-                    aliases.get(key) or key: value
-                    for key, value in zip(model_fields, items)
-                }
+    stack = [frame]
+    while True:
+        frame = stack[-1]
+
+        if frame.index < len(frame.children):
+            # Visit the next child, copying the context so it does not "propagate up"
+            child = frame.children[frame.index]
+            frame.index += 1
+            value, child_frame = visit_expression(
+                child,
+                frame.context.copy() if frame.context is not None else None,
+                frame.max_depth - 1,
             )
+            if child_frame is not None:
+                child_frame.original = child
+                stack.append(child_frame)
+                continue
 
-            # Private attributes are not included in `__fields_set__` but we do not want
-            # to drop them from the model so we restore them after constructing a new
-            # model
-            for attr in expr.__private_attributes__:
-                # Use `object.__setattr__` to avoid errors on immutable models
-                object.__setattr__(model_instance, attr, getattr(expr, attr))
-
-            result = model_instance
         else:
-            result = None
+            # All children have been visited, pass the collection to its parent
+            stack.pop()
+            value = (
+                _rebuild_visited(frame, remove_annotations, copy_unchanged)
+                if return_data
+                else None
+            )
+            if not stack:
+                return value
 
-    else:
-        result = result if return_data else None
+            child = frame.original
+            frame = stack[-1]
 
-    return result
+        if return_data:
+            frame.results.append(value)
+            if value is not child:
+                frame.changed = True
 
 
 def remove_nested_keys(keys_to_remove: List[Hashable], obj):
@@ -1,12 +1,17 @@
 import hashlib
+import json
 import sys
+import weakref
+from dataclasses import fields, is_dataclass
 from functools import partial
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 import cloudpickle
+import pydantic
 
-from prefect.serializers import JSONSerializer
+from prefect.serializers import JSONSerializer, prefect_json_object_encoder
+from prefect.utilities.importtools import to_qualified_name
 
 if sys.version_info[:2] >= (3, 9):
     _md5 = partial(hashlib.md5, usedforsecurity=False)
@@ -65,3 +70,211 @@ def hash_objects(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
         pass
 
     return None
+
+
+# The size of the chunks of non-contiguous arrays passed to the hash algorithm
+ARRAY_CHUNK_SIZE = 1 << 20
+
+# Digests of immutable NumPy arrays by the hash algorithm and array id. Entries are
+# removed when the array is garbage collected.
+_digest_cache: Dict[Tuple[Callable, int], Tuple[weakref.ref, str]] = {}
+
+
+def hash_structure(*args, hash_algo=_md5, **kwargs) -> Optional[str]:
+    """
+    Attempt to hash objects by dumping their structure to JSON, streaming the contents
+    of large objects into the hash algorithm instead of serializing them.
+
+    Bytes, memoryviews, NumPy arrays, and pandas objects are hashed from their
+    underlying buffers without copying them and are dumped as their digest. Hashes of
+    NumPy arrays backed by `bytes`, whose contents cannot change, are memoized so they
+    are only hashed once. Pydantic models and dataclasses are traversed, and other
+    objects that are not JSON serializable are dumped as the digest of their
+    cloudpickle serialization.
+
+    If the objects cannot be dumped, for example due to dictionary keys that cannot be
+    sorted, they are serialized with cloudpickle as a whole. On failure of both, `None`
+    will be returned.
+    """
+    try:
+        data = json.dumps(
+            (args, kwargs),
+            sort_keys=True,
+            default=partial(_encode_for_hash, hash_algo=hash_algo),
+        )
+        return stable_hash(data, hash_algo=hash_algo)
+    except Exception:
+        pass
+
+    try:
+        return stable_hash(cloudpickle.dumps((args, kwargs)), hash_algo=hash_algo)
+    except Exception:
+        pass
+
+    return None
+
+
+def _encode_for_hash(obj: Any, hash_algo) -> Any:
+    """
+    `JSONEncoder.default` for `hash_structure`.
+    """
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        h = hash_algo()
+        h.update(memoryview(obj).cast("B"))
+        return {"__bytes__": h.hexdigest()}
+
+    elif isinstance(obj, (set, frozenset)):
+        # Sets are dumped in a stable order
+        return {
+            "__set__": sorted(hash_structure(item, hash_algo=hash_algo) for item in obj)
+        }
+
+    elif isinstance(obj, pydantic.BaseModel):
+        # Includes extra fields but not private attributes
+        return {"__class__": to_qualified_name(type(obj)), "fields": obj.__dict__}
+
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            "__class__": to_qualified_name(type(obj)),
+            "fields": {field.name: getattr(obj, field.name) for field in fields(obj)},
+        }
+
+    elif _is_numpy_array(obj):
+        return {"__ndarray__": _array_digest(obj, hash_algo)}
+
+    elif _is_pandas_object(obj):
+        return {
+            "__class__": to_qualified_name(type(obj)),
+            "digest": _pandas_digest(obj, hash_algo),
+        }
+
+    try:
+        return prefect_json_object_encoder(obj)
+    except Exception:
+        return {"__pickle__": stable_hash(cloudpickle.dumps(obj), hash_algo=hash_algo)}
+
+
+def _is_numpy_array(obj: Any) -> bool:
+    # NumPy must have been imported if the object is an array
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def _is_pandas_object(obj: Any) -> bool:
+    # pandas must have been imported if the object is a pandas object
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(obj, (pd.DataFrame, pd.Series, pd.Index))
+
+
+def _is_immutable_array(array) -> bool:
+    # Read-only arrays can be made writeable again or be views of memory written to
+    # elsewhere, so only arrays whose memory belongs to a `bytes` object are immutable
+    while _is_numpy_array(array):
+        array = array.base
+    if isinstance(array, memoryview):
+        array = array.obj
+    return type(array) is bytes
+
+
+def _array_digest(array, hash_algo) -> str:
+    """
+    Returns the digest of the dtype, shape, and contents of a NumPy array, memoized for
+    immutable arrays.
+    """
+    immutable = _is_immutable_array(array)
+    key = (hash_algo, id(array))
+    if immutable:
+        cached = _digest_cache.get(key)
+        if cached is not None and cached[0]() is array:
+            return cached[1]
+
+    if array.dtype.hasobject:
+        # The buffers of object arrays contain pointers
+        digest = hash_structure(
+            repr(array.dtype), array.shape, array.tolist(), hash_algo=hash_algo
+        )
+    else:
+        h = hash_algo()
+        h.update(f"{array.dtype!r}{array.shape}".encode())
+        _hash_array_into(h, array)
+        digest = h.hexdigest()
+
+    if immutable:
+        _digest_cache[key] = (
+            weakref.ref(array, lambda _: _digest_cache.pop(key, None)),
+            digest,
+        )
+    return digest
+
+
+def _hash_array_into(h, array) -> None:
+    """
+    Stream the contents of a NumPy array into the hash `h` in C order in a single pass,
+    without copying the array.
+    """
+    import numpy as np
+
+    if array.flags.c_contiguous:
+        h.update(array.reshape(-1).view(np.uint8))
+
+    elif array.size:
+        # Non-contiguous arrays are iterated over in chunks, only copying each chunk
+        for chunk in np.nditer(
+            array,
+            flags=["external_loop", "buffered", "zerosize_ok"],
+            order="C",
+            buffersize=max(ARRAY_CHUNK_SIZE // array.itemsize, 1),
+        ):
+            h.update(np.ascontiguousarray(chunk).view(np.uint8))
+
+
+def _pandas_digest(obj, hash_algo) -> str:
+    """
+    Returns the digest of a pandas `DataFrame`, `Series`, or `Index`.
+
+    Columns and indexes with NumPy dtypes are hashed from their arrays without copying
+    them, which for columns are views of the arrays of their blocks.
+    """
+    import pandas as pd
+
+    if isinstance(obj, pd.Index):
+        return hash_structure(
+            obj.names,
+            str(obj.dtype),
+            _pandas_values_digest(obj, hash_algo),
+            hash_algo=hash_algo,
+        )
+
+    if isinstance(obj, pd.Series):
+        header = [obj.name, obj.index]
+        columns = [obj]
+    else:
+        header = [obj.columns, obj.index]
+        columns = [obj.iloc[:, i] for i in range(obj.shape[1])]
+
+    column_digests = [
+        [str(column.dtype), _pandas_values_digest(column, hash_algo)]
+        for column in columns
+    ]
+    return hash_structure(header, column_digests, hash_algo=hash_algo)
+
+
+def _pandas_values_digest(values, hash_algo) -> str:
+    """
+    Returns the digest of the values of a pandas `Series` or `Index`.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(values.dtype, np.dtype) and not values.dtype.hasobject:
+        return _array_digest(values.to_numpy(copy=False), hash_algo)
+
+    if values.dtype.kind in "mM":
+        # Datetimes with time zones are hashed by pandas from their integer values
+        return _array_digest(
+            pd.util.hash_pandas_object(values, index=False).to_numpy(), hash_algo
+        )
+
+    # pandas hashes the values of object columns as strings, so `1` and `"1"` or `None`
+    # and `"None"` would have the same hash; their structure is hashed instead
+    return hash_structure(values.tolist(), hash_algo=hash_algo)
@@ -2,7 +2,7 @@ import sys
 from collections import deque
 from traceback import format_exception
 from types import TracebackType
-from typing import Callable, Coroutine, Deque, Tuple
+from typing import Callable, Coroutine, Deque, Tuple, Union
 
 import anyio
 import httpx
@@ -13,7 +13,7 @@ from prefect.utilities.math import clamped_poisson_interval
 
 async def critical_service_loop(
     workload: Callable[..., Coroutine],
-    interval: float,
+    interval: Union[float, Callable[[], float]],
     memory: int = 10,
     consecutive: int = 3,
     backoff: int = 1,
@@ -33,7 +33,8 @@ async def critical_service_loop(
 
     Args:
         workload: the function to call
-        interval: how frequently to call it
+        interval: how frequently to call it, or a function returning how long to wait
+            before calling it again, called after each call
         memory: how many recent errors to remember
         consecutive: how many consecutive errors must we see before we begin backoff
         backoff: how many times we should allow consecutive errors before exiting
@@ -48,6 +49,9 @@ async def critical_service_loop(
     failures: Deque[Tuple[Exception, TracebackType]] = deque(maxlen=memory)
     backoff_count = 0
 
+    def current_interval() -> float:
+        return interval() if callable(interval) else interval
+
     while True:
         try:
             await workload()
@@ -125,15 +129,17 @@ async def critical_service_loop(
             failures.clear()
             printer(
                 "Backing off due to consecutive errors, using increased interval of "
-                f" {interval * 2**backoff_count}s."
+                f" {current_interval() * 2**backoff_count}s."
             )
 
         if run_once:
             return
 
         if jitter_range is not None:
-            sleep = clamped_poisson_interval(interval, clamping_factor=jitter_range)
+            sleep = clamped_poisson_interval(
+                current_interval(), clamping_factor=jitter_range
+            )
         else:
-            sleep = interval * 2**backoff_count
+            sleep = current_interval() * 2**backoff_count
 
         await anyio.sleep(sleep)
@@ -0,0 +1,155 @@
+"""
+Binary encoding and compression of REST API payloads.
+
+Clients and servers exchange JSON by default. When the optional `msgpack` package is
+installed, they can negotiate MessagePack bodies, which are smaller and faster to
+encode and decode than JSON. When the optional `zstandard` package is installed, they
+can also negotiate Zstandard compression of request and response bodies.
+"""
+import json
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ZSTD_ENCODING = "zstd"
+
+# Bodies smaller than this are not worth compressing
+MINIMUM_COMPRESSION_SIZE = 500
+
+# The size of the chunks Zstandard compressed data is decompressed in
+DECOMPRESSION_CHUNK_SIZE = 1 << 16
+
+
+def msgpack_available() -> bool:
+    """
+    Returns whether MessagePack encoding is available.
+    """
+    return msgpack is not None
+
+
+def zstd_available() -> bool:
+    """
+    Returns whether Zstandard compression is available.
+    """
+    return zstandard is not None
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    """
+    Encode a JSON compatible object as MessagePack.
+    """
+    return msgpack.packb(obj)
+
+
+def msgpack_loads(data: bytes) -> Any:
+    """
+    Decode a MessagePack encoded object.
+    """
+    return msgpack.unpackb(data, strict_map_key=False)
+
+
+def zstd_compress(data: bytes) -> bytes:
+    """
+    Compress data with Zstandard.
+    """
+    return zstandard.ZstdCompressor().compress(data)
+
+
+def zstd_decompress(data: bytes, max_size: Optional[int] = None) -> bytes:
+    """
+    Decompress Zstandard compressed data, including data compressed by streaming
+    compressors that do not record the content size.
+
+    Raises:
+        ValueError: If the decompressed data is larger than `max_size` bytes
+    """
+    chunks = []
+    size = 0
+    with zstandard.ZstdDecompressor().stream_reader(data) as reader:
+        while True:
+            chunk = reader.read(DECOMPRESSION_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if max_size is not None and size > max_size:
+                raise ValueError(f"Decompressed data exceeds {max_size} bytes.")
+            chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
+def accepts(header_value: Optional[str], token: str) -> bool:
+    """
+    Returns whether an `Accept` or `Accept-Encoding` header value includes the given
+    media type or encoding with a non-zero quality.
+    """
+    for item in (header_value or "").split(","):
+        value, *params = [part.strip() for part in item.split(";")]
+        if value.lower() != token:
+            continue
+        for param in params:
+            name, _, quality = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    return float(quality) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+def encode_body(
+    obj: Any, use_msgpack: bool = False, use_zstd: bool = False
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Encode a JSON compatible object as a request or response body.
+
+    Args:
+        obj: The object to encode
+        use_msgpack: Encode the object as MessagePack instead of JSON
+        use_zstd: Compress the body with Zstandard if it is large enough to benefit
+
+    Returns:
+        The body and its `Content-Type` and `Content-Encoding` headers
+    """
+    if use_msgpack:
+        body = msgpack_dumps(obj)
+        headers = {"Content-Type": MSGPACK_MEDIA_TYPE}
+    else:
+        body = json.dumps(obj).encode("utf-8")
+        headers = {"Content-Type": JSON_MEDIA_TYPE}
+
+    if use_zstd and len(body) >= MINIMUM_COMPRESSION_SIZE:
+        body = zstd_compress(body)
+        headers["Content-Encoding"] = ZSTD_ENCODING
+
+    return body, headers
+
+
+class ZstdStreamCompressor:
+    """
+    Compresses a stream of chunks with Zstandard. Each chunk is flushed so it can be
+    decompressed as soon as it is received.
+    """
+
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor().compressobj()
+
+    def compress(self, chunk: bytes, final: bool = False) -> bytes:
+        flush_mode = (
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+            if final
+            else zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+        return self._compressor.compress(chunk) + self._compressor.flush(flush_mode)
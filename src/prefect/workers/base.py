@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field, PrivateAttr, validator
 
 import prefect
 from prefect._internal.compatibility.experimental import experimental
+from prefect.client.cache import MetadataCache
 from prefect.client.orchestration import PrefectClient, get_client
 from prefect.client.schemas.actions import WorkPoolCreate, WorkPoolUpdate
 from prefect.client.schemas.filters import (
@@ -36,7 +37,12 @@ from prefect.exceptions import (
     ObjectNotFound,
 )
 from prefect.logging.loggers import PrefectLogAdapter, flow_run_logger, get_logger
-from prefect.settings import PREFECT_WORKER_PREFETCH_SECONDS, get_current_settings
+from prefect.settings import (
+    PREFECT_WORKER_LONG_POLL_SECONDS,
+    PREFECT_WORKER_METADATA_CACHE_TTL_SECONDS,
+    PREFECT_WORKER_PREFETCH_SECONDS,
+    get_current_settings,
+)
 from prefect.states import Crashed, Pending, exception_to_failed_state
 from prefect.utilities.dispatch import get_registry_for_type, register_base_type
 from prefect.utilities.slugify import slugify
@@ -346,10 +352,13 @@ class BaseWorker(abc.ABC):
         self._prefetch_seconds: float = (
             prefetch_seconds or PREFECT_WORKER_PREFETCH_SECONDS.value()
         )
+        # whether the last query was a long poll that returned no flow runs
+        self._long_poll_returned_nothing = False
 
         self._work_pool: Optional[WorkPool] = None
         self._runs_task_group: Optional[anyio.abc.TaskGroup] = None
         self._client: Optional[PrefectClient] = None
+        self._metadata_cache: Optional[MetadataCache] = None
         self._limit = limit
         self._limiter: Optional[anyio.CapacityLimiter] = None
         self._submitting_flow_run_ids = set()
@@ -482,6 +491,17 @@ class BaseWorker(abc.ABC):
             await self._client.__aexit__(*exc_info)
         self._runs_task_group = None
         self._client = None
+        self._metadata_cache = None
+
+    def next_query_interval(self, query_seconds: float) -> float:
+        """
+        Returns how long to wait before querying for scheduled flow runs again.
+
+        A long poll that returned no flow runs has already waited for flow runs to be
+        scheduled, so the next query is made after a second instead of
+        `query_seconds`.
+        """
+        return 1 if self._long_poll_returned_nothing else query_seconds
 
     async def get_and_submit_flow_runs(self):
         runs_response = await self._get_scheduled_flow_runs()
@@ -638,6 +658,18 @@ class BaseWorker(abc.ABC):
 
         self._work_pool = work_pool
 
+    def _get_metadata_cache(self) -> MetadataCache:
+        # The cache is bound to the client it reads objects with
+        if (
+            self._metadata_cache is None
+            or self._metadata_cache.client is not self._client
+        ):
+            self._metadata_cache = MetadataCache(
+                self._client,
+                ttl_seconds=PREFECT_WORKER_METADATA_CACHE_TTL_SECONDS.value(),
+            )
+        return self._metadata_cache
+
     async def _send_worker_heartbeat(self):
         if self._work_pool:
             await self._client.send_worker_heartbeat(
@@ -653,6 +685,8 @@ class BaseWorker(abc.ABC):
 
         await self._send_worker_heartbeat()
 
+        await self._get_metadata_cache().revalidate()
+
         self._logger.debug("Worker synchronized with the Prefect API server.")
 
     async def _get_scheduled_flow_runs(
@@ -671,15 +705,21 @@ class BaseWorker(abc.ABC):
                     work_pool_name=self._work_pool_name,
                     scheduled_before=scheduled_before,
                     work_queue_names=list(self._work_queues),
+                    wait_seconds=PREFECT_WORKER_LONG_POLL_SECONDS.value(),
                 )
             )
             self._logger.debug(
                 f"Discovered {len(scheduled_flow_runs)} scheduled_flow_runs"
             )
+            self._long_poll_returned_nothing = (
+                bool(PREFECT_WORKER_LONG_POLL_SECONDS.value())
+                and not scheduled_flow_runs
+            )
             return scheduled_flow_runs
         except ObjectNotFound:
             # the pool doesn't exist; it will be created on the next
             # heartbeat (or an appropriate warning will be logged)
+            self._long_poll_returned_nothing = False
             return []
 
     async def _submit_scheduled_flow_runs(
@@ -728,7 +768,9 @@ class BaseWorker(abc.ABC):
         was created from a deployment with a storage block.
         """
         if flow_run.deployment_id:
-            deployment = await self._client.read_deployment(flow_run.deployment_id)
+            deployment = await self._get_metadata_cache().read_deployment(
+                flow_run.deployment_id
+            )
             if deployment.storage_document_id:
                 raise ValueError(
                     f"Flow run {flow_run.id!r} was created from deployment"
@@ -844,7 +886,8 @@ class BaseWorker(abc.ABC):
     def get_status(self):
         """
         Retrieves the status of the current worker including its name, current worker
-        pool, the work pool queues it is polling, and its local settings.
+        pool, the work pool queues it is polling, its local settings, and the hit rate
+        of its deployment and flow cache.
         """
         return {
             "name": self.name,
@@ -856,14 +899,21 @@ class BaseWorker(abc.ABC):
             "settings": {
                 "prefetch_seconds": self._prefetch_seconds,
             },
+            "metadata_cache": (
+                self._metadata_cache.stats()
+                if self._metadata_cache is not None
+                else None
+            ),
         }
 
     async def _get_configuration(
         self,
         flow_run: "FlowRun",
     ) -> BaseJobConfiguration:
-        deployment = await self._client.read_deployment(flow_run.deployment_id)
-        flow = await self._client.read_flow(flow_run.flow_id)
+        deployment = await self._get_metadata_cache().read_deployment(
+            flow_run.deployment_id
+        )
+        flow = await self._get_metadata_cache().read_flow(flow_run.flow_id)
         configuration = await self.job_configuration.from_template_and_values(
             base_job_template=self._work_pool.base_job_template,
             values=deployment.infra_overrides or {},
@@ -20,6 +20,7 @@ from prefect.states import (
     Scheduled,
     StateType,
 )
+from prefect.settings import PREFECT_API_LOG_STREAM_POLL_SECONDS, temporary_settings
 from prefect.testing.cli import invoke_and_assert
 from prefect.utilities.asyncutils import run_sync_in_worker_thread, sync_compatible
 
@@ -703,3 +704,38 @@ class TestFlowRunLogs:
             ],
             expected_line_count=251,
         )
+
+    async def test_follow_streams_logs_until_flow_run_finishes(
+        self, flow_run_factory, prefect_client
+    ):
+        # Given
+        flow_run = await flow_run_factory(num_logs=5)
+        await prefect_client.set_flow_run_state(flow_run.id, Completed(), force=True)
+
+        # When/Then
+        with temporary_settings({PREFECT_API_LOG_STREAM_POLL_SECONDS: 0.1}):
+            await run_sync_in_worker_thread(
+                invoke_and_assert,
+                command=["flow-run", "logs", str(flow_run.id), "--follow"],
+                expected_code=0,
+                expected_output_contains=[
+                    f"Flow run '{flow_run.name}' - Log {i} from flow_run {flow_run.id}."
+                    for i in range(5)
+                ],
+                expected_line_count=5,
+            )
+
+    async def test_follow_cannot_be_used_with_tail(self, flow_run_factory):
+        # Given
+        flow_run = await flow_run_factory(num_logs=1)
+
+        # When/Then
+        await run_sync_in_worker_thread(
+            invoke_and_assert,
+            command=["flow-run", "logs", str(flow_run.id), "--follow", "--tail"],
+            expected_code=1,
+            expected_output_contains=(
+                "The `follow` option cannot be used with the `head`, `tail`,"
+                " `reverse`, or `num-logs` options."
+            ),
+        )
@@ -1,11 +1,22 @@
+import asyncio
+import threading
 from unittest.mock import call
 
 import httpx
 import pytest
+import respx
 from fastapi import status
 from httpx import AsyncClient, Request, Response
 
-from prefect.client.base import PrefectHttpxClient, PrefectResponse
+from prefect.client import base
+from prefect.client.base import (
+    LatencyHistogram,
+    PrefectHttpxClient,
+    PrefectResponse,
+    SharedTransport,
+    get_request_latencies,
+    reset_request_latencies,
+)
 from prefect.exceptions import PrefectHTTPStatusError
 from prefect.settings import (
     PREFECT_CLIENT_RETRY_EXTRA_CODES,
@@ -473,3 +484,150 @@ class TestPrefectHttpxClient:
                 "Response: {'extra_info': [{'message': 'a test error message'}]}"
                 in str(exc)
             )
+
+    async def test_prefect_httpx_client_streams_responses(self):
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            for chunk in [b"a", b"b"]:
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            await send({"type": "http.response.body", "body": b""})
+
+        async with PrefectHttpxClient(app=app, base_url="http://test") as client:
+            async with client.stream("GET", "/") as response:
+                assert isinstance(response, PrefectResponse)
+                assert (
+                    b"".join([chunk async for chunk in response.aiter_bytes()]) == b"ab"
+                )
+
+
+class TestRequestLatencies:
+    @pytest.fixture(autouse=True)
+    def reset_latencies(self):
+        reset_request_latencies()
+        yield
+        reset_request_latencies()
+
+    def test_histogram_buckets_latencies(self):
+        histogram = LatencyHistogram()
+        for seconds in [0.001, 0.003, 0.02, 0.3, 20]:
+            histogram.observe(seconds)
+
+        assert histogram.count == 5
+        assert histogram.total_seconds == pytest.approx(20.324)
+        assert histogram.to_dict()["buckets"] == {
+            "0.005": 2,
+            "0.01": 0,
+            "0.025": 1,
+            "0.05": 0,
+            "0.1": 0,
+            "0.25": 0,
+            "0.5": 1,
+            "1.0": 0,
+            "2.5": 0,
+            "5.0": 0,
+            "10.0": 0,
+            "inf": 1,
+        }
+        assert histogram.quantile(0.5) == 0.025
+        assert histogram.quantile(0.99) == float("inf")
+        assert LatencyHistogram().quantile(0.5) == 0.0
+
+    async def test_client_records_latencies_by_endpoint(self, prefect_client, flow):
+        await prefect_client.read_flow(flow.id)
+        await prefect_client.read_flow(flow.id)
+        await prefect_client.hello()
+
+        latencies = get_request_latencies()
+        assert latencies["GET /api/flows/{id}"].count == 2
+        assert latencies["GET /api/hello"].count == 1
+
+    async def test_latencies_are_copies(self, prefect_client):
+        await prefect_client.hello()
+        latencies = get_request_latencies()
+        await prefect_client.hello()
+
+        assert latencies["GET /api/hello"].count == 1
+        assert get_request_latencies()["GET /api/hello"].count == 2
+
+
+class TestSharedTransport:
+    API_URL = "http://prefect.test/api"
+
+    @pytest.fixture(autouse=True)
+    def mock_api(self):
+        with respx.mock(base_url=self.API_URL, assert_all_called=False) as router:
+            router.get("/hello").respond(200, json="Hello!")
+            yield router
+
+    async def test_transports_share_pools_within_a_loop(self):
+        first = SharedTransport(self.API_URL, http2=True)
+        second = SharedTransport(self.API_URL, http2=True)
+        other = SharedTransport(self.API_URL, http2=False)
+
+        async with httpx.AsyncClient(transport=first) as client:
+            await client.get(f"{self.API_URL}/hello")
+            async with httpx.AsyncClient(transport=second) as nested:
+                await nested.get(f"{self.API_URL}/hello")
+            async with httpx.AsyncClient(transport=other) as nested:
+                await nested.get(f"{self.API_URL}/hello")
+
+            pools = base.SHARED_POOLS[asyncio.get_running_loop()]
+            assert pools[first.key].ref_count == 1
+            assert (
+                pools[first.key].transport
+                is first._acquired[asyncio.get_running_loop()]
+            )
+            assert other.key not in pools
+
+        assert asyncio.get_running_loop() not in base.SHARED_POOLS
+
+    async def test_pool_is_closed_with_last_transport(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(
+            httpx.AsyncHTTPTransport,
+            "aclose",
+            lambda self: closed.append(self) or asyncio.sleep(0),
+        )
+        first = SharedTransport(self.API_URL)
+        second = SharedTransport(self.API_URL)
+        await first.handle_async_request(httpx.Request("GET", f"{self.API_URL}/hello"))
+        await second.handle_async_request(httpx.Request("GET", f"{self.API_URL}/hello"))
+        pool = first._acquired[asyncio.get_running_loop()]
+
+        await first.aclose()
+        assert closed == []
+        await second.aclose()
+        assert closed == [pool]
+
+    async def test_transports_do_not_share_pools_across_loops(self):
+        transport = SharedTransport(self.API_URL)
+        await transport.handle_async_request(
+            httpx.Request("GET", f"{self.API_URL}/hello")
+        )
+
+        def use_in_new_loop():
+            async def use():
+                other = SharedTransport(self.API_URL)
+                await other.handle_async_request(
+                    httpx.Request("GET", f"{self.API_URL}/hello")
+                )
+                pool = other._acquired[asyncio.get_running_loop()]
+                await other.aclose()
+                return pool
+
+            return asyncio.run(use())
+
+        pools = []
+        thread = threading.Thread(target=lambda: pools.append(use_in_new_loop()))
+        thread.start()
+        thread.join()
+
+        assert pools[0] is not transport._acquired[asyncio.get_running_loop()]
+        await transport.aclose()
+
+    def test_transport_settings_must_be_hashable(self):
+        SharedTransport(self.API_URL, limits=httpx.Limits(max_connections=1))
+        with pytest.raises(TypeError):
+            SharedTransport(self.API_URL, verify=["unhashable"])
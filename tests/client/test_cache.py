@@ -0,0 +1,148 @@
+import pytest
+
+from prefect.client import cache
+from prefect.client.cache import MetadataCache
+from prefect.server import models, schemas
+
+
+@pytest.fixture
+def spy_reads(prefect_client, monkeypatch):
+    reads = []
+
+    def spy(name):
+        method = getattr(prefect_client, name)
+
+        async def wrapper(*args, **kwargs):
+            reads.append(name)
+            return await method(*args, **kwargs)
+
+        monkeypatch.setattr(prefect_client, name, wrapper)
+
+    for name in [
+        "read_deployment",
+        "read_deployments",
+        "read_flow",
+        "read_flows",
+        "read_block_document",
+    ]:
+        spy(name)
+    return reads
+
+
+async def test_caches_reads(prefect_client, deployment, spy_reads):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+
+    for _ in range(3):
+        result = await metadata_cache.read_deployment(deployment.id)
+        assert result.id == deployment.id
+        assert (await metadata_cache.read_flow(deployment.flow_id)).name == "my-flow"
+
+    assert spy_reads == ["read_deployment", "read_flow"]
+    assert metadata_cache.stats() == {
+        "size": 2,
+        "hits": 4,
+        "misses": 2,
+        "hit_rate": 4 / 6,
+        "invalidations": 0,
+    }
+
+
+async def test_zero_ttl_disables_caching(prefect_client, deployment, spy_reads):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=0)
+
+    await metadata_cache.read_deployment(deployment.id)
+    await metadata_cache.read_deployment(deployment.id)
+
+    assert spy_reads == ["read_deployment", "read_deployment"]
+    assert metadata_cache.stats()["size"] == 0
+
+
+async def test_cached_objects_expire(
+    prefect_client, deployment, spy_reads, monkeypatch
+):
+    now = cache.time.monotonic()
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+
+    await metadata_cache.read_deployment(deployment.id)
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + 59)
+    await metadata_cache.read_deployment(deployment.id)
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now + 61)
+    await metadata_cache.read_deployment(deployment.id)
+
+    assert spy_reads == ["read_deployment", "read_deployment"]
+
+
+async def test_revalidate_replaces_updated_objects(
+    prefect_client, session, deployment, spy_reads
+):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+    await metadata_cache.read_deployment(deployment.id)
+    await metadata_cache.read_flow(deployment.flow_id)
+
+    await models.deployments.update_deployment(
+        session=session,
+        deployment_id=deployment.id,
+        deployment=schemas.actions.DeploymentUpdate(infra_overrides={"a": "b"}),
+    )
+    await session.commit()
+
+    await metadata_cache.revalidate()
+    result = await metadata_cache.read_deployment(deployment.id)
+
+    assert result.infra_overrides == {"a": "b"}
+    assert spy_reads == [
+        "read_deployment",
+        "read_flow",
+        "read_deployments",
+        "read_flows",
+    ]
+    assert metadata_cache.stats()["invalidations"] == 1
+
+
+async def test_revalidate_drops_deleted_objects(
+    prefect_client, session, deployment, spy_reads
+):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+    await metadata_cache.read_deployment(deployment.id)
+
+    await models.deployments.delete_deployment(
+        session=session, deployment_id=deployment.id
+    )
+    await session.commit()
+
+    await metadata_cache.revalidate()
+
+    assert metadata_cache.stats()["size"] == 0
+    assert metadata_cache.stats()["invalidations"] == 1
+
+
+async def test_revalidate_drops_block_documents(
+    prefect_client, infrastructure_document_id, spy_reads
+):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+    await metadata_cache.read_block_document(infrastructure_document_id)
+    await metadata_cache.read_block_document(infrastructure_document_id)
+
+    await metadata_cache.revalidate()
+    await metadata_cache.read_block_document(infrastructure_document_id)
+
+    assert spy_reads == ["read_block_document", "read_block_document"]
+
+
+async def test_revalidate_clears_the_cache_on_error(
+    prefect_client, deployment, monkeypatch, caplog
+):
+    metadata_cache = MetadataCache(prefect_client, ttl_seconds=60)
+    await metadata_cache.read_deployment(deployment.id)
+
+    async def fail(*args, **kwargs):
+        raise RuntimeError("API unavailable")
+
+    monkeypatch.setattr(prefect_client, "read_deployments", fail)
+
+    await metadata_cache.revalidate()
+
+    assert metadata_cache.stats()["size"] == 0
+    assert "Failed to revalidate cached deployments and flows" in caplog.text
+    assert "API unavailable" in caplog.text
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from prefect import flow
+from prefect.client.pipelining import TaskRunStatePipeline
+from prefect.client.schemas.objects import StateType
+from prefect.client.schemas.responses import SetStateStatus
+from prefect.states import Completed, Running
+from prefect.tasks import task
+
+
+@pytest.fixture
+async def task_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo, state=Running())
+    return [
+        await prefect_client.create_task_run(
+            bar, flow_run_id=flow_run.id, dynamic_key=str(i)
+        )
+        for i in range(5)
+    ]
+
+
+@pytest.fixture
+def spy_set_task_run_states(prefect_client, monkeypatch):
+    batches = []
+    set_task_run_states = prefect_client.set_task_run_states
+
+    async def spy(proposals):
+        batches.append(list(proposals))
+        return await set_task_run_states(batches[-1])
+
+    monkeypatch.setattr(prefect_client, "set_task_run_states", spy)
+    return batches
+
+
+async def test_pipeline_coalesces_concurrent_proposals(
+    prefect_client, task_runs, spy_set_task_run_states
+):
+    pipeline = TaskRunStatePipeline(prefect_client, interval=0.1)
+
+    results = await asyncio.gather(
+        *[pipeline.set_task_run_state(task_run.id, Running()) for task_run in task_runs]
+    )
+
+    assert [len(batch) for batch in spy_set_task_run_states] == [5]
+    assert [proposal.task_run_id for proposal in spy_set_task_run_states[0]] == [
+        task_run.id for task_run in task_runs
+    ]
+    assert all(result.status == SetStateStatus.ACCEPT for result in results)
+
+    for task_run, result in zip(task_runs, results):
+        run = await prefect_client.read_task_run(task_run.id)
+        assert run.state.id == result.state.id
+        assert run.state.type == StateType.RUNNING
+
+
+async def test_pipeline_flushes_at_max_batch_size(
+    prefect_client, task_runs, spy_set_task_run_states
+):
+    pipeline = TaskRunStatePipeline(prefect_client, max_batch_size=2, interval=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            *[
+                pipeline.set_task_run_state(task_run.id, Running())
+                for task_run in task_runs[:4]
+            ]
+        ),
+        timeout=5,
+    )
+
+    assert [len(batch) for batch in spy_set_task_run_states] == [2, 2]
+    assert all(result.status == SetStateStatus.ACCEPT for result in results)
+
+
+async def test_pipeline_passes_force(prefect_client, task_runs):
+    pipeline = TaskRunStatePipeline(prefect_client)
+
+    await pipeline.set_task_run_state(task_runs[0].id, Completed())
+    result = await pipeline.set_task_run_state(task_runs[0].id, Running(), force=True)
+
+    assert result.status == SetStateStatus.ACCEPT
+    run = await prefect_client.read_task_run(task_runs[0].id)
+    assert run.state.type == StateType.RUNNING
+
+
+async def test_pipeline_reports_errors_to_every_caller(
+    prefect_client, task_runs, monkeypatch
+):
+    async def fail(proposals):
+        raise ValueError("oh no")
+
+    monkeypatch.setattr(prefect_client, "set_task_run_states", fail)
+    pipeline = TaskRunStatePipeline(prefect_client)
+
+    results = await asyncio.gather(
+        *[
+            pipeline.set_task_run_state(task_run.id, Running())
+            for task_run in task_runs[:2]
+        ],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
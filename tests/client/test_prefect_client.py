@@ -1,3 +1,4 @@
+import asyncio
 import os
 import random
 import threading
@@ -21,6 +22,7 @@ import prefect.client.schemas as client_schemas
 import prefect.context
 import prefect.exceptions
 from prefect import flow, tags
+from prefect.client.base import SharedTransport
 from prefect.client.orchestration import PrefectClient, ServerType, get_client
 from prefect.client.schemas.responses import (
     OrchestrationResult,
@@ -33,6 +35,8 @@ from prefect.server.api.server import SERVER_API_VERSION, create_app
 from prefect.client.schemas.actions import (
     ArtifactCreate,
     LogCreate,
+    TaskRunCreate,
+    TaskRunStateProposal,
     WorkPoolCreate,
     VariableCreate,
 )
@@ -53,11 +57,19 @@ from prefect.client.schemas.filters import (
     LogFilter,
     LogFilterFlowRunId,
 )
+from prefect.client.schemas.sorting import FlowRunSort
 from prefect.client.schemas.schedules import IntervalSchedule
 from prefect.client.schemas.objects import StateType
 from prefect.settings import (
     PREFECT_API_DATABASE_MIGRATE_ON_START,
+    PREFECT_API_ENABLE_MSGPACK,
+    PREFECT_API_ENABLE_ZSTD,
+    PREFECT_API_KEEPALIVE_EXPIRY,
     PREFECT_API_KEY,
+    PREFECT_API_MAX_CONNECTIONS,
+    PREFECT_API_LOG_STREAM_POLL_SECONDS,
+    PREFECT_API_MAX_KEEPALIVE_CONNECTIONS,
+    PREFECT_API_SHARED_CONNECTION_POOLS,
     PREFECT_API_TLS_INSECURE_SKIP_VERIFY,
     PREFECT_API_URL,
     PREFECT_CLOUD_API_URL,
@@ -66,6 +78,7 @@ from prefect.settings import (
 from prefect.states import Completed, Pending, Running, Scheduled, State
 from prefect.tasks import task
 from prefect.testing.utilities import AsyncMock, exceptions_equal
+from prefect.utilities import wire
 
 
 class TestGetClient:
@@ -104,6 +117,17 @@ class TestClientProxyAwareness:
         httpx_client = get_client()._client
         assert isinstance(httpx_client, httpx.AsyncClient)
 
+        transport_for_api = httpx_client._transport_for_url(remote_https_api)
+        assert isinstance(transport_for_api, SharedTransport)
+        assert transport_for_api.transport_kwargs["retries"] == 3
+
+    def test_unproxied_remote_client_without_shared_pools_will_retry(
+        self, remote_https_api: httpx.URL
+    ):
+        with temporary_settings(updates={PREFECT_API_SHARED_CONNECTION_POOLS: False}):
+            httpx_client = get_client()._client
+        assert isinstance(httpx_client, httpx.AsyncClient)
+
         transport_for_api = httpx_client._transport_for_url(remote_https_api)
         assert isinstance(transport_for_api, httpx.AsyncHTTPTransport)
 
@@ -111,6 +135,21 @@ class TestClientProxyAwareness:
         assert isinstance(pool, httpcore.AsyncConnectionPool)
         assert pool._retries == 3  # set in prefect.client.orchestration.get_client()
 
+    def test_pool_limits_are_configurable(self, remote_https_api: httpx.URL):
+        with temporary_settings(
+            updates={
+                PREFECT_API_MAX_CONNECTIONS: 32,
+                PREFECT_API_MAX_KEEPALIVE_CONNECTIONS: 4,
+                PREFECT_API_KEEPALIVE_EXPIRY: 10,
+            }
+        ):
+            httpx_client = get_client()._client
+
+        transport_for_api = httpx_client._transport_for_url(remote_https_api)
+        assert transport_for_api.transport_kwargs["limits"] == httpx.Limits(
+            max_connections=32, max_keepalive_connections=4, keepalive_expiry=10
+        )
+
     def test_users_can_still_provide_transport(self, remote_https_api: httpx.URL):
         """If users want to supply an alternative transport, they still can and
         we will not alter it"""
@@ -184,6 +223,101 @@ class TestClientProxyAwareness:
         assert pool._retries == 3  # set in prefect.client.orchestration.get_client()
 
 
+class TestWireFormats:
+    @pytest.fixture
+    async def wire_client(self):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+        with temporary_settings(
+            updates={PREFECT_API_ENABLE_MSGPACK: True, PREFECT_API_ENABLE_ZSTD: True}
+        ):
+            client = get_client()
+
+        async with client:
+            yield client
+
+    @pytest.fixture
+    def responses(self, wire_client):
+        responses = []
+        wire_client._client.event_hooks["response"].append(
+            lambda response: responses.append(response) or asyncio.sleep(0)
+        )
+        return responses
+
+    async def test_client_negotiates_msgpack_and_zstd(
+        self, wire_client, responses, flow_function
+    ):
+        for i in range(20):
+            await wire_client.create_flow_run(
+                flow=flow_function, name=f"run-{i}", parameters={"x": "y" * 100}
+            )
+
+        flow_runs = await wire_client.read_flow_runs()
+
+        assert {flow_run.name for flow_run in flow_runs} == {
+            f"run-{i}" for i in range(20)
+        }
+        assert responses[-1].headers["content-type"] == "application/msgpack"
+        assert responses[-1].headers["content-encoding"] == "zstd"
+        assert responses[-1].request.headers["content-type"] == "application/msgpack"
+
+    async def test_client_sends_large_bodies_compressed(
+        self, wire_client, responses, flow_function
+    ):
+        await wire_client.read_flow_runs()
+        await wire_client.create_flow_run(
+            flow=flow_function, parameters={"x": "y" * 1000}
+        )
+        assert responses[-1].request.headers["content-encoding"] == "zstd"
+
+    async def test_client_sends_json_until_the_server_accepts_wire_formats(
+        self, wire_client, responses, flow_function
+    ):
+        await wire_client.create_flow_run(
+            flow=flow_function, parameters={"x": "y" * 1000}
+        )
+        await wire_client.create_flow_run(
+            flow=flow_function, parameters={"x": "y" * 1000}
+        )
+
+        assert responses[0].request.headers["content-type"] == "application/json"
+        assert "content-encoding" not in responses[0].request.headers
+        assert responses[0].headers["accept-encoding"] == "zstd"
+        assert responses[-1].request.headers["content-type"] == "application/msgpack"
+        assert responses[-1].request.headers["content-encoding"] == "zstd"
+
+    async def test_client_falls_back_to_json_when_rejected(
+        self, wire_client, responses, flow_function, monkeypatch
+    ):
+        await wire_client.read_flow_runs()
+
+        # The server stops decoding the formats it advertised
+        monkeypatch.setattr(wire, "msgpack_available", lambda: False)
+        monkeypatch.setattr(wire, "zstd_available", lambda: False)
+
+        flow_run = await wire_client.create_flow_run(
+            flow=flow_function, parameters={"x": "y" * 1000}
+        )
+
+        assert flow_run.parameters == {"x": "y" * 1000}
+        # Creating the flow is rejected and sent again as JSON
+        assert [response.status_code for response in responses] == [200, 415, 201, 201]
+        for response in responses[2:]:
+            assert response.request.headers["content-type"] == "application/json"
+            assert "content-encoding" not in response.request.headers
+
+    async def test_wire_formats_are_disabled_by_default(self, prefect_client, flow_run):
+        responses = []
+        prefect_client._client.event_hooks["response"].append(
+            lambda response: responses.append(response) or asyncio.sleep(0)
+        )
+
+        await prefect_client.read_flow_runs()
+
+        assert responses[-1].headers["content-type"] == "application/json"
+        assert responses[-1].request.headers["content-type"] == "application/json"
+
+
 class TestInjectClient:
     @staticmethod
     @inject_client
@@ -814,6 +948,89 @@ async def test_create_then_read_flow_run(prefect_client):
     assert lookup == flow_run
 
 
+class TestCoalescedReads:
+    @pytest.fixture
+    async def flow_run(self, prefect_client):
+        @flow
+        def foo():
+            pass
+
+        return await prefect_client.create_flow_run(foo)
+
+    @pytest.fixture
+    def spy_get(self, prefect_client, monkeypatch):
+        urls = []
+        get = prefect_client._client.get
+
+        async def spy(url, *args, **kwargs):
+            urls.append(url)
+            await anyio.sleep(0.1)
+            return await get(url, *args, **kwargs)
+
+        monkeypatch.setattr(prefect_client._client, "get", spy)
+        return urls
+
+    async def test_concurrent_reads_share_a_request(
+        self, prefect_client, flow_run, spy_get
+    ):
+        results = await asyncio.gather(
+            *[prefect_client.read_flow_run(flow_run.id) for _ in range(5)]
+        )
+
+        assert spy_get == [f"/flow_runs/{flow_run.id}"]
+        assert all(result.id == flow_run.id for result in results)
+        # Each caller receives its own object
+        assert len({id(result) for result in results}) == 5
+
+    async def test_sequential_reads_are_not_cached(
+        self, prefect_client, flow_run, spy_get
+    ):
+        await prefect_client.read_flow_run(flow_run.id)
+        await prefect_client.read_flow_run(flow_run.id)
+
+        assert len(spy_get) == 2
+
+    async def test_concurrent_reads_share_errors(self, prefect_client, spy_get):
+        flow_run_id = uuid4()
+        results = await asyncio.gather(
+            *[prefect_client.read_flow_run(flow_run_id) for _ in range(2)],
+            return_exceptions=True,
+        )
+
+        assert len(spy_get) == 1
+        assert all(isinstance(r, prefect.exceptions.ObjectNotFound) for r in results)
+
+    async def test_cancelling_a_reader_does_not_cancel_others(
+        self, prefect_client, flow_run, spy_get
+    ):
+        first = asyncio.ensure_future(prefect_client.read_flow_run(flow_run.id))
+        second = asyncio.ensure_future(prefect_client.read_flow_run(flow_run.id))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert (await second).id == flow_run.id
+        assert first.cancelled()
+
+    async def test_cached_reads(self, prefect_client, flow_run, spy_get):
+        with prefect_client.cached_reads(ttl_seconds=60):
+            first = await prefect_client.read_flow_run(flow_run.id)
+            second = await prefect_client.read_flow_run(flow_run.id)
+
+        await prefect_client.read_flow_run(flow_run.id)
+
+        assert len(spy_get) == 2
+        assert first == second
+        assert first is not second
+
+    async def test_cached_reads_expire(self, prefect_client, flow_run, spy_get):
+        with prefect_client.cached_reads(ttl_seconds=0.01):
+            await prefect_client.read_flow_run(flow_run.id)
+            await asyncio.sleep(0.02)
+            await prefect_client.read_flow_run(flow_run.id)
+
+        assert len(spy_get) == 2
+
+
 async def test_create_flow_run_retains_parameters(prefect_client):
     @flow
     def foo():
@@ -920,6 +1137,26 @@ async def test_read_flow_runs_with_filtering(prefect_client):
     assert {flow_run.id for flow_run in flow_runs} == {fr_id_4, fr_id_5}
 
 
+async def test_iter_flow_runs_reads_every_page(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run_ids = [(await prefect_client.create_flow_run(foo)).id for _ in range(5)]
+
+    flow_runs = [
+        flow_run
+        async for flow_run in prefect_client.iter_flow_runs(
+            sort=FlowRunSort.NAME_ASC, page_size=2
+        )
+    ]
+    assert all(isinstance(flow_run, client_schemas.FlowRun) for flow_run in flow_runs)
+    assert [flow_run.name for flow_run in flow_runs] == sorted(
+        flow_run.name for flow_run in flow_runs
+    )
+    assert sorted(flow_run.id for flow_run in flow_runs) == sorted(flow_run_ids)
+
+
 async def test_read_flows_without_filter(prefect_client):
     @flow
     def foo():
@@ -1122,6 +1359,32 @@ async def test_create_then_read_task_run_with_state(prefect_client):
     assert task_run.state.is_running()
 
 
+async def test_create_then_read_task_runs(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(prefect_client):
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_runs = await prefect_client.create_task_runs(
+        [
+            TaskRunCreate(
+                flow_run_id=flow_run.id, task_key=bar.task_key, dynamic_key=str(i)
+            )
+            for i in range(3)
+        ]
+    )
+    assert all(isinstance(task_run, TaskRun) for task_run in task_runs)
+    assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+
+    for task_run in task_runs:
+        lookup = await prefect_client.read_task_run(task_run.id)
+        assert lookup.state.is_pending()
+
+
 async def test_set_then_read_task_run_state(prefect_client):
     @flow
     def foo():
@@ -1150,6 +1413,45 @@ async def test_set_then_read_task_run_state(prefect_client):
     assert run.state.message == "Test!"
 
 
+async def test_set_then_read_task_run_states(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    @task
+    def bar(prefect_client):
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    task_runs = await prefect_client.create_task_runs(
+        [
+            TaskRunCreate(
+                flow_run_id=flow_run.id, task_key=bar.task_key, dynamic_key=str(i)
+            )
+            for i in range(2)
+        ]
+    )
+
+    responses = await prefect_client.set_task_run_states(
+        [
+            TaskRunStateProposal(
+                task_run_id=task_run.id,
+                state=Completed(message=f"Test {i}!").to_state_create(),
+            )
+            for i, task_run in enumerate(task_runs)
+        ]
+    )
+
+    assert len(responses) == 2
+    for i, (task_run, response) in enumerate(zip(task_runs, responses)):
+        assert isinstance(response, OrchestrationResult)
+        assert response.status == SetStateStatus.ACCEPT
+
+        run = await prefect_client.read_task_run(task_run.id)
+        assert run.state.type == StateType.COMPLETED
+        assert run.state.message == f"Test {i}!"
+
+
 async def test_create_then_read_flow_run_notification_policy(
     prefect_client, block_document
 ):
@@ -1202,6 +1504,60 @@ async def test_read_filtered_logs(session, prefect_client, deployment):
         assert log.flow_run_id not in flow_runs[3:]
 
 
+async def test_iter_logs_reads_every_page(prefect_client):
+    flow_run_id = uuid4()
+    now = datetime.now(tz=timezone.utc)
+    await prefect_client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now + timedelta(seconds=i),
+                flow_run_id=flow_run_id,
+            )
+            for i in range(5)
+        ]
+    )
+
+    logs = [log async for log in prefect_client.iter_logs(page_size=2)]
+
+    assert [log.message for log in logs] == [f"Log {i}" for i in range(5)]
+
+
+async def test_stream_logs_of_finished_flow_run(prefect_client):
+    @flow
+    def foo():
+        pass
+
+    flow_run = await prefect_client.create_flow_run(foo)
+    now = datetime.now(tz=timezone.utc)
+    await prefect_client.create_logs(
+        [
+            LogCreate(
+                name="prefect.flow_runs",
+                level=20,
+                message=f"Log {i}",
+                timestamp=now + timedelta(seconds=i),
+                flow_run_id=flow_run.id,
+            )
+            for i in range(3)
+        ]
+    )
+    await prefect_client.set_flow_run_state(flow_run.id, Completed(), force=True)
+
+    with temporary_settings({PREFECT_API_LOG_STREAM_POLL_SECONDS: 0.1}):
+        logs = [log async for log in prefect_client.stream_logs(flow_run.id)]
+
+    assert [log.message for log in logs] == ["Log 0", "Log 1", "Log 2"]
+
+
+async def test_stream_logs_of_missing_flow_run(prefect_client):
+    with pytest.raises(prefect.exceptions.ObjectNotFound):
+        async for _ in prefect_client.stream_logs(uuid4()):
+            pass
+
+
 async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypatch):
     with temporary_settings(updates={PREFECT_API_TLS_INSECURE_SKIP_VERIFY: True}):
         mock = Mock()
@@ -1214,6 +1570,8 @@ async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_true(monkeypa
         transport=ANY,
         base_url=ANY,
         timeout=ANY,
+        enable_msgpack=False,
+        enable_zstd=False,
     )
 
 
@@ -1228,6 +1586,8 @@ async def test_prefect_api_tls_insecure_skip_verify_setting_set_to_false(monkeyp
         transport=ANY,
         base_url=ANY,
         timeout=ANY,
+        enable_msgpack=False,
+        enable_zstd=False,
     )
 
 
@@ -1240,6 +1600,8 @@ async def test_prefect_api_tls_insecure_skip_verify_default_setting(monkeypatch)
         transport=ANY,
         base_url=ANY,
         timeout=ANY,
+        enable_msgpack=False,
+        enable_zstd=False,
     )
 
 
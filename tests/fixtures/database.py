@@ -71,6 +71,9 @@ async def clear_db(db):
         for table in reversed(db.Base.metadata.sorted_tables):
             await session.execute(table.delete())
 
+    # forget cached task run states kept in memory along with the deleted ones
+    models.task_run_state_cache.clear_memory_cache()
+
 
 @pytest.fixture
 async def session(db) -> AsyncSession:
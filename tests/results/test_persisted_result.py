@@ -1,10 +1,34 @@
 import json
+import pickle
+from uuid import uuid4
 
 import pytest
 
 from prefect.filesystems import LocalFileSystem
-from prefect.results import DEFAULT_STORAGE_KEY_FN, PersistedResult, PersistedResultBlob
+from prefect.results import (
+    BINARY_BLOB_ALIGNMENT,
+    DEFAULT_STORAGE_KEY_FN,
+    BinaryPersistedResultBlob,
+    PersistedResult,
+    PersistedResultBlob,
+    ResultCache,
+    get_result_cache,
+)
 from prefect.serializers import JSONSerializer, PickleSerializer
+from prefect.settings import (
+    PREFECT_RESULTS_BINARY_BLOBS,
+    PREFECT_RESULTS_CACHE_MAX_BYTES,
+    temporary_settings,
+)
+from prefect.utilities.annotations import NotSet
+
+
+@pytest.fixture(autouse=True)
+def result_cache():
+    cache = get_result_cache()
+    cache.clear()
+    yield cache
+    cache.clear()
 
 
 @pytest.fixture
@@ -120,3 +144,212 @@ async def test_result_reference_create_uses_storage_key_fn(storage_block):
     assert result.storage_key == "test"
     contents = await storage_block.read_path("test")
     assert contents
+
+
+async def test_result_reference_get_uses_result_cache(
+    storage_block, result_cache, monkeypatch
+):
+    result = await PersistedResult.create(
+        {"foo": "bar"},
+        storage_block_id=storage_block._block_document_id,
+        storage_block=storage_block,
+        storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+        serializer=JSONSerializer(),
+    )
+
+    async def read_blob(*args, **kwargs):
+        raise AssertionError("The result should not be read from storage")
+
+    monkeypatch.setattr(PersistedResult, "_read_blob", read_blob)
+
+    # A new reference to the same result, as retrieved from the API
+    reference = PersistedResult.parse_obj(result.dict())
+    assert not reference.has_cached_object()
+
+    assert await reference.get() == {"foo": "bar"}
+    assert result_cache.hits == 1
+
+
+async def test_result_reference_get_populates_result_cache(storage_block, result_cache):
+    result = await PersistedResult.create(
+        "test",
+        storage_block_id=storage_block._block_document_id,
+        storage_block=storage_block,
+        storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+        serializer=JSONSerializer(),
+    )
+    result_cache.clear()
+
+    assert await PersistedResult.parse_obj(result.dict()).get() == "test"
+    content = await storage_block.read_path(result.storage_key)
+    assert result_cache.stats() == dict(
+        hits=0, misses=1, evictions=0, entries=1, size=len(content)
+    )
+
+    assert await PersistedResult.parse_obj(result.dict()).get() == "test"
+    assert result_cache.hits == 1
+
+
+async def test_result_reference_without_object_caching_skips_result_cache(
+    storage_block, result_cache
+):
+    result = await PersistedResult.create(
+        "test",
+        storage_block_id=storage_block._block_document_id,
+        storage_block=storage_block,
+        storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+        serializer=JSONSerializer(),
+        cache_object=False,
+    )
+
+    assert await result.get() == "test"
+    assert len(result_cache) == 0
+
+
+async def test_result_reference_create_replaces_result_cache_entry(
+    storage_block, result_cache
+):
+    for value in ["first", "second"]:
+        result = await PersistedResult.create(
+            value,
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=lambda: "test",
+            serializer=JSONSerializer(),
+        )
+
+    assert len(result_cache) == 1
+    assert await PersistedResult.parse_obj(result.dict()).get() == "second"
+
+
+class TestBinaryBlobs:
+    @pytest.fixture(autouse=True)
+    def enable_binary_blobs(self):
+        with temporary_settings({PREFECT_RESULTS_BINARY_BLOBS: True}):
+            yield
+
+    @pytest.mark.parametrize(
+        "serializer", [JSONSerializer(), PickleSerializer(picklelib="pickle")]
+    )
+    async def test_create_and_get(self, serializer, storage_block):
+        result = await PersistedResult.create(
+            {"foo": [1, 2, 3]},
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=serializer,
+            cache_object=False,
+        )
+
+        contents = await storage_block.read_path(result.storage_key)
+        assert BinaryPersistedResultBlob.is_binary(contents)
+        assert await result.get() == {"foo": [1, 2, 3]}
+
+    async def test_blob_stores_raw_payload(self, storage_block):
+        serializer = PickleSerializer(picklelib="pickle")
+        result = await PersistedResult.create(
+            "test",
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=serializer,
+        )
+
+        contents = await storage_block.read_path(result.storage_key)
+        blob = BinaryPersistedResultBlob.from_buffer(contents)
+        assert blob.serializer == serializer
+        assert pickle.loads(blob.payload) == "test"
+
+    async def test_buffers_are_loaded_from_storage_without_copies(self, storage_block):
+        data = pickle.PickleBuffer(bytearray(b"x" * 4096))
+
+        result = await PersistedResult.create(
+            data,
+            storage_block_id=storage_block._block_document_id,
+            storage_block=storage_block,
+            storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+            serializer=PickleSerializer(picklelib="pickle"),
+            cache_object=False,
+        )
+
+        loaded = await result.get()
+        # The buffer is a view of the memory-mapped result file
+        assert isinstance(loaded, memoryview)
+        assert loaded.nbytes == 4096
+        assert bytes(loaded) == b"x" * 4096
+
+    def test_sections_are_aligned(self):
+        blob = BinaryPersistedResultBlob(
+            serializer=PickleSerializer(),
+            payload=b"payload",
+            buffers=[b"a" * 100, b"b" * 10],
+        )
+        content = blob.to_bytes()
+        loaded = BinaryPersistedResultBlob.from_buffer(content)
+
+        assert bytes(loaded.payload) == b"payload"
+        assert [bytes(buffer) for buffer in loaded.buffers] == [b"a" * 100, b"b" * 10]
+        for section in [loaded.payload, *loaded.buffers]:
+            assert content.index(bytes(section)) % BINARY_BLOB_ALIGNMENT == 0
+
+    async def test_json_blobs_are_still_readable(self, storage_block):
+        with temporary_settings({PREFECT_RESULTS_BINARY_BLOBS: False}):
+            result = await PersistedResult.create(
+                "test",
+                storage_block_id=storage_block._block_document_id,
+                storage_block=storage_block,
+                storage_key_fn=DEFAULT_STORAGE_KEY_FN,
+                serializer=JSONSerializer(),
+                cache_object=False,
+            )
+
+        assert await result.get() == "test"
+
+
+class TestResultCache:
+    def test_get_missing(self):
+        cache = ResultCache(max_bytes=10)
+        assert cache.get(uuid4(), "foo") is NotSet
+        assert cache.misses == 1
+
+    def test_evicts_least_recently_used(self):
+        cache = ResultCache(max_bytes=10)
+        block_id = uuid4()
+
+        cache.put(block_id, "a", "a", size=4)
+        cache.put(block_id, "b", "b", size=4)
+        assert cache.get(block_id, "a") == "a"
+
+        cache.put(block_id, "c", "c", size=4)
+
+        assert cache.get(block_id, "b") is NotSet
+        assert cache.get(block_id, "a") == "a"
+        assert cache.get(block_id, "c") == "c"
+        assert cache.stats() == dict(hits=3, misses=1, evictions=1, entries=2, size=8)
+
+    def test_does_not_cache_objects_larger_than_budget(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put(uuid4(), "a", "a", size=11)
+        assert len(cache) == 0
+        assert cache.size == 0
+
+    def test_put_replaces_entry(self):
+        cache = ResultCache(max_bytes=10)
+        block_id = uuid4()
+
+        cache.put(block_id, "a", "first", size=4)
+        cache.put(block_id, "a", "second", size=6)
+
+        assert cache.get(block_id, "a") == "second"
+        assert cache.size == 6
+
+    def test_keys_include_storage_block(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put(uuid4(), "a", "a", size=1)
+        assert cache.get(uuid4(), "a") is NotSet
+
+    def test_uses_setting_by_default(self):
+        cache = ResultCache()
+        with temporary_settings({PREFECT_RESULTS_CACHE_MAX_BYTES: 0}):
+            cache.put(uuid4(), "a", "a", size=1)
+        assert len(cache) == 0
@@ -66,3 +66,28 @@ class TestDatabaseAdmin:
 
         response = await client.post("/admin/database/create", json=dict(confirm=False))
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestOrchestrationStats:
+    async def test_read_and_reset_orchestration_stats(self, client, flow_run):
+        response = await client.delete("/admin/orchestration/stats")
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        response = await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="SCHEDULED")),
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await client.get("/admin/orchestration/stats")
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()
+        assert list(stats["transitions"]) == ["flow_run None => SCHEDULED"]
+        transition = stats["transitions"]["flow_run None => SCHEDULED"]
+        assert transition["duration_seconds"]["count"] == 1
+        assert transition["statements"]["count"] == 1
+        assert stats["rules"]["SetRunStateType"]["before_transition"]["count"] == 1
+
+        await client.delete("/admin/orchestration/stats")
+        response = await client.get("/admin/orchestration/stats")
+        assert response.json() == {"transitions": {}, "rules": {}}
@@ -646,6 +646,73 @@ class TestReadFlowRuns:
         assert response.json()[0]["id"] == str(flow_run.id)
 
 
+class TestPaginateFlowRuns:
+    @pytest.fixture
+    async def flow_runs(self, flow, session):
+        flow_runs = []
+        for i in range(5):
+            flow_run = await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=actions.FlowRunCreate(flow_id=flow.id, name=f"fr{i % 2}"),
+            )
+            flow_runs.append(flow_run)
+        await session.commit()
+        return flow_runs
+
+    async def test_paginate_flow_runs(self, flow_runs, client):
+        response = await client.post(
+            "/flow_runs/paginate", json=dict(limit=2, sort="NAME_ASC")
+        )
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert [flow_run["name"] for flow_run in page["results"]] == ["fr0", "fr0"]
+        assert page["next_cursor"]
+
+    async def test_paginate_flow_runs_follows_cursor(self, flow_runs, client):
+        ids, cursor = [], None
+        while True:
+            response = await client.post(
+                "/flow_runs/paginate",
+                json=dict(limit=2, sort="NAME_DESC", cursor=cursor),
+            )
+            assert response.status_code == status.HTTP_200_OK
+            page = response.json()
+            ids.extend(flow_run["id"] for flow_run in page["results"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert len(ids) == 5
+        assert set(ids) == {str(flow_run.id) for flow_run in flow_runs}
+
+    async def test_paginate_flow_runs_applies_filter(self, flow_runs, client):
+        flow_run_filter = {"flow_runs": {"name": {"any_": ["fr1"]}}}
+        response = await client.post("/flow_runs/paginate", json=flow_run_filter)
+        page = response.json()
+        assert {flow_run["name"] for flow_run in page["results"]} == {"fr1"}
+        assert len(page["results"]) == 2
+        assert page["next_cursor"] is None
+
+    async def test_paginate_flow_runs_rejects_invalid_cursor(self, client):
+        response = await client.post(
+            "/flow_runs/paginate", json=dict(cursor="not-a-cursor")
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    async def test_paginate_flow_runs_rejects_cursor_for_another_sort(
+        self, flow_runs, client
+    ):
+        response = await client.post(
+            "/flow_runs/paginate", json=dict(limit=1, sort="NAME_ASC")
+        )
+        response = await client.post(
+            "/flow_runs/paginate",
+            json=dict(sort="NAME_DESC", cursor=response.json()["next_cursor"]),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert "NAME_ASC" in response.json()["detail"]
+
+
 class TestReadFlowRunGraph:
     @pytest.fixture
     async def graph_data(self, session):
@@ -722,6 +789,57 @@ class TestReadFlowRunGraph:
             for task_run in task_runs
         )
 
+    async def test_read_flow_run_graph_updates(self, graph_data, client):
+        response = await client.get(f"/flow_runs/{graph_data.id}/graph/updates")
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["nodes"]) == 10
+        assert response.json()["cursor"] is not None
+
+    async def test_read_flow_run_graph_updates_since_cursor(self, graph_data, client):
+        response = await client.get(f"/flow_runs/{graph_data.id}/graph/updates")
+        nodes = response.json()["nodes"]
+        cursor = response.json()["cursor"]
+
+        updated_task_run_id = nodes[0]["id"]
+        response = await client.post(
+            f"/task_runs/{updated_task_run_id}/set_state",
+            json=dict(state=dict(type="RUNNING"), force=True),
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await client.get(
+            f"/flow_runs/{graph_data.id}/graph/updates", params={"since": cursor}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        updates = response.json()
+
+        # task runs updated shortly before the cursor are returned again
+        assert updated_task_run_id in [node["id"] for node in updates["nodes"]]
+        assert pendulum.parse(updates["cursor"]) > pendulum.parse(cursor)
+
+        updated_node = next(
+            node for node in updates["nodes"] if node["id"] == updated_task_run_id
+        )
+        assert updated_node["state"]["type"] == "RUNNING"
+
+    async def test_read_flow_run_graph_updates_without_changes(
+        self, graph_data, client
+    ):
+        since = pendulum.now("UTC").add(hours=1)
+        response = await client.get(
+            f"/flow_runs/{graph_data.id}/graph/updates",
+            params={"since": since.isoformat()},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["nodes"] == []
+        assert pendulum.parse(response.json()["cursor"]) == since
+
+    async def test_read_flow_run_graph_updates_returns_404_if_does_not_exist(
+        self, client
+    ):
+        response = await client.get(f"/flow_runs/{uuid4()}/graph/updates")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 class TestDeleteFlowRuns:
     async def test_delete_flow_runs(self, flow_run, client, session):
@@ -6,6 +6,8 @@ order. This is purely so that we can test sorting by flow run and
 task run ID with a stable order across test machines.
 """
 
+import asyncio
+import json
 from datetime import timedelta
 from unittest import mock
 from uuid import uuid1
@@ -14,14 +16,24 @@ import pendulum
 import pytest
 from sqlalchemy.orm.exc import FlushError
 
-from prefect.server import models
+from prefect.server import models, schemas
+from prefect.server.api import logs as logs_api
 from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
+from prefect.server.services.log_buffer import LogBuffer, get_log_buffer
+from prefect.server.utilities import pagination
+from prefect.settings import (
+    PREFECT_API_DEFAULT_LIMIT,
+    PREFECT_API_LOG_STREAM_POLL_SECONDS,
+    temporary_settings,
+)
 
 NOW = pendulum.now("UTC")
 CREATE_LOGS_URL = "/logs/"
 READ_LOGS_URL = "/logs/filter"
+PAGINATE_LOGS_URL = "/logs/paginate"
+STREAM_LOGS_URL = "/logs/stream"
 
 
 @pytest.fixture
@@ -106,6 +118,31 @@ class TestCreateLogs:
             assert response.status_code == 500
 
 
+class TestCreateLogsWithLogBuffer:
+    @pytest.fixture
+    async def log_buffer(self):
+        buffer = LogBuffer(handle_signals=False, loop_seconds=60)
+        task = asyncio.ensure_future(buffer.start())
+        while get_log_buffer() is not buffer:
+            await asyncio.sleep(0.01)
+        yield buffer
+        await buffer.stop()
+        await task
+
+    async def test_create_logs_is_acknowledged_before_logs_are_written(
+        self, session, client, log_data, flow_run_id, log_buffer
+    ):
+        response = await client.post(CREATE_LOGS_URL, json=log_data)
+        assert response.status_code == 201
+        assert log_buffer.stats()["received"] == 2
+
+        await log_buffer.flush()
+
+        log_filter = LogFilter(flow_run_id={"any_": [flow_run_id]})
+        logs = await models.logs.read_logs(session=session, log_filter=log_filter)
+        assert len(logs) == 2
+
+
 class TestReadLogs:
     @pytest.fixture()
     async def logs(self, client, log_data):
@@ -175,3 +212,200 @@ class TestReadLogs:
         api_logs = [Log(**log_data) for log_data in response.json()]
         assert api_logs[0].timestamp > api_logs[1].timestamp
         assert api_logs[0].message == "Black flag ahead, captain!"
+
+
+class TestPaginateLogs:
+    @pytest.fixture()
+    async def logs(self, client, log_data):
+        await client.post(CREATE_LOGS_URL, json=log_data)
+
+    async def test_paginate_logs(self, client, logs):
+        response = await client.post(
+            PAGINATE_LOGS_URL, json={"limit": 1, "sort": "TIMESTAMP_ASC"}
+        )
+        assert response.status_code == 200
+        page = response.json()
+        assert [log["message"] for log in page["results"]] == ["Ahoy, captain"]
+
+        response = await client.post(
+            PAGINATE_LOGS_URL,
+            json={
+                "limit": 1,
+                "sort": "TIMESTAMP_ASC",
+                "cursor": page["next_cursor"],
+            },
+        )
+        page = response.json()
+        assert [log["message"] for log in page["results"]] == [
+            "Black flag ahead, captain!"
+        ]
+        assert page["next_cursor"] is None
+
+    async def test_paginate_logs_returns_empty_page(self, client):
+        response = await client.post(PAGINATE_LOGS_URL)
+        assert response.json() == {"results": [], "next_cursor": None}
+
+    async def test_paginate_logs_rejects_invalid_cursor(self, client):
+        response = await client.post(PAGINATE_LOGS_URL, json={"cursor": "abc"})
+        assert response.status_code == 422
+
+
+class TestStreamLogs:
+    @pytest.fixture(autouse=True)
+    def short_poll(self):
+        with temporary_settings({PREFECT_API_LOG_STREAM_POLL_SECONDS: 0.1}):
+            yield
+
+    async def set_state(self, session, flow_run, state):
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=state, force=True
+        )
+        await session.commit()
+
+    def create_logs(self, flow_run, messages, start=NOW):
+        return [
+            LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message=message,
+                timestamp=start + timedelta(seconds=i),
+                flow_run_id=flow_run.id,
+            ).dict(json_compatible=True)
+            for i, message in enumerate(messages)
+        ]
+
+    def read_stream(self, response):
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    async def test_stream_logs_of_finished_flow_run(self, client, session, flow_run):
+        await client.post(CREATE_LOGS_URL, json=self.create_logs(flow_run, "ab"))
+        await self.set_state(session, flow_run, schemas.states.Completed())
+
+        response = await client.get(
+            STREAM_LOGS_URL, params={"flow_run_id": str(flow_run.id)}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        batches = self.read_stream(response)
+        assert [log["message"] for log in batches[0]["logs"]] == ["a", "b"]
+        # the stream ends with heartbeats positioned after the last log
+        assert all(batch["logs"] == [] for batch in batches[1:])
+        assert batches[-1]["cursor"] == batches[0]["cursor"]
+
+    async def test_stream_logs_after_cursor(self, client, session, flow_run):
+        await client.post(CREATE_LOGS_URL, json=self.create_logs(flow_run, "ab"))
+        await self.set_state(session, flow_run, schemas.states.Completed())
+        response = await client.post(
+            PAGINATE_LOGS_URL,
+            json={"limit": 1, "logs": {"flow_run_id": {"any_": [str(flow_run.id)]}}},
+        )
+
+        response = await client.get(
+            STREAM_LOGS_URL,
+            params={
+                "flow_run_id": str(flow_run.id),
+                "cursor": response.json()["next_cursor"],
+            },
+        )
+
+        batches = self.read_stream(response)
+        assert [log["message"] for log in batches[0]["logs"]] == ["b"]
+
+    async def test_stream_logs_follows_new_logs(self, client, session, flow_run):
+        await self.set_state(session, flow_run, schemas.states.Running())
+        stream = asyncio.create_task(
+            client.get(STREAM_LOGS_URL, params={"flow_run_id": str(flow_run.id)})
+        )
+
+        await asyncio.sleep(0.2)
+        await client.post(CREATE_LOGS_URL, json=self.create_logs(flow_run, "ab"))
+        await asyncio.sleep(0.2)
+        await client.post(
+            CREATE_LOGS_URL,
+            json=self.create_logs(flow_run, "c", start=NOW + timedelta(minutes=1)),
+        )
+        await self.set_state(session, flow_run, schemas.states.Completed())
+
+        response = await asyncio.wait_for(stream, timeout=10)
+        messages = [
+            log["message"]
+            for batch in self.read_stream(response)
+            for log in batch["logs"]
+        ]
+        assert messages == ["a", "b", "c"]
+
+    async def test_stream_logs_includes_logs_written_late(
+        self, client, session, flow_run
+    ):
+        await self.set_state(session, flow_run, schemas.states.Running())
+        stream = asyncio.create_task(
+            client.get(STREAM_LOGS_URL, params={"flow_run_id": str(flow_run.id)})
+        )
+
+        await asyncio.sleep(0.2)
+        await client.post(CREATE_LOGS_URL, json=self.create_logs(flow_run, "ab"))
+        await asyncio.sleep(0.2)
+        # written after "b" was streamed, with an earlier timestamp
+        await client.post(
+            CREATE_LOGS_URL,
+            json=self.create_logs(
+                flow_run, ["late"], start=NOW + timedelta(milliseconds=500)
+            ),
+        )
+        await asyncio.sleep(0.2)
+        await self.set_state(session, flow_run, schemas.states.Completed())
+
+        response = await asyncio.wait_for(stream, timeout=10)
+        batches = self.read_stream(response)
+        messages = [log["message"] for batch in batches for log in batch["logs"]]
+        assert messages == ["a", "b", "late"]
+        # the cursor stays after the latest log
+        assert batches[-1]["cursor"] == next(
+            batch["cursor"] for batch in batches if batch["logs"]
+        )
+
+    async def test_stream_logs_sends_each_page_as_it_is_read(
+        self, client, session, db, flow_run, monkeypatch
+    ):
+        await client.post(CREATE_LOGS_URL, json=self.create_logs(flow_run, "abcde"))
+
+        read_logs = models.logs.read_logs
+        pages_read = 0
+
+        async def count_pages(**kwargs):
+            nonlocal pages_read
+            pages_read += 1
+            return await read_logs(**kwargs)
+
+        monkeypatch.setattr(models.logs, "read_logs", count_pages)
+
+        sort = schemas.sorting.LogSort.TIMESTAMP_ASC
+        with temporary_settings({PREFECT_API_DEFAULT_LIMIT: 2}):
+            stream = logs_api._stream_flow_run_logs(
+                db, flow_run.id, sort, pagination.decode_cursor(None, sort)
+            )
+            batches = [json.loads(await stream.__anext__())]
+            assert pages_read == 1
+
+            batches.append(json.loads(await stream.__anext__()))
+            batches.append(json.loads(await stream.__anext__()))
+            await stream.aclose()
+
+        assert [[log["message"] for log in batch["logs"]] for batch in batches] == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+
+    async def test_stream_logs_of_missing_flow_run(self, client):
+        response = await client.get(
+            STREAM_LOGS_URL, params={"flow_run_id": str(uuid1())}
+        )
+        assert response.status_code == 404
+
+    async def test_stream_logs_rejects_invalid_cursor(self, client, flow_run):
+        response = await client.get(
+            STREAM_LOGS_URL, params={"flow_run_id": str(flow_run.id), "cursor": "abc"}
+        )
+        assert response.status_code == 422
@@ -1,5 +1,7 @@
 from datetime import timedelta
 from typing import List
+from unittest.mock import AsyncMock
+from uuid import uuid4
 
 import pendulum
 import pydantic
@@ -9,7 +11,13 @@ from fastapi import Response, status
 
 from prefect.server import models
 from prefect.server.schemas import actions, core, responses, states
+from prefect.server.models.run_history_rollups import RUN_HISTORY_ROLLUP_STATE_KEY
 from prefect.server.schemas.states import StateType
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+from prefect.settings import (
+    PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED,
+    temporary_settings,
+)
 
 dt = pendulum.datetime(2021, 7, 1)
 
@@ -911,3 +919,181 @@ async def test_flow_run_lateness(client, session):
         )
         < 2.5
     )
+
+
+class TestRunHistoryRollups:
+    @pytest.fixture
+    def enable_rollups(self):
+        with temporary_settings(
+            {PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: True}
+        ):
+            yield
+
+    @pytest.fixture
+    async def rollups(self, db, enable_rollups):
+        await RunHistoryRollups(handle_signals=False).start(loops=1)
+        yield
+        async with db.session_context(begin_transaction=True) as session:
+            await session.execute(sa.delete(db.RunHistoryRollup))
+            await session.execute(
+                sa.delete(db.Configuration).where(
+                    db.Configuration.key == RUN_HISTORY_ROLLUP_STATE_KEY
+                )
+            )
+
+    async def read_history(self, client, route, **kwargs):
+        response = await client.post(route, json=kwargs)
+        return parse_response(
+            response, include=["state_type", "state_name", "count_runs"]
+        )
+
+    @pytest.mark.parametrize("route", ["/flow_runs/history", "/task_runs/history"])
+    @pytest.mark.parametrize(
+        "start,end,interval",
+        [
+            (dt.subtract(days=14), dt.add(days=4), timedelta(days=1)),
+            (dt.subtract(days=3), dt.add(days=4), timedelta(hours=6)),
+            (dt, dt.add(hours=1), timedelta(minutes=5)),
+            (dt.subtract(days=1), dt.add(days=1), timedelta(seconds=90)),
+            # the history extends past the rollups into the current hour
+            (
+                pendulum.now("UTC").start_of("hour").subtract(hours=3),
+                pendulum.now("UTC").add(hours=3),
+                timedelta(hours=1),
+            ),
+        ],
+    )
+    async def test_history_from_rollups_matches_history_from_runs(
+        self, client, rollups, route, start, end, interval
+    ):
+        query = dict(
+            history_start=str(start),
+            history_end=str(end),
+            history_interval_seconds=interval.total_seconds(),
+        )
+
+        rolled_up = await self.read_history(client, route, **query)
+        with temporary_settings(
+            {PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False}
+        ):
+            expected = await self.read_history(client, route, **query)
+
+        assert rolled_up == expected
+
+    async def test_history_from_rollups_with_filters(self, client, rollups, work_queue):
+        flows = await client.post("/flows/filter", json=dict(limit=1))
+        flow_id = flows.json()[0]["id"]
+
+        for filters in (
+            dict(flows=dict(id=dict(any_=[flow_id]))),
+            dict(flow_runs=dict(work_queue_name=dict(any_=[work_queue.name]))),
+            dict(deployments=dict(id=dict(any_=[str(uuid4())]))),
+        ):
+            query = dict(
+                history_start=str(dt.subtract(days=14)),
+                history_end=str(dt.add(days=4)),
+                history_interval_seconds=timedelta(days=1).total_seconds(),
+                **filters,
+            )
+            rolled_up = await self.read_history(client, "/flow_runs/history", **query)
+            with temporary_settings(
+                {PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False}
+            ):
+                expected = await self.read_history(
+                    client, "/flow_runs/history", **query
+                )
+
+            assert rolled_up == expected
+
+    async def test_history_from_rollups_includes_estimates(self, client, rollups):
+        query = dict(
+            history_start=str(dt.subtract(days=14)),
+            history_end=str(dt.subtract(days=3)),
+            history_interval_seconds=timedelta(days=1).total_seconds(),
+        )
+        rolled_up = parse_response(await client.post("/flow_runs/history", json=query))
+        with temporary_settings(
+            {PREFECT_API_SERVICES_RUN_HISTORY_ROLLUPS_ENABLED: False}
+        ):
+            expected = parse_response(
+                await client.post("/flow_runs/history", json=query)
+            )
+
+        assert rolled_up == expected
+
+    @pytest.mark.parametrize(
+        "filters,reads_rollups",
+        [
+            (dict(), True),
+            (dict(flows=dict(id=dict(any_=[str(uuid4())]))), True),
+            (
+                dict(
+                    deployments=dict(id=dict(any_=[str(uuid4())])),
+                    flow_runs=dict(
+                        deployment_id=dict(any_=[str(uuid4())]),
+                        work_queue_name=dict(any_=["wq"]),
+                    ),
+                ),
+                True,
+            ),
+            (dict(flows=dict(name=dict(any_=["f-1"]))), False),
+            (dict(flow_runs=dict(tags=dict(all_=["completed"]))), False),
+            (dict(flow_runs=dict(work_queue_name=dict(is_null_=True))), False),
+            (
+                dict(
+                    flow_runs=dict(
+                        operator="or_",
+                        deployment_id=dict(any_=[str(uuid4())]),
+                        work_queue_name=dict(any_=["wq"]),
+                    )
+                ),
+                False,
+            ),
+            (
+                dict(work_pools=dict(name=dict(any_=["test-work-pool-run-history"]))),
+                False,
+            ),
+        ],
+    )
+    async def test_history_is_read_from_rollups_for_supported_filters(
+        self, client, rollups, monkeypatch, filters, reads_rollups
+    ):
+        read_rollups = AsyncMock(
+            wraps=models.run_history_rollups.read_run_history_rollups
+        )
+        monkeypatch.setattr(
+            models.run_history_rollups, "read_run_history_rollups", read_rollups
+        )
+
+        response = await client.post(
+            "/flow_runs/history",
+            json=dict(
+                history_start=str(dt.subtract(days=14)),
+                history_end=str(dt.add(days=4)),
+                history_interval_seconds=timedelta(days=1).total_seconds(),
+                **filters,
+            ),
+        )
+        assert len(parse_response(response)) == 18
+        assert read_rollups.called == reads_rollups
+
+    async def test_history_is_read_from_runs_for_unaligned_intervals(
+        self, client, rollups, monkeypatch
+    ):
+        read_rollups = AsyncMock(
+            wraps=models.run_history_rollups.read_run_history_rollups
+        )
+        monkeypatch.setattr(
+            models.run_history_rollups, "read_run_history_rollups", read_rollups
+        )
+
+        response = await client.post(
+            "/flow_runs/history",
+            json=dict(
+                history_start=str(dt.add(seconds=30)),
+                history_end=str(dt.add(days=1)),
+                history_interval_seconds=timedelta(hours=1).total_seconds(),
+            ),
+        )
+        assert len(parse_response(response)) == 24
+        read_rollups.assert_not_called()
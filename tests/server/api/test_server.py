@@ -4,6 +4,7 @@ from uuid import uuid4
 import pytest
 import sqlalchemy as sa
 import asyncpg
+import orjson
 import toml
 from fastapi import APIRouter, status, testclient
 from httpx import ASGITransport, AsyncClient
@@ -18,11 +19,13 @@ from prefect.server.api.server import (
 )
 from prefect.settings import (
     PREFECT_API_DATABASE_CONNECTION_URL,
+    PREFECT_API_MAX_DECODED_BODY_SIZE,
     PREFECT_MEMO_STORE_PATH,
     PREFECT_MEMOIZE_BLOCK_AUTO_REGISTRATION,
     temporary_settings,
 )
 from prefect.testing.utilities import AsyncMock
+from prefect.utilities import wire
 
 
 async def test_validation_error_handler_422(client):
@@ -204,6 +207,9 @@ class TestCreateOrionAPI:
         def foo():
             pass
 
+        router.post("/paginate")(MagicMock())
+        router.get("/stream")(MagicMock())
+
         with pytest.raises(
             ValueError,
             match="override for '/logs' is missing paths.* {'POST /logs/filter'}",
@@ -221,6 +227,8 @@ class TestCreateOrionAPI:
 
         logs_filter = MagicMock()
         router.post("/filter")(logs_filter)
+        router.post("/paginate")(MagicMock())
+        router.get("/stream")(MagicMock())
 
         app = create_orion_api(router_overrides={"/logs": router})
         client = testclient.TestClient(app)
@@ -248,6 +256,9 @@ class TestCreateOrionAPI:
         def foobar():
             return logs_get()
 
+        router.post("/paginate")(MagicMock())
+        router.get("/stream")(MagicMock())
+
         app = create_orion_api(router_overrides={"/logs": router})
 
         client = testclient.TestClient(app)
@@ -255,6 +266,108 @@ class TestCreateOrionAPI:
         logs_get.assert_called_once()
 
 
+class TestWireFormatMiddleware:
+    @pytest.fixture(autouse=True)
+    def require_wire_formats(self):
+        pytest.importorskip("msgpack")
+        pytest.importorskip("zstandard")
+
+    @pytest.fixture
+    async def flows(self, client):
+        for i in range(20):
+            await client.post("/flows/", json={"name": f"my-flow-{i}"})
+
+    async def test_responds_with_json_by_default(self, client, flows):
+        response = await client.post("/flows/filter")
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers.get("content-encoding") != wire.ZSTD_ENCODING
+        assert len(response.json()) == 20
+
+    async def test_responds_with_msgpack_when_accepted(self, client, flows):
+        response = await client.post(
+            "/flows/filter",
+            headers={"Accept": "application/msgpack, application/json;q=0.9"},
+        )
+        assert response.headers["content-type"] == wire.MSGPACK_MEDIA_TYPE
+        flows = wire.msgpack_loads(response.content)
+        assert {flow["name"] for flow in flows} == {f"my-flow-{i}" for i in range(20)}
+
+    async def test_flow_runs_respond_with_msgpack_when_accepted(self, client, flow_run):
+        response = await client.post(
+            "/flow_runs/filter", headers={"Accept": "application/msgpack"}
+        )
+        assert response.headers["content-type"] == wire.MSGPACK_MEDIA_TYPE
+        assert wire.msgpack_loads(response.content)[0]["id"] == str(flow_run.id)
+
+    async def test_compresses_responses_with_zstd_when_accepted(self, client, flows):
+        response = await client.post(
+            "/flows/filter", headers={"Accept-Encoding": "zstd, gzip"}
+        )
+        assert response.headers["content-encoding"] == wire.ZSTD_ENCODING
+        flows = orjson.loads(wire.zstd_decompress(response.content))
+        assert len(flows) == 20
+
+    async def test_does_not_compress_small_responses(self, client):
+        response = await client.get("/health", headers={"Accept-Encoding": "zstd"})
+        assert "content-encoding" not in response.headers
+        assert response.json() is True
+
+    @pytest.mark.parametrize("use_zstd", [True, False])
+    @pytest.mark.parametrize("use_msgpack", [True, False])
+    async def test_decodes_request_bodies(self, client, use_msgpack, use_zstd):
+        body, headers = wire.encode_body(
+            {"name": "my-flow", "tags": ["a" * 1000]},
+            use_msgpack=use_msgpack,
+            use_zstd=use_zstd,
+        )
+        response = await client.post("/flows/", content=body, headers=headers)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["tags"] == ["a" * 1000]
+
+    async def test_advertises_zstd_request_bodies(self, client):
+        response = await client.get("/health")
+        assert response.headers["accept-encoding"] == wire.ZSTD_ENCODING
+
+    @pytest.mark.parametrize(
+        "unavailable,headers",
+        [
+            ("msgpack_available", {"Content-Type": "application/msgpack"}),
+            ("zstd_available", {"Content-Encoding": "zstd"}),
+        ],
+    )
+    async def test_rejects_unsupported_request_bodies(
+        self, client, monkeypatch, unavailable, headers
+    ):
+        monkeypatch.setattr(wire, unavailable, lambda: False)
+        response = await client.post("/flows/", content=b"{}", headers=headers)
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    async def test_rejects_request_bodies_that_decompress_too_large(self, client):
+        body, headers = wire.encode_body({"name": "a" * 10_000}, use_zstd=True)
+        assert len(body) < 1000
+
+        with temporary_settings({PREFECT_API_MAX_DECODED_BODY_SIZE: 1000}):
+            response = await client.post("/flows/", content=body, headers=headers)
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    async def test_rejects_request_bodies_that_are_too_large(self, client):
+        body, headers = wire.encode_body({"name": "a" * 2000}, use_msgpack=True)
+
+        with temporary_settings({PREFECT_API_MAX_DECODED_BODY_SIZE: 1000}):
+            response = await client.post("/flows/", content=body, headers=headers)
+
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+
+    async def test_rejects_invalid_request_bodies(self, client):
+        response = await client.post(
+            "/flows/",
+            content=b"not msgpack",
+            headers={"Content-Type": "application/msgpack", "Content-Encoding": "zstd"},
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 class TestMemoizeBlockAutoRegistration:
     @pytest.fixture(autouse=True)
     def enable_memoization(self, tmp_path):
@@ -1,3 +1,4 @@
+import asyncio
 from uuid import uuid4
 
 import pendulum
@@ -5,8 +6,14 @@ import pytest
 from fastapi import status
 
 from prefect.server import models, schemas
+from prefect.server.orchestration import concurrency_slots
 from prefect.server.schemas import responses, states
 from prefect.server.schemas.responses import OrchestrationResult
+from prefect.settings import (
+    PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED,
+    PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT,
+    temporary_settings,
+)
 
 
 class TestCreateTaskRun:
@@ -123,6 +130,64 @@ class TestCreateTaskRun:
         )
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs(self, flow_run, client, session):
+        task_run_data = [
+            {
+                "flow_run_id": str(flow_run.id),
+                "task_key": "my-task-key",
+                "name": f"my-task-run-{i}",
+                "dynamic_key": str(i),
+            }
+            for i in range(3)
+        ]
+        response = await client.post("/task_runs/bulk", json=task_run_data)
+        assert response.status_code == status.HTTP_200_OK
+        assert [task_run["name"] for task_run in response.json()] == [
+            "my-task-run-0",
+            "my-task-run-1",
+            "my-task-run-2",
+        ]
+
+        for task_run_response in response.json():
+            task_run = await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run_response["id"]
+            )
+            assert task_run.flow_run_id == flow_run.id
+            assert task_run.state.type == states.StateType.PENDING
+
+    async def test_create_task_runs_gracefully_upserts(self, flow_run, client):
+        task_run_data = {
+            "flow_run_id": str(flow_run.id),
+            "task_key": "my-task-key",
+            "dynamic_key": "my-dynamic-key",
+        }
+        task_run_response = await client.post("/task_runs/", json=task_run_data)
+
+        response = await client.post(
+            "/task_runs/bulk",
+            json=[task_run_data, {**task_run_data, "dynamic_key": "other-key"}],
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0]["id"] == task_run_response.json()["id"]
+        assert response.json()[1]["id"] != task_run_response.json()["id"]
+
+    async def test_create_task_runs_with_state(self, flow_run, client, session):
+        task_run_data = schemas.actions.TaskRunCreate(
+            flow_run_id=flow_run.id,
+            task_key="task-key",
+            state=schemas.actions.StateCreate(type=schemas.states.StateType.RUNNING),
+            dynamic_key="0",
+        )
+        response = await client.post(
+            "/task_runs/bulk", json=[task_run_data.dict(json_compatible=True)]
+        )
+        task_run = await models.task_runs.read_task_run(
+            session=session, task_run_id=response.json()[0]["id"]
+        )
+        assert task_run.state.type == task_run_data.state.type
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, flow_run, task_run, client):
         # make sure we we can read the task run correctly
@@ -465,6 +530,216 @@ class TestSetTaskRunState:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestSetTaskRunStateWithConcurrencySlotLeases:
+    @pytest.fixture(autouse=True)
+    def enable_slot_leases(self, monkeypatch):
+        monkeypatch.setattr(concurrency_slots, "_concurrency_slot_manager", None)
+        with temporary_settings(
+            {
+                PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED: True,
+                PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT: 10,
+            }
+        ):
+            yield
+
+    @pytest.fixture
+    async def limited_task_runs(self, flow_run, client, session):
+        await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        await client.post(
+            "/concurrency_limits/", json=dict(tag="limited", concurrency_limit=1)
+        )
+        task_runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-key",
+                    dynamic_key=str(i),
+                    tags=["limited"],
+                    state=schemas.states.Pending(),
+                ),
+            )
+            for i in range(2)
+        ]
+        await session.commit()
+        return task_runs
+
+    async def test_running_transition_waits_for_released_slot(
+        self, limited_task_runs, client
+    ):
+        first, second = limited_task_runs
+
+        response = await client.post(
+            f"/task_runs/{first.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        assert response.json()["status"] == "ACCEPT"
+
+        waiting_request = asyncio.ensure_future(
+            client.post(
+                f"/task_runs/{second.id}/set_state",
+                json=dict(state=dict(type="RUNNING")),
+            )
+        )
+        await asyncio.sleep(0.5)
+        assert not waiting_request.done()
+
+        start = pendulum.now("UTC")
+        response = await client.post(
+            f"/task_runs/{first.id}/set_state",
+            json=dict(state=dict(type="COMPLETED")),
+        )
+        assert response.json()["status"] == "ACCEPT"
+
+        response = await asyncio.wait_for(waiting_request, 10)
+        assert response.json()["status"] == "ACCEPT"
+        assert (pendulum.now("UTC") - start).in_seconds() < 5
+
+    async def test_running_transition_waits_until_timeout(
+        self, limited_task_runs, client
+    ):
+        first, second = limited_task_runs
+
+        await client.post(
+            f"/task_runs/{first.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+
+        with temporary_settings({PREFECT_API_TASK_CONCURRENCY_SLOT_WAIT_TIMEOUT: 0.1}):
+            response = await client.post(
+                f"/task_runs/{second.id}/set_state",
+                json=dict(state=dict(type="RUNNING")),
+            )
+
+        api_response = OrchestrationResult.parse_obj(response.json())
+        assert api_response.status == responses.SetStateStatus.WAIT
+        assert api_response.details.delay_seconds == 1
+
+    async def test_concurrency_limit_reports_leased_slots(
+        self, limited_task_runs, client
+    ):
+        first, _ = limited_task_runs
+
+        await client.post(
+            f"/task_runs/{first.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+
+        response = await client.get("/concurrency_limits/tag/limited")
+        assert response.json()["active_slots"] == [str(first.id)]
+
+        await client.post("/concurrency_limits/tag/limited/reset")
+        response = await client.get("/concurrency_limits/tag/limited")
+        assert response.json()["active_slots"] == []
+
+
+class TestSetTaskRunStates:
+    async def test_set_task_run_states(self, flow_run, client, session):
+        await client.post(
+            f"/flow_runs/{flow_run.id}/set_state",
+            json=dict(state=dict(type="RUNNING")),
+        )
+        task_runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                ),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/set_states",
+            json=[
+                dict(task_run_id=str(task_run.id), state=dict(type=state_type))
+                for task_run, state_type in zip(
+                    task_runs, ["RUNNING", "PENDING", "RUNNING"]
+                )
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        results = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert [result.status for result in results] == [
+            responses.SetStateStatus.ACCEPT
+        ] * 3
+        assert [result.state.type for result in results] == [
+            states.StateType.RUNNING,
+            states.StateType.PENDING,
+            states.StateType.RUNNING,
+        ]
+
+        for task_run, result in zip(task_runs, results):
+            response = await client.get(f"/task_runs/{task_run.id}")
+            assert response.json()["state"]["id"] == str(result.state.id)
+
+    async def test_set_task_run_states_applies_orchestration_rules(
+        self, task_run, client, session
+    ):
+        task_run.empirical_policy = task_run.empirical_policy.copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=states.Running()
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/set_states",
+            json=[dict(task_run_id=str(task_run.id), state=dict(type="FAILED"))],
+        )
+        (result,) = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert result.status == responses.SetStateStatus.REJECT
+        assert result.state.name == "AwaitingRetry"
+
+    async def test_set_task_run_states_force_skips_orchestration(
+        self, task_run, client, session
+    ):
+        task_run.empirical_policy = task_run.empirical_policy.copy()
+        task_run.empirical_policy.retries = 1
+        await session.flush()
+
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=states.Running()
+        )
+        await session.commit()
+
+        response = await client.post(
+            "/task_runs/set_states",
+            json=[
+                dict(
+                    task_run_id=str(task_run.id),
+                    state=dict(type="FAILED"),
+                    force=True,
+                )
+            ],
+        )
+        (result,) = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert result.status == responses.SetStateStatus.ACCEPT
+        assert result.state.type == states.StateType.FAILED
+
+    async def test_set_task_run_states_aborts_missing_task_runs(self, task_run, client):
+        response = await client.post(
+            "/task_runs/set_states",
+            json=[
+                dict(task_run_id=str(uuid4()), state=dict(type="PENDING")),
+                dict(task_run_id=str(task_run.id), state=dict(type="PENDING")),
+            ],
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        missing, found = [OrchestrationResult.parse_obj(r) for r in response.json()]
+        assert missing.status == responses.SetStateStatus.ABORT
+        assert "not found" in missing.details.reason
+        assert found.status == responses.SetStateStatus.ACCEPT
+
+
 class TestTaskRunHistory:
     async def test_history_interval_must_be_one_second_or_larger(self, client):
         response = await client.post(
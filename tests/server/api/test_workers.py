@@ -1,4 +1,7 @@
+import asyncio
+import time
 from typing import List
+from uuid import uuid4
 
 import pendulum
 import pydantic
@@ -892,3 +895,112 @@ class TestGetScheduledRuns:
         for work_queue in work_queues:
             assert work_queue.last_polled is not None
             assert work_queue.last_polled > now
+
+
+class TestGetScheduledRunsLongPoll:
+    @pytest.fixture
+    async def work_queue(self, session):
+        work_pool = await models.workers.create_work_pool(
+            session=session,
+            work_pool=schemas.actions.WorkPoolCreate(name="long-poll"),
+        )
+        work_queue = await models.workers.create_work_queue(
+            session=session,
+            work_pool_id=work_pool.id,
+            work_queue=schemas.actions.WorkQueueCreate(name="wq"),
+        )
+        await session.commit()
+        return work_queue
+
+    async def schedule_run(self, db, flow, work_queue):
+        async with db.session_context(begin_transaction=True) as session:
+            return await models.flow_runs.create_flow_run(
+                session=session,
+                flow_run=schemas.core.FlowRun(
+                    flow_id=flow.id,
+                    state=prefect.states.Scheduled(),
+                    work_queue_id=work_queue.id,
+                ),
+            )
+
+    async def test_wait_times_out_without_runs(self, client, work_queue):
+        start = time.monotonic()
+        response = await client.post(
+            "/work_pools/long-poll/get_scheduled_flow_runs",
+            json=dict(wait_seconds=0.5),
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        assert time.monotonic() - start >= 0.5
+
+    async def test_returns_runs_without_waiting(self, client, db, flow, work_queue):
+        flow_run = await self.schedule_run(db, flow, work_queue)
+
+        start = time.monotonic()
+        response = await client.post(
+            "/work_pools/long-poll/get_scheduled_flow_runs",
+            json=dict(wait_seconds=10),
+        )
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - start < 5
+
+    @pytest.mark.parametrize("work_queue_names", [None, ["wq"]])
+    async def test_wakes_up_when_run_is_scheduled(
+        self, client, db, flow, work_queue, work_queue_names
+    ):
+        body = dict(wait_seconds=10)
+        if work_queue_names:
+            body["work_queue_names"] = work_queue_names
+
+        start = time.monotonic()
+        request = asyncio.create_task(
+            client.post("/work_pools/long-poll/get_scheduled_flow_runs", json=body)
+        )
+        await asyncio.sleep(0.2)
+        flow_run = await self.schedule_run(db, flow, work_queue)
+
+        response = await request
+        assert [r["flow_run"]["id"] for r in response.json()] == [str(flow_run.id)]
+        assert time.monotonic() - start < 5
+
+    async def test_wakes_up_when_scheduler_inserts_runs(
+        self, client, db, flow, work_queue
+    ):
+        request = asyncio.create_task(
+            client.post(
+                "/work_pools/long-poll/get_scheduled_flow_runs",
+                json=dict(wait_seconds=10),
+            )
+        )
+        await asyncio.sleep(0.2)
+
+        start = time.monotonic()
+        async with db.session_context(begin_transaction=True) as session:
+            await models.deployments._insert_scheduled_flow_runs(
+                session=session,
+                runs=[
+                    {
+                        "id": uuid4(),
+                        "flow_id": flow.id,
+                        "work_queue_name": "wq",
+                        "work_queue_id": work_queue.id,
+                        "idempotency_key": "scheduled",
+                        "state": schemas.states.Scheduled().dict(),
+                        "state_type": schemas.states.StateType.SCHEDULED,
+                        "state_name": "Scheduled",
+                        "next_scheduled_start_time": pendulum.now("UTC"),
+                        "expected_start_time": pendulum.now("UTC"),
+                    }
+                ],
+            )
+
+        response = await request
+        assert len(response.json()) == 1
+        assert time.monotonic() - start < 5
+
+    async def test_wait_seconds_is_limited(self, client, work_queue):
+        response = await client.post(
+            "/work_pools/long-poll/get_scheduled_flow_runs",
+            json=dict(wait_seconds=3600),
+        )
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
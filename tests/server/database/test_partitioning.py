@@ -0,0 +1,244 @@
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server.database import partitioning
+from prefect.server.utilities.database import UUID, Timestamp
+
+
+@pytest.fixture
+def requires_postgres(session):
+    if not partitioning.is_postgres(session):
+        pytest.skip("Partitioning is only supported on PostgreSQL")
+
+
+@pytest.fixture
+async def scratch_table(session):
+    """
+    A table shaped like the log table, created outside of the Prefect metadata so that
+    partitioning it does not change the tables used by other tests.
+    """
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "partitioning_scratch",
+        metadata,
+        sa.Column("id", UUID(), primary_key=True, default=uuid4),
+        sa.Column("message", sa.String, nullable=False),
+        sa.Column("timestamp", Timestamp(), nullable=False),
+        sa.Index("ix_partitioning_scratch__timestamp", "timestamp"),
+    )
+
+    connection = await session.connection()
+    await connection.run_sync(metadata.create_all)
+    await session.commit()
+    try:
+        yield table
+    finally:
+        await session.rollback()
+        connection = await session.connection()
+        await connection.run_sync(metadata.drop_all)
+        await session.commit()
+
+
+class TestPartitionIntervals:
+    @pytest.mark.parametrize(
+        "interval,start,end",
+        [
+            ("day", "2023-01-04T00:00:00+00:00", "2023-01-05T00:00:00+00:00"),
+            ("week", "2023-01-02T00:00:00+00:00", "2023-01-09T00:00:00+00:00"),
+            ("month", "2023-01-01T00:00:00+00:00", "2023-02-01T00:00:00+00:00"),
+        ],
+    )
+    def test_partition_bounds(self, interval, start, end):
+        dt = pendulum.datetime(2023, 1, 4, 15, 30, tz="America/New_York")
+
+        assert partitioning.partition_start(dt, interval) == pendulum.parse(start)
+        assert partitioning.partition_end(
+            pendulum.parse(start), interval
+        ) == pendulum.parse(end)
+
+    def test_upcoming_partitions_end(self):
+        now = pendulum.datetime(2023, 1, 4, 12)
+        assert partitioning.upcoming_partitions_end(now, "day", 2) == pendulum.datetime(
+            2023, 1, 7
+        )
+
+    def test_partition_name(self):
+        assert (
+            partitioning.partition_name("log", pendulum.datetime(2023, 1, 2))
+            == "log_p20230102"
+        )
+
+    def test_parses_postgres_bounds(self):
+        assert partitioning._parse_bound("2023-01-02 00:00:00+00") == pendulum.datetime(
+            2023, 1, 2
+        )
+
+
+class TestUnpartitionedDatabases:
+    async def test_sqlite_tables_are_not_partitioned(self, session):
+        if partitioning.is_postgres(session):
+            pytest.skip("Only applies to SQLite")
+
+        assert await partitioning.read_partitioned_tables(session) == set()
+        assert await partitioning.read_partitions(session, "log") == []
+
+    async def test_sqlite_tables_cannot_be_partitioned(self, session, db):
+        if partitioning.is_postgres(session):
+            pytest.skip("Only applies to SQLite")
+
+        with pytest.raises(ValueError, match="Only PostgreSQL"):
+            await partitioning.partition_table(
+                session=session,
+                table=db.Log.__table__,
+                interval="week",
+                until=pendulum.now("UTC"),
+            )
+
+    async def test_unique_indexes_must_include_partition_key(self, session):
+        metadata = sa.MetaData()
+        table = sa.Table(
+            "partitioning_unique",
+            metadata,
+            sa.Column("id", UUID(), primary_key=True),
+            sa.Column("name", sa.String),
+            sa.Column("timestamp", Timestamp()),
+            sa.Index("uq_partitioning_unique__name", "name", unique=True),
+        )
+        if not partitioning.is_postgres(session):
+            pytest.skip("Partitioning is only supported on PostgreSQL")
+
+        with pytest.raises(ValueError, match="does not include the partition key"):
+            await partitioning.partition_table(
+                session=session,
+                table=table,
+                interval="week",
+                until=pendulum.now("UTC"),
+            )
+
+
+@pytest.mark.usefixtures("requires_postgres")
+class TestPartitionedTables:
+    async def test_partitioning_a_table_keeps_its_rows(self, session, scratch_table):
+        now = pendulum.now("UTC")
+        timestamps = [now.subtract(days=20), now.subtract(days=3), now]
+        await session.execute(
+            sa.insert(scratch_table),
+            [
+                {"id": uuid4(), "message": "hello", "timestamp": timestamp}
+                for timestamp in timestamps
+            ],
+        )
+        await session.commit()
+
+        until = partitioning.upcoming_partitions_end(now, "week", 1)
+        assert await partitioning.partition_table(
+            session=session, table=scratch_table, interval="week", until=until
+        )
+        await session.commit()
+
+        partitions = await partitioning.read_partitions(session, scratch_table.name)
+        assert partitions[0].lower == partitioning.partition_start(
+            timestamps[0], "week"
+        )
+        assert partitions[-1].upper == until
+        for earlier, later in zip(partitions, partitions[1:]):
+            assert earlier.upper == later.lower
+
+        result = await session.execute(
+            sa.select(scratch_table.c.timestamp).order_by(scratch_table.c.timestamp)
+        )
+        assert result.scalars().all() == timestamps
+
+        # partitioning a partitioned table does nothing
+        assert not await partitioning.partition_table(
+            session=session, table=scratch_table, interval="week", until=until
+        )
+
+    async def test_create_and_drop_partitions(self, session, scratch_table):
+        now = pendulum.now("UTC")
+        await partitioning.partition_table(
+            session=session,
+            table=scratch_table,
+            interval="day",
+            until=partitioning.partition_end(
+                partitioning.partition_start(now, "day"), "day"
+            ),
+        )
+        await session.commit()
+
+        created = await partitioning.create_partitions(
+            session=session,
+            table=scratch_table.name,
+            until=now.add(days=3),
+            interval="day",
+        )
+        assert len(created) == 3
+
+        await session.execute(
+            sa.insert(scratch_table),
+            [
+                {"id": uuid4(), "message": "old", "timestamp": now.subtract(days=1)},
+                {"id": uuid4(), "message": "new", "timestamp": now.add(days=1)},
+            ],
+        )
+
+        # the partition holding today's rows is not dropped
+        dropped = await partitioning.drop_partitions(
+            session=session, table=scratch_table.name, older_than=now
+        )
+        assert dropped == []
+
+        dropped = await partitioning.drop_partitions(
+            session=session,
+            table=scratch_table.name,
+            older_than=partitioning.partition_end(
+                partitioning.partition_start(now, "day"), "day"
+            ),
+        )
+        assert len(dropped) == 1
+        await session.commit()
+
+        # rows older than the partitions are kept in the default partition
+        result = await session.execute(sa.select(scratch_table.c.message))
+        assert sorted(result.scalars().all()) == ["new", "old"]
+
+    async def test_create_partitions_moves_rows_out_of_the_default_partition(
+        self, session, scratch_table
+    ):
+        now = pendulum.now("UTC")
+        await partitioning.partition_table(
+            session=session,
+            table=scratch_table,
+            interval="day",
+            until=partitioning.partition_end(
+                partitioning.partition_start(now, "day"), "day"
+            ),
+        )
+        await session.commit()
+
+        # a row written before its partition exists lands in the default partition
+        await session.execute(
+            sa.insert(scratch_table),
+            [{"id": uuid4(), "message": "early", "timestamp": now.add(days=1)}],
+        )
+        await session.commit()
+
+        created = await partitioning.create_partitions(
+            session=session,
+            table=scratch_table.name,
+            until=now.add(days=2),
+            interval="day",
+        )
+        await session.commit()
+        assert len(created) == 2
+
+        default = partitioning.default_partition_name(scratch_table.name)
+        result = await session.execute(sa.text(f"SELECT count(*) FROM {default}"))
+        assert result.scalar() == 0
+        result = await session.execute(
+            sa.text(f"SELECT message FROM {created[0].name}")
+        )
+        assert result.scalars().all() == ["early"]
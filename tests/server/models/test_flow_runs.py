@@ -1,3 +1,4 @@
+import datetime
 from uuid import uuid4
 
 import pendulum
@@ -1204,6 +1205,96 @@ class TestReadFlowRunTaskRunDependencies:
         assert d2["upstream_dependencies"][0].id == d1["id"]
         assert d3["upstream_dependencies"][0].id == d2["id"]
 
+    async def test_read_task_run_dependency_updates(self, flow_run, session):
+        task_runs = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key=f"key-{i}",
+                    dynamic_key="0",
+                    state=schemas.states.Pending(),
+                ),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+
+        update = await models.flow_runs.read_task_run_dependency_updates(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert {node.id for node in update.nodes} == {tr.id for tr in task_runs}
+        assert update.cursor == max(tr.updated for tr in task_runs)
+
+        update = await models.flow_runs.read_task_run_dependency_updates(
+            session=session,
+            flow_run_id=flow_run.id,
+            since=update.cursor
+            + models.flow_runs.DEPENDENCY_UPDATES_OVERLAP
+            + datetime.timedelta(seconds=1),
+        )
+        assert update.nodes == []
+
+    async def test_read_task_run_dependency_updates_includes_late_commits(
+        self, flow_run, session, db
+    ):
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="key",
+                dynamic_key="0",
+                state=schemas.states.Pending(),
+            ),
+        )
+        await session.commit()
+        update = await models.flow_runs.read_task_run_dependency_updates(
+            session=session, flow_run_id=flow_run.id
+        )
+
+        # a task run stamped before the cursor but committed after it was read
+        late_task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="late",
+                dynamic_key="0",
+                state=schemas.states.Pending(),
+            ),
+        )
+        await session.execute(
+            sa.update(db.TaskRun)
+            .where(db.TaskRun.id == late_task_run.id)
+            .values(updated=update.cursor.subtract(seconds=5))
+        )
+        await session.commit()
+
+        update = await models.flow_runs.read_task_run_dependency_updates(
+            session=session, flow_run_id=flow_run.id, since=update.cursor
+        )
+        assert {node.id for node in update.nodes} == {task_run.id, late_task_run.id}
+
+    async def test_read_task_run_dependencies_estimates_run_time_of_running_tasks(
+        self, flow_run, session
+    ):
+        task_run = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="key",
+                dynamic_key="0",
+                state=schemas.states.Running(
+                    timestamp=pendulum.now("UTC").subtract(seconds=5)
+                ),
+            ),
+        )
+
+        dependencies = await models.flow_runs.read_task_run_dependencies(
+            session=session, flow_run_id=flow_run.id
+        )
+        assert dependencies[0]["id"] == task_run.id
+        assert dependencies[0]["estimated_run_time"] >= datetime.timedelta(seconds=5)
+
     async def test_read_task_run_dependencies_throws_error_if_does_not_exist(
         self, session
     ):
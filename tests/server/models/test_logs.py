@@ -1,8 +1,10 @@
+import asyncio
 from datetime import timedelta
 from uuid import uuid4
 
 import pendulum
 import pytest
+import sqlalchemy as sa
 from sqlalchemy import select
 
 from prefect.server import models
@@ -10,6 +12,7 @@ from prefect.server.schemas.actions import LogCreate
 from prefect.server.schemas.core import Log
 from prefect.server.schemas.filters import LogFilter
 from prefect.server.schemas.sorting import LogSort
+from prefect.server.utilities.log_notifications import get_log_notifier
 
 NOW = pendulum.now("UTC")
 
@@ -74,6 +77,63 @@ class TestCreateLogs:
                 == log_data[i]
             )
 
+    async def test_create_logs_notifies_on_commit(self, session, flow_run_id, log_data):
+        waiter = asyncio.create_task(get_log_notifier().wait([flow_run_id], timeout=5))
+        await models.logs.create_logs(session=session, logs=log_data)
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        await session.commit()
+        assert await waiter
+
+
+class TestBulkCreateLogs:
+    async def test_bulk_create_logs_succeeds(self, session, log_data, db):
+        await models.logs.bulk_create_logs(session=session, logs=log_data)
+
+        query = select(db.Log).order_by(db.Log.timestamp.asc())
+        result = await session.execute(query)
+        read_logs = result.scalars().unique().all()
+
+        assert len(read_logs) == len(log_data)
+        for i, log in enumerate(read_logs):
+            assert (
+                Log.from_orm(log).dict(exclude={"created", "id", "updated"})
+                == log_data[i]
+            )
+
+    async def test_bulk_create_logs_notifies_on_commit(
+        self, session, flow_run_id, log_data
+    ):
+        waiter = asyncio.create_task(get_log_notifier().wait([flow_run_id], timeout=5))
+        await models.logs.bulk_create_logs(session=session, logs=log_data)
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        await session.commit()
+        assert await waiter
+
+    async def test_bulk_create_logs_exceeds_query_parameter_limit(
+        self, session, flow_run_id, db
+    ):
+        count = models.logs.LOG_BATCH_SIZE + 1
+        await models.logs.bulk_create_logs(
+            session=session,
+            logs=[
+                LogCreate(
+                    name="prefect.flow_run",
+                    level=20,
+                    message=f"Log {i}",
+                    timestamp=NOW,
+                    flow_run_id=flow_run_id,
+                )
+                for i in range(count)
+            ],
+        )
+
+        result = await session.execute(select(sa.func.count(db.Log.id)))
+        assert result.scalar() == count
+
 
 class TestReadLogs:
     async def test_read_logs_timestamp_after_inclusive(self, session, logs, log_data):
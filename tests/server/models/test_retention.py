@@ -0,0 +1,423 @@
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.schemas.states import StateType
+
+TERMINAL_STATE_TYPES = [
+    StateType.COMPLETED,
+    StateType.CANCELLED,
+    StateType.FAILED,
+    StateType.CRASHED,
+]
+
+
+@pytest.fixture
+def later():
+    # everything created by the tests is older than this
+    return pendulum.now("UTC").add(minutes=1)
+
+
+async def create_flow_run(session, flow, states, deployment_id=None):
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(flow_id=flow.id, deployment_id=deployment_id),
+    )
+    for state in states:
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=state, force=True
+        )
+    return flow_run
+
+
+async def create_task_run(session, flow_run, states, dynamic_key="0"):
+    task_run = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_run.id, task_key="task", dynamic_key=dynamic_key
+        ),
+    )
+    for state in states:
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=state, force=True
+        )
+    return task_run
+
+
+@pytest.fixture
+async def completed_flow_run(session, flow):
+    flow_run = await create_flow_run(
+        session,
+        flow,
+        [
+            schemas.states.Pending(),
+            schemas.states.Running(),
+            schemas.states.Completed(),
+        ],
+    )
+    await session.commit()
+    return flow_run
+
+
+@pytest.fixture
+async def running_flow_run(session, flow):
+    flow_run = await create_flow_run(
+        session, flow, [schemas.states.Pending(), schemas.states.Running()]
+    )
+    await session.commit()
+    return flow_run
+
+
+async def read_state_ids(session, db, state_model, run_id_column, run_id):
+    result = await session.execute(
+        sa.select(state_model.id).where(run_id_column == run_id)
+    )
+    return set(result.scalars().all())
+
+
+class TestPruneFlowRunStates:
+    async def test_prunes_all_but_current_state(
+        self, session, db, completed_flow_run, running_flow_run, later
+    ):
+        pruned = await models.retention.prune_flow_run_states(
+            session=session, older_than=later, state_types=TERMINAL_STATE_TYPES
+        )
+
+        assert pruned == 2
+        assert await read_state_ids(
+            session,
+            db,
+            db.FlowRunState,
+            db.FlowRunState.flow_run_id,
+            completed_flow_run.id,
+        ) == {completed_flow_run.state_id}
+
+        # the states of runs in other state types are kept
+        assert (
+            len(
+                await read_state_ids(
+                    session,
+                    db,
+                    db.FlowRunState,
+                    db.FlowRunState.flow_run_id,
+                    running_flow_run.id,
+                )
+            )
+            == 2
+        )
+
+    async def test_keeps_newer_states(self, session, db, completed_flow_run):
+        pruned = await models.retention.prune_flow_run_states(
+            session=session,
+            older_than=pendulum.now("UTC").subtract(days=1),
+            state_types=TERMINAL_STATE_TYPES,
+        )
+        assert pruned == 0
+
+    async def test_prunes_states_of_deployments(
+        self, session, db, flow, deployment, completed_flow_run, later
+    ):
+        deployment_flow_run = await create_flow_run(
+            session,
+            flow,
+            [schemas.states.Running(), schemas.states.Completed()],
+            deployment_id=deployment.id,
+        )
+        await session.commit()
+
+        pruned = await models.retention.prune_flow_run_states(
+            session=session,
+            older_than=later,
+            state_types=TERMINAL_STATE_TYPES,
+            deployment_ids=[deployment.id],
+        )
+
+        assert pruned == 1
+        assert await read_state_ids(
+            session,
+            db,
+            db.FlowRunState,
+            db.FlowRunState.flow_run_id,
+            deployment_flow_run.id,
+        ) == {deployment_flow_run.state_id}
+        assert (
+            len(
+                await read_state_ids(
+                    session,
+                    db,
+                    db.FlowRunState,
+                    db.FlowRunState.flow_run_id,
+                    completed_flow_run.id,
+                )
+            )
+            == 3
+        )
+
+    async def test_prunes_in_batches_and_archives_rows(
+        self, session, completed_flow_run, later
+    ):
+        archived = []
+
+        async def archive(table, rows):
+            assert table == "flow_run_state"
+            archived.extend(rows)
+
+        pruned = await models.retention.prune_flow_run_states(
+            session=session,
+            older_than=later,
+            state_types=TERMINAL_STATE_TYPES,
+            limit=1,
+            archive=archive,
+        )
+
+        assert pruned == 1
+        assert len(archived) == 1
+        assert archived[0]["flow_run_id"] == completed_flow_run.id
+        assert archived[0]["type"] in (StateType.PENDING, StateType.RUNNING)
+
+
+class TestPruneTaskRunStates:
+    async def test_prunes_all_but_current_state(
+        self, session, db, completed_flow_run, running_flow_run, later
+    ):
+        task_runs = []
+        for flow_run in [completed_flow_run, running_flow_run]:
+            task_runs.append(
+                await create_task_run(
+                    session,
+                    flow_run,
+                    [
+                        schemas.states.Pending(),
+                        schemas.states.Running(),
+                        schemas.states.Completed(),
+                    ],
+                )
+            )
+        task_run, running_task_run = task_runs
+        await session.commit()
+
+        pruned = await models.retention.prune_task_run_states(
+            session=session, older_than=later, state_types=TERMINAL_STATE_TYPES
+        )
+
+        assert pruned == 2
+        assert await read_state_ids(
+            session, db, db.TaskRunState, db.TaskRunState.task_run_id, task_run.id
+        ) == {task_run.state_id}
+
+        # task runs of flow runs in other state types are kept
+        assert (
+            len(
+                await read_state_ids(
+                    session,
+                    db,
+                    db.TaskRunState,
+                    db.TaskRunState.task_run_id,
+                    running_task_run.id,
+                )
+            )
+            == 3
+        )
+
+
+class TestPruneFlowRuns:
+    async def test_prunes_flow_runs_with_their_task_runs(
+        self, session, db, completed_flow_run, running_flow_run, later
+    ):
+        task_run = await create_task_run(
+            session, completed_flow_run, [schemas.states.Completed()]
+        )
+        await session.commit()
+
+        pruned = await models.retention.prune_flow_runs(
+            session=session, older_than=later, state_types=TERMINAL_STATE_TYPES
+        )
+        await session.commit()
+        session.expunge_all()
+
+        # the flow run, its 3 states, and its task run and the task run's state
+        assert pruned == 6
+        assert (
+            await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=completed_flow_run.id
+            )
+            is None
+        )
+        assert (
+            await models.task_runs.read_task_run(
+                session=session, task_run_id=task_run.id
+            )
+            is None
+        )
+        assert (
+            await models.flow_runs.read_flow_run(
+                session=session, flow_run_id=running_flow_run.id
+            )
+            is not None
+        )
+
+    async def test_prunes_task_runs_and_states_in_batches_and_archives_them(
+        self, session, db, completed_flow_run, later
+    ):
+        task_runs = [
+            await create_task_run(
+                session,
+                completed_flow_run,
+                [schemas.states.Running(), schemas.states.Completed()],
+                dynamic_key=str(i),
+            )
+            for i in range(3)
+        ]
+        await session.commit()
+
+        archived = {}
+        batch_sizes = []
+
+        async def archive(table, rows):
+            archived.setdefault(table, []).extend(rows)
+            batch_sizes.append(len(rows))
+
+        # each call prunes at most two rows, so the flow run is pruned once its
+        # 3 task runs, their 6 states, and its own 3 states are
+        calls = 0
+        while True:
+            pruned = await models.retention.prune_flow_runs(
+                session=session,
+                older_than=later,
+                state_types=TERMINAL_STATE_TYPES,
+                limit=2,
+                archive=archive,
+            )
+            await session.commit()
+            calls += 1
+            assert pruned <= 2
+            if pruned < 2:
+                break
+
+        assert calls == 7
+        assert max(batch_sizes) <= 2
+        assert {row["id"] for row in archived["task_run"]} == {
+            task_run.id for task_run in task_runs
+        }
+        assert len(archived["task_run_state"]) == 6
+        assert len(archived["flow_run_state"]) == 3
+        assert [row["id"] for row in archived["flow_run"]] == [completed_flow_run.id]
+
+        for model in [db.TaskRunState, db.TaskRun, db.FlowRunState, db.FlowRun]:
+            count = await session.execute(sa.select(sa.func.count(model.id)))
+            assert count.scalar() == 0
+
+
+class TestPruneLogs:
+    async def test_prunes_logs_of_prunable_and_missing_flow_runs(
+        self, session, db, completed_flow_run, running_flow_run, later
+    ):
+        flow_run_ids = [completed_flow_run.id, running_flow_run.id, uuid4()]
+        await models.logs.create_logs(
+            session=session,
+            logs=[
+                schemas.actions.LogCreate(
+                    name="prefect.flow_run",
+                    level=20,
+                    message="Ahoy, captain",
+                    timestamp=pendulum.now("UTC"),
+                    flow_run_id=flow_run_id,
+                )
+                for flow_run_id in flow_run_ids
+            ],
+        )
+        await session.commit()
+
+        pruned = await models.retention.prune_logs(
+            session=session, older_than=later, state_types=TERMINAL_STATE_TYPES
+        )
+
+        assert pruned == 2
+        remaining = (await session.execute(sa.select(db.Log.flow_run_id))).all()
+        assert remaining == [(running_flow_run.id,)]
+
+
+class TestPruneArtifacts:
+    async def test_keeps_latest_artifacts_and_results(
+        self, session, db, completed_flow_run, later
+    ):
+        artifacts = []
+        for key in ["report", "report", None, None]:
+            artifacts.append(
+                await models.artifacts.create_artifact(
+                    session=session,
+                    artifact=schemas.core.Artifact(
+                        key=key, data=1, flow_run_id=completed_flow_run.id
+                    ),
+                )
+            )
+        old_report, latest_report, result, unkeyed = artifacts
+
+        state = await session.get(db.FlowRunState, completed_flow_run.state_id)
+        state.result_artifact_id = result.id
+        await session.commit()
+
+        pruned = await models.retention.prune_artifacts(
+            session=session, older_than=later, state_types=TERMINAL_STATE_TYPES
+        )
+
+        assert pruned == 2
+        remaining = (await session.execute(sa.select(db.Artifact.id))).scalars().all()
+        assert set(remaining) == {latest_report.id, result.id}
+
+
+class TestPruneTaskRunStateCache:
+    async def test_prunes_expired_and_dangling_cached_states(
+        self, session, db, completed_flow_run
+    ):
+        task_run = await create_task_run(
+            session, completed_flow_run, [schemas.states.Completed()]
+        )
+        for cache_key, cache_expiration, task_run_state_id in [
+            ("valid", None, task_run.state_id),
+            ("expired", pendulum.now("UTC").subtract(days=1), task_run.state_id),
+            ("dangling", None, completed_flow_run.id),
+        ]:
+            session.add(
+                db.TaskRunStateCache(
+                    cache_key=cache_key,
+                    cache_expiration=cache_expiration,
+                    task_run_state_id=task_run_state_id,
+                )
+            )
+        await session.commit()
+
+        pruned = await models.retention.prune_task_run_state_cache(session=session)
+
+        assert pruned == 2
+        remaining = (
+            (await session.execute(sa.select(db.TaskRunStateCache.cache_key)))
+            .scalars()
+            .all()
+        )
+        assert remaining == ["valid"]
+
+    async def test_prunes_cached_states_by_age(
+        self, session, db, completed_flow_run, later
+    ):
+        task_run = await create_task_run(
+            session, completed_flow_run, [schemas.states.Completed()]
+        )
+        session.add(
+            db.TaskRunStateCache(
+                cache_key="valid",
+                cache_expiration=None,
+                task_run_state_id=task_run.state_id,
+            )
+        )
+        await session.commit()
+
+        assert await models.retention.prune_task_run_state_cache(session=session) == 0
+
+        pruned = await models.retention.prune_task_run_state_cache(
+            session=session, older_than=later
+        )
+        assert pruned == 1
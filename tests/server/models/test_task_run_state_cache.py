@@ -0,0 +1,233 @@
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.settings import PREFECT_API_TASK_CACHE_MEMORY_SIZE, temporary_settings
+
+
+@pytest.fixture
+async def completed_states(session, flow_run):
+    task_run = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_run.id, task_key="task", dynamic_key="0"
+        ),
+    )
+    states = []
+    for _ in range(2):
+        result = await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Completed(),
+            force=True,
+        )
+        states.append(result.state)
+    await session.commit()
+    return states
+
+
+async def read_cache_rows(session, db):
+    result = await session.execute(
+        sa.select(
+            db.TaskRunStateCache.cache_key, db.TaskRunStateCache.task_run_state_id
+        )
+    )
+    return result.all()
+
+
+class TestUpsertCachedState:
+    async def test_stores_one_row_per_cache_key(self, session, db, completed_states):
+        first, second = completed_states
+        for state in completed_states:
+            await models.task_run_state_cache.upsert_cached_state(
+                session=session, cache_key="key", task_run_state_id=state.id
+            )
+        await session.commit()
+
+        assert await read_cache_rows(session, db) == [("key", second.id)]
+
+    async def test_replaces_state_kept_in_memory(self, session, completed_states):
+        first, second = completed_states
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=first.id
+        )
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == first.id
+
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=second.id
+        )
+        await session.commit()
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == second.id
+
+    async def test_state_kept_in_memory_is_replaced_on_commit(
+        self, session, completed_states
+    ):
+        first, second = completed_states
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=first.id
+        )
+        await session.commit()
+        await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=second.id
+        )
+        await session.rollback()
+
+        # other sessions still see the first state until the new one is committed
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == first.id
+
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=second.id
+        )
+        await session.commit()
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == second.id
+
+    async def test_state_kept_in_memory_is_forgotten_when_its_run_is_deleted(
+        self, session, completed_states
+    ):
+        state = completed_states[0]
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=state.id
+        )
+        await session.commit()
+        await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+
+        await models.task_runs.delete_task_run(
+            session=session, task_run_id=state.state_details.task_run_id
+        )
+        await session.commit()
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+
+class TestReadCachedState:
+    async def test_reads_cached_state(self, session, completed_states):
+        state = completed_states[0]
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=state.id
+        )
+
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == state.id
+        assert cached.type == schemas.states.StateType.COMPLETED
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="other"
+            )
+            is None
+        )
+
+    async def test_ignores_expired_states(self, session, completed_states):
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session,
+            cache_key="key",
+            task_run_state_id=completed_states[0].id,
+            cache_expiration=pendulum.now("UTC").subtract(seconds=1),
+        )
+
+        assert (
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            is None
+        )
+
+    async def test_repeated_reads_are_served_from_memory(
+        self, session, db, completed_states
+    ):
+        state = completed_states[0]
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session, cache_key="key", task_run_state_id=state.id
+        )
+        await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+
+        # remove the cached state from the database behind the memory cache's back
+        await session.execute(sa.delete(db.TaskRunStateCache))
+
+        cached = await models.task_run_state_cache.read_cached_state(
+            session=session, cache_key="key"
+        )
+        assert cached.id == state.id
+
+    async def test_memory_cache_can_be_disabled(self, session, db, completed_states):
+        models.task_run_state_cache.clear_memory_cache()
+        with temporary_settings({PREFECT_API_TASK_CACHE_MEMORY_SIZE: 0}):
+            await models.task_run_state_cache.upsert_cached_state(
+                session=session,
+                cache_key="key",
+                task_run_state_id=completed_states[0].id,
+            )
+            await models.task_run_state_cache.read_cached_state(
+                session=session, cache_key="key"
+            )
+            await session.execute(sa.delete(db.TaskRunStateCache))
+
+            assert (
+                await models.task_run_state_cache.read_cached_state(
+                    session=session, cache_key="key"
+                )
+                is None
+            )
+        models.task_run_state_cache.clear_memory_cache()
+
+
+class TestDeleteExpiredCachedStates:
+    async def test_deletes_expired_cached_states(self, session, db, completed_states):
+        now = pendulum.now("UTC")
+        for cache_key, cache_expiration in [
+            ("unexpiring", None),
+            ("unexpired", now.add(days=1)),
+            ("expired", now.subtract(days=1)),
+            ("also-expired", now.subtract(seconds=1)),
+        ]:
+            await models.task_run_state_cache.upsert_cached_state(
+                session=session,
+                cache_key=cache_key,
+                task_run_state_id=completed_states[0].id,
+                cache_expiration=cache_expiration,
+            )
+
+        assert (
+            await models.task_run_state_cache.delete_expired_cached_states(
+                session=session, limit=1
+            )
+            == 1
+        )
+        assert (
+            await models.task_run_state_cache.delete_expired_cached_states(
+                session=session
+            )
+            == 1
+        )
+        assert sorted(key for key, _ in await read_cache_rows(session, db)) == [
+            "unexpired",
+            "unexpiring",
+        ]
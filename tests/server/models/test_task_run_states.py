@@ -17,7 +17,13 @@ from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
     BaseOrchestrationRule,
 )
-from prefect.server.schemas.states import Failed, Running, Scheduled, StateType
+from prefect.server.schemas.states import (
+    Failed,
+    Pending,
+    Running,
+    Scheduled,
+    StateType,
+)
 
 
 class TestCreateTaskRunState:
@@ -215,6 +221,33 @@ class TestCreateTaskRunState:
 
                 assert trs.status == schemas.responses.SetStateStatus.ABORT
 
+    async def test_transition_is_aborted_if_the_flow_run_is_missing(
+        self, task_run, session, monkeypatch
+    ):
+        await models.task_runs.set_task_run_state(
+            session=session, task_run_id=task_run.id, state=Pending(), force=True
+        )
+
+        async def missing_flow_run(self):
+            return None
+
+        monkeypatch.setattr(
+            "prefect.server.orchestration.rules.TaskOrchestrationContext.flow_run",
+            missing_flow_run,
+        )
+
+        result = await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=Running(),
+            task_policy=await provide_task_policy(),
+        )
+
+        assert result.status == schemas.responses.SetStateStatus.ABORT
+        assert "Unable to read flow run" in result.details.reason
+        await session.refresh(task_run)
+        assert task_run.state_type == StateType.PENDING
+
     async def test_object_not_found_if_id_not_found(self, session):
         with pytest.raises(ObjectNotFoundError):
             await models.task_runs.set_task_run_state(
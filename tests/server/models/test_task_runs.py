@@ -138,6 +138,145 @@ class TestCreateTaskRun:
         assert result.name == "My Scheduled State"
 
 
+class TestCreateTaskRuns:
+    async def test_create_task_runs_succeeds(self, flow_run, session):
+        task_runs = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                )
+                for i in range(3)
+            ],
+        )
+        assert [task_run.dynamic_key for task_run in task_runs] == ["0", "1", "2"]
+        assert all(task_run.flow_run_id == flow_run.id for task_run in task_runs)
+        assert all(task_run.state is None for task_run in task_runs)
+        assert len({task_run.id for task_run in task_runs}) == 3
+
+    async def test_create_task_runs_with_no_task_runs(self, session):
+        assert (
+            await models.task_runs.create_task_runs(session=session, task_runs=[]) == []
+        )
+
+    async def test_create_task_runs_returns_existing_task_runs(self, flow_run, session):
+        existing = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id, task_key="my-key", dynamic_key="1"
+            ),
+        )
+
+        task_runs = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key="my-key", dynamic_key=str(i)
+                )
+                for i in range(3)
+            ],
+        )
+        assert task_runs[1].id == existing.id
+        assert existing.id not in {task_runs[0].id, task_runs[2].id}
+
+    async def test_create_task_runs_matches_whole_keys(self, flow_run, session):
+        existing = [
+            await models.task_runs.create_task_run(
+                session=session,
+                task_run=schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key=task_key, dynamic_key=dynamic_key
+                ),
+            )
+            for task_key, dynamic_key in [("a", "0"), ("b", "1")]
+        ]
+
+        task_runs = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id, task_key=task_key, dynamic_key=dynamic_key
+                )
+                for task_key, dynamic_key in [("a", "1"), ("b", "0")]
+            ],
+        )
+        assert [(run.task_key, run.dynamic_key) for run in task_runs] == [
+            ("a", "1"),
+            ("b", "0"),
+        ]
+        assert not {run.id for run in task_runs} & {run.id for run in existing}
+
+    async def test_create_task_runs_with_state(self, flow_run, session, db):
+        task_runs = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-key",
+                    dynamic_key=str(i),
+                    state=Pending(),
+                )
+                for i in range(3)
+            ],
+        )
+        for task_run in task_runs:
+            assert task_run.state.type == "PENDING"
+            assert task_run.state_type == "PENDING"
+            assert task_run.state_name == "Pending"
+            assert task_run.expected_start_time == task_run.state.timestamp
+            assert task_run.state.state_details.task_run_id == task_run.id
+            assert task_run.state.state_details.flow_run_id == flow_run.id
+
+        query = await session.execute(
+            sa.select(sa.func.count(db.TaskRunState.id)).where(
+                db.TaskRunState.task_run_id.in_([task_run.id for task_run in task_runs])
+            )
+        )
+        assert query.scalar() == 3
+
+    async def test_create_task_runs_with_non_pending_state(self, flow_run, session):
+        (task_run,) = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-key",
+                    dynamic_key="0",
+                    state=Running(),
+                )
+            ],
+        )
+        assert task_run.state.type == "RUNNING"
+        assert task_run.run_count == 1
+        assert task_run.start_time == task_run.state.timestamp
+
+    async def test_create_task_runs_does_not_set_state_on_existing_task_runs(
+        self, flow_run, session
+    ):
+        existing = await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="my-key",
+                dynamic_key="0",
+                state=Scheduled(),
+            ),
+        )
+
+        (task_run,) = await models.task_runs.create_task_runs(
+            session=session,
+            task_runs=[
+                schemas.core.TaskRun(
+                    flow_run_id=flow_run.id,
+                    task_key="my-key",
+                    dynamic_key="0",
+                    state=Running(),
+                )
+            ],
+        )
+        assert task_run.id == existing.id
+        assert task_run.state.type == "SCHEDULED"
+
+
 class TestReadTaskRun:
     async def test_read_task_run(self, task_run, session):
         read_task_run = await models.task_runs.read_task_run(
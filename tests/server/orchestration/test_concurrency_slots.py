@@ -0,0 +1,216 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from prefect.server.orchestration import concurrency_slots
+from prefect.server.orchestration.concurrency_slots import (
+    ConcurrencySlotManager,
+    get_concurrency_slot_manager,
+)
+
+
+@pytest.fixture
+def manager():
+    manager = ConcurrencySlotManager(lease_duration=30)
+    manager.track_limit("a", 2)
+    manager.track_limit("b", 1)
+    return manager
+
+
+class TestConcurrencySlotManager:
+    def test_acquires_slots_up_to_the_limit(self, manager):
+        assert manager.try_acquire(["a"], uuid4())
+        assert manager.try_acquire(["a"], uuid4())
+        assert not manager.try_acquire(["a"], uuid4())
+        assert len(manager.active_slots("a")) == 2
+
+    def test_acquires_slots_on_all_tags_or_none(self, manager):
+        assert manager.try_acquire(["b"], uuid4())
+
+        holder = uuid4()
+        assert not manager.try_acquire(["a", "b"], holder)
+        assert holder not in manager.active_slots("a")
+
+    def test_untracked_tags_are_not_limited(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["untracked"], holder)
+        assert manager.try_acquire(["untracked"], uuid4())
+        assert not manager.is_tracking("untracked")
+
+    def test_holder_does_not_consume_multiple_slots(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+        assert manager.try_acquire(["b"], holder)
+        assert manager.active_slots("b") == [holder]
+
+    def test_release_frees_slots(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["a", "b"], holder)
+        manager.release(["a", "b"], holder)
+        assert manager.active_slots("a") == []
+        assert manager.active_slots("b") == []
+
+    def test_leases_expire(self):
+        manager = ConcurrencySlotManager(lease_duration=0)
+        manager.track_limit("b", 1)
+
+        assert manager.try_acquire(["b"], uuid4())
+        assert manager.try_acquire(["b"], uuid4())
+        assert manager.stats()["expirations"] == 1
+
+    def test_held_slots_do_not_expire(self):
+        manager = ConcurrencySlotManager(lease_duration=0)
+        manager.track_limit("b", 1)
+
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+        manager.hold(["b"], holder)
+        assert not manager.try_acquire(["b"], uuid4())
+        assert manager.active_slots("b") == [holder]
+
+    def test_track_limit_populates_active_slots(self):
+        manager = ConcurrencySlotManager()
+        holder = uuid4()
+        manager.track_limit("b", 1, [str(holder)])
+
+        assert manager.active_slots("b") == [holder]
+        assert not manager.try_acquire(["b"], uuid4())
+
+        # slots are only populated from the database once
+        manager.track_limit("b", 1, [])
+        assert manager.active_slots("b") == [holder]
+
+    def test_reclaims_slots_held_by_holders_that_are_not_running(self):
+        manager = ConcurrencySlotManager(lease_duration=0)
+        manager.track_limit("a", 2)
+
+        running, failed = uuid4(), uuid4()
+        for holder in [running, failed]:
+            assert manager.try_acquire(["a"], holder)
+            manager.hold(["a"], holder)
+
+        assert manager.reclaim("a", [running]) == 1
+        assert manager.active_slots("a") == [running]
+
+    def test_recently_held_slots_are_not_reclaimed(self):
+        manager = ConcurrencySlotManager(lease_duration=30)
+        manager.track_limit("a", 1)
+
+        holder = uuid4()
+        assert manager.try_acquire(["a"], holder)
+        manager.hold(["a"], holder)
+
+        # the holder's transition into a Running state may not be committed yet
+        assert manager.reclaim("a", []) == 0
+        assert manager.active_slots("a") == [holder]
+
+    def test_leased_slots_are_not_reclaimed(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+
+        assert manager.reclaim("b", []) == 0
+        assert manager.active_slots("b") == [holder]
+
+    def test_reset_slots(self, manager):
+        assert manager.try_acquire(["a"], uuid4())
+        override = uuid4()
+        manager.reset_slots("a", [override])
+        assert manager.active_slots("a") == [override]
+
+        manager.reset_slots("a")
+        assert manager.active_slots("a") == []
+
+    async def test_acquire_waits_for_a_released_slot(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+
+        waiter = asyncio.ensure_future(manager.acquire(["b"], uuid4(), timeout=10))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        assert manager.stats()["waiting"] == 1
+
+        manager.release(["b"], holder)
+        assert await asyncio.wait_for(waiter, 1)
+        assert manager.stats()["waiting"] == 0
+
+    async def test_acquire_times_out(self, manager):
+        assert manager.try_acquire(["b"], uuid4())
+        assert not await manager.acquire(["b"], uuid4(), timeout=0.01)
+        assert manager.stats()["timeouts"] == 1
+        assert manager.stats()["waiting"] == 0
+
+    async def test_acquire_waits_for_an_expired_lease(self):
+        manager = ConcurrencySlotManager(lease_duration=0.05)
+        manager.track_limit("b", 1)
+
+        assert manager.try_acquire(["b"], uuid4())
+        assert await manager.acquire(["b"], uuid4(), timeout=1)
+
+    async def test_acquire_wakes_waiters_on_limit_increase(self, manager):
+        assert manager.try_acquire(["b"], uuid4())
+
+        waiter = asyncio.ensure_future(manager.acquire(["b"], uuid4(), timeout=10))
+        await asyncio.sleep(0.01)
+        manager.track_limit("b", 2)
+        assert await asyncio.wait_for(waiter, 1)
+
+    async def test_waiters_are_granted_slots_in_order(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+
+        granted = []
+
+        async def acquire(i):
+            waiter = uuid4()
+            await manager.acquire(["b"], waiter, timeout=10)
+            granted.append(i)
+            manager.release(["b"], waiter)
+
+        waiters = [asyncio.ensure_future(acquire(i)) for i in range(5)]
+        await asyncio.sleep(0.01)
+
+        # a new request cannot take a slot ahead of the queue
+        manager.release(["b"], holder)
+        assert not manager.try_acquire(["b"], uuid4())
+
+        await asyncio.wait_for(asyncio.gather(*waiters), 1)
+        assert granted == [0, 1, 2, 3, 4]
+
+    async def test_queued_request_for_multiple_tags_is_not_starved(self, manager):
+        assert manager.try_acquire(["a"], uuid4())
+        b_holder = uuid4()
+        assert manager.try_acquire(["b"], b_holder)
+
+        multi_tag_waiter = asyncio.ensure_future(
+            manager.acquire(["a", "b"], uuid4(), timeout=10)
+        )
+        await asyncio.sleep(0.01)
+
+        # the slot on "a" is left for the queued request
+        assert not manager.try_acquire(["a"], uuid4())
+
+        manager.release(["b"], b_holder)
+        assert await asyncio.wait_for(multi_tag_waiter, 1)
+
+    async def test_cancelled_waiter_leaves_the_queue(self, manager):
+        holder = uuid4()
+        assert manager.try_acquire(["b"], holder)
+
+        waiter_holder = uuid4()
+        waiter = asyncio.ensure_future(
+            manager.acquire(["b"], waiter_holder, timeout=10)
+        )
+        await asyncio.sleep(0.01)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        manager.release(["b"], holder)
+        assert manager.active_slots("b") == []
+        assert manager.stats()["waiting"] == 0
+
+
+def test_get_concurrency_slot_manager_returns_a_single_manager(monkeypatch):
+    monkeypatch.setattr(concurrency_slots, "_concurrency_slot_manager", None)
+    assert get_concurrency_slot_manager() is get_concurrency_slot_manager()
@@ -10,8 +10,8 @@ import pytest
 
 from prefect.results import LiteralResult, PersistedResult, UnpersistedResult
 from prefect.server import schemas
-from prefect.server.exceptions import ObjectNotFoundError
 from prefect.server.models import concurrency_limits
+from prefect.server.orchestration import concurrency_slots
 from prefect.server.orchestration.core_policy import (
     BypassCancellingScheduledFlowRuns,
     CacheInsertion,
@@ -40,6 +40,10 @@ from prefect.server.orchestration.rules import (
 from prefect.server.schemas import actions, states
 from prefect.server.schemas.responses import SetStateStatus
 from prefect.server.schemas.states import StateType
+from prefect.settings import (
+    PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED,
+    temporary_settings,
+)
 from prefect.testing.utilities import AsyncMock
 
 # Convert constants from sets to lists for deterministic ordering of tests
@@ -569,7 +573,7 @@ class TestUpdatingFlowRunTrackerOnTasks:
 
         assert ctx.run.flow_run_run_count == flow_run_count
 
-    async def test_task_run_tracking_raises_informative_errors_on_missing_flow_runs(
+    async def test_task_run_tracking_aborts_informatively_on_missing_flow_runs(
         self,
         session,
         initialize_orchestration,
@@ -595,21 +599,50 @@ class TestUpdatingFlowRunTrackerOnTasks:
         async def missing_flow_run(self):
             return None
 
-        with pytest.raises(ObjectNotFoundError, match="Unable to read flow run"):
-            async with contextlib.AsyncExitStack() as stack:
-                for rule in update_policy:
-                    ctx = await stack.enter_async_context(
-                        rule(ctx, *intended_transition)
-                    )
-                    monkeypatch.setattr(
-                        "prefect.server.orchestration.rules.TaskOrchestrationContext.flow_run",
-                        missing_flow_run,
-                    )
+        monkeypatch.setattr(
+            "prefect.server.orchestration.rules.TaskOrchestrationContext.flow_run",
+            missing_flow_run,
+        )
+
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in update_policy:
+                ctx = await stack.enter_async_context(rule(ctx, *intended_transition))
 
+        assert ctx.response_status == SetStateStatus.ABORT
+        assert "Unable to read flow run" in ctx.response_details.reason
+        assert ctx.orchestration_error is None
         assert (
             ctx.run.flow_run_run_count == 1
         ), "The run count should not be updated if the flow run is missing"
 
+    async def test_task_run_tracking_is_reverted_if_the_transition_is_rejected(
+        self,
+        session,
+        initialize_orchestration,
+    ):
+        class RejectRunning(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = [states.StateType.RUNNING]
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                await self.reject_transition(
+                    state=states.Paused(name="NotReady"), reason="Not yet"
+                )
+
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        ctx = await initialize_orchestration(
+            session, "task", *intended_transition, flow_run_count=42
+        )
+        ctx.run.flow_run_run_count = 1
+
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in [UpdateFlowRunTrackerOnTasks, RejectRunning]:
+                ctx = await stack.enter_async_context(rule(ctx, *intended_transition))
+            await ctx.validate_proposed_state()
+
+        assert ctx.validated_state.is_paused()
+        assert ctx.run.flow_run_run_count == 1
+
 
 class TestPermitRerunningFailedTaskRuns:
     """
@@ -2322,6 +2355,171 @@ class TestTaskConcurrencyLimits:
         assert task1_pending_ctx.response_status == SetStateStatus.ABORT
         assert (await self.count_concurrency_slots(session, "small")) == 1
 
+    async def test_untagged_task_runs_do_not_read_concurrency_limits(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+        monkeypatch,
+    ):
+        for function in [
+            "filter_concurrency_limits_for_orchestration",
+            "read_concurrency_limits_by_tags",
+            "read_concurrency_limit_by_tag",
+        ]:
+            monkeypatch.setattr(
+                concurrency_limits,
+                function,
+                AsyncMock(side_effect=AssertionError(f"{function} was called")),
+            )
+
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        for transition in [
+            (states.StateType.PENDING, states.StateType.RUNNING),
+            (states.StateType.RUNNING, states.StateType.COMPLETED),
+        ]:
+            ctx = await initialize_orchestration(session, "task", *transition)
+
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(rule(ctx, *transition))
+                await ctx.validate_proposed_state()
+
+            assert ctx.response_status == SetStateStatus.ACCEPT
+
+
+class TestTaskConcurrencySlotLeases(TestTaskConcurrencyLimits):
+    """
+    Runs the concurrency limit tests against slots managed in memory.
+    """
+
+    @pytest.fixture(autouse=True)
+    def enable_slot_leases(self, monkeypatch):
+        monkeypatch.setattr(concurrency_slots, "_concurrency_slot_manager", None)
+        with temporary_settings(
+            {PREFECT_API_TASK_CONCURRENCY_SLOT_LEASES_ENABLED: True}
+        ):
+            yield
+
+    async def count_concurrency_slots(self, session, tag):
+        return len(await self.read_concurrency_slots(session, tag))
+
+    async def read_concurrency_slots(self, session, tag):
+        manager = concurrency_slots.get_concurrency_slot_manager()
+        return [str(slot) for slot in manager.active_slots(tag)]
+
+    async def test_slots_are_not_written_to_the_database(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        ctx = await initialize_orchestration(
+            session, "task", *running_transition, run_tags=["some tag"]
+        )
+
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in concurrency_policy:
+                ctx = await stack.enter_async_context(rule(ctx, *running_transition))
+            await ctx.validate_proposed_state()
+
+        assert ctx.response_status == SetStateStatus.ACCEPT
+        assert (await self.count_concurrency_slots(session, "some tag")) == 1
+        limit = await concurrency_limits.read_concurrency_limit_by_tag(
+            session, "some tag"
+        )
+        assert limit.active_slots == []
+
+    async def test_delays_transition_briefly_when_limit_is_reached(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        for expected_status in [SetStateStatus.ACCEPT, SetStateStatus.WAIT]:
+            ctx = await initialize_orchestration(
+                session, "task", *running_transition, run_tags=["some tag"]
+            )
+
+            async with contextlib.AsyncExitStack() as stack:
+                for rule in concurrency_policy:
+                    ctx = await stack.enter_async_context(
+                        rule(ctx, *running_transition)
+                    )
+                await ctx.validate_proposed_state()
+
+            assert ctx.response_status == expected_status
+
+        assert ctx.response_details.delay_seconds == 1
+
+    async def test_running_task_runs_hold_slots_of_newly_tracked_limits(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+    ):
+        await self.create_concurrency_limit(session, "some tag", 1)
+        # a task run that was already running, for example before a server restart
+        await initialize_orchestration(
+            session,
+            "task",
+            states.StateType.RUNNING,
+            states.StateType.COMPLETED,
+            run_tags=["some tag"],
+        )
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+
+        ctx = await initialize_orchestration(
+            session, "task", *running_transition, run_tags=["some tag"]
+        )
+
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in concurrency_policy:
+                ctx = await stack.enter_async_context(rule(ctx, *running_transition))
+            await ctx.validate_proposed_state()
+
+        assert ctx.response_status == SetStateStatus.WAIT
+
+    async def test_reclaims_slots_held_by_task_runs_that_are_not_running(
+        self,
+        session,
+        run_type,
+        initialize_orchestration,
+        monkeypatch,
+    ):
+        manager = concurrency_slots.ConcurrencySlotManager(lease_duration=0)
+        monkeypatch.setattr(concurrency_slots, "_concurrency_slot_manager", manager)
+        await self.create_concurrency_limit(session, "some tag", 1)
+
+        # a slot held by a task run whose transition into Running failed to commit
+        manager.track_limit("some tag", 1)
+        failed_holder = uuid4()
+        assert manager.try_acquire(["some tag"], failed_holder)
+        manager.hold(["some tag"], failed_holder)
+
+        concurrency_policy = [SecureTaskConcurrencySlots, ReleaseTaskConcurrencySlots]
+        running_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        ctx = await initialize_orchestration(
+            session, "task", *running_transition, run_tags=["some tag"]
+        )
+
+        async with contextlib.AsyncExitStack() as stack:
+            for rule in concurrency_policy:
+                ctx = await stack.enter_async_context(rule(ctx, *running_transition))
+            await ctx.validate_proposed_state()
+
+        assert ctx.response_status == SetStateStatus.ACCEPT
+        assert manager.active_slots("some tag") == [ctx.run.id]
+
 
 class TestPausingFlows:
     async def test_can_not_nonblocking_pause_subflows(
@@ -1,3 +1,5 @@
+import pytest
+
 from prefect.server.orchestration.policies import BaseOrchestrationPolicy
 from prefect.server.orchestration.rules import (
     ALL_ORCHESTRATION_STATES,
@@ -75,3 +77,66 @@ class TestPoliciesRespectOrdering:
 
         transition = (states.StateType.PENDING, states.StateType.RUNNING)
         assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+
+class TestTransitionTables:
+    def test_transition_rules_are_compiled_once_per_policy(self, monkeypatch):
+        class ValidRule(BaseOrchestrationRule):
+            FROM_STATES = [states.StateType.PENDING]
+            TO_STATES = [states.StateType.RUNNING]
+
+        class Bureaucracy(BaseOrchestrationPolicy):
+            def priority():
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+        # later compilations are served from the table built by the first one
+        monkeypatch.setattr(
+            Bureaucracy, "priority", lambda: pytest.fail("priority was re-read")
+        )
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+        assert (
+            Bureaucracy.compile_transition_rules(
+                states.StateType.RUNNING, states.StateType.COMPLETED
+            )
+            == []
+        )
+
+    def test_compiled_rules_can_be_modified_by_callers(self):
+        class ValidRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+        class Bureaucracy(BaseOrchestrationPolicy):
+            def priority():
+                return [ValidRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        Bureaucracy.compile_transition_rules(*transition).append(ValidRule)
+        assert Bureaucracy.compile_transition_rules(*transition) == [ValidRule]
+
+    def test_subclasses_compile_their_own_rules(self):
+        class FirstRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+        class SecondRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+        class Bureaucracy(BaseOrchestrationPolicy):
+            def priority():
+                return [FirstRule]
+
+        class BiggerBureaucracy(Bureaucracy):
+            def priority():
+                return [FirstRule, SecondRule]
+
+        transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        assert Bureaucracy.compile_transition_rules(*transition) == [FirstRule]
+        assert BiggerBureaucracy.compile_transition_rules(*transition) == [
+            FirstRule,
+            SecondRule,
+        ]
@@ -0,0 +1,130 @@
+import pytest
+
+from prefect.server import models, schemas
+from prefect.server.orchestration.core_policy import CoreFlowPolicy, CoreTaskPolicy
+from prefect.server.orchestration.profiling import (
+    DURATION_BUCKETS,
+    Histogram,
+    get_orchestration_profiler,
+)
+from prefect.settings import (
+    PREFECT_API_ORCHESTRATION_PROFILING_ENABLED,
+    temporary_settings,
+)
+
+
+@pytest.fixture(autouse=True)
+def profiler():
+    profiler = get_orchestration_profiler()
+    profiler.reset()
+    yield profiler
+    profiler.reset()
+
+
+class TestHistogram:
+    def test_empty_histogram(self):
+        histogram = Histogram(DURATION_BUCKETS)
+        assert histogram.to_dict()["count"] == 0
+        assert histogram.quantile(0.5) == 0.0
+
+    def test_quantiles_are_bucket_bounds(self):
+        histogram = Histogram((1, 2, 5, float("inf")))
+        for value in [1, 1, 2, 4, 40]:
+            histogram.observe(value)
+
+        assert histogram.quantile(0.5) == 2
+        assert histogram.quantile(0.8) == 5
+        # quantiles are never larger than the largest observation
+        assert histogram.quantile(0.99) == 40
+
+        summary = histogram.to_dict()
+        assert summary["count"] == 5
+        assert summary["mean"] == 48 / 5
+        assert summary["max"] == 40
+        assert summary["buckets"] == {"1": 2, "2": 1, "5": 1, "inf": 1}
+
+
+class TestProfileTransitions:
+    async def test_task_run_transitions_are_profiled(self, session, task_run, profiler):
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Pending(),
+            task_policy=CoreTaskPolicy,
+        )
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Running(),
+            task_policy=CoreTaskPolicy,
+        )
+
+        stats = profiler.stats()
+        transition = stats["transitions"]["task_run PENDING => RUNNING"]
+        assert transition["duration_seconds"]["count"] == 1
+        assert transition["validation_seconds"]["count"] == 1
+        assert transition["statements"]["count"] == 1
+        assert transition["statements"]["max"] > 0
+        assert "task_run None => PENDING" in stats["transitions"]
+
+        # both orchestration rules and global transforms are timed
+        assert stats["rules"]["CacheRetrieval"]["before_transition"]["count"] == 1
+        assert stats["rules"]["SetStartTime"]["after_transition"]["count"] == 2
+
+    async def test_flow_run_transitions_are_profiled(self, session, flow_run, profiler):
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=flow_run.id,
+            state=schemas.states.Scheduled(),
+            flow_policy=CoreFlowPolicy,
+        )
+
+        stats = profiler.stats()
+        assert (
+            stats["transitions"]["flow_run None => SCHEDULED"]["duration_seconds"][
+                "count"
+            ]
+            == 1
+        )
+        assert "SetRunStateType" in stats["rules"]
+
+    async def test_rejected_transitions_are_profiled(self, session, task_run, profiler):
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Completed(),
+            force=True,
+        )
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Running(),
+            task_policy=CoreTaskPolicy,
+        )
+
+        stats = profiler.stats()
+        assert "task_run COMPLETED => RUNNING" in stats["transitions"]
+        assert stats["rules"]["PreventRunningTasksFromStoppedFlows"]
+
+    async def test_profiling_can_be_disabled(self, session, task_run, profiler):
+        with temporary_settings({PREFECT_API_ORCHESTRATION_PROFILING_ENABLED: False}):
+            await models.task_runs.set_task_run_state(
+                session=session,
+                task_run_id=task_run.id,
+                state=schemas.states.Pending(),
+                task_policy=CoreTaskPolicy,
+            )
+
+        assert profiler.stats() == {"transitions": {}, "rules": {}}
+
+    async def test_reset_discards_profiles(self, session, task_run, profiler):
+        await models.task_runs.set_task_run_state(
+            session=session,
+            task_run_id=task_run.id,
+            state=schemas.states.Pending(),
+        )
+        assert profiler.stats()["transitions"]
+
+        profiler.reset()
+
+        assert profiler.stats() == {"transitions": {}, "rules": {}}
@@ -981,6 +981,37 @@ class TestBaseOrchestrationRule:
         # because all fizzled rules cleaned up and invalid rules never fire, side-effects have been undone
         assert side_effects == 0
 
+    async def test_unimplemented_hooks_are_skipped(
+        self, session, initialize_orchestration
+    ):
+        before_transition_hook = MagicMock()
+
+        class BeforeOnlyRule(BaseOrchestrationRule):
+            FROM_STATES = ALL_ORCHESTRATION_STATES
+            TO_STATES = ALL_ORCHESTRATION_STATES
+
+            async def before_transition(self, initial_state, proposed_state, context):
+                before_transition_hook()
+
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        ctx = await initialize_orchestration(session, "task", *intended_transition)
+
+        rule = BeforeOnlyRule(ctx, *intended_transition)
+        exit_context = MagicMock(wraps=ctx.exit_context)
+        object.__setattr__(ctx, "exit_context", exit_context)
+
+        async with rule as ctx:
+            await ctx.validate_proposed_state()
+
+        assert BeforeOnlyRule._implements_hook("before_transition")
+        assert not BeforeOnlyRule._implements_hook("after_transition")
+        assert before_transition_hook.call_count == 1
+
+        # the context is not copied for the skipped after-transition hook, but the
+        # rule is still recorded as having fired
+        assert exit_context.call_count == 0
+        assert ctx.finalization_signature == [str(BeforeOnlyRule)]
+
 
 class TestBaseUniversalTransform:
     async def test_universal_transforms_are_context_managers(self, session, task_run):
@@ -1912,3 +1943,25 @@ class TestNullRejection:
         assert before_transition_hook.call_count == 1
         assert after_transition_hook.call_count == 1
         assert cleanup_step.call_count == 0
+
+
+class TestTaskOrchestrationContext:
+    async def test_flow_run_is_read_once(
+        self, session, initialize_orchestration, monkeypatch
+    ):
+        intended_transition = (states.StateType.PENDING, states.StateType.RUNNING)
+        ctx = await initialize_orchestration(session, "task", *intended_transition)
+
+        read_flow_run = AsyncMock(wraps=models.flow_runs.read_flow_run)
+        monkeypatch.setattr(
+            "prefect.server.orchestration.rules.flow_runs.read_flow_run",
+            read_flow_run,
+        )
+
+        flow_run = await ctx.flow_run()
+        assert flow_run.id == ctx.run.flow_run_id
+
+        # copies of the context given to rules share the flow run
+        assert await ctx.safe_copy().flow_run() is flow_run
+        assert await ctx.flow_run() is flow_run
+        assert read_flow_run.call_count == 1
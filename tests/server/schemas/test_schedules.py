@@ -1,3 +1,4 @@
+import json
 from datetime import datetime as pydatetime
 from datetime import timedelta
 from unittest import mock
@@ -9,6 +10,7 @@ from dateutil import rrule
 from pendulum import datetime, now
 from pydantic import ValidationError
 
+import prefect.server.schemas.schedules as schedules
 from prefect.server.schemas.schedules import (
     MAX_ITERATIONS,
     MAX_RRULE_LENGTH,
@@ -960,3 +962,127 @@ class TestRRuleSchedule:
             dt.add(days=8),
             dt.add(days=9),
         ]
+
+
+class TestBulkDateGeneration:
+    @pytest.fixture(autouse=True)
+    def clear_occurrence_cache(self, monkeypatch):
+        monkeypatch.setattr(schedules, "_occurrence_cache", schedules.OrderedDict())
+        monkeypatch.setattr(schedules, "_cached_occurrence_count", 0)
+
+    def generator_dates(self, monkeypatch, schedule, **kwargs):
+        with monkeypatch.context() as m:
+            m.setattr(schedules, "_get_cached_timestamps", lambda *_: None)
+            return list(schedule._get_dates_generator(**kwargs))
+
+    @pytest.mark.parametrize(
+        "schedule",
+        [
+            CronSchedule(cron="*/5 * * * *"),
+            CronSchedule(cron="30 9 * * 1-5", timezone="America/New_York"),
+            CronSchedule(cron="0 0 1-7 * 5", timezone="Europe/London", day_or=False),
+            CronSchedule(cron="0 12 1 * 0", timezone="Asia/Kolkata"),
+            IntervalSchedule(
+                interval=timedelta(minutes=7),
+                anchor_date=datetime(2020, 1, 1, 0, 0, 1, 500),
+                timezone="America/New_York",
+            ),
+            IntervalSchedule(
+                interval=timedelta(days=1), anchor_date=datetime(2020, 1, 1, 9)
+            ),
+            RRuleSchedule(
+                rrule="DTSTART:20200101T000000\nRRULE:FREQ=HOURLY;BYMINUTE=15",
+                timezone="America/New_York",
+            ),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "start",
+        [
+            # far from a DST transition
+            datetime(2020, 6, 1, 12, 0, 30),
+            # across the DST transition on 3/8/2020 in America/New_York
+            datetime(2020, 3, 7, 12),
+            datetime(2020, 3, 8, 6, 30),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "kwargs", [dict(n=100), dict(n=5), dict(end=datetime(2020, 6, 20))]
+    )
+    def test_matches_generator(self, monkeypatch, schedule, start, kwargs):
+        dates = list(schedule._get_dates_generator(start=start, **kwargs))
+        expected = self.generator_dates(monkeypatch, schedule, start=start, **kwargs)
+        assert dates == expected
+        assert [d.timezone_name for d in dates] == [d.timezone_name for d in expected]
+
+    def test_reuses_cached_occurrences(self, monkeypatch):
+        schedule = CronSchedule(cron="* * * * *")
+        get_timestamps = mock.Mock(wraps=schedule._get_timestamps)
+        monkeypatch.setattr(CronSchedule, "_get_timestamps", get_timestamps)
+
+        for minute in range(10):
+            start = dt.add(minutes=minute)
+            dates = list(
+                CronSchedule(cron="* * * * *")._get_dates_generator(n=3, start=start)
+            )
+            assert dates == [start, start.add(minutes=1), start.add(minutes=2)]
+
+        get_timestamps.assert_called_once()
+
+    def test_recomputes_occurrences_outside_of_the_cache(self, monkeypatch):
+        schedule = CronSchedule(cron="* * * * *")
+        get_timestamps = mock.Mock(wraps=schedule._get_timestamps)
+        monkeypatch.setattr(CronSchedule, "_get_timestamps", get_timestamps)
+
+        list(schedule._get_dates_generator(n=3, start=dt))
+        dates = list(schedule._get_dates_generator(n=3, start=dt.add(days=1)))
+
+        assert dates[0] == dt.add(days=1)
+        assert get_timestamps.call_count == 2
+
+    def test_cache_is_bounded_by_total_occurrences(self, monkeypatch):
+        monkeypatch.setattr(
+            schedules, "MAX_CACHED_OCCURRENCES", 2 * schedules.OCCURRENCE_BATCH_SIZE
+        )
+
+        for minutes in range(1, 5):
+            schedule = IntervalSchedule(interval=timedelta(minutes=minutes))
+            list(schedule._get_dates_generator(n=3, start=dt))
+
+        assert len(schedules._occurrence_cache) == 2
+        assert schedules._cached_occurrence_count == sum(
+            len(occurrences.timestamps)
+            for occurrences in schedules._occurrence_cache.values()
+        )
+        assert schedules._cached_occurrence_count <= schedules.MAX_CACHED_OCCURRENCES
+        # the least recently used schedules are evicted first
+        assert [
+            json.loads(key.split(":", 1)[1])["interval"]
+            for key in schedules._occurrence_cache
+        ] == [180, 240]
+
+    def test_cached_occurrences_only_cover_computed_dates(self, monkeypatch):
+        schedule = IntervalSchedule(
+            interval=timedelta(hours=1),
+            anchor_date=datetime(2021, 6, 1),
+            timezone="America/New_York",
+        )
+        # the first call caches dates for about 40 days, well before the next DST
+        # transition
+        list(schedule._get_dates_generator(n=3, start=datetime(2022, 6, 1)))
+
+        kwargs = dict(start=datetime(2022, 7, 19), end=datetime(2022, 7, 20))
+        dates = list(schedule._get_dates_generator(**kwargs))
+        assert len(dates) == 25
+        assert dates == self.generator_dates(monkeypatch, schedule, **kwargs)
+
+    @pytest.mark.parametrize("cron", ["0 0 L * *", "0 0 * * 5#2", "*/10 * * * * *"])
+    def test_special_cron_expressions_use_croniter(self, cron):
+        schedule = CronSchedule(cron=cron)
+        assert schedule._get_timestamps(0, 10) is None
+        assert len(list(schedule._get_dates_generator(n=3, start=dt))) == 3
+
+    def test_dates_close_to_dst_transitions_are_not_computed_in_bulk(self):
+        schedule = CronSchedule(cron="0 * * * *", timezone="America/New_York")
+        start = datetime(2020, 3, 8, 2, 30, tz="America/New_York")
+        assert schedule._get_timestamps(schedules._to_timestamp(start), 10) is None
@@ -0,0 +1,172 @@
+import asyncio
+from uuid import uuid4
+
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models
+from prefect.server.schemas.actions import LogCreate
+from prefect.server.services import log_buffer
+from prefect.server.services.log_buffer import LogBuffer, get_log_buffer
+
+
+def make_logs(count, flow_run_id=None):
+    flow_run_id = flow_run_id or uuid4()
+    return [
+        LogCreate(
+            name="prefect.flow_run",
+            level=20,
+            message=f"Log {i}",
+            timestamp=pendulum.now("UTC"),
+            flow_run_id=flow_run_id,
+        )
+        for i in range(count)
+    ]
+
+
+async def count_logs(session, db):
+    result = await session.execute(sa.select(sa.func.count(db.Log.id)))
+    return result.scalar()
+
+
+@pytest.fixture
+async def buffer():
+    buffer = LogBuffer(handle_signals=False, loop_seconds=0.1)
+    task = asyncio.ensure_future(buffer.start())
+    while get_log_buffer() is not buffer:
+        await asyncio.sleep(0.01)
+    yield buffer
+    await buffer.stop()
+    await task
+
+
+async def test_buffer_is_only_available_while_running(buffer):
+    assert get_log_buffer() is buffer
+    await buffer.stop()
+    assert get_log_buffer() is None
+
+
+async def test_writes_buffered_logs(session, db, buffer):
+    assert await buffer.put(make_logs(5))
+    assert await buffer.put(make_logs(5))
+
+    while buffer.stats()["written"] < 10:
+        await asyncio.sleep(0.05)
+
+    assert await count_logs(session, db) == 10
+    assert buffer.stats()["buffered"] == 0
+
+
+async def test_writes_buffered_logs_in_batches(session, db):
+    buffer = LogBuffer(handle_signals=False)
+    buffer.batch_size = 3
+    buffer._accepting = True
+
+    await buffer.put(make_logs(10))
+    await buffer.flush()
+
+    assert await count_logs(session, db) == 10
+    assert buffer.written == 10
+
+
+async def test_writes_buffered_logs_on_stop(session, db):
+    buffer = LogBuffer(handle_signals=False, loop_seconds=60)
+    task = asyncio.ensure_future(buffer.start())
+    while get_log_buffer() is not buffer:
+        await asyncio.sleep(0.01)
+    # let the first loop run before logs are buffered
+    await asyncio.sleep(0.1)
+
+    assert await buffer.put(make_logs(5))
+    await buffer.stop()
+    await task
+
+    assert await count_logs(session, db) == 5
+
+
+async def test_put_waits_while_the_buffer_is_full():
+    buffer = LogBuffer(handle_signals=False, max_size=5)
+    buffer._accepting = True
+
+    assert await buffer.put(make_logs(5))
+    waiter = asyncio.ensure_future(buffer.put(make_logs(1)))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await buffer.flush()
+    assert await asyncio.wait_for(waiter, 1)
+    assert buffer.stats()["buffered"] == 1
+
+
+async def test_put_accepts_more_logs_than_the_maximum_size_when_empty():
+    buffer = LogBuffer(handle_signals=False, max_size=5)
+    buffer._accepting = True
+
+    assert await buffer.put(make_logs(10))
+    assert buffer.stats()["buffered"] == 10
+
+
+async def test_put_is_refused_when_not_running():
+    buffer = LogBuffer(handle_signals=False)
+    assert not await buffer.put(make_logs(1))
+
+
+async def test_failed_writes_are_retried(session, db, monkeypatch):
+    buffer = LogBuffer(handle_signals=False)
+    buffer._accepting = True
+    await buffer.put(make_logs(3))
+
+    bulk_create_logs = models.logs.bulk_create_logs
+
+    async def fail(*args, **kwargs):
+        raise ValueError("database unavailable")
+
+    monkeypatch.setattr(models.logs, "bulk_create_logs", fail)
+    with pytest.raises(ValueError):
+        await buffer.flush()
+    assert buffer.stats()["buffered"] == 3
+
+    monkeypatch.setattr(models.logs, "bulk_create_logs", bulk_create_logs)
+    await buffer.flush()
+    assert await count_logs(session, db) == 3
+
+
+async def test_logs_that_cannot_be_written_are_dropped_after_retries(
+    session, db, monkeypatch
+):
+    buffer = LogBuffer(handle_signals=False, max_size=10)
+    buffer._accepting = True
+    logs = make_logs(10)
+    logs[6].message = "bad"
+    await buffer.put(logs)
+
+    bulk_create_logs = models.logs.bulk_create_logs
+
+    async def reject_bad_logs(session, logs):
+        if any(log.message == "bad" for log in logs):
+            raise ValueError("invalid byte sequence")
+        await bulk_create_logs(session=session, logs=logs)
+
+    monkeypatch.setattr(models.logs, "bulk_create_logs", reject_bad_logs)
+    for _ in range(buffer.max_retries):
+        with pytest.raises(ValueError):
+            await buffer.flush()
+        assert buffer.stats()["buffered"] == 10
+
+    waiter = asyncio.ensure_future(buffer.put(make_logs(1)))
+    await buffer.flush()
+    assert await asyncio.wait_for(waiter, 1)
+
+    # the good logs of the failed batch and the log written after it are kept
+    result = await session.execute(sa.select(db.Log.message))
+    messages = result.scalars().all()
+    assert len(messages) == 10
+    assert "bad" not in messages
+    assert buffer.written == 10
+    assert buffer.stats()["buffered"] == 0
+
+
+def test_get_log_buffer_returns_none_when_not_running(monkeypatch):
+    monkeypatch.setattr(log_buffer, "_log_buffer", None)
+    assert get_log_buffer() is None
@@ -0,0 +1,25 @@
+import pendulum
+import pytest
+
+from prefect.server.database import partitioning
+from prefect.server.services.partition_maintenance import PartitionMaintenance
+
+
+async def test_does_nothing_without_partitioned_tables(session):
+    if partitioning.is_postgres(session):
+        pytest.skip("Only applies to SQLite")
+
+    service = PartitionMaintenance(handle_signals=False)
+    await service.start(loops=1)
+
+    assert await partitioning.read_partitions(session, "log") == []
+
+
+def test_uses_configured_interval():
+    service = PartitionMaintenance(handle_signals=False)
+
+    assert service.interval == "week"
+    assert service.premake == 4
+    assert partitioning.upcoming_partitions_end(
+        pendulum.datetime(2023, 1, 4), service.interval, service.premake
+    ) == pendulum.datetime(2023, 2, 6)
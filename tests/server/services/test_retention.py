@@ -0,0 +1,163 @@
+import gzip
+import json
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.retention import Retention
+from prefect.settings import (
+    PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH,
+    PREFECT_API_SERVICES_RETENTION_BATCH_SIZE,
+    PREFECT_API_SERVICES_RETENTION_DEPLOYMENT_IDS,
+    PREFECT_API_SERVICES_RETENTION_FLOW_RUNS_AFTER,
+    PREFECT_API_SERVICES_RETENTION_LOGS_AFTER,
+    PREFECT_API_SERVICES_RETENTION_STATE_TYPES,
+    PREFECT_API_SERVICES_RETENTION_STATES_AFTER,
+    temporary_settings,
+)
+
+
+@pytest.fixture
+async def completed_flow_run(session, flow):
+    flow_run = await models.flow_runs.create_flow_run(
+        session=session,
+        flow_run=schemas.core.FlowRun(flow_id=flow.id),
+    )
+    for state in [
+        schemas.states.Pending(),
+        schemas.states.Running(),
+        schemas.states.Completed(),
+    ]:
+        await models.flow_runs.set_flow_run_state(
+            session=session, flow_run_id=flow_run.id, state=state, force=True
+        )
+    await models.logs.create_logs(
+        session=session,
+        logs=[
+            schemas.actions.LogCreate(
+                name="prefect.flow_run",
+                level=20,
+                message="Ahoy, captain",
+                timestamp=flow_run.start_time,
+                flow_run_id=flow_run.id,
+            )
+        ],
+    )
+    await session.commit()
+    return flow_run
+
+
+async def count_rows(session, model):
+    return (await session.execute(sa.select(sa.func.count(model.id)))).scalar()
+
+
+@pytest.mark.parametrize(
+    "settings",
+    [
+        {PREFECT_API_SERVICES_RETENTION_STATE_TYPES: "failed"},
+        {PREFECT_API_SERVICES_RETENTION_DEPLOYMENT_IDS: str(uuid4())},
+        {PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH: "archive"},
+    ],
+)
+def test_only_drops_partitions_without_run_filters_or_archives(settings):
+    assert Retention(handle_signals=False).drop_partitions
+
+    with temporary_settings(settings):
+        service = Retention(handle_signals=False)
+    assert not service.drop_partitions
+
+
+async def test_keeps_everything_by_default(session, db, completed_flow_run):
+    service = Retention(handle_signals=False)
+    await service.start(loops=1)
+
+    assert service.pruned == {"task_run_state_cache": 0}
+    assert await count_rows(session, db.FlowRunState) == 3
+    assert await count_rows(session, db.Log) == 1
+
+
+async def test_prunes_data_older_than_retention_periods(
+    session, db, completed_flow_run
+):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_RETENTION_STATES_AFTER: timedelta(0),
+            PREFECT_API_SERVICES_RETENTION_LOGS_AFTER: timedelta(0),
+            PREFECT_API_SERVICES_RETENTION_BATCH_SIZE: 1,
+        }
+    ):
+        service = Retention(handle_signals=False)
+    await service.start(loops=1)
+
+    assert service.pruned == {
+        "flow_run_state": 2,
+        "task_run_state": 0,
+        "log": 1,
+        "task_run_state_cache": 0,
+    }
+    assert await count_rows(session, db.FlowRunState) == 1
+    assert await count_rows(session, db.Log) == 0
+
+
+async def test_only_prunes_runs_in_configured_state_types(
+    session, db, completed_flow_run
+):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_RETENTION_STATES_AFTER: timedelta(0),
+            PREFECT_API_SERVICES_RETENTION_STATE_TYPES: "failed, crashed",
+        }
+    ):
+        service = Retention(handle_signals=False)
+    await service.start(loops=1)
+
+    assert service.pruned["flow_run_state"] == 0
+    assert await count_rows(session, db.FlowRunState) == 3
+
+
+async def test_archives_pruned_rows(session, db, completed_flow_run, tmp_path):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_RETENTION_STATES_AFTER: timedelta(0),
+            PREFECT_API_SERVICES_RETENTION_BATCH_SIZE: 1,
+            PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH: tmp_path / "archive",
+        }
+    ):
+        service = Retention(handle_signals=False)
+    await service.start(loops=1)
+
+    (archive,) = (tmp_path / "archive").glob("flow_run_state-*.jsonl.gz")
+    with gzip.open(archive, "rt") as file:
+        rows = [json.loads(line) for line in file]
+
+    assert len(rows) == 2
+    assert {row["type"] for row in rows} == {"PENDING", "RUNNING"}
+    assert {row["flow_run_id"] for row in rows} == {str(completed_flow_run.id)}
+
+
+async def test_archives_the_states_of_pruned_flow_runs(
+    session, db, completed_flow_run, tmp_path
+):
+    with temporary_settings(
+        {
+            PREFECT_API_SERVICES_RETENTION_FLOW_RUNS_AFTER: timedelta(0),
+            PREFECT_API_SERVICES_RETENTION_ARCHIVE_PATH: tmp_path / "archive",
+        }
+    ):
+        service = Retention(handle_signals=False)
+    await service.start(loops=1)
+
+    # the flow run and its 3 states
+    assert service.pruned["flow_run"] == 4
+    assert await count_rows(session, db.FlowRunState) == 0
+
+    archives = {
+        path.name.split("-")[0]: path
+        for path in (tmp_path / "archive").glob("*.jsonl.gz")
+    }
+    assert set(archives) == {"flow_run", "flow_run_state"}
+    with gzip.open(archives["flow_run_state"], "rt") as file:
+        assert len(file.readlines()) == 3
@@ -0,0 +1,132 @@
+import pendulum
+import pytest
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.run_history_rollups import RunHistoryRollups
+
+dt = pendulum.datetime(2021, 7, 1)
+
+
+@pytest.fixture
+async def completed_runs(session, flow, deployment):
+    async with session.begin():
+        runs = []
+        for minutes in (0, 1, 1, 75):
+            runs.append(
+                await models.flow_runs.create_flow_run(
+                    session=session,
+                    flow_run=schemas.core.FlowRun(
+                        flow_id=flow.id,
+                        deployment_id=deployment.id,
+                        work_queue_name="wq",
+                        state=schemas.states.Completed(
+                            timestamp=dt.add(minutes=minutes)
+                        ),
+                    ),
+                )
+            )
+        return runs
+
+
+async def read_rollups(session, db, run_type="flow_run", interval_seconds=60):
+    result = await session.execute(
+        sa.select(db.RunHistoryRollup)
+        .where(
+            db.RunHistoryRollup.run_type == run_type,
+            db.RunHistoryRollup.interval_seconds == interval_seconds,
+        )
+        .order_by(db.RunHistoryRollup.interval_start)
+    )
+    return result.scalars().all()
+
+
+async def test_rolls_up_runs_by_minute_and_hour(session, db, completed_runs):
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    minutes = await read_rollups(session, db, interval_seconds=60)
+    assert [(r.interval_start, r.count_runs) for r in minutes] == [
+        (dt, 1),
+        (dt.add(minutes=1), 2),
+        (dt.add(minutes=75), 1),
+    ]
+    assert minutes[0].state_type == "COMPLETED"
+    assert minutes[0].state_name == "Completed"
+    assert minutes[0].flow_id == completed_runs[0].flow_id
+    assert minutes[0].deployment_id == completed_runs[0].deployment_id
+    assert minutes[0].work_queue_name == "wq"
+
+    hours = await read_rollups(session, db, interval_seconds=3600)
+    assert [(r.interval_start, r.count_runs) for r in hours] == [
+        (dt, 3),
+        (dt.add(hours=1), 1),
+    ]
+
+
+async def test_rolls_up_task_runs(session, db, flow_run):
+    async with session.begin():
+        await models.task_runs.create_task_run(
+            session=session,
+            task_run=schemas.core.TaskRun(
+                flow_run_id=flow_run.id,
+                task_key="a",
+                dynamic_key="0",
+                state=schemas.states.Failed(timestamp=dt),
+            ),
+        )
+
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    rollups = await read_rollups(session, db, run_type="task_run")
+    assert [(r.interval_start, r.state_type, r.count_runs) for r in rollups] == [
+        (dt, "FAILED", 1)
+    ]
+    assert rollups[0].flow_id is None
+
+
+async def test_records_rollup_progress(session, completed_runs):
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    state = await models.run_history_rollups.read_run_history_rollup_state(
+        session=session
+    )
+    assert state["flow_run"]["rolled_up_until"] == pendulum.now("UTC").start_of("hour")
+    assert state["flow_run"]["updated_after"] < pendulum.now("UTC")
+    assert "task_run" in state
+
+
+async def test_does_not_roll_up_the_current_hour(session, db, flow):
+    async with session.begin():
+        await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                state=schemas.states.Scheduled(scheduled_time=pendulum.now("UTC")),
+            ),
+        )
+
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    assert await read_rollups(session, db) == []
+
+
+async def test_rolls_up_hours_with_updated_runs_again(session, db, completed_runs):
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    async with session.begin():
+        await models.flow_runs.set_flow_run_state(
+            session=session,
+            flow_run_id=completed_runs[0].id,
+            state=schemas.states.Failed(timestamp=dt.add(seconds=30)),
+            force=True,
+        )
+
+    await RunHistoryRollups(handle_signals=False).start(loops=1)
+
+    session.expire_all()
+    hours = await read_rollups(session, db, interval_seconds=3600)
+    assert sorted((r.interval_start, r.state_type, r.count_runs) for r in hours) == [
+        (dt, "COMPLETED", 2),
+        (dt, "FAILED", 1),
+        (dt.add(hours=1), "COMPLETED", 1),
+    ]
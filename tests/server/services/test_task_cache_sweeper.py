@@ -0,0 +1,40 @@
+import pendulum
+import sqlalchemy as sa
+
+from prefect.server import models, schemas
+from prefect.server.services.task_cache_sweeper import TaskCacheSweeper
+
+
+async def test_deletes_expired_cached_states_in_batches(session, db, flow_run):
+    task_run = await models.task_runs.create_task_run(
+        session=session,
+        task_run=schemas.core.TaskRun(
+            flow_run_id=flow_run.id, task_key="task", dynamic_key="0"
+        ),
+    )
+    result = await models.task_runs.set_task_run_state(
+        session=session,
+        task_run_id=task_run.id,
+        state=schemas.states.Completed(),
+        force=True,
+    )
+    now = pendulum.now("UTC")
+    for i in range(3):
+        await models.task_run_state_cache.upsert_cached_state(
+            session=session,
+            cache_key=f"expired-{i}",
+            task_run_state_id=result.state.id,
+            cache_expiration=now.subtract(minutes=1),
+        )
+    await models.task_run_state_cache.upsert_cached_state(
+        session=session, cache_key="valid", task_run_state_id=result.state.id
+    )
+    await session.commit()
+
+    service = TaskCacheSweeper(handle_signals=False)
+    service.batch_size = 2
+    await service.start(loops=1)
+
+    assert service.deleted == 3
+    result = await session.execute(sa.select(db.TaskRunStateCache.cache_key))
+    assert result.scalars().all() == ["valid"]
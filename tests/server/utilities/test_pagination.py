@@ -0,0 +1,111 @@
+from uuid import uuid4
+
+import pendulum
+import pytest
+
+from prefect.server import models, schemas
+from prefect.server.utilities import pagination
+from prefect.server.utilities.pagination import KeysetCursor
+
+NOW = pendulum.datetime(2023, 6, 1, tz="UTC")
+
+
+@pytest.fixture
+async def flow_runs(session, flow):
+    flow_runs = []
+    for i in range(25):
+        # Repeat names and times so sorts have ties, and leave some times unset
+        flow_run = await models.flow_runs.create_flow_run(
+            session=session,
+            flow_run=schemas.core.FlowRun(
+                flow_id=flow.id,
+                name=f"flow-run-{i % 4}",
+                expected_start_time=NOW.add(minutes=i % 3) if i % 5 else None,
+                start_time=NOW.add(minutes=i % 2) if i % 7 == 0 else None,
+                end_time=NOW.add(minutes=i % 6) if i % 2 else None,
+            ),
+        )
+        flow_runs.append(flow_run)
+    await session.commit()
+    return flow_runs
+
+
+async def read_all_pages(session, db, sort, page_size):
+    pages = []
+    cursor = None
+    while True:
+
+        async def read(after, limit):
+            return await models.flow_runs.read_flow_runs(
+                session=session, sort=sort, limit=limit, cursor=after
+            )
+
+        page, cursor = await pagination.read_page(
+            read, sort, sort.as_sql_sort(db), cursor, page_size
+        )
+        pages.append(page)
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize("sort", list(schemas.sorting.FlowRunSort))
+async def test_pages_cover_every_row_once_in_sort_order(session, db, flow_runs, sort):
+    pages = await read_all_pages(session, db, sort, page_size=4)
+    ids = [flow_run.id for page in pages for flow_run in page]
+
+    expected = await models.flow_runs.read_flow_runs(
+        session=session, sort=sort, cursor=KeysetCursor()
+    )
+    assert ids == [flow_run.id for flow_run in expected]
+    assert len(set(ids)) == len(flow_runs)
+    assert [len(page) for page in pages] == [4] * 6 + [1]
+
+
+async def test_keyset_order_follows_the_sort(session, flow_runs):
+    expected = await models.flow_runs.read_flow_runs(
+        session=session,
+        sort=schemas.sorting.FlowRunSort.EXPECTED_START_TIME_DESC,
+        cursor=KeysetCursor(),
+    )
+    times = [flow_run.expected_start_time for flow_run in expected]
+    present = [time for time in times if time is not None]
+
+    assert present == sorted(present, reverse=True)
+    assert times[len(present) :] == [None] * (len(times) - len(present))
+
+
+async def test_last_page_has_no_cursor(session, db, flow_runs):
+    pages = await read_all_pages(
+        session, db, schemas.sorting.FlowRunSort.NAME_ASC, page_size=25
+    )
+    assert len(pages) == 1
+
+
+def test_cursor_round_trip():
+    sort = schemas.sorting.FlowRunSort.START_TIME_ASC
+    cursor = KeysetCursor(value=NOW, id=uuid4())
+
+    decoded = pagination.decode_cursor(pagination.encode_cursor(sort, cursor), sort)
+
+    assert decoded == cursor
+
+
+def test_missing_cursor_selects_first_page():
+    assert (
+        pagination.decode_cursor(None, schemas.sorting.FlowRunSort.ID_DESC)
+        == KeysetCursor()
+    )
+
+
+@pytest.mark.parametrize("cursor", ["not-a-cursor", "e30="])
+def test_invalid_cursors_are_rejected(cursor):
+    with pytest.raises(pagination.InvalidCursorError, match="Invalid"):
+        pagination.decode_cursor(cursor, schemas.sorting.FlowRunSort.ID_DESC)
+
+
+def test_cursors_for_other_sorts_are_rejected():
+    cursor = pagination.encode_cursor(
+        schemas.sorting.FlowRunSort.NAME_ASC, KeysetCursor(value="a", id=uuid4())
+    )
+    with pytest.raises(pagination.InvalidCursorError, match="NAME_ASC"):
+        pagination.decode_cursor(cursor, schemas.sorting.FlowRunSort.NAME_DESC)
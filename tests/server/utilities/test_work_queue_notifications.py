@@ -0,0 +1,60 @@
+import asyncio
+from uuid import uuid4
+
+from prefect.server.utilities.work_queue_notifications import WorkQueueNotifier
+
+
+async def test_wait_times_out():
+    notifier = WorkQueueNotifier()
+    assert not await notifier.wait([uuid4()], timeout=0.1)
+
+
+async def test_notify_wakes_waiters_on_any_work_queue():
+    notifier = WorkQueueNotifier()
+    a, b = uuid4(), uuid4()
+
+    waiter = asyncio.create_task(notifier.wait([a, b], timeout=5))
+    await asyncio.sleep(0)
+    notifier.notify([b])
+
+    assert await waiter
+    assert not notifier._waiters
+
+
+async def test_notify_ignores_other_work_queues():
+    notifier = WorkQueueNotifier()
+
+    waiter = asyncio.create_task(notifier.wait([uuid4()], timeout=0.2))
+    await asyncio.sleep(0)
+    notifier.notify([uuid4()])
+
+    assert not await waiter
+
+
+async def test_notify_on_commit_waits_for_commit(db):
+    notifier = WorkQueueNotifier()
+    work_queue_id = uuid4()
+
+    waiter = asyncio.create_task(notifier.wait([work_queue_id], timeout=5))
+    async with db.session_context() as session:
+        async with session.begin():
+            notifier.notify_on_commit(session, [work_queue_id])
+            await asyncio.sleep(0.1)
+            assert not waiter.done()
+
+    assert await waiter
+
+
+async def test_notify_on_commit_does_not_notify_on_rollback(db):
+    notifier = WorkQueueNotifier()
+    work_queue_id = uuid4()
+
+    waiter = asyncio.create_task(notifier.wait([work_queue_id], timeout=0.5))
+    async with db.session_context() as session:
+        async with session.begin():
+            notifier.notify_on_commit(session, [work_queue_id])
+            await session.rollback()
+        async with session.begin():
+            pass
+
+    assert not await waiter
@@ -29,6 +29,7 @@ from prefect.engine import (
     orchestrate_task_run,
     pause_flow_run,
     propose_state,
+    resolve_inputs,
     resume_flow_run,
     retrieve_flow_then_begin_flow_run,
 )
@@ -2189,3 +2190,28 @@ def test_subflow_call_with_task_runner_duplicate_not_implemented(caplog):
         " the same flow."
         in caplog.text
     )
+
+
+class TestResolveInputs:
+    async def test_resolve_inputs_returns_copies_of_parameters(self):
+        parameters = {"x": [1, {"y": [2]}], "z": 3}
+
+        resolved = await resolve_inputs(parameters)
+
+        assert resolved == parameters
+        assert resolved["x"] is not parameters["x"]
+        assert resolved["x"][1]["y"] is not parameters["x"][1]["y"]
+
+    def test_task_does_not_mutate_caller_parameters(self):
+        @task
+        def append(items):
+            items.append(2)
+            return items
+
+        @flow
+        def my_flow(items):
+            return append(items)
+
+        items = [1]
+        assert my_flow(items) == [1, 2]
+        assert items == [1]
@@ -76,6 +76,61 @@ class TestLocalFileSystem:
         with pytest.raises(ValueError, match="not a file"):
             await fs.read_path(tmp_path / "folder")
 
+    async def test_read_path_mapped(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+
+        content = await fs.read_path_mapped("test.txt")
+        assert isinstance(content, memoryview)
+        assert bytes(content) == b"hello"
+
+    async def test_read_path_mapped_writes_are_private(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+
+        content = await fs.read_path_mapped("test.txt")
+        content[0:1] = b"j"
+
+        assert bytes(content) == b"jello"
+        assert await fs.read_path("test.txt") == b"hello"
+
+    async def test_read_path_mapped_empty_file(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"")
+        assert bytes(await fs.read_path_mapped("test.txt")) == b""
+
+    async def test_read_path_mapped_fails_for_directory(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        (tmp_path / "folder").mkdir()
+        with pytest.raises(ValueError, match="not a file"):
+            await fs.read_path_mapped(tmp_path / "folder")
+
+    async def test_write_does_not_modify_mapped_content(self, tmp_path):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+        content = await fs.read_path_mapped("test.txt")
+
+        await fs.write_path("test.txt", content=b"bye")
+
+        assert bytes(content) == b"hello"
+        assert await fs.read_path("test.txt") == b"bye"
+        assert [path.name for path in tmp_path.iterdir()] == ["test.txt"]
+
+    async def test_write_in_place_if_file_cannot_be_replaced(
+        self, tmp_path, monkeypatch
+    ):
+        fs = LocalFileSystem(basepath=str(tmp_path))
+        await fs.write_path("test.txt", content=b"hello")
+
+        # Windows does not allow replacing files that are open
+        monkeypatch.setattr(
+            "prefect.filesystems.os.replace", MagicMock(side_effect=PermissionError)
+        )
+        await fs.write_path("test.txt", content=b"bye")
+
+        assert await fs.read_path("test.txt") == b"bye"
+        assert [path.name for path in tmp_path.iterdir()] == ["test.txt"]
+
     async def test_resolve_path(self, tmp_path):
         fs = LocalFileSystem(basepath=str(tmp_path))
 
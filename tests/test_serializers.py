@@ -1,5 +1,6 @@
 import base64
 import json
+import pickle
 import uuid
 from dataclasses import dataclass
 from unittest.mock import MagicMock
@@ -162,6 +163,25 @@ class TestPickleSerializer:
         serialized = serializer.dumps(data)
         assert serializer.loads(serialized) == data
 
+    @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
+    def test_raw_roundtrip(self, data):
+        serializer = PickleSerializer()
+        payload, buffers = serializer.dumps_raw(data)
+        assert serializer.loads_raw(memoryview(payload), buffers) == data
+
+    def test_raw_roundtrip_uses_out_of_band_buffers(self):
+        serializer = PickleSerializer()
+        data = pickle.PickleBuffer(bytearray(b"x" * 1024))
+
+        payload, buffers = serializer.dumps_raw(data)
+
+        assert len(buffers) == 1
+        assert bytes(buffers[0]) == b"x" * 1024
+        assert b"x" * 1024 not in payload
+        assert bytes(serializer.loads_raw(memoryview(payload), buffers)) == (
+            b"x" * 1024
+        )
+
     def test_picklelib_must_be_string(self):
         import pickle
 
@@ -316,6 +336,13 @@ class TestJSONSerializer:
         with pytest.raises(pydantic.ValidationError):
             JSONSerializer(dumps_kwargs={"default": "foo"})
 
+    def test_raw_roundtrip_defaults_to_dumps(self):
+        serializer = JSONSerializer()
+        payload, buffers = serializer.dumps_raw({"foo": "bar"})
+        assert payload == serializer.dumps({"foo": "bar"})
+        assert buffers == []
+        assert serializer.loads_raw(memoryview(payload), buffers) == {"foo": "bar"}
+
 
 class TestCompressedSerializer:
     @pytest.mark.parametrize("data", SERIALIZER_TEST_CASES)
@@ -1,7 +1,22 @@
+import asyncio
+import os
+from unittest.mock import AsyncMock, MagicMock
+
+import cloudpickle
 import pytest
+from cryptography.fernet import Fernet
+
+from prefect import flow, task
+from prefect.results import PersistedResult, UnpersistedResult
+
+import prefect.task_runners
 
 # Import the local 'tests' module to pickle to ray workers
-from prefect.task_runners import ConcurrentTaskRunner, SequentialTaskRunner
+from prefect.task_runners import (
+    ConcurrentTaskRunner,
+    ProcessPoolTaskRunner,
+    SequentialTaskRunner,
+)
 from prefect.testing.standard_test_suites import TaskRunnerStandardTestSuite
 
 
@@ -32,3 +47,75 @@ class TestConcurrentTaskRunner(TaskRunnerStandardTestSuite):
     @pytest.fixture
     def task_runner(self):
         yield ConcurrentTaskRunner()
+
+
+class TestProcessPoolTaskRunner(TaskRunnerStandardTestSuite):
+    @pytest.fixture(autouse=True)
+    def shared_encryption_key(self, monkeypatch):
+        # The test database is cleared between tests, but the encryption key for
+        # block documents remains cached in this process; share it with the workers
+        monkeypatch.setenv(
+            "PREFECT_SERVER_ENCRYPTION_KEY", Fernet.generate_key().decode()
+        )
+
+    @pytest.fixture
+    def task_runner(self):
+        yield ProcessPoolTaskRunner(max_workers=2)
+
+    def test_workers_are_reused_with_their_clients(self):
+        @task
+        def get_worker_details():
+            import prefect.task_runners
+
+            return os.getpid(), len(prefect.task_runners._worker_clients)
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=1))
+        def test_flow():
+            return [get_worker_details.submit() for _ in range(3)]
+
+        details = [state.result() for state in test_flow()]
+
+        assert len(set(details)) == 1
+        pid, client_count = details[0]
+        assert pid != os.getpid()
+        assert client_count == 1
+
+    def test_worker_clients_are_exited_at_shutdown(self, monkeypatch):
+        loop = asyncio.new_event_loop()
+        client = MagicMock(__aexit__=AsyncMock())
+        monkeypatch.setattr(prefect.task_runners, "_worker_loop", loop)
+        monkeypatch.setattr(prefect.task_runners, "_worker_clients", {("key",): client})
+
+        prefect.task_runners._shutdown_worker()
+
+        client.__aexit__.assert_awaited_once_with(None, None, None)
+        assert prefect.task_runners._worker_clients == {}
+        assert prefect.task_runners._worker_loop is None
+        assert loop.is_closed()
+
+    def test_results_are_returned_by_reference(self):
+        @task
+        def get_data():
+            return list(range(10))
+
+        @task(persist_result=False)
+        def get_unpersisted_data():
+            return list(range(10))
+
+        @flow(task_runner=ProcessPoolTaskRunner(max_workers=1))
+        def test_flow():
+            return get_data.submit(), get_unpersisted_data.submit()
+
+        persisted, unpersisted = test_flow()
+
+        assert isinstance(persisted.data, PersistedResult)
+        assert not persisted.data.has_cached_object()
+        assert persisted.result() == list(range(10))
+
+        assert isinstance(unpersisted.data, UnpersistedResult)
+        assert unpersisted.result() == list(range(10))
+
+    def test_cannot_submit_after_serialization(self):
+        task_runner = cloudpickle.loads(cloudpickle.dumps(ProcessPoolTaskRunner()))
+        assert task_runner._executor is None
+        assert task_runner == ProcessPoolTaskRunner()
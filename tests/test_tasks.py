@@ -12,6 +12,7 @@ import pytest
 
 from prefect import flow, get_run_logger, tags
 from prefect.blocks.core import Block
+from prefect.client.orchestration import PrefectClient
 from prefect.client.schemas.objects import StateType, TaskRunResult
 from prefect.context import PrefectObjectRegistry, TaskRunContext, get_run_context
 from prefect.engine import get_state_for_result
@@ -27,11 +28,14 @@ from prefect.server import models
 from prefect.settings import (
     PREFECT_DEBUG_MODE,
     PREFECT_TASK_DEFAULT_RETRIES,
+    PREFECT_TASK_MAP_CREATE_BATCH_SIZE,
+    PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT,
+    PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED,
     PREFECT_TASKS_REFRESH_CACHE,
     temporary_settings,
 )
 from prefect.states import State
-from prefect.task_runners import SequentialTaskRunner
+from prefect.task_runners import ConcurrentTaskRunner, SequentialTaskRunner
 from prefect.tasks import Task, task, task_input_hash
 from prefect.testing.utilities import exceptions_equal, flaky_on_windows
 from prefect.utilities.annotations import allow_failure, unmapped
@@ -2723,6 +2727,55 @@ class TestTaskMap:
         states = my_flow()
         assert [state.result() for state in states] == [2, 3, 4]
 
+    @pytest.mark.parametrize(
+        "task_runner", [SequentialTaskRunner, ConcurrentTaskRunner]
+    )
+    def test_map_creates_task_runs_in_batches(self, monkeypatch, task_runner):
+        batch_sizes = []
+        original_create_task_runs = PrefectClient.create_task_runs
+
+        async def create_task_runs(self, task_runs):
+            task_runs = list(task_runs)
+            batch_sizes.append(len(task_runs))
+            return await original_create_task_runs(self, task_runs)
+
+        monkeypatch.setattr(PrefectClient, "create_task_runs", create_task_runs)
+
+        @flow(task_runner=task_runner())
+        def my_flow():
+            return TestTaskMap.add_one.map([1, 2, 3, 4, 5])
+
+        with temporary_settings({PREFECT_TASK_MAP_CREATE_BATCH_SIZE: 2}):
+            task_states = my_flow()
+
+        assert batch_sizes == [2, 2, 1]
+        assert [state.result() for state in task_states] == [2, 3, 4, 5, 6]
+        assert len({state.state_details.task_run_id for state in task_states}) == 5
+
+    def test_map_pipelines_task_run_state_proposals(self, monkeypatch):
+        batch_sizes = []
+        original_set_task_run_states = PrefectClient.set_task_run_states
+
+        async def set_task_run_states(self, proposals):
+            proposals = list(proposals)
+            batch_sizes.append(len(proposals))
+            return await original_set_task_run_states(self, proposals)
+
+        monkeypatch.setattr(PrefectClient, "set_task_run_states", set_task_run_states)
+
+        @flow(task_runner=ConcurrentTaskRunner())
+        def my_flow():
+            return TestTaskMap.add_one.map([1, 2, 3, 4, 5])
+
+        with temporary_settings({PREFECT_TASK_RUN_STATE_PIPELINING_ENABLED: True}):
+            task_states = my_flow()
+
+        assert [state.result() for state in task_states] == [2, 3, 4, 5, 6]
+        assert all(state.is_completed() for state in task_states)
+        # Each task run proposes two states, some of which are sent together
+        assert sum(batch_sizes) == 10
+        assert len(batch_sizes) < 10
+
     def test_map_can_take_tuple_as_input(self):
         @flow
         def my_flow():
@@ -3231,6 +3284,197 @@ class TestTaskMap:
         assert sync_mock_item.call_args_list == [call(n) for n in nums]
 
 
+class TestTaskImap:
+    @task
+    def increment(x):
+        return x + 1
+
+    @task
+    async def async_increment(x):
+        return x + 1
+
+    @task
+    def add(x, y):
+        return x + y
+
+    def test_imap_over_generator(self):
+        @flow
+        def my_flow():
+            return list(TestTaskImap.increment.imap(x for x in range(5)))
+
+        assert my_flow() == [1, 2, 3, 4, 5]
+
+    def test_imap_yields_results_in_input_order(self):
+        @task
+        def sleepy_task(n):
+            time.sleep(n / 100)
+            return n
+
+        @flow(task_runner=ConcurrentTaskRunner())
+        def my_flow():
+            return list(sleepy_task.imap(range(10, 0, -1), max_in_flight=4))
+
+        assert my_flow() == list(range(10, 0, -1))
+
+    def test_imap_return_state_true(self):
+        @flow
+        def my_flow():
+            states = list(TestTaskImap.increment.imap([1, 2, 3], return_state=True))
+            assert all(isinstance(s, State) for s in states)
+            return states
+
+        states = my_flow()
+        assert [state.result() for state in states] == [2, 3, 4]
+
+    def test_imap_consumes_input_lazily(self):
+        consumed = []
+
+        def generate_numbers():
+            for i in range(20):
+                consumed.append(i)
+                yield i
+
+        @flow
+        def my_flow():
+            results = TestTaskImap.increment.imap(generate_numbers(), max_in_flight=4)
+            first = next(results)
+            consumed_after_first = len(consumed)
+            return first, consumed_after_first, list(results)
+
+        first, consumed_after_first, rest = my_flow()
+        assert first == 1
+        assert consumed_after_first == 4
+        assert rest == list(range(2, 21))
+
+    def test_imap_uses_max_in_flight_setting(self):
+        batch_sizes = []
+
+        @flow
+        def my_flow():
+            return list(TestTaskImap.increment.imap(range(10)))
+
+        original_create_task_runs = PrefectClient.create_task_runs
+
+        async def create_task_runs(self, task_runs):
+            task_runs = list(task_runs)
+            batch_sizes.append(len(task_runs))
+            return await original_create_task_runs(self, task_runs)
+
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(PrefectClient, "create_task_runs", create_task_runs)
+            with temporary_settings({PREFECT_TASK_MAP_STREAM_MAX_IN_FLIGHT: 4}):
+                assert my_flow() == list(range(1, 11))
+
+        # Each chunk refills the in-flight task runs once half of them are done
+        assert max(batch_sizes) == 4
+        assert sum(batch_sizes) == 10
+
+    def test_imap_with_static_and_unmapped_parameters(self):
+        @task
+        def add_n_to_items(items, n):
+            return [item + n for item in items]
+
+        @flow
+        def my_flow():
+            return list(add_n_to_items.imap(unmapped([10, 20]), n=iter([1, 2, 3])))
+
+        assert my_flow() == [[11, 21], [12, 22], [13, 23]]
+
+    def test_imap_with_static_parameters(self):
+        @flow
+        def my_flow():
+            return list(TestTaskImap.add.imap(iter([1, 2, 3]), y=10))
+
+        assert my_flow() == [11, 12, 13]
+
+    def test_imap_over_multiple_iterators(self):
+        @flow
+        def my_flow():
+            return list(TestTaskImap.add.imap(iter([1, 2, 3]), iter([4, 5, 6])))
+
+        assert my_flow() == [5, 7, 9]
+
+    def test_imap_raises_on_length_mismatch(self):
+        @flow
+        def my_flow():
+            return list(TestTaskImap.add.imap(iter([1, 2, 3]), iter([4, 5])))
+
+        with pytest.raises(MappingLengthMismatch):
+            my_flow()
+
+    def test_imap_raises_without_iterables(self):
+        @flow
+        def my_flow():
+            return TestTaskImap.increment.imap(1)
+
+        with pytest.raises(MappingMissingIterable):
+            my_flow()
+
+    def test_imap_raises_on_invalid_max_in_flight(self):
+        @flow
+        def my_flow():
+            return TestTaskImap.increment.imap([1], max_in_flight=0)
+
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            my_flow()
+
+    def test_imap_releases_yielded_futures(self):
+        @flow
+        def my_flow():
+            results = list(TestTaskImap.increment.imap(range(5), max_in_flight=2))
+            return results, get_run_context().task_run_futures
+
+        results, task_run_futures = my_flow()
+        assert results == [1, 2, 3, 4, 5]
+        assert task_run_futures == []
+
+    def test_imap_async_iterable_in_sync_flow_raises(self):
+        async def numbers():
+            yield 1
+
+        @flow
+        def my_flow():
+            return TestTaskImap.increment.imap(numbers())
+
+        with pytest.raises(TypeError, match="Async iterables can only be streamed"):
+            my_flow()
+
+    async def test_imap_async_task_over_async_iterable(self):
+        async def numbers():
+            for i in range(5):
+                await sleep(0)
+                yield i
+
+        @flow
+        async def my_flow():
+            return [
+                result
+                async for result in TestTaskImap.async_increment.imap(
+                    numbers(), max_in_flight=2
+                )
+            ]
+
+        assert await my_flow() == [1, 2, 3, 4, 5]
+
+    async def test_imap_async_task_return_state_true(self):
+        @flow
+        async def my_flow():
+            return [
+                state
+                async for state in TestTaskImap.async_increment.imap(
+                    iter([1, 2, 3]), return_state=True
+                )
+            ]
+
+        states = await my_flow()
+        assert all(isinstance(state, State) for state in states)
+        assert [await state.result() for state in states] == [2, 3, 4]
+
+    def test_imap_outside_flow_raises(self):
+        with pytest.raises(RuntimeError, match="Tasks cannot be run outside of a flow"):
+            TestTaskImap.increment.imap([1, 2, 3])
+
+
 class TestTaskConstructorValidation:
     async def test_task_cannot_configure_too_many_custom_retry_delays(self):
         with pytest.raises(ValueError, match="Can not configure more"):
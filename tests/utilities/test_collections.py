@@ -1,5 +1,6 @@
 import io
 import json
+import sys
 import uuid
 from dataclasses import dataclass
 from typing import Any
@@ -471,6 +472,57 @@ class TestVisitCollection:
         # Only the first two items should be visited
         assert result == [2, 3, [3, [4, 5, 6]]]
 
+    def test_visit_collection_copies_unchanged_collections_by_default(self):
+        inner = {"a": [1, 3], "b": SimplePydantic(x=1, y=3)}
+        foo = [inner, (5, SimpleDataclass(x=1, y=3)), {7}]
+
+        result = visit_collection(foo, negative_even_numbers, return_data=True)
+
+        assert result == foo
+        assert result is not foo
+        assert result[0] is not inner
+        assert result[0]["a"] is not inner["a"]
+        assert result[0]["b"] is not inner["b"]
+
+    def test_visit_collection_does_not_copy_unchanged_collections(self):
+        inner = {"a": [1, 3], "b": SimplePydantic(x=1, y=3)}
+        foo = [inner, (5, SimpleDataclass(x=1, y=3)), {7}]
+
+        result = visit_collection(
+            foo, negative_even_numbers, return_data=True, copy_unchanged=False
+        )
+
+        assert result is foo
+        assert result[0] is inner
+
+    def test_visit_collection_copies_only_changed_collections(self):
+        unchanged = [1, 3]
+        changed = [1, 2]
+        foo = {"a": unchanged, "b": changed, "c": SimplePydantic(x=2, y=3)}
+
+        result = visit_collection(
+            foo, negative_even_numbers, return_data=True, copy_unchanged=False
+        )
+
+        assert result == {"a": [1, 3], "b": [1, -2], "c": SimplePydantic(x=-2, y=3)}
+        assert result is not foo
+        assert result["a"] is unchanged
+        assert result["b"] is not changed
+        assert foo == {"a": [1, 3], "b": [1, 2], "c": SimplePydantic(x=2, y=3)}
+
+    def test_visit_collection_deeply_nested(self):
+        foo = [2]
+        for _ in range(10 * sys.getrecursionlimit()):
+            foo = [foo]
+
+        result = visit_collection(
+            foo, lambda x: -x if isinstance(x, int) else x, return_data=True
+        )
+
+        for _ in range(10 * sys.getrecursionlimit()):
+            result = result[0]
+        assert result == [-2]
+
 
 class TestRemoveKeys:
     def test_remove_single_key(self):
@@ -1,8 +1,15 @@
 import hashlib
+import threading
+from dataclasses import dataclass
+from unittest.mock import MagicMock
 
+import numpy as np
+import pendulum
+import pydantic
 import pytest
 
-from prefect.utilities.hashing import file_hash, stable_hash
+from prefect.utilities import hashing
+from prefect.utilities.hashing import file_hash, hash_structure, stable_hash
 
 
 @pytest.mark.parametrize(
@@ -55,3 +62,143 @@ class TestFileHash:
         assert val == hashlib.md5(b"0").hexdigest()
         # Check if the hash is stable
         assert val == "cfcd208495d565ef66e7dff9f98764da"
+
+
+class TestHashStructure:
+    def test_hash_structure_is_stable(self):
+        value = {"a": [1, 2.5, "x", None, True], "b": (b"bytes", {1, 2})}
+        assert hash_structure(value) == hash_structure(value)
+        assert hash_structure(value) == "2ba7132a8c903dee3a7b9322eea0207f"
+
+    def test_hash_structure_ignores_dict_and_set_order(self):
+        assert hash_structure({"a": 1, "b": 2}) == hash_structure({"b": 2, "a": 1})
+        assert hash_structure({"a", "b", "c"}) == hash_structure({"c", "b", "a"})
+
+    @pytest.mark.parametrize(
+        "left,right",
+        [
+            (1, "1"),
+            (1, 1.0),
+            (1, True),
+            ([[1], 2], [1, [2]]),
+            (["ab", "c"], ["a", "bc"]),
+            ({"a": 1}, {"a": 2}),
+            (b"a", "a"),
+        ],
+    )
+    def test_hash_structure_distinguishes_values(self, left, right):
+        assert hash_structure(left) != hash_structure(right)
+
+    def test_hash_structure_args_and_kwargs(self):
+        assert hash_structure(1, x=2) == hash_structure(1, x=2)
+        assert hash_structure(1, x=2) != hash_structure(1, 2)
+
+    def test_hash_structure_buffers(self):
+        assert hash_structure(b"abc") == hash_structure(bytearray(b"abc"))
+        assert hash_structure(b"abc") == hash_structure(memoryview(b"abc"))
+
+    def test_hash_structure_pydantic_models(self):
+        class Model(pydantic.BaseModel):
+            x: int
+            y: bytes
+
+        class OtherModel(Model):
+            pass
+
+        assert hash_structure(Model(x=1, y=b"a")) == hash_structure(Model(x=1, y=b"a"))
+        assert hash_structure(Model(x=1, y=b"a")) != hash_structure(Model(x=1, y=b"b"))
+        assert hash_structure(Model(x=1, y=b"a")) != hash_structure(
+            OtherModel(x=1, y=b"a")
+        )
+
+    def test_hash_structure_dataclasses(self):
+        @dataclass
+        class Data:
+            x: int
+            y: bytes
+
+        assert hash_structure(Data(x=1, y=b"a")) == hash_structure(Data(x=1, y=b"a"))
+        assert hash_structure(Data(x=1, y=b"a")) != hash_structure(Data(x=1, y=b"b"))
+
+    def test_hash_structure_falls_back_to_serializers(self):
+        class Unserializable:
+            def __init__(self, x):
+                self.x = x
+
+        now = pendulum.now()
+        assert hash_structure(now) == hash_structure(now)
+        assert hash_structure(Unserializable(1)) == hash_structure(Unserializable(1))
+        assert hash_structure(Unserializable(1)) != hash_structure(Unserializable(2))
+
+    def test_hash_structure_falls_back_to_cloudpickle_for_unsortable_keys(self):
+        assert hash_structure({1: "a", "b": 2}) == hash_structure({1: "a", "b": 2})
+
+    def test_hash_structure_returns_none_for_unhashable_objects(self):
+        assert hash_structure(threading.Lock()) is None
+
+    def test_hash_structure_numpy_arrays(self):
+        array = np.arange(12, dtype=np.int64).reshape(3, 4)
+
+        assert hash_structure(array) == hash_structure(array.copy())
+        # The memory layout does not change the hash
+        assert hash_structure(array) == hash_structure(np.asfortranarray(array))
+        assert hash_structure(array[:, ::2]) == hash_structure(array[:, ::2].copy())
+
+        assert hash_structure(array) != hash_structure(array.reshape(4, 3))
+        assert hash_structure(array) != hash_structure(array.astype(np.int32))
+        assert hash_structure(array) != hash_structure(array + 1)
+
+    def test_hash_structure_memoizes_arrays_backed_by_bytes(self, monkeypatch):
+        hash_array_into = MagicMock(wraps=hashing._hash_array_into)
+        monkeypatch.setattr(hashing, "_hash_array_into", hash_array_into)
+
+        immutable = np.frombuffer(np.arange(10).tobytes(), dtype=np.int64)
+        assert hash_structure(immutable) == hash_structure(immutable)
+        assert hash_structure(immutable[::2]) == hash_structure(immutable[::2])
+        assert hash_array_into.call_count == 3
+
+        writeable = np.arange(10)
+        assert hash_structure(writeable) == hash_structure(immutable)
+        writeable[0] = 1
+        assert hash_structure(writeable) != hash_structure(immutable)
+        assert hash_array_into.call_count == 5
+
+    def test_hash_structure_does_not_memoize_read_only_arrays(self):
+        array = np.arange(10)
+        array.flags.writeable = False
+        view = array[:]
+        digest = hash_structure(view)
+
+        array.flags.writeable = True
+        array[0] = 1
+
+        assert hash_structure(view) != digest
+
+    def test_hash_structure_pandas_dataframes(self):
+        pd = pytest.importorskip("pandas")
+
+        df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [0.5, 1, 2]})
+
+        assert hash_structure(df) == hash_structure(df.copy())
+        assert hash_structure(df) != hash_structure(df.rename(columns={"a": "d"}))
+        assert hash_structure(df) != hash_structure(df.iloc[::-1])
+        assert hash_structure(df) != hash_structure(df.astype({"a": "int32"}))
+        assert hash_structure(df["a"]) != hash_structure(df["c"])
+
+    @pytest.mark.parametrize(
+        "left,right",
+        [
+            ([1, "b"], ["1", "b"]),
+            ([None, "b"], ["None", "b"]),
+            ([{"k": 1}, "b"], ["{'k': 1}", "b"]),
+            ([(1, 2), "b"], ["(1, 2)", "b"]),
+        ],
+    )
+    def test_hash_structure_distinguishes_pandas_object_values(self, left, right):
+        pd = pytest.importorskip("pandas")
+
+        assert hash_structure(pd.Series(left)) != hash_structure(pd.Series(right))
+        assert hash_structure(pd.DataFrame({"a": left})) != hash_structure(
+            pd.DataFrame({"a": right})
+        )
+        assert hash_structure(pd.Index(left)) != hash_structure(pd.Index(right))
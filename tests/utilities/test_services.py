@@ -146,6 +146,20 @@ async def test_consistent_sleeps_between_loops(monkeypatch):
     ]
 
 
+async def test_sleeps_for_interval_returned_by_function(monkeypatch):
+    workload = AsyncMock(side_effect=[None, None, None, UncapturedException])
+    sleeper = AsyncMock()
+    intervals = iter([1.0, 10.0, 1.0])
+
+    monkeypatch.setattr("prefect.utilities.services.anyio.sleep", sleeper)
+
+    with pytest.raises(UncapturedException):
+        await critical_service_loop(workload, lambda: next(intervals))
+
+    sleep_times = [call.args[0] for call in sleeper.await_args_list]
+    assert sleep_times == [1.0, 10.0, 1.0]
+
+
 async def test_jittered_sleeps_between_loops(monkeypatch):
     workload = AsyncMock(
         side_effect=[
@@ -0,0 +1,50 @@
+import pytest
+
+from prefect.utilities import wire
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, False),
+        ("application/json", False),
+        ("application/msgpack", True),
+        ("application/json, application/msgpack;q=0.9", True),
+        ("Application/MsgPack", True),
+        ("application/msgpack;q=0", False),
+        ("application/msgpack;q=invalid", False),
+    ],
+)
+def test_accepts(header, expected):
+    assert wire.accepts(header, "application/msgpack") is expected
+
+
+def test_encode_body_compresses_large_bodies_only():
+    pytest.importorskip("zstandard")
+
+    body, headers = wire.encode_body({"a": 1}, use_zstd=True)
+    assert headers == {"Content-Type": "application/json"}
+    assert body == b'{"a": 1}'
+
+    body, headers = wire.encode_body({"a": "b" * 1000}, use_zstd=True)
+    assert headers["Content-Encoding"] == "zstd"
+    assert wire.zstd_decompress(body) == b'{"a": "' + b"b" * 1000 + b'"}'
+
+
+def test_stream_compressor_chunks_can_be_decompressed_as_received():
+    zstandard = pytest.importorskip("zstandard")
+
+    compressor = wire.ZstdStreamCompressor()
+    decompressor = zstandard.ZstdDecompressor().decompressobj()
+
+    assert decompressor.decompress(compressor.compress(b"first")) == b"first"
+    assert decompressor.decompress(compressor.compress(b"last", final=True)) == b"last"
+
+
+def test_zstd_decompress_limits_the_decompressed_size():
+    pytest.importorskip("zstandard")
+
+    body = wire.zstd_compress(b"a" * 200_000)
+    assert wire.zstd_decompress(body, max_size=200_000) == b"a" * 200_000
+    with pytest.raises(ValueError, match="exceeds 199999 bytes"):
+        wire.zstd_decompress(body, max_size=199_999)
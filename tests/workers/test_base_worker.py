@@ -23,7 +23,12 @@ from prefect.server import models
 from prefect.server.schemas.core import Flow
 from prefect.server.schemas.responses import DeploymentResponse
 from prefect.server.schemas.states import StateType
-from prefect.settings import PREFECT_WORKER_PREFETCH_SECONDS, get_current_settings
+from prefect.settings import (
+    PREFECT_WORKER_LONG_POLL_SECONDS,
+    PREFECT_WORKER_PREFETCH_SECONDS,
+    get_current_settings,
+    temporary_settings,
+)
 from prefect.states import Cancelled, Cancelling, Completed, Pending, Running, Scheduled
 from prefect.testing.utilities import AsyncMock
 from prefect.workers.base import BaseJobConfiguration, BaseVariables, BaseWorker
@@ -113,6 +118,27 @@ async def test_worker_respects_settings(setting, attr):
     )
 
 
+async def test_worker_caches_deployments_and_flows(
+    prefect_client: PrefectClient, worker_deployment_wq1, work_pool
+):
+    flow_run = await prefect_client.create_flow_run_from_deployment(
+        worker_deployment_wq1.id
+    )
+
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        await worker.sync_with_backend()
+        await worker._get_configuration(flow_run)
+        await worker._get_configuration(flow_run)
+
+        assert worker.get_status()["metadata_cache"] == {
+            "size": 2,
+            "hits": 2,
+            "misses": 2,
+            "hit_rate": 0.5,
+            "invalidations": 0,
+        }
+
+
 async def test_worker_sends_heartbeat_messages(
     prefect_client: PrefectClient,
 ):
@@ -175,6 +201,24 @@ async def test_worker_with_work_pool(
     assert {flow_run.id for flow_run in submitted_flow_runs} == set(flow_run_ids[1:4])
 
 
+async def test_worker_queries_again_soon_only_after_an_empty_long_poll(work_pool):
+    async with WorkerTestImpl(work_pool_name=work_pool.name) as worker:
+        get_runs = AsyncMock(return_value=[])
+        worker._client.get_scheduled_flow_runs_for_work_pool = get_runs
+
+        await worker._get_scheduled_flow_runs()
+        assert worker.next_query_interval(10) == 10
+
+        with temporary_settings({PREFECT_WORKER_LONG_POLL_SECONDS: 30}):
+            await worker._get_scheduled_flow_runs()
+            assert worker.next_query_interval(10) == 1
+
+            # runs that are returned but not submitted do not shorten the interval
+            get_runs.return_value = [MagicMock()]
+            await worker._get_scheduled_flow_runs()
+            assert worker.next_query_interval(10) == 10
+
+
 async def test_worker_with_work_pool_and_work_queue(
     prefect_client: PrefectClient,
     worker_deployment_wq1,